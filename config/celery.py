@@ -0,0 +1,18 @@
+# backend/config/celery.py
+"""
+Celery app. Configured from Django settings (CELERY_* keys); jobs live in each
+app's jobs.py module.
+
+    celery -A config worker -l info
+    celery -A config beat -l info
+"""
+
+import os
+
+from celery import Celery
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+
+app = Celery("hm")
+app.config_from_object("django.conf:settings", namespace="CELERY")
+app.autodiscover_tasks(related_name="jobs")
@@ -181,3 +181,96 @@ CORS_ALLOW_ALL_ORIGINS = True  # Only for development!
 CORS_ALLOW_CREDENTIALS = True
 
 COMMON_IDEMPOTENCY_USE_DB = True
+
+# Shared cache. Version stamps of the in-process caches below (rules, charge
+# catalog, facility settings, permission registry, token versions) must reach
+# every worker, so without REDIS_URL those caches raise ImproperlyConfigured
+# unless HM_SINGLE_PROCESS=1 (one process: dev server, tests; see hm_core/common/cache.py).
+REDIS_URL = os.getenv("REDIS_URL", "")
+if REDIS_URL:
+    CACHES = {"default": {"BACKEND": "django.core.cache.backends.redis.RedisCache", "LOCATION": REDIS_URL}}
+else:
+    CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+HM_SINGLE_PROCESS = os.getenv("HM_SINGLE_PROCESS", "0") == "1"
+
+# IAM: facility-membership cache used by scope enforcement.
+# BACKEND: "lru" (in-process) | "django" (CACHES[CACHE_ALIAS], e.g. Redis) | "none"
+IAM_MEMBERSHIP_CACHE = {
+    "BACKEND": os.getenv("IAM_MEMBERSHIP_CACHE_BACKEND", "lru"),
+    "TTL": int(os.getenv("IAM_MEMBERSHIP_CACHE_TTL", "300")),
+    "MAX_ENTRIES": 10000,
+    "CACHE_ALIAS": "default",
+}
+
+# IAM: compiled permission registry (see hm_core/iam/services/permission_registry.py);
+# stamps as for RULES_CACHE.
+IAM_PERMISSION_REGISTRY_CACHE = {
+    "BACKEND": os.getenv("IAM_PERMISSION_REGISTRY_CACHE_BACKEND", "django"),
+    "TTL": int(os.getenv("IAM_PERMISSION_REGISTRY_CACHE_TTL", "300")),
+    "CACHE_ALIAS": "default",
+}
+
+# Emit per-phase scope resolution timings (parse/membership) as a Server-Timing header.
+HM_SCOPE_SERVER_TIMING = os.getenv("HM_SCOPE_SERVER_TIMING", "1" if DEBUG else "0") == "1"
+
+# IAM: embed signed membership/role claims in access tokens so authorization
+# skips DB lookups (see hm_core/iam/services/token_claims.py). Token versions need
+# a shared cache (CACHES[VERSION_CACHE_ALIAS], e.g. Redis) unless HM_SINGLE_PROCESS.
+IAM_TOKEN_CLAIMS = {
+    "ENABLED": os.getenv("IAM_TOKEN_CLAIMS", "0") == "1",
+    "VERSION_CACHE_ALIAS": os.getenv("IAM_TOKEN_CLAIMS_CACHE_ALIAS", "default"),
+}
+
+# Rules: compiled rule cache (see hm_core/rules/cache.py). Version stamps live in
+# CACHES[CACHE_ALIAS], which must be shared (Redis) unless HM_SINGLE_PROCESS.
+RULES_CACHE = {
+    "BACKEND": os.getenv("RULES_CACHE_BACKEND", "django"),
+    "TTL": int(os.getenv("RULES_CACHE_TTL", "300")),
+    "MAX_ENTRIES": 10000,
+    "CACHE_ALIAS": "default",
+}
+
+# Charges: per-facility charge catalog cache (see hm_core/charges/catalog.py);
+# stamps as for RULES_CACHE.
+CHARGE_CATALOG_CACHE = {
+    "BACKEND": os.getenv("CHARGE_CATALOG_CACHE_BACKEND", "django"),
+    "TTL": int(os.getenv("CHARGE_CATALOG_CACHE_TTL", "300")),
+    "MAX_ENTRIES": 1000,
+    "CACHE_ALIAS": "default",
+}
+
+# Facilities: typed facility settings cache (see hm_core/facilities/facility_settings.py);
+# stamps as for RULES_CACHE.
+FACILITY_SETTINGS_CACHE = {
+    "BACKEND": os.getenv("FACILITY_SETTINGS_CACHE_BACKEND", "django"),
+    "TTL": int(os.getenv("FACILITY_SETTINGS_CACHE_TTL", "300")),
+    "MAX_ENTRIES": 10000,
+    "CACHE_ALIAS": "default",
+}
+
+# Celery (config/celery.py; jobs in hm_core/*/jobs.py). Without a broker, jobs run
+# eagerly in-process (local dev / tests); set CELERY_BROKER_URL to use worker + beat.
+CELERY_BROKER_URL = os.getenv("CELERY_BROKER_URL", "")
+CELERY_TASK_ALWAYS_EAGER = os.getenv("CELERY_TASK_ALWAYS_EAGER", "0" if CELERY_BROKER_URL else "1") == "1"
+CELERY_TASK_EAGER_PROPAGATES = True
+CELERY_TIMEZONE = TIME_ZONE
+CELERY_BEAT_SCHEDULE = {
+    "tasks-sweep-overdue": {
+        "task": "tasks.sweep_overdue_tasks",
+        "schedule": int(os.getenv("TASKS_OVERDUE_SWEEP_INTERVAL", "60")),  # seconds
+    },
+}
+
+# Tasks: overdue sweeper (see hm_core/tasks/overdue.py).
+TASKS_OVERDUE_SWEEP = {
+    "BATCH_SIZE": 500,
+    "INITIAL_LOOKBACK_HOURS": int(os.getenv("TASKS_OVERDUE_LOOKBACK_HOURS", "24")),
+}
+
+# Billing: invoice number sequences (see hm_core/billing/numbering.py).
+BILLING_INVOICE_NUMBERING = {
+    "SERIES": "INV",
+    "FORMAT": os.getenv("BILLING_INVOICE_NUMBER_FORMAT", "{series}-{number:06d}"),
+    "RESET": os.getenv("BILLING_INVOICE_NUMBER_RESET", "never"),  # "never" | "yearly"
+    "BLOCK_SIZE": int(os.getenv("BILLING_INVOICE_NUMBER_BLOCK_SIZE", "1")),
+}
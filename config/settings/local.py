@@ -1,6 +1,11 @@
+import os
+
 from .base import *  # noqa
 
 DEBUG = True
 
+# runserver / pytest are one process: process-local cache stamps are fine
+HM_SINGLE_PROCESS = os.getenv("HM_SINGLE_PROCESS", "1") == "1"
+
 # For local dev, allow everything
 ALLOWED_HOSTS = ["*"]
@@ -0,0 +1,68 @@
+# Generated by Django 5.2.9 on 2026-10-17 06:12
+
+import django.db.models.deletion
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Alert',
+            fields=[
+                ('created_at', models.DateTimeField(auto_now_add=True, db_index=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('tenant_id', models.UUIDField(db_index=True)),
+                ('facility_id', models.UUIDField(db_index=True)),
+                ('code', models.SlugField(max_length=64)),
+                ('title', models.CharField(max_length=255)),
+                ('message', models.TextField(blank=True, default='')),
+                ('severity', models.CharField(choices=[('INFO', 'Info'), ('WARNING', 'Warning'), ('CRITICAL', 'Critical')], db_index=True, default='INFO', max_length=16)),
+                ('status', models.CharField(choices=[('OPEN', 'Open'), ('ACKED', 'Acknowledged'), ('RESOLVED', 'Resolved'), ('DISMISSED', 'Dismissed')], db_index=True, default='OPEN', max_length=16)),
+                ('encounter_id', models.UUIDField(blank=True, db_index=True, null=True)),
+                ('task_id', models.UUIDField(blank=True, db_index=True, null=True)),
+                ('patient_id', models.UUIDField(blank=True, db_index=True, null=True)),
+                ('lab_result_id', models.UUIDField(blank=True, db_index=True, null=True)),
+                ('created_by_user_id', models.IntegerField(blank=True, null=True)),
+                ('acked_by_user_id', models.IntegerField(blank=True, null=True)),
+                ('acked_at', models.DateTimeField(blank=True, null=True)),
+                ('meta', models.JSONField(blank=True, default=dict)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['tenant_id', 'facility_id', 'status', 'severity'], name='alerts_aler_tenant__7e8c81_idx'), models.Index(fields=['tenant_id', 'facility_id', 'encounter_id'], name='alerts_aler_tenant__07ab8d_idx'), models.Index(fields=['tenant_id', 'facility_id', 'task_id'], name='alerts_aler_tenant__38547a_idx')],
+            },
+        ),
+        migrations.CreateModel(
+            name='Notification',
+            fields=[
+                ('created_at', models.DateTimeField(auto_now_add=True, db_index=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('tenant_id', models.UUIDField(db_index=True)),
+                ('facility_id', models.UUIDField(db_index=True)),
+                ('channel', models.CharField(choices=[('IN_APP', 'In App'), ('EMAIL', 'Email'), ('SMS', 'SMS'), ('WHATSAPP', 'WhatsApp')], db_index=True, default='IN_APP', max_length=16)),
+                ('title', models.CharField(max_length=255)),
+                ('body', models.TextField(blank=True, default='')),
+                ('encounter_id', models.UUIDField(blank=True, db_index=True, null=True)),
+                ('task_id', models.UUIDField(blank=True, db_index=True, null=True)),
+                ('is_read', models.BooleanField(db_index=True, default=False)),
+                ('read_at', models.DateTimeField(blank=True, null=True)),
+                ('meta', models.JSONField(blank=True, default=dict)),
+                ('alert', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='notifications', to='alerts.alert')),
+                ('recipient', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='notifications', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'abstract': False,
+                'indexes': [models.Index(fields=['tenant_id', 'facility_id'], name='scoped_tenant_facility_idx')],
+            },
+        ),
+    ]
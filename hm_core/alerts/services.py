@@ -49,6 +49,33 @@ class AlertService:
             meta=meta or {},
         )
 
+    @staticmethod
+    @transaction.atomic
+    def create_alerts(*, ctx: AlertContext, items: Iterable[dict]) -> list[Alert]:
+        """
+        Batch form of create_alert (one INSERT); items take create_alert's keyword
+        arguments (code, title, message?, severity?, encounter_id?, task_id?, ...).
+        """
+        objs = [
+            Alert(
+                tenant_id=ctx.tenant_id,
+                facility_id=ctx.facility_id,
+                created_by_user_id=ctx.actor_user_id,
+                code=item["code"],
+                title=item["title"],
+                message=item.get("message", ""),
+                severity=item.get("severity", AlertSeverity.INFO),
+                status=AlertStatus.OPEN,
+                encounter_id=item.get("encounter_id"),
+                task_id=item.get("task_id"),
+                patient_id=item.get("patient_id"),
+                lab_result_id=item.get("lab_result_id"),
+                meta=item.get("meta") or {},
+            )
+            for item in items
+        ]
+        return Alert.objects.bulk_create(objs)
+
     @staticmethod
     @transaction.atomic
     def ack_alert(*, ctx: AlertContext, alert_id: UUID) -> Alert:
@@ -91,3 +118,26 @@ class NotificationService:
             for uid in user_ids
         ]
         return Notification.objects.bulk_create(objs)
+
+    @staticmethod
+    @transaction.atomic
+    def notify_alert_recipients(*, ctx: AlertContext, recipients: Iterable[tuple[Alert, int]]) -> list[Notification]:
+        """
+        One in-app notification per (alert, user_id), all in one INSERT
+        (batch counterpart of notify_users_in_app for alerts raised in bulk).
+        """
+        objs = [
+            Notification(
+                tenant_id=ctx.tenant_id,
+                facility_id=ctx.facility_id,
+                recipient_id=uid,
+                channel="IN_APP",
+                title=alert.title,
+                body=alert.message,
+                alert=alert,
+                encounter_id=alert.encounter_id,
+                task_id=alert.task_id,
+            )
+            for alert, uid in recipients
+        ]
+        return Notification.objects.bulk_create(objs)
@@ -0,0 +1,38 @@
+# Generated by Django 5.2.9 on 2026-10-17 06:12
+
+import django.db.models.deletion
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AuditEvent',
+            fields=[
+                ('created_at', models.DateTimeField(auto_now_add=True, db_index=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('tenant_id', models.UUIDField(db_index=True)),
+                ('facility_id', models.UUIDField(db_index=True)),
+                ('event_code', models.CharField(db_index=True, max_length=128)),
+                ('entity_type', models.CharField(db_index=True, max_length=128)),
+                ('entity_id', models.UUIDField(db_index=True)),
+                ('occurred_at', models.DateTimeField(auto_now_add=True, db_index=True)),
+                ('metadata', models.JSONField(default=dict)),
+                ('actor_user', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='audit_events', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'db_table': 'audit_audit_event',
+                'indexes': [models.Index(fields=['tenant_id', 'facility_id', 'occurred_at'], name='audit_audit_tenant__bf6243_idx'), models.Index(fields=['entity_type', 'entity_id'], name='audit_audit_entity__879812_idx'), models.Index(fields=['tenant_id', 'facility_id', 'event_code'], name='audit_audit_tenant__4d6e60_idx')],
+            },
+        ),
+    ]
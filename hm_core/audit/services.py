@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterable, Optional
 from uuid import UUID
 
 from django.db import transaction
@@ -60,3 +60,25 @@ class AuditService:
             actor_user_id=actor_user_id,
             metadata=metadata,
         )
+
+    @staticmethod
+    @transaction.atomic
+    def log_many(records: Iterable[AuditRecord]) -> int:
+        """
+        Persist many audit records in one INSERT (bulk service paths).
+        Returns the number of rows written.
+        """
+        rows = [
+            AuditEvent(
+                tenant_id=r.tenant_id,
+                facility_id=r.facility_id,
+                event_code=r.event_code,
+                entity_type=r.entity_type,
+                entity_id=r.entity_id,
+                actor_user_id=r.actor_user_id,
+                metadata=r.metadata or {},
+            )
+            for r in records
+        ]
+        AuditEvent.objects.bulk_create(rows)
+        return len(rows)
@@ -27,7 +27,7 @@ from hm_core.billing.services import InvoiceService, PaymentService
 from hm_core.charges.selectors import get_active_charge_item
 from hm_core.common.api.pagination import paginate
 from hm_core.common.scope import require_scope
-from hm_core.facilities.models import Facility, PricingTaxMode
+from hm_core.facilities.facility_settings import get_facility_settings
 
 
 def _uuid_or_none(value: str | None, field_name: str) -> UUID | None:
@@ -39,11 +39,6 @@ def _uuid_or_none(value: str | None, field_name: str) -> UUID | None:
         raise DRFValidationError({field_name: "Invalid UUID"})
 
 
-def _facility_tax_mode(*, tenant_id: UUID, facility_id: UUID) -> str:
-    facility = Facility.objects.filter(tenant_id=tenant_id, id=facility_id).only("pricing_tax_mode").first()
-    return facility.pricing_tax_mode if facility else PricingTaxMode.EXCLUSIVE
-
-
 class BillableEventViewSet(viewsets.GenericViewSet):
     """
     Billing events (read-only in v1).
@@ -273,8 +268,9 @@ class InvoiceViewSet(viewsets.GenericViewSet):
         tax_percent = Decimal(str(tax_percent or "0.00")).quantize(Decimal("0.01"))
 
         if price_includes_tax is None:
-            mode = _facility_tax_mode(tenant_id=scope.tenant_id, facility_id=scope.facility_id)
-            price_includes_tax = (mode == PricingTaxMode.INCLUSIVE)
+            price_includes_tax = get_facility_settings(
+                tenant_id=scope.tenant_id, facility_id=scope.facility_id
+            ).prices_include_tax
 
         if price_includes_tax and tax_percent > Decimal("0.00"):
             gross_line_total = (quantity * unit_price_in).quantize(Decimal("0.01"))
@@ -0,0 +1,31 @@
+# hm_core/billing/management/commands/verify_invoice_totals.py
+from __future__ import annotations
+
+from django.core.management.base import BaseCommand
+
+from hm_core.billing.services import InvoiceService
+
+
+class Command(BaseCommand):
+    help = "Detect invoices whose stored totals drifted from their lines (SUM per invoice); --repair recomputes them."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--repair", action="store_true", help="Recompute drifted invoices from their lines.")
+        parser.add_argument("--tenant-id", type=str, default=None, help="Optional tenant UUID filter.")
+        parser.add_argument("--facility-id", type=str, default=None, help="Optional facility UUID filter.")
+        parser.add_argument("--chunk-size", type=int, default=500, help="Invoices checked per query.")
+
+    def handle(self, *args, **opts):
+        result = InvoiceService.verify_totals(
+            tenant_id=opts["tenant_id"],
+            facility_id=opts["facility_id"],
+            repair=opts["repair"],
+            chunk_size=max(1, int(opts["chunk_size"])),
+        )
+
+        self.stdout.write(f"Invoices examined: {result.scanned}")
+        self.stdout.write(f"Invoices with drifted totals: {len(result.drifted)}")
+        for invoice_id in result.drifted:
+            self.stdout.write(f"  {invoice_id}")
+        if opts["repair"]:
+            self.stdout.write(f"Invoices repaired: {result.repaired}")
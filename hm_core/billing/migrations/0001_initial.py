@@ -0,0 +1,154 @@
+# Generated by Django 5.2.9 on 2026-10-17 06:12
+
+import django.db.models.deletion
+import django.utils.timezone
+import uuid
+from decimal import Decimal
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('encounters', '0001_initial'),
+        ('orders', '0001_initial'),
+        ('patients', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BillableEvent',
+            fields=[
+                ('created_at', models.DateTimeField(auto_now_add=True, db_index=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('tenant_id', models.UUIDField(db_index=True)),
+                ('facility_id', models.UUIDField(db_index=True)),
+                ('event_type', models.CharField(choices=[('SERVICE_DELIVERED', 'Service Delivered')], default='SERVICE_DELIVERED', max_length=32)),
+                ('chargeable_code', models.SlugField(max_length=64)),
+                ('quantity', models.PositiveIntegerField(default=1)),
+                ('encounter', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='billable_events', to='encounters.encounter')),
+                ('source_order_item', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='billable_event', to='orders.orderitem')),
+            ],
+            options={
+                'db_table': 'billing_billable_event',
+            },
+        ),
+        migrations.CreateModel(
+            name='Invoice',
+            fields=[
+                ('created_at', models.DateTimeField(auto_now_add=True, db_index=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('tenant_id', models.UUIDField(db_index=True)),
+                ('facility_id', models.UUIDField(db_index=True)),
+                ('invoice_number', models.CharField(blank=True, max_length=32)),
+                ('status', models.CharField(choices=[('DRAFT', 'Draft'), ('ISSUED', 'Issued'), ('PARTIALLY_PAID', 'Partially Paid'), ('PAID', 'Paid'), ('VOID', 'Void')], db_index=True, default='DRAFT', max_length=32)),
+                ('currency', models.CharField(default='INR', max_length=8)),
+                ('subtotal', models.DecimalField(decimal_places=2, default=Decimal('0.00'), max_digits=12)),
+                ('discount_total', models.DecimalField(decimal_places=2, default=Decimal('0.00'), max_digits=12)),
+                ('tax_total', models.DecimalField(decimal_places=2, default=Decimal('0.00'), max_digits=12)),
+                ('grand_total', models.DecimalField(decimal_places=2, default=Decimal('0.00'), max_digits=12)),
+                ('amount_paid', models.DecimalField(decimal_places=2, default=Decimal('0.00'), max_digits=12)),
+                ('balance_due', models.DecimalField(decimal_places=2, default=Decimal('0.00'), max_digits=12)),
+                ('issued_at', models.DateTimeField(blank=True, null=True)),
+                ('due_at', models.DateTimeField(blank=True, null=True)),
+                ('paid_at', models.DateTimeField(blank=True, null=True)),
+                ('voided_at', models.DateTimeField(blank=True, null=True)),
+                ('notes', models.TextField(blank=True)),
+                ('encounter', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='invoices', to='encounters.encounter')),
+                ('patient', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='invoices', to='patients.patient')),
+            ],
+            options={
+                'db_table': 'billing_invoice',
+            },
+        ),
+        migrations.CreateModel(
+            name='InvoiceLine',
+            fields=[
+                ('created_at', models.DateTimeField(auto_now_add=True, db_index=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('tenant_id', models.UUIDField(db_index=True)),
+                ('facility_id', models.UUIDField(db_index=True)),
+                ('chargeable_code', models.SlugField(blank=True, max_length=64)),
+                ('description', models.CharField(max_length=255)),
+                ('quantity', models.DecimalField(decimal_places=2, default=Decimal('1.00'), max_digits=10)),
+                ('unit_price', models.DecimalField(decimal_places=2, default=Decimal('0.00'), max_digits=12)),
+                ('line_total', models.DecimalField(decimal_places=2, default=Decimal('0.00'), max_digits=12)),
+                ('tax_percent', models.DecimalField(decimal_places=2, default=Decimal('0.00'), max_digits=5)),
+                ('tax_amount', models.DecimalField(decimal_places=2, default=Decimal('0.00'), max_digits=12)),
+                ('billable_event', models.OneToOneField(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='invoice_line', to='billing.billableevent')),
+                ('invoice', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='lines', to='billing.invoice')),
+            ],
+            options={
+                'db_table': 'billing_invoice_line',
+            },
+        ),
+        migrations.CreateModel(
+            name='InvoiceNumberSequence',
+            fields=[
+                ('created_at', models.DateTimeField(auto_now_add=True, db_index=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('tenant_id', models.UUIDField(db_index=True)),
+                ('facility_id', models.UUIDField(db_index=True)),
+                ('series', models.SlugField(default='INV', max_length=32)),
+                ('period', models.CharField(blank=True, default='', max_length=8)),
+                ('last_value', models.BigIntegerField(default=0)),
+            ],
+            options={
+                'db_table': 'billing_invoice_number_sequence',
+                'constraints': [models.UniqueConstraint(fields=('tenant_id', 'facility_id', 'series', 'period'), name='uq_invoice_number_sequence_scope')],
+            },
+        ),
+        migrations.CreateModel(
+            name='Payment',
+            fields=[
+                ('created_at', models.DateTimeField(auto_now_add=True, db_index=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('tenant_id', models.UUIDField(db_index=True)),
+                ('facility_id', models.UUIDField(db_index=True)),
+                ('amount', models.DecimalField(decimal_places=2, max_digits=12)),
+                ('method', models.CharField(choices=[('CASH', 'Cash'), ('CARD', 'Card'), ('UPI', 'UPI'), ('BANK', 'Bank Transfer'), ('INSURANCE', 'Insurance'), ('OTHER', 'Other')], default='CASH', max_length=32)),
+                ('reference', models.CharField(blank=True, max_length=64)),
+                ('received_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('recorded_by_user_id', models.IntegerField(blank=True, null=True)),
+                ('invoice', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='payments', to='billing.invoice')),
+            ],
+            options={
+                'db_table': 'billing_payment',
+            },
+        ),
+        migrations.AddIndex(
+            model_name='billableevent',
+            index=models.Index(fields=['tenant_id', 'facility_id', 'encounter'], name='billing_bil_tenant__db1d42_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='invoice',
+            index=models.Index(fields=['tenant_id', 'facility_id', 'status', 'created_at'], name='billing_inv_tenant__bc39fb_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='invoice',
+            index=models.Index(fields=['tenant_id', 'facility_id', 'patient', 'created_at'], name='billing_inv_tenant__b917bf_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='invoice',
+            index=models.Index(fields=['tenant_id', 'facility_id', 'encounter', 'created_at'], name='billing_inv_tenant__47c94b_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='invoice',
+            constraint=models.UniqueConstraint(condition=models.Q(('invoice_number', ''), _negated=True), fields=('tenant_id', 'facility_id', 'invoice_number'), name='uq_invoice_scope_number'),
+        ),
+        migrations.AddIndex(
+            model_name='invoiceline',
+            index=models.Index(fields=['tenant_id', 'facility_id', 'invoice'], name='billing_inv_tenant__2562ba_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='payment',
+            index=models.Index(fields=['tenant_id', 'facility_id', 'invoice', 'received_at'], name='billing_pay_tenant__d19282_idx'),
+        ),
+    ]
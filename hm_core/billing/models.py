@@ -4,6 +4,7 @@ from __future__ import annotations
 from decimal import Decimal
 
 from django.db import models
+from django.db.models import Q
 from django.utils import timezone
 
 from hm_core.common.models import ScopedModel
@@ -80,8 +81,10 @@ class Invoice(ScopedModel):
     class Meta:
         db_table = "billing_invoice"
         constraints = [
+            # drafts have no number yet (""); only assigned numbers must be unique
             models.UniqueConstraint(
                 fields=["tenant_id", "facility_id", "invoice_number"],
+                condition=~Q(invoice_number=""),
                 name="uq_invoice_scope_number",
             )
         ]
@@ -96,6 +99,26 @@ class Invoice(ScopedModel):
         self.voided_at = timezone.now()
 
 
+class InvoiceNumberSequence(ScopedModel):
+    """
+    Invoice number counter per (tenant, facility, series, period).
+    Allocated by hm_core.billing.numbering with one UPDATE ... RETURNING;
+    period is "" for never-resetting series or the year (e.g. "2026") for yearly ones.
+    """
+    series = models.SlugField(max_length=32, default="INV")
+    period = models.CharField(max_length=8, blank=True, default="")
+    last_value = models.BigIntegerField(default=0)
+
+    class Meta:
+        db_table = "billing_invoice_number_sequence"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["tenant_id", "facility_id", "series", "period"],
+                name="uq_invoice_number_sequence_scope",
+            )
+        ]
+
+
 class InvoiceLine(ScopedModel):
     """
     Snapshot line item. Optionally linked to a BillableEvent to enforce 'billed once'.
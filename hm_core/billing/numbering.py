@@ -0,0 +1,188 @@
+# backend/hm_core/billing/numbering.py
+"""
+Invoice number allocation.
+
+Numbers come from InvoiceNumberSequence - one counter row per (tenant, facility,
+series, period) - advanced with a single atomic statement:
+
+    UPDATE billing_invoice_number_sequence SET last_value = last_value + n ... RETURNING last_value
+
+Issuing no longer locks invoice rows or parses the latest number, and different
+facilities / series never wait on each other. The first allocation of a counter
+INSERTs it (ON CONFLICT DO UPDATE for racing creators), seeded past the numbers
+already issued by the previous "INV-nnnnnn" scheme.
+
+Settings (BILLING_INVOICE_NUMBERING):
+  SERIES      default series ("INV")
+  FORMAT      str.format template over {series}, {year}, {number}; default
+              "{series}-{number:06d}", e.g. "{series}/{year}/{number:05d}" for yearly series
+  RESET       "never" | "yearly" (one counter per calendar year, facility-local date;
+              FORMAT must then contain {year})
+  BLOCK_SIZE  1 (default): one counter update per number, inside the issuing
+              transaction, so numbering stays gapless (a rollback returns the number).
+              N > 1: a worker reserves N numbers per update and hands out the rest from
+              memory once its transaction has committed - N times fewer counter updates,
+              at the cost of gaps (reserved numbers die with the process) and numbers
+              that are not strictly in issue order across workers.
+"""
+
+from __future__ import annotations
+
+import string
+import threading
+import uuid
+from collections import deque
+from datetime import date
+from typing import Optional
+from uuid import UUID
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.db import connection, transaction
+from django.utils import timezone
+
+from hm_core.billing.models import Invoice, InvoiceNumberSequence
+from hm_core.facilities.facility_settings import get_facility_settings
+
+RESET_NEVER = "never"
+RESET_YEARLY = "yearly"
+
+DEFAULTS = {
+    "SERIES": "INV",
+    "FORMAT": "{series}-{number:06d}",
+    "RESET": RESET_NEVER,
+    "BLOCK_SIZE": 1,
+}
+
+# numbers of the scheme used before sequences (latest invoice's number + 1)
+LEGACY_FIRST_NUMBER = "INV-000001"
+LEGACY_NUMBER_REGEX = r"^INV-[0-9]{6}$"
+
+_lock = threading.Lock()
+_reserved: dict[tuple, deque] = {}
+
+
+def _config() -> dict:
+    cfg = {**DEFAULTS, **getattr(settings, "BILLING_INVOICE_NUMBERING", {})}
+    fields = {name for _, name, _, _ in string.Formatter().parse(cfg["FORMAT"]) if name}
+    if cfg["RESET"] == RESET_YEARLY and "year" not in fields:
+        # counters restart every year: without the year numbers repeat and
+        # collide on uq_invoice_scope_number
+        raise ImproperlyConfigured(
+            "BILLING_INVOICE_NUMBERING FORMAT must contain {year} when RESET is 'yearly'."
+        )
+    return cfg
+
+
+def clear_reserved() -> None:
+    """
+    Drop this process' reserved blocks (tests, settings changes).
+    """
+    with _lock:
+        _reserved.clear()
+
+
+def _period(reset: str, on: date) -> str:
+    if reset == RESET_NEVER:
+        return ""
+    if reset == RESET_YEARLY:
+        return str(on.year)
+    raise ImproperlyConfigured(f"BILLING_INVOICE_NUMBERING RESET must be {RESET_NEVER!r} or {RESET_YEARLY!r}.")
+
+
+def _take_reserved(key: tuple) -> Optional[int]:
+    with _lock:
+        numbers = _reserved.get(key)
+        return numbers.popleft() if numbers else None
+
+
+def _release(key: tuple, numbers: range) -> None:
+    with _lock:
+        _reserved.setdefault(key, deque()).extend(numbers)
+
+
+def _legacy_seed(*, tenant_id: UUID, facility_id: UUID, fmt: str, series: str) -> int:
+    """
+    Highest number issued by the legacy scheme, when this format continues it.
+    """
+    if fmt.format(series=series, year=0, number=1) != LEGACY_FIRST_NUMBER:
+        return 0
+    latest = (
+        Invoice.objects.filter(tenant_id=tenant_id, facility_id=facility_id, invoice_number__regex=LEGACY_NUMBER_REGEX)
+        .order_by("-invoice_number")
+        .values_list("invoice_number", flat=True)
+        .first()
+    )
+    return int(latest[len("INV-"):]) if latest else 0
+
+
+def _advance(*, tenant_id: UUID, facility_id: UUID, series: str, period: str, count: int, fmt: str) -> int:
+    """
+    Reserve `count` numbers of a counter; returns the last one.
+    """
+    qn = connection.ops.quote_name
+    table = qn(InvoiceNumberSequence._meta.db_table)
+    ts = timezone.now()
+    scope = [UUID(str(tenant_id)), UUID(str(facility_id)), series, period]
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"UPDATE {table} SET last_value = last_value + %s, updated_at = %s "
+            "WHERE tenant_id = %s AND facility_id = %s AND series = %s AND period = %s "
+            "RETURNING last_value",
+            [count, ts, *scope],
+        )
+        row = cursor.fetchone()
+        if row:
+            return row[0]
+
+        seed = _legacy_seed(tenant_id=scope[0], facility_id=scope[1], fmt=fmt, series=series) if not period else 0
+        cursor.execute(
+            f"INSERT INTO {table} AS s (id, tenant_id, facility_id, series, period, last_value, created_at, updated_at) "
+            "VALUES (%s, %s, %s, %s, %s, %s, %s, %s) "
+            "ON CONFLICT (tenant_id, facility_id, series, period) "
+            "DO UPDATE SET last_value = s.last_value + %s, updated_at = EXCLUDED.updated_at "
+            "RETURNING last_value",
+            [uuid.uuid4(), *scope, seed + count, ts, ts, count],
+        )
+        return cursor.fetchone()[0]
+
+
+def next_invoice_number(
+    *,
+    tenant_id: UUID,
+    facility_id: UUID,
+    series: Optional[str] = None,
+    on: Optional[date] = None,
+) -> str:
+    """
+    Allocate the next invoice number of a facility's series (call inside the
+    issuing transaction).
+    """
+    cfg = _config()
+    series = series or cfg["SERIES"]
+    if on is None:
+        tz = get_facility_settings(tenant_id=tenant_id, facility_id=facility_id).tzinfo
+        on = timezone.localdate(timezone=tz)
+    period = _period(cfg["RESET"], on)
+    key = (str(tenant_id), str(facility_id), series, period)
+
+    number = _take_reserved(key)
+    if number is None:
+        block = max(1, int(cfg["BLOCK_SIZE"]))
+        last = _advance(
+            tenant_id=tenant_id,
+            facility_id=facility_id,
+            series=series,
+            period=period,
+            count=block,
+            fmt=cfg["FORMAT"],
+        )
+        number = last - block + 1
+        if block > 1:
+            # only committed reservations may be handed out: a rolled-back block
+            # is re-reserved by the next update
+            rest = range(number + 1, last + 1)
+            transaction.on_commit(lambda: _release(key, rest))
+
+    return cfg["FORMAT"].format(series=series, year=on.year, number=number)
@@ -1,14 +1,17 @@
 # backend/hm_core/billing/services.py
 from __future__ import annotations
 
-import re
+from dataclasses import dataclass, field
 from decimal import Decimal
 from uuid import UUID
 
 from django.db import transaction
+from django.db.models import DecimalField, Exists, OuterRef, Subquery, Sum, Value
+from django.db.models.functions import Coalesce
 from django.utils import timezone
 from rest_framework.exceptions import ValidationError
 
+from hm_core.billing import numbering
 from hm_core.billing.models import (
     BillableEvent,
     Invoice,
@@ -17,6 +20,18 @@ from hm_core.billing.models import (
     Payment,
     PaymentMethod,
 )
+from hm_core.charges.selectors import get_active_charge_items
+from hm_core.facilities.facility_settings import get_facility_settings
+
+
+MONEY = DecimalField(max_digits=12, decimal_places=2)
+
+
+@dataclass(frozen=True)
+class TotalsCheck:
+    scanned: int
+    drifted: list[UUID] = field(default_factory=list)
+    repaired: int = 0
 
 
 class InvoiceService:
@@ -51,26 +66,124 @@ class InvoiceService:
         if invoice.status != InvoiceStatus.DRAFT:
             raise ValidationError({"invoice": "Invoice is not editable unless in DRAFT status."})
 
+    @staticmethod
+    def _expected_totals(invoice: Invoice, *, subtotal: Decimal, tax_total: Decimal) -> dict:
+        """
+        Totals implied by line sums: grand_total / balance_due derived from the
+        invoice's discount and payments.
+        """
+        subtotal = subtotal.quantize(Decimal("0.01"))
+        tax_total = tax_total.quantize(Decimal("0.01"))
+        grand_total = (subtotal - (invoice.discount_total or Decimal("0.00")) + tax_total).quantize(Decimal("0.01"))
+        balance_due = (grand_total - (invoice.amount_paid or Decimal("0.00"))).quantize(Decimal("0.01"))
+        if invoice.status == InvoiceStatus.PAID and balance_due < 0:
+            # record_payment clamps overpayment to a zero balance
+            balance_due = Decimal("0.00")
+        return {
+            "subtotal": subtotal,
+            "tax_total": tax_total,
+            "grand_total": grand_total,
+            "balance_due": balance_due,
+        }
+
+    @staticmethod
+    def _set_totals(invoice: Invoice, *, subtotal: Decimal, tax_total: Decimal) -> None:
+        totals = InvoiceService._expected_totals(invoice, subtotal=subtotal, tax_total=tax_total)
+        for name, value in totals.items():
+            setattr(invoice, name, value)
+        invoice.save(update_fields=[*totals, "updated_at"])
+
+    @staticmethod
+    def _add_to_totals(invoice: Invoice, *, line_total: Decimal, tax_amount: Decimal) -> None:
+        """
+        Incremental totals: add new line amounts (one line or the sum of a batch)
+        to the stored totals - O(1) whatever the number of lines.
+
+        The caller must hold the invoice row lock (select_for_update) and have
+        read the invoice under it, so the stored totals are current.
+        """
+        InvoiceService._set_totals(
+            invoice,
+            subtotal=(invoice.subtotal or Decimal("0.00")) + line_total,
+            tax_total=(invoice.tax_total or Decimal("0.00")) + tax_amount,
+        )
+
+    @staticmethod
+    def _line_sums():
+        return {
+            "line_subtotal": Coalesce(Sum("line_total"), Value(Decimal("0.00")), output_field=MONEY),
+            "line_tax_total": Coalesce(Sum("tax_amount"), Value(Decimal("0.00")), output_field=MONEY),
+        }
+
     @staticmethod
     def _recalc_totals(invoice: Invoice) -> None:
-        lines = InvoiceLine.objects.filter(
+        """
+        Full recomputation from the lines (one SUM aggregate): issue() and drift repair.
+        """
+        sums = InvoiceLine.objects.filter(
             tenant_id=invoice.tenant_id,
             facility_id=invoice.facility_id,
             invoice=invoice,
-        )
-
-        subtotal = sum((l.line_total for l in lines), Decimal("0.00"))
-        tax_total = sum((l.tax_amount for l in lines), Decimal("0.00"))
-
-        discount_total = invoice.discount_total or Decimal("0.00")
-        grand_total = subtotal - discount_total + tax_total
+        ).aggregate(**InvoiceService._line_sums())
 
-        invoice.subtotal = subtotal.quantize(Decimal("0.01"))
-        invoice.tax_total = tax_total.quantize(Decimal("0.01"))
-        invoice.grand_total = grand_total.quantize(Decimal("0.01"))
-        invoice.balance_due = (invoice.grand_total - (invoice.amount_paid or Decimal("0.00"))).quantize(Decimal("0.01"))
+        InvoiceService._set_totals(invoice, subtotal=sums["line_subtotal"], tax_total=sums["line_tax_total"])
 
-        invoice.save(update_fields=["subtotal", "tax_total", "grand_total", "balance_due", "updated_at"])
+    @staticmethod
+    def verify_totals(
+        *,
+        tenant_id: UUID | None = None,
+        facility_id: UUID | None = None,
+        repair: bool = False,
+        chunk_size: int = 500,
+    ) -> TotalsCheck:
+        """
+        Compare stored invoice totals against their lines (optionally for one
+        tenant/facility). Walks invoices in pk order (keyset), one annotated query
+        per chunk (line sums as subqueries). With repair=True each drifted invoice
+        is locked and recomputed (_recalc_totals).
+        """
+        sums = (
+            InvoiceLine.objects.filter(invoice=OuterRef("pk"))
+            .order_by()
+            .values("invoice")
+            .annotate(**InvoiceService._line_sums())
+        )
+        qs = Invoice.objects.annotate(
+            line_subtotal=Coalesce(Subquery(sums.values("line_subtotal")), Value(Decimal("0.00")), output_field=MONEY),
+            line_tax_total=Coalesce(Subquery(sums.values("line_tax_total")), Value(Decimal("0.00")), output_field=MONEY),
+        )
+        if tenant_id:
+            qs = qs.filter(tenant_id=tenant_id)
+        if facility_id:
+            qs = qs.filter(facility_id=facility_id)
+        qs = qs.order_by("pk")
+
+        scanned = 0
+        drifted: list[UUID] = []
+        last_pk = None
+        while True:
+            chunk = list((qs if last_pk is None else qs.filter(pk__gt=last_pk))[:chunk_size])
+            if not chunk:
+                break
+            last_pk = chunk[-1].pk
+            scanned += len(chunk)
+
+            for inv in chunk:
+                expected = InvoiceService._expected_totals(
+                    inv, subtotal=inv.line_subtotal, tax_total=inv.line_tax_total
+                )
+                if any(getattr(inv, name) != value for name, value in expected.items()):
+                    drifted.append(inv.pk)
+
+        repaired = 0
+        if repair:
+            for invoice_id in drifted:
+                with transaction.atomic():
+                    invoice = Invoice.objects.select_for_update().get(pk=invoice_id)
+                    InvoiceService._recalc_totals(invoice)
+                repaired += 1
+
+        return TotalsCheck(scanned=scanned, drifted=drifted, repaired=repaired)
 
     @staticmethod
     @transaction.atomic
@@ -140,9 +253,36 @@ class InvoiceService:
             tax_amount=tax_amount,
         )
 
-        InvoiceService._recalc_totals(invoice)
+        InvoiceService._add_to_totals(invoice, line_total=line.line_total, tax_amount=line.tax_amount)
         return line
 
+    @staticmethod
+    def _line_amounts(
+        *,
+        quantity: Decimal,
+        list_unit_price: Decimal,
+        tax_percent: Decimal,
+        price_includes_tax: bool,
+    ) -> tuple[Decimal, Decimal, Decimal]:
+        """
+        (unit_price, line_total, tax_amount) for a list price. With
+        price_includes_tax the gross amount is split into base + tax.
+        """
+        list_unit_price = Decimal(str(list_unit_price)).quantize(Decimal("0.01"))
+        tax_percent = Decimal(str(tax_percent)).quantize(Decimal("0.01"))
+
+        if price_includes_tax and tax_percent > Decimal("0.00"):
+            gross_line_total = (quantity * list_unit_price).quantize(Decimal("0.01"))
+            divisor = Decimal("1.00") + (tax_percent / Decimal("100.00"))
+            line_total = (gross_line_total / divisor).quantize(Decimal("0.01"))
+            tax_amount = (gross_line_total - line_total).quantize(Decimal("0.01"))
+            unit_price = (line_total / quantity).quantize(Decimal("0.01")) if quantity > 0 else Decimal("0.00")
+            return unit_price, line_total, tax_amount
+
+        line_total = (quantity * list_unit_price).quantize(Decimal("0.01"))
+        tax_amount = (line_total * tax_percent / Decimal("100.00")).quantize(Decimal("0.01"))
+        return list_unit_price, line_total, tax_amount
+
     @staticmethod
     @transaction.atomic
     def generate_from_billable_events(
@@ -154,6 +294,15 @@ class InvoiceService:
         patient_id: UUID | None = None,
         default_unit_price: Decimal = Decimal("0.00"),
     ) -> int:
+        """
+        Bill every not-yet-billed event of the encounter (or patient) in a fixed
+        number of queries: unbilled events (anti-join), the facility tax mode, one
+        bulk INSERT of lines and one totals update.
+
+        Events with an active charge item (cached charge catalog, no query when
+        warm) are priced from it (honouring the facility's pricing_tax_mode);
+        others get default_unit_price, untaxed.
+        """
         invoice = Invoice.objects.select_for_update().get(id=invoice_id, tenant_id=tenant_id, facility_id=facility_id)
         InvoiceService._ensure_editable(invoice)
 
@@ -169,57 +318,63 @@ class InvoiceService:
         else:
             qs = qs.filter(encounter__patient_id=eff_patient_id)
 
-        qs = qs.order_by("created_at")
+        # anti-join: only events without an invoice line (billed once)
+        qs = qs.filter(~Exists(InvoiceLine.objects.filter(billable_event=OuterRef("pk")))).order_by("created_at")
+        events = list(qs)
+        if not events:
+            return 0
 
-        created = 0
-        for ev in qs:
-            if hasattr(ev, "invoice_line") and ev.invoice_line is not None:
-                continue
+        charges = get_active_charge_items(
+            tenant_id=tenant_id,
+            facility_id=facility_id,
+            codes={ev.chargeable_code for ev in events},
+        )
+        inclusive = get_facility_settings(tenant_id=tenant_id, facility_id=facility_id).prices_include_tax
+        default_unit_price = Decimal(str(default_unit_price)).quantize(Decimal("0.01"))
 
+        lines = []
+        for ev in events:
             qty = Decimal(str(ev.quantity)).quantize(Decimal("0.01"))
-            unit_price = Decimal(str(default_unit_price)).quantize(Decimal("0.01"))
-            line_total = (qty * unit_price).quantize(Decimal("0.01"))
-
-            tax_percent = Decimal("0.00")
-            tax_amount = Decimal("0.00")
-
-            InvoiceLine.objects.create(
-                tenant_id=tenant_id,
-                facility_id=facility_id,
-                invoice=invoice,
-                billable_event=ev,
-                chargeable_code=ev.chargeable_code,
-                description=f"{ev.chargeable_code}",
-                quantity=qty,
-                unit_price=unit_price,
-                line_total=line_total,
-                tax_percent=tax_percent,
-                tax_amount=tax_amount,
+            charge = charges.get(ev.chargeable_code)
+            if charge:
+                # charge master price, same pricing as the auto-attach signal
+                unit_price, line_total, tax_amount = InvoiceService._line_amounts(
+                    quantity=qty,
+                    list_unit_price=charge.default_price,
+                    tax_percent=charge.tax_percent,
+                    price_includes_tax=inclusive,
+                )
+                tax_percent = charge.tax_percent
+                description = (charge.name or ev.chargeable_code)[:255]
+            else:
+                unit_price = default_unit_price
+                line_total = (qty * unit_price).quantize(Decimal("0.01"))
+                tax_percent = tax_amount = Decimal("0.00")
+                description = ev.chargeable_code
+
+            lines.append(
+                InvoiceLine(
+                    tenant_id=tenant_id,
+                    facility_id=facility_id,
+                    invoice=invoice,
+                    billable_event=ev,
+                    chargeable_code=ev.chargeable_code,
+                    description=description,
+                    quantity=qty,
+                    unit_price=unit_price,
+                    line_total=line_total,
+                    tax_percent=tax_percent,
+                    tax_amount=tax_amount,
+                )
             )
-            created += 1
-
-        InvoiceService._recalc_totals(invoice)
-        return created
 
-    @staticmethod
-    def _next_invoice_number_locked(*, tenant_id: UUID, facility_id: UUID) -> str:
-        latest = (
-            Invoice.objects.select_for_update()
-            .filter(tenant_id=tenant_id, facility_id=facility_id)
-            .exclude(invoice_number="")
-            .order_by("-created_at")
-            .first()
+        InvoiceLine.objects.bulk_create(lines)
+        InvoiceService._add_to_totals(
+            invoice,
+            line_total=sum((line.line_total for line in lines), Decimal("0.00")),
+            tax_amount=sum((line.tax_amount for line in lines), Decimal("0.00")),
         )
-
-        if not latest or not latest.invoice_number:
-            return "INV-000001"
-
-        m = re.match(r"INV-(\d{6})$", latest.invoice_number.strip())
-        if not m:
-            return f"INV-{timezone.now().strftime('%y%m%d%H%M%S')}"
-
-        n = int(m.group(1)) + 1
-        return f"INV-{n:06d}"
+        return len(lines)
 
     @staticmethod
     @transaction.atomic
@@ -240,9 +395,7 @@ class InvoiceService:
             raise ValidationError({"invoice": "Cannot issue an empty invoice."})
 
         if not invoice.invoice_number:
-            invoice.invoice_number = InvoiceService._next_invoice_number_locked(
-                tenant_id=tenant_id, facility_id=facility_id
-            )
+            invoice.invoice_number = numbering.next_invoice_number(tenant_id=tenant_id, facility_id=facility_id)
 
         invoice.status = InvoiceStatus.ISSUED
         invoice.issued_at = timezone.now()
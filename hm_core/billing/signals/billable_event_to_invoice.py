@@ -10,7 +10,7 @@ from django.dispatch import receiver
 from hm_core.billing.models import BillableEvent, Invoice, InvoiceLine, InvoiceStatus
 from hm_core.billing.services import InvoiceService
 from hm_core.charges.selectors import get_active_charge_item
-from hm_core.facilities.models import Facility, PricingTaxMode
+from hm_core.facilities.facility_settings import get_facility_settings
 
 
 @receiver(post_save, sender=BillableEvent)
@@ -76,12 +76,7 @@ def auto_attach_billable_event_to_invoice(sender, instance: BillableEvent, creat
 
         qty = Decimal(str(instance.quantity)).quantize(Decimal("0.01"))
 
-        facility = (
-            Facility.objects.filter(tenant_id=tenant_id, id=facility_id)
-            .only("pricing_tax_mode")
-            .first()
-        )
-        pricing_tax_mode = facility.pricing_tax_mode if facility else PricingTaxMode.EXCLUSIVE
+        price_includes_tax = get_facility_settings(tenant_id=tenant_id, facility_id=facility_id).prices_include_tax
 
         charge = get_active_charge_item(
             tenant_id=tenant_id,
@@ -98,19 +93,14 @@ def auto_attach_billable_event_to_invoice(sender, instance: BillableEvent, creat
             tax_percent = Decimal("0.00")
             description = str(instance.chargeable_code)[:255]
 
-        if pricing_tax_mode == PricingTaxMode.INCLUSIVE and tax_percent > Decimal("0.00"):
-            gross_line_total = (qty * list_unit_price).quantize(Decimal("0.01"))
-            divisor = (Decimal("1.00") + (tax_percent / Decimal("100.00")))
-            base_line_total = (gross_line_total / divisor).quantize(Decimal("0.01"))
-            tax_amount = (gross_line_total - base_line_total).quantize(Decimal("0.01"))
-            unit_price = (base_line_total / qty).quantize(Decimal("0.01")) if qty > 0 else Decimal("0.00")
-            line_total = base_line_total
-        else:
-            unit_price = list_unit_price
-            line_total = (qty * unit_price).quantize(Decimal("0.01"))
-            tax_amount = (line_total * tax_percent / Decimal("100.00")).quantize(Decimal("0.01"))
+        unit_price, line_total, tax_amount = InvoiceService._line_amounts(
+            quantity=qty,
+            list_unit_price=list_unit_price,
+            tax_percent=tax_percent,
+            price_includes_tax=price_includes_tax,
+        )
 
-        InvoiceLine.objects.get_or_create(
+        line, line_created = InvoiceLine.objects.get_or_create(
             tenant_id=tenant_id,
             facility_id=facility_id,
             billable_event=instance,
@@ -126,4 +116,6 @@ def auto_attach_billable_event_to_invoice(sender, instance: BillableEvent, creat
             },
         )
 
-        InvoiceService._recalc_totals(invoice)
+        # new invoice (created above in this transaction): totals are just this line
+        if line_created:
+            InvoiceService._add_to_totals(invoice, line_total=line.line_total, tax_amount=line.tax_amount)
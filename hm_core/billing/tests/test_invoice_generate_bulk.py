@@ -0,0 +1,118 @@
+# backend/hm_core/billing/tests/test_invoice_generate_bulk.py
+from decimal import Decimal
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from hm_core.billing.models import BillableEvent, InvoiceLine
+from hm_core.billing.services import InvoiceService
+from hm_core.charges import catalog
+from hm_core.charges.services import ChargeItemService
+from hm_core.facilities.facility_settings import get_facility_settings
+from hm_core.facilities.models import PricingTaxMode
+from hm_core.orders.models import Order, OrderItem, OrderPriority, OrderType
+
+
+def _events(tenant, facility, encounter, codes):
+    order = Order.objects.create(
+        tenant_id=tenant.id,
+        facility_id=facility.id,
+        encounter=encounter,
+        order_type=OrderType.LAB,
+    )
+    items = OrderItem.objects.bulk_create(
+        [
+            OrderItem(
+                tenant_id=tenant.id,
+                facility_id=facility.id,
+                order=order,
+                encounter=encounter,
+                service_code=code,
+                priority=OrderPriority.ROUTINE,
+            )
+            for code in codes
+        ]
+    )
+    # bulk_create: no post_save, so the auto-attach signal stays out of the way
+    return BillableEvent.objects.bulk_create(
+        [
+            BillableEvent(
+                tenant_id=tenant.id,
+                facility_id=facility.id,
+                encounter=encounter,
+                source_order_item=item,
+                chargeable_code=item.service_code,
+                quantity=2,
+            )
+            for item in items
+        ]
+    )
+
+
+def _generate(inv, encounter):
+    return InvoiceService.generate_from_billable_events(
+        tenant_id=inv.tenant_id,
+        facility_id=inv.facility_id,
+        invoice_id=inv.id,
+        encounter_id=encounter.id,
+        default_unit_price=Decimal("10.00"),
+    )
+
+
+@pytest.mark.django_db
+def test_generate_prices_from_charge_master_with_fallback(tenant, facility, patient, encounter):
+    facility.pricing_tax_mode = PricingTaxMode.INCLUSIVE
+    facility.save(update_fields=["pricing_tax_mode", "updated_at"])
+    ChargeItemService.upsert(
+        tenant_id=tenant.id,
+        facility_id=facility.id,
+        code="cbc",
+        name="Complete Blood Count",
+        default_price="118.00",
+        tax_percent="18.00",
+    )
+    inv = InvoiceService.create_draft(
+        tenant_id=tenant.id, facility_id=facility.id, patient_id=patient.id, encounter_id=encounter.id
+    )
+    _events(tenant, facility, encounter, ["cbc", "misc"])
+
+    assert _generate(inv, encounter) == 2
+
+    cbc = InvoiceLine.objects.get(invoice=inv, chargeable_code="cbc")
+    # inclusive: gross 2 * 118 = 236 -> base 200 + tax 36
+    assert (cbc.description, cbc.unit_price, cbc.line_total, cbc.tax_amount) == (
+        "Complete Blood Count",
+        Decimal("100.00"),
+        Decimal("200.00"),
+        Decimal("36.00"),
+    )
+    misc = InvoiceLine.objects.get(invoice=inv, chargeable_code="misc")
+    assert (misc.unit_price, misc.line_total, misc.tax_amount) == (Decimal("10.00"), Decimal("20.00"), Decimal("0.00"))
+
+    inv.refresh_from_db()
+    assert (inv.subtotal, inv.tax_total, inv.grand_total) == (Decimal("220.00"), Decimal("36.00"), Decimal("256.00"))
+
+
+@pytest.mark.django_db
+def test_generate_query_count_does_not_grow_with_events(tenant, facility, patient, encounter):
+    inv = InvoiceService.create_draft(
+        tenant_id=tenant.id, facility_id=facility.id, patient_id=patient.id, encounter_id=encounter.id
+    )
+    _events(tenant, facility, encounter, [f"svc-{i}" for i in range(3)])
+    # warm caches: no catalog / facility query in either run
+    catalog.get_catalog(tenant_id=tenant.id, facility_id=facility.id)
+    get_facility_settings(tenant_id=tenant.id, facility_id=facility.id)
+    with CaptureQueriesContext(connection) as small:
+        assert _generate(inv, encounter) == 3
+
+    _events(tenant, facility, encounter, [f"svc-{i}" for i in range(3, 60)])
+    with CaptureQueriesContext(connection) as large:
+        assert _generate(inv, encounter) == 57
+
+    assert len(large.captured_queries) == len(small.captured_queries)
+    assert _generate(inv, encounter) == 0
+
+    inv.refresh_from_db()
+    assert inv.grand_total == Decimal("1200.00")  # 60 events * 2 * 10.00
+    assert InvoiceService.verify_totals(facility_id=facility.id).drifted == []
@@ -0,0 +1,99 @@
+# backend/hm_core/billing/tests/test_invoice_numbering.py
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from django.core.exceptions import ImproperlyConfigured
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from hm_core.billing import numbering
+from hm_core.billing.models import Invoice, InvoiceStatus
+from hm_core.billing.services import InvoiceService
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture(autouse=True)
+def _no_reserved_blocks():
+    numbering.clear_reserved()
+    yield
+    numbering.clear_reserved()
+
+
+def _issued(tenant, facility, patient):
+    inv = InvoiceService.create_draft(tenant_id=tenant.id, facility_id=facility.id, patient_id=patient.id)
+    InvoiceService.add_line(
+        tenant_id=tenant.id,
+        facility_id=facility.id,
+        invoice_id=inv.id,
+        description="Consultation",
+        unit_price=Decimal("100.00"),
+    )
+    return InvoiceService.issue(tenant_id=tenant.id, facility_id=facility.id, invoice_id=inv.id)
+
+
+def _next(tenant, facility, **kwargs):
+    return numbering.next_invoice_number(tenant_id=tenant.id, facility_id=facility.id, **kwargs)
+
+
+def test_issue_allocates_sequential_numbers_per_facility(tenant, facility, patient):
+    # several drafts may coexist now that only assigned numbers are unique
+    first = _issued(tenant, facility, patient)
+    second = _issued(tenant, facility, patient)
+
+    assert (first.invoice_number, second.invoice_number) == ("INV-000001", "INV-000002")
+
+
+def test_sequence_continues_after_legacy_numbers(tenant, facility, patient):
+    Invoice.objects.create(
+        tenant_id=tenant.id,
+        facility_id=facility.id,
+        patient=patient,
+        status=InvoiceStatus.ISSUED,
+        invoice_number="INV-000041",
+    )
+
+    assert _issued(tenant, facility, patient).invoice_number == "INV-000042"
+
+
+def test_allocation_is_one_statement(tenant, facility):
+    _next(tenant, facility)
+    with CaptureQueriesContext(connection) as ctx:
+        assert _next(tenant, facility) == "INV-000002"
+
+    assert len(ctx.captured_queries) == 1
+    assert ctx.captured_queries[0]["sql"].startswith("UPDATE")
+
+
+def test_yearly_format_resets_each_year(tenant, facility, settings):
+    settings.BILLING_INVOICE_NUMBERING = {"FORMAT": "{series}/{year}/{number:05d}", "RESET": "yearly"}
+
+    assert _next(tenant, facility, on=date(2026, 3, 1)) == "INV/2026/00001"
+    assert _next(tenant, facility, on=date(2026, 12, 31)) == "INV/2026/00002"
+    assert _next(tenant, facility, on=date(2027, 1, 1)) == "INV/2027/00001"
+    assert _next(tenant, facility, on=date(2027, 1, 2), series="CR") == "CR/2027/00001"
+
+
+def test_yearly_reset_requires_year_in_format(tenant, facility, settings):
+    # restarting the counter without {year} would reissue INV-000001 every January
+    settings.BILLING_INVOICE_NUMBERING = {"RESET": "yearly"}
+
+    with pytest.raises(ImproperlyConfigured):
+        _next(tenant, facility)
+
+
+def test_block_reservation_hands_out_committed_blocks(tenant, facility, settings, django_capture_on_commit_callbacks):
+    settings.BILLING_INVOICE_NUMBERING = {"BLOCK_SIZE": 3}
+
+    with django_capture_on_commit_callbacks(execute=True):
+        assert _next(tenant, facility) == "INV-000001"
+
+    with CaptureQueriesContext(connection) as ctx:
+        assert [_next(tenant, facility) for _ in range(2)] == ["INV-000002", "INV-000003"]
+    assert len(ctx.captured_queries) == 0
+
+    # block used up: next update reserves 4..6; not handed out without a commit
+    with django_capture_on_commit_callbacks(execute=False):
+        assert _next(tenant, facility) == "INV-000004"
+    assert _next(tenant, facility) == "INV-000007"
@@ -0,0 +1,75 @@
+# backend/hm_core/billing/tests/test_invoice_totals.py
+from decimal import Decimal
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from hm_core.billing.models import Invoice
+from hm_core.billing.services import InvoiceService
+
+
+def _draft(tenant, facility, patient):
+    return InvoiceService.create_draft(tenant_id=tenant.id, facility_id=facility.id, patient_id=patient.id)
+
+
+def _add(inv, price, tax="0.00"):
+    return InvoiceService.add_line(
+        tenant_id=inv.tenant_id,
+        facility_id=inv.facility_id,
+        invoice_id=inv.id,
+        description="svc",
+        quantity=Decimal("1.00"),
+        unit_price=Decimal(price),
+        tax_percent=Decimal(tax),
+    )
+
+
+@pytest.mark.django_db
+def test_add_line_maintains_totals_incrementally(tenant, facility, patient):
+    inv = _draft(tenant, facility, patient)
+    _add(inv, "100.00", tax="18.00")
+    _add(inv, "50.00")
+
+    inv.refresh_from_db()
+    assert inv.subtotal == Decimal("150.00")
+    assert inv.tax_total == Decimal("18.00")
+    assert inv.grand_total == Decimal("168.00")
+    assert inv.balance_due == Decimal("168.00")
+
+    # O(1): adding a line never reads the other lines back
+    with CaptureQueriesContext(connection) as ctx:
+        _add(inv, "10.00")
+    assert not [q for q in ctx.captured_queries if q["sql"].startswith('SELECT') and "billing_invoice_line" in q["sql"]]
+
+    inv.refresh_from_db()
+    assert inv.grand_total == Decimal("178.00")
+
+
+@pytest.mark.django_db
+def test_verify_totals_detects_and_repairs_drift(tenant, facility, patient):
+    good = _draft(tenant, facility, patient)
+    _add(good, "20.00")
+    bad = _draft(tenant, facility, patient)
+    _add(bad, "30.00", tax="10.00")
+    Invoice.objects.filter(id=bad.id).update(subtotal=Decimal("1.00"), grand_total=Decimal("1.00"))
+
+    check = InvoiceService.verify_totals(tenant_id=tenant.id, facility_id=facility.id, chunk_size=1)
+    assert check.scanned == 2
+    assert check.drifted == [bad.id]
+    assert check.repaired == 0
+
+    out = StringIO()
+    call_command("verify_invoice_totals", "--repair", "--facility-id", str(facility.id), stdout=out)
+    assert "Invoices repaired: 1" in out.getvalue()
+
+    bad.refresh_from_db()
+    assert (bad.subtotal, bad.tax_total, bad.grand_total, bad.balance_due) == (
+        Decimal("30.00"),
+        Decimal("3.00"),
+        Decimal("33.00"),
+        Decimal("33.00"),
+    )
+    assert InvoiceService.verify_totals(facility_id=facility.id).drifted == []
@@ -3,4 +3,8 @@ from django.apps import AppConfig
 
 class ChargesConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
-    name = "hm_core.charges"
\ No newline at end of file
+    name = "hm_core.charges"
+
+    def ready(self) -> None:
+        # charge catalog cache invalidation
+        from hm_core.charges import signals  # noqa: F401
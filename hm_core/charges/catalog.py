@@ -0,0 +1,110 @@
+# backend/hm_core/charges/catalog.py
+"""
+Per-facility charge catalog cache.
+
+Every billable event, manual invoice line and invoice generation prices codes
+against the charge master, which changes rarely. The active ChargeItems of a
+(tenant, facility) are loaded in one query into an immutable code -> ChargePrice
+map and kept per process, so pricing an invoice of any size costs zero catalog
+queries once the catalog is warm.
+
+Coherence uses a per-scope catalog version stamp (common.cache.StampedCache).
+Saving or deleting a ChargeItem (ChargeItemService.upsert, admin; see
+charges.signals) bumps it. QuerySet.update() / bulk_create() on ChargeItem send
+no signals: such bulk writes must call invalidate_on_commit() for their scope.
+
+Settings (optional, shape in common.cache):
+
+    CHARGE_CATALOG_CACHE = {
+        "BACKEND": "django",       # where version stamps live: "django" | "lru" | "none"
+        "TTL": 300,                # seconds a catalog is kept per process
+        "MAX_ENTRIES": 1000,       # catalogs (facilities) per process
+        "CACHE_ALIAS": "default",  # django only
+    }
+
+Price changes reach every worker through a shared CACHES[CACHE_ALIAS] (Redis);
+process-local stamps raise ImproperlyConfigured unless HM_SINGLE_PROCESS
+(common.cache), so workers never price from a stale copy unnoticed.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from decimal import Decimal
+from types import MappingProxyType
+from typing import Iterable, Mapping, Optional
+from uuid import UUID
+
+from hm_core.charges.models import ChargeItem
+from hm_core.common.cache import StampedCache
+
+DEFAULT_MAX_CATALOGS = 1000
+
+_cache = StampedCache(setting="CHARGE_CATALOG_CACHE", key_prefix="charges:catalog", max_entries=DEFAULT_MAX_CATALOGS)
+
+
+@dataclass(frozen=True)
+class ChargePrice:
+    """
+    Immutable price of one active charge item (field names match ChargeItem).
+    """
+
+    code: str
+    name: str
+    department: str
+    default_price: Decimal
+    tax_percent: Decimal
+
+
+def reset() -> None:
+    """
+    Drop backends and every loaded catalog (tests / settings overrides).
+    """
+    _cache.reset()
+
+
+def current_version(*, tenant_id, facility_id) -> int:
+    return _cache.version(tenant_id, facility_id)
+
+
+def _load(*, tenant_id: UUID, facility_id: UUID) -> Mapping[str, ChargePrice]:
+    rows = ChargeItem.objects.filter(tenant_id=tenant_id, facility_id=facility_id, is_active=True).values_list(
+        "code", "name", "department", "default_price", "tax_percent"
+    )
+    return MappingProxyType({row[0]: ChargePrice(*row) for row in rows})
+
+
+def get_catalog(*, tenant_id: UUID, facility_id: UUID) -> Mapping[str, ChargePrice]:
+    """
+    Read-only code -> ChargePrice map of a facility's active charge items, loaded
+    at most once per version stamp.
+    """
+    return _cache.get_or_build(
+        (tenant_id, facility_id),
+        "catalog",
+        lambda: _load(tenant_id=tenant_id, facility_id=facility_id),
+    )
+
+
+def resolve(*, tenant_id: UUID, facility_id: UUID, code: str) -> Optional[ChargePrice]:
+    return get_catalog(tenant_id=tenant_id, facility_id=facility_id).get(code)
+
+
+def resolve_many(*, tenant_id: UUID, facility_id: UUID, codes: Iterable[str]) -> dict[str, ChargePrice]:
+    """
+    Price a batch of codes against one catalog read; unknown/inactive codes are
+    left out of the result.
+    """
+    catalog = get_catalog(tenant_id=tenant_id, facility_id=facility_id)
+    return {code: catalog[code] for code in set(codes) if code in catalog}
+
+
+def invalidate(*, tenant_id, facility_id) -> None:
+    """
+    Force processes to reload the catalog of one (tenant, facility) scope.
+    """
+    _cache.invalidate(tenant_id, facility_id)
+
+
+def invalidate_on_commit(*, tenant_id, facility_id) -> None:
+    _cache.invalidate_on_commit(tenant_id, facility_id)
@@ -0,0 +1,37 @@
+# Generated by Django 5.2.9 on 2026-10-17 06:12
+
+import uuid
+from decimal import Decimal
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ChargeItem',
+            fields=[
+                ('created_at', models.DateTimeField(auto_now_add=True, db_index=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('tenant_id', models.UUIDField(db_index=True)),
+                ('facility_id', models.UUIDField(db_index=True)),
+                ('code', models.SlugField(max_length=64)),
+                ('name', models.CharField(max_length=255)),
+                ('department', models.CharField(blank=True, max_length=64)),
+                ('default_price', models.DecimalField(decimal_places=2, default=Decimal('0.00'), max_digits=12)),
+                ('tax_percent', models.DecimalField(decimal_places=2, default=Decimal('0.00'), max_digits=5)),
+                ('is_active', models.BooleanField(default=True)),
+            ],
+            options={
+                'db_table': 'charges_charge_item',
+                'indexes': [models.Index(fields=['tenant_id', 'facility_id', 'code'], name='charges_cha_tenant__3e5373_idx'), models.Index(fields=['tenant_id', 'facility_id', 'is_active'], name='charges_cha_tenant__b91273_idx')],
+                'constraints': [models.UniqueConstraint(fields=('tenant_id', 'facility_id', 'code'), name='uq_charge_item_scope_code')],
+            },
+        ),
+    ]
@@ -1,18 +1,22 @@
 from __future__ import annotations
 
+from typing import Iterable
 from uuid import UUID
 
-from hm_core.charges.models import ChargeItem
+from hm_core.charges import catalog
+from hm_core.charges.catalog import ChargePrice
 
 
-def get_active_charge_item(*, tenant_id: UUID, facility_id: UUID, code: str) -> ChargeItem | None:
-    return (
-        ChargeItem.objects.filter(
-            tenant_id=tenant_id,
-            facility_id=facility_id,
-            code=code,
-            is_active=True,
-        )
-        .order_by("-created_at")
-        .first()
-    )
+def get_active_charge_item(*, tenant_id: UUID, facility_id: UUID, code: str) -> ChargePrice | None:
+    """
+    Active price of one code, served from the cached facility catalog.
+    """
+    return catalog.resolve(tenant_id=tenant_id, facility_id=facility_id, code=code)
+
+
+def get_active_charge_items(*, tenant_id: UUID, facility_id: UUID, codes: Iterable[str]) -> dict[str, ChargePrice]:
+    """
+    Bulk form of get_active_charge_item: code -> active price, no queries once
+    the facility catalog is cached.
+    """
+    return catalog.resolve_many(tenant_id=tenant_id, facility_id=facility_id, codes=codes)
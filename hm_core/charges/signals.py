@@ -0,0 +1,17 @@
+# backend/hm_core/charges/signals.py
+from __future__ import annotations
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from hm_core.charges import catalog
+from hm_core.charges.models import ChargeItem
+
+
+@receiver(post_save, sender=ChargeItem, dispatch_uid="charges_catalog_item_save")
+@receiver(post_delete, sender=ChargeItem, dispatch_uid="charges_catalog_item_delete")
+def charge_item_changed(sender, instance: ChargeItem, **kwargs):
+    # Covers ChargeItemService.upsert, admin edits and instance save()/delete().
+    # QuerySet.update() and bulk_create() send no signals: callers of those must
+    # call catalog.invalidate_on_commit() themselves.
+    catalog.invalidate_on_commit(tenant_id=instance.tenant_id, facility_id=instance.facility_id)
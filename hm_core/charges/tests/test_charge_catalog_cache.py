@@ -0,0 +1,107 @@
+# backend/hm_core/charges/tests/test_charge_catalog_cache.py
+from decimal import Decimal
+
+import pytest
+from django.core.exceptions import ImproperlyConfigured
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from hm_core.billing.services import InvoiceService
+from hm_core.billing.tests.test_invoice_generate_bulk import _events
+from hm_core.charges import catalog
+from hm_core.charges.models import ChargeItem
+from hm_core.charges.selectors import get_active_charge_item, get_active_charge_items
+from hm_core.charges.services import ChargeItemService
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture(autouse=True)
+def _fresh_catalog():
+    catalog.reset()
+    yield
+    catalog.reset()
+
+
+def _upsert(tenant, facility, code, price, **kwargs):
+    return ChargeItemService.upsert(
+        tenant_id=tenant.id, facility_id=facility.id, code=code, name=code.upper(), default_price=price, **kwargs
+    )
+
+
+def test_catalog_loads_once_per_facility(tenant, facility, django_assert_num_queries):
+    for i in range(100):
+        _upsert(tenant, facility, f"svc-{i}", "10.00", tax_percent="5.00")
+
+    with django_assert_num_queries(1):
+        get_active_charge_item(tenant_id=tenant.id, facility_id=facility.id, code="svc-0")
+
+    with django_assert_num_queries(0):
+        prices = get_active_charge_items(
+            tenant_id=tenant.id, facility_id=facility.id, codes=[f"svc-{i}" for i in range(100)] + ["unknown"]
+        )
+        one = get_active_charge_item(tenant_id=tenant.id, facility_id=facility.id, code="svc-7")
+
+    assert len(prices) == 100
+    assert (one.name, one.default_price, one.tax_percent) == ("SVC-7", Decimal("10.00"), Decimal("5.00"))
+
+
+def test_upsert_bumps_catalog_version(tenant, facility):
+    _upsert(tenant, facility, "cbc", "100.00")
+    assert get_active_charge_item(tenant_id=tenant.id, facility_id=facility.id, code="cbc").default_price == Decimal(
+        "100.00"
+    )
+    version = catalog.current_version(tenant_id=tenant.id, facility_id=facility.id)
+
+    _upsert(tenant, facility, "cbc", "120.00")
+    assert catalog.current_version(tenant_id=tenant.id, facility_id=facility.id) != version
+    assert get_active_charge_item(tenant_id=tenant.id, facility_id=facility.id, code="cbc").default_price == Decimal(
+        "120.00"
+    )
+
+    _upsert(tenant, facility, "cbc", "120.00", is_active=False)
+    assert get_active_charge_item(tenant_id=tenant.id, facility_id=facility.id, code="cbc") is None
+
+
+def test_invoice_generation_does_not_query_warm_catalog(tenant, facility, patient, encounter):
+    for i in range(100):
+        _upsert(tenant, facility, f"svc-{i}", "10.00")
+    inv = InvoiceService.create_draft(
+        tenant_id=tenant.id, facility_id=facility.id, patient_id=patient.id, encounter_id=encounter.id
+    )
+    _events(tenant, facility, encounter, [f"svc-{i}" for i in range(100)])
+    catalog.get_catalog(tenant_id=tenant.id, facility_id=facility.id)
+
+    with CaptureQueriesContext(connection) as ctx:
+        created = InvoiceService.generate_from_billable_events(
+            tenant_id=tenant.id, facility_id=facility.id, invoice_id=inv.id, encounter_id=encounter.id
+        )
+
+    assert created == 100
+    assert not [q for q in ctx.captured_queries if "charges_charge_item" in q["sql"]]
+    inv.refresh_from_db()
+    assert inv.subtotal == Decimal("2000.00")  # 100 events * 2 * 10.00
+
+
+def test_queryset_update_needs_explicit_invalidation(tenant, facility):
+    item = _upsert(tenant, facility, "xray", "300.00")
+    get_active_charge_item(tenant_id=tenant.id, facility_id=facility.id, code="xray")
+
+    # no post_save: the cached catalog keeps the old price until invalidated
+    ChargeItem.objects.filter(id=item.id).update(default_price=Decimal("350.00"))
+    assert get_active_charge_item(tenant_id=tenant.id, facility_id=facility.id, code="xray").default_price == Decimal(
+        "300.00"
+    )
+
+    catalog.invalidate_on_commit(tenant_id=tenant.id, facility_id=facility.id)
+    assert get_active_charge_item(tenant_id=tenant.id, facility_id=facility.id, code="xray").default_price == Decimal(
+        "350.00"
+    )
+
+
+def test_process_local_stamps_need_single_process(settings, tenant, facility):
+    settings.HM_SINGLE_PROCESS = False  # CACHES["default"] is LocMemCache here
+    catalog.reset()
+
+    with pytest.raises(ImproperlyConfigured):
+        get_active_charge_item(tenant_id=tenant.id, facility_id=facility.id, code="xray")
@@ -0,0 +1,61 @@
+# Generated by Django 5.2.9 on 2026-10-17 06:12
+
+import django.db.models.deletion
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('encounters', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ClinicalDocument',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('tenant_id', models.UUIDField(db_index=True)),
+                ('facility_id', models.UUIDField(db_index=True)),
+                ('patient_id', models.UUIDField(db_index=True)),
+                ('encounter_id', models.UUIDField(db_index=True)),
+                ('template_code', models.CharField(db_index=True, max_length=100)),
+                ('version', models.PositiveIntegerField()),
+                ('idempotency_key', models.CharField(blank=True, db_index=True, max_length=255, null=True)),
+                ('status', models.CharField(choices=[('DRAFT', 'Draft'), ('FINAL', 'Final'), ('AMENDED', 'Amended')], db_index=True, max_length=16)),
+                ('supersedes_document_id', models.UUIDField(blank=True, db_index=True, null=True)),
+                ('payload', models.JSONField(default=dict)),
+                ('created_by_user_id', models.BigIntegerField(db_index=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'db_table': 'clinical_docs_clinical_document',
+                'indexes': [models.Index(fields=['encounter_id', 'template_code'], name='clinical_do_encount_f54a62_idx'), models.Index(fields=['encounter_id', 'created_at'], name='clinical_do_encount_10a266_idx'), models.Index(fields=['patient_id', 'created_at'], name='clinical_do_patient_f5ce67_idx'), models.Index(fields=['tenant_id', 'facility_id', 'encounter_id', 'created_at'], name='clinical_do_tenant__babb10_idx')],
+                'constraints': [models.UniqueConstraint(condition=models.Q(('status', 'DRAFT'), ('idempotency_key__isnull', False)), fields=('tenant_id', 'facility_id', 'encounter_id', 'template_code', 'idempotency_key'), name='uniq_doc_idempo_draft'), models.UniqueConstraint(condition=models.Q(('status', 'FINAL'), ('idempotency_key__isnull', False)), fields=('tenant_id', 'facility_id', 'supersedes_document_id', 'idempotency_key'), name='uniq_doc_idempo_finalize'), models.UniqueConstraint(condition=models.Q(('status', 'AMENDED'), ('idempotency_key__isnull', False)), fields=('tenant_id', 'facility_id', 'supersedes_document_id', 'idempotency_key'), name='uniq_doc_idempo_amend')],
+            },
+        ),
+        migrations.CreateModel(
+            name='EncounterDocument',
+            fields=[
+                ('created_at', models.DateTimeField(auto_now_add=True, db_index=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('tenant_id', models.UUIDField(db_index=True)),
+                ('facility_id', models.UUIDField(db_index=True)),
+                ('kind', models.CharField(choices=[('VITALS', 'Vitals'), ('ASSESSMENT', 'Assessment'), ('PLAN', 'Plan'), ('NOTE', 'Note')], db_index=True, max_length=32)),
+                ('content', models.JSONField(default=dict)),
+                ('authored_at', models.DateTimeField(auto_now_add=True, db_index=True)),
+                ('authored_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='authored_documents', to=settings.AUTH_USER_MODEL)),
+                ('encounter', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='documents', to='encounters.encounter')),
+            ],
+            options={
+                'db_table': 'clinical_docs_encounter_document',
+                'indexes': [models.Index(fields=['tenant_id', 'facility_id', 'encounter', 'kind'], name='clinical_do_tenant__6d6220_idx'), models.Index(fields=['tenant_id', 'facility_id', 'authored_at'], name='clinical_do_tenant__8acb43_idx')],
+            },
+        ),
+    ]
@@ -4,7 +4,7 @@ from django.dispatch import receiver
 from django.utils.timezone import now
 
 from hm_core.clinical_docs.models import EncounterDocument
-from hm_core.encounters.models import EncounterEvent
+from hm_core.encounters.signals._emit import emit_event
 
 
 @receiver(post_save, sender=EncounterDocument)
@@ -14,20 +14,17 @@ def doc_post_save(sender, instance: EncounterDocument, created: bool, **kwargs):
 
     ts = instance.authored_at or instance.created_at or now()
 
-    EncounterEvent.objects.get_or_create(
+    emit_event(
         tenant_id=instance.tenant_id,
         facility_id=instance.facility_id,
         encounter_id=instance.encounter_id,
         event_key=f"DOC_AUTHORED:{instance.id}",
-        defaults={
-            "type": "EVENT",
-            "code": "DOC_AUTHORED",
-            "title": "Document authored",
-            "timestamp": ts,
-            "meta": {
-                "document_id": str(instance.id),
-                "kind": instance.kind,
-                "authored_by_id": instance.authored_by_id,
-            },
+        code="DOC_AUTHORED",
+        title="Document authored",
+        timestamp=ts,
+        meta={
+            "document_id": str(instance.id),
+            "kind": instance.kind,
+            "authored_by_id": instance.authored_by_id,
         },
     )
@@ -0,0 +1,299 @@
+# backend/hm_core/common/cache.py
+"""
+Cache building blocks shared by the in-process caches (iam membership / roles /
+permission registry, rules.cache, charges.catalog, facilities.facility_settings).
+
+Backends (same get / set / delete / clear interface):
+  - LRUBackend:         thread-safe in-process LRU with per-entry expiry
+  - DjangoCacheBackend: Django's cache framework (CACHES[alias]: LocMem, Redis, ...)
+  - NullBackend:        caches nothing
+
+The settings dicts of those caches share one shape:
+
+    {
+        "BACKEND": "lru" | "django" | "none",
+        "TTL": 300,                # seconds
+        "MAX_ENTRIES": 10000,      # lru only
+        "CACHE_ALIAS": "default",  # django only
+    }
+
+StampedCache keeps immutable values per process, keyed with a per-scope version
+stamp read from the configured backend; invalidate() moves the stamp. A stamp
+only reaches other workers through a shared backend, i.e. "django" over a shared
+CACHES alias (Redis). With "lru", or "django" over LocMemCache, an invalidation
+would be seen by the process that made it only, so such stamp backends raise
+ImproperlyConfigured unless the deployment is declared single-process
+(settings.HM_SINGLE_PROCESS, or "SINGLE_PROCESS" in the cache's settings dict).
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Optional, TypeVar
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.db import transaction
+
+DEFAULT_TTL = 300
+DEFAULT_MAX_ENTRIES = 10000
+
+BACKEND_LRU = "lru"
+BACKEND_DJANGO = "django"
+BACKEND_NONE = "none"
+
+# Django cache backends that keep entries per process (or not at all)
+PROCESS_LOCAL_CACHE_BACKENDS = (
+    "django.core.cache.backends.locmem.LocMemCache",
+    "django.core.cache.backends.dummy.DummyCache",
+)
+
+T = TypeVar("T")
+
+_MISSING = object()
+
+
+class LRUBackend:
+    """
+    Thread-safe in-process LRU with per-entry expiry.
+    """
+
+    def __init__(self, *, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.max_entries = max(1, int(max_entries))
+        self._data: "OrderedDict[str, tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        with self._lock:
+            item = self._data.get(key, _MISSING)
+            if item is _MISSING:
+                return default
+            expires_at, value = item
+            if expires_at and expires_at <= time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any, timeout: Optional[int] = None) -> None:
+        expires_at = time.monotonic() + timeout if timeout else 0.0
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+class DjangoCacheBackend:
+    """
+    Adapter over Django's cache framework (LocMem, Redis, ...).
+    """
+
+    def __init__(self, *, alias: str = "default"):
+        self.alias = alias
+
+    @property
+    def _cache(self):
+        from django.core.cache import caches
+
+        return caches[self.alias]
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self._cache.get(key, default)
+
+    def set(self, key: str, value: Any, timeout: Optional[int] = None) -> None:
+        self._cache.set(key, value, timeout)
+
+    def delete(self, key: str) -> None:
+        self._cache.delete(key)
+
+    def clear(self) -> None:
+        # Never flush a shared cache; callers bump their global generation instead.
+        return None
+
+
+class NullBackend:
+    """
+    Disables caching (every lookup goes to the DB).
+    """
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return default
+
+    def set(self, key: str, value: Any, timeout: Optional[int] = None) -> None:
+        return None
+
+    def delete(self, key: str) -> None:
+        return None
+
+    def clear(self) -> None:
+        return None
+
+
+def backend_kind(cfg: dict, *, default: str = BACKEND_LRU) -> str:
+    return str(cfg.get("BACKEND", default)).lower()
+
+
+def build_backend(cfg: dict, *, default: str = BACKEND_LRU):
+    """
+    Build a backend from a cache settings dict (shape in the module docstring).
+    """
+    kind = backend_kind(cfg, default=default)
+
+    if kind == BACKEND_DJANGO:
+        return DjangoCacheBackend(alias=cfg.get("CACHE_ALIAS", "default"))
+    if kind == BACKEND_NONE:
+        return NullBackend()
+    return LRUBackend(max_entries=cfg.get("MAX_ENTRIES", DEFAULT_MAX_ENTRIES))
+
+
+def config_ttl(cfg: dict) -> int:
+    try:
+        return int(cfg.get("TTL", DEFAULT_TTL))
+    except (TypeError, ValueError):
+        return DEFAULT_TTL
+
+
+def is_single_process(cfg: dict) -> bool:
+    """
+    True when process-local stamps are acceptable: the cache's own SINGLE_PROCESS,
+    else settings.HM_SINGLE_PROCESS (dev server, tests).
+    """
+    return bool(cfg.get("SINGLE_PROCESS", getattr(settings, "HM_SINGLE_PROCESS", False)))
+
+
+def require_shared_cache(alias: str, *, setting: str, cfg: dict) -> None:
+    """
+    Raise ImproperlyConfigured when CACHES[alias] is process-local and the
+    deployment is not declared single-process.
+    """
+    backend = (settings.CACHES.get(alias) or {}).get("BACKEND", "")
+    if backend in PROCESS_LOCAL_CACHE_BACKENDS and not is_single_process(cfg):
+        raise ImproperlyConfigured(
+            f"{setting} needs a shared cache; CACHES[{alias!r}] is {backend}. "
+            "Configure a shared cache (e.g. Redis via REDIS_URL) or set HM_SINGLE_PROCESS "
+            "for a single-process deployment."
+        )
+
+
+def new_stamp() -> int:
+    """
+    Version / generation stamp. Wall-clock ns stamps avoid read-modify-write
+    races between workers (no increment of a shared counter).
+    """
+    return time.time_ns()
+
+
+def now_and_on_commit(func: Callable[[], None]) -> None:
+    """
+    Run an invalidation now (same-transaction reads) and again after commit, so
+    a concurrent request cannot re-cache the pre-commit state.
+    """
+    func()
+    transaction.on_commit(func)
+
+
+class StampedCache:
+    """
+    Per-process store of immutable values, invalidated per scope by version stamps
+    (see the module docstring for how far an invalidation reaches).
+
+    `setting` names the settings dict; its BACKEND chooses where stamps live and
+    defaults to "django" (CACHES[CACHE_ALIAS]), so a shared default cache makes
+    invalidation cross-worker without extra configuration. Process-local stamps
+    are rejected outside single-process deployments. BACKEND "none" disables
+    caching.
+    """
+
+    def __init__(self, *, setting: str, key_prefix: str, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.setting = setting
+        self.key_prefix = key_prefix
+        self.max_entries = max_entries
+        self._stamps = None
+        self._values = None
+        self._lock = threading.Lock()
+
+    def config(self) -> dict:
+        return getattr(settings, self.setting, {}) or {}
+
+    def stamps(self):
+        """
+        Backend holding the per-scope version stamps.
+        """
+        if self._stamps is None:
+            with self._lock:
+                if self._stamps is None:
+                    cfg = self.config()
+                    kind = backend_kind(cfg, default=BACKEND_DJANGO)
+                    if kind == BACKEND_DJANGO:
+                        require_shared_cache(cfg.get("CACHE_ALIAS", "default"), setting=self.setting, cfg=cfg)
+                    elif kind == BACKEND_LRU and not is_single_process(cfg):
+                        raise ImproperlyConfigured(
+                            f"{self.setting} BACKEND 'lru' keeps version stamps per process; "
+                            "use 'django' over a shared cache or set HM_SINGLE_PROCESS."
+                        )
+                    self._stamps = build_backend(cfg, default=BACKEND_DJANGO)
+        return self._stamps
+
+    def values(self):
+        """
+        Per-process store of the values (never pickled; entries are immutable).
+        """
+        if self._values is None:
+            with self._lock:
+                if self._values is None:
+                    cfg = self.config()
+                    if backend_kind(cfg, default=BACKEND_DJANGO) == BACKEND_NONE:
+                        self._values = NullBackend()
+                    else:
+                        self._values = LRUBackend(max_entries=cfg.get("MAX_ENTRIES", self.max_entries))
+        return self._values
+
+    def reset(self) -> None:
+        """
+        Drop backends and every cached value (tests / settings overrides).
+        """
+        with self._lock:
+            self._stamps = None
+            self._values = None
+
+    def _scope_key(self, scope: tuple) -> str:
+        return ":".join(str(part) for part in scope)
+
+    def version(self, *scope) -> int:
+        return int(self.stamps().get(f"{self.key_prefix}:v:{self._scope_key(scope)}", 0) or 0)
+
+    def get_or_build(self, scope: tuple, name: str, build: Callable[[], T]) -> T:
+        """
+        Return the value cached for (scope, name), calling build() at most once per
+        version stamp.
+
+        The key (with its stamp) is computed before building, so an invalidation
+        that races with the DB read stores under a stale key never addressed again.
+        """
+        key = f"{self.key_prefix}:{self.version(*scope)}:{self._scope_key(scope)}:{name}"
+        values = self.values()
+        entry = values.get(key)
+        if entry is not None:
+            return entry[0]
+
+        value = build()
+        # Wrapped so a build returning None is still a cache hit.
+        values.set(key, (value,), config_ttl(self.config()))
+        return value
+
+    def invalidate(self, *scope) -> None:
+        self.stamps().set(f"{self.key_prefix}:v:{self._scope_key(scope)}", new_stamp(), None)
+
+    def invalidate_on_commit(self, *scope) -> None:
+        now_and_on_commit(lambda: self.invalidate(*scope))
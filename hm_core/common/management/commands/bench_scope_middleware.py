@@ -0,0 +1,138 @@
+# backend/hm_core/common/management/commands/bench_scope_middleware.py
+from __future__ import annotations
+
+import timeit
+import uuid
+from types import SimpleNamespace
+
+from django.core.management.base import BaseCommand, CommandError
+from django.test import RequestFactory
+
+from hm_core.common.middleware import TenantFacilityScopeMiddleware
+from hm_core.common.route_policy import (
+    AUTH,
+    OPTIONAL_SCOPE,
+    PUBLIC,
+    REQUIRED_SCOPE,
+    ROUTE_POLICY,
+    ROUTE_POLICY_TABLE,
+    CompiledRoutePolicy,
+)
+from hm_core.common.scope import _REQUEST_ATTR
+from hm_core.iam.services.token_claims import USER_ATTR_MEMBERSHIPS
+
+SAMPLE_PATHS = (
+    "/api/v1/patients/",
+    "/api/v1/encounters/6f2c1f3e-7c55-4d3e-9d8a-0e0b5f1b9a11/timeline/",
+    "/api/v1/tasks/",
+    "/api/v1/tasks/0a8d6c1e-3f5b-4f70-8d6e-2b5d9c7e4a10/done/",
+    "/api/v1/me/",
+    "/api/v1/session/bootstrap/",
+    "/api/auth/login/",
+    "/api/v1/",
+    "/api/schema/",
+    "/admin/login/",
+    "/healthz",
+)
+
+
+def legacy_classify(path: str) -> str:
+    """
+    Tuple-scan classification as TenantFacilityScopeMiddleware did it before the
+    route policy table (kept here only as the benchmark baseline).
+    """
+    if any(path.startswith(p) for p in ("/admin/", "/api/docs/", "/api/schema/")):
+        return PUBLIC
+    if not any(path.startswith(p) for p in ("/api/v1/", "/api/")):
+        return PUBLIC
+    if path in ("/api/v1/", "/api/"):
+        return PUBLIC
+    if any(path.endswith(s) for s in ("/auth/login/", "/auth/refresh/", "/auth/logout/")):
+        return AUTH
+    if any(path.endswith(s) for s in ("/me/", "/session/bootstrap/")):
+        return OPTIONAL_SCOPE
+    return REQUIRED_SCOPE
+
+
+class LegacyScopeMiddleware(TenantFacilityScopeMiddleware):
+    """
+    The scope middleware classifying paths with legacy_classify (benchmark baseline).
+    """
+
+    route_policy = SimpleNamespace(classify=legacy_classify)
+
+
+def scoped_requests(paths=SAMPLE_PATHS) -> list:
+    """
+    Authenticated requests carrying valid scope headers. Membership comes from
+    token claims, so the benchmark measures classification + scope handling
+    without touching the database.
+    """
+    tenant_id, facility_id = uuid.uuid4(), uuid.uuid4()
+    user = SimpleNamespace(id=1, is_authenticated=True, **{USER_ATTR_MEMBERSHIPS: {(tenant_id, facility_id): "admin"}})
+    rf = RequestFactory(HTTP_X_TENANT_ID=str(tenant_id), HTTP_X_FACILITY_ID=str(facility_id))
+    requests = [rf.get(p) for p in paths]
+    for r in requests:
+        r.user = user
+    return requests
+
+
+def process_fresh(middleware, request):
+    # RequestScope is memoized per request; drop it so every call pays the full
+    # per-request cost (header parse + membership check), as a new request would.
+    request.__dict__.pop(_REQUEST_ATTR, None)
+    return middleware.process_request(request)
+
+
+class Command(BaseCommand):
+    help = (
+        "Micro-benchmark scope middleware path classification and the full "
+        "authenticated, scoped process_request (legacy tuple scans vs compiled route policy)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--number", type=int, default=200_000, help="Operations per variant.")
+
+    def handle(self, *args, **opts):
+        number = int(opts["number"])
+        paths = SAMPLE_PATHS
+
+        # Sanity: both classifiers agree on the sample set.
+        for p in paths:
+            if legacy_classify(p) != ROUTE_POLICY.classify(p):
+                raise CommandError(f"Route policy disagrees with legacy classification for {p}")
+
+        uncached = CompiledRoutePolicy(ROUTE_POLICY_TABLE, cache_size=0)
+        legacy_mw = LegacyScopeMiddleware(get_response=lambda r: None)
+        mw = TenantFacilityScopeMiddleware(get_response=lambda r: None)
+        requests = scoped_requests(paths)
+
+        # ... and both middlewares let every scoped request through with the same scope.
+        for r in requests:
+            legacy = (process_fresh(legacy_mw, r), r.tenant_id, r.facility_id)
+            compiled = (process_fresh(mw, r), r.tenant_id, r.facility_id)
+            if legacy != compiled or legacy[0] is not None:
+                raise CommandError(f"Scope middleware outcome differs for {r.path}: {legacy!r} vs {compiled!r}")
+
+        def run(fn, items=paths):
+            i = 0
+            n = len(items)
+
+            def _step():
+                nonlocal i
+                fn(items[i % n])
+                i += 1
+
+            return timeit.timeit(_step, number=number)
+
+        results = [
+            ("legacy tuple scans", run(legacy_classify)),
+            ("compiled regex (no LRU)", run(uncached.classify)),
+            ("compiled regex + LRU", run(ROUTE_POLICY.classify)),
+            ("process_request, scoped (legacy)", run(lambda r: process_fresh(legacy_mw, r), requests)),
+            ("process_request, scoped (compiled)", run(lambda r: process_fresh(mw, r), requests)),
+        ]
+
+        for name, seconds in results:
+            ns = seconds / number * 1e9
+            self.stdout.write(f"{name:<42} {ns:10.1f} ns/op")
@@ -1,29 +1,22 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Optional
-from uuid import UUID
-
+from django.conf import settings
 from django.http import JsonResponse
 from django.utils.deprecation import MiddlewareMixin
 
 from hm_core.common.api.exceptions import build_error_envelope
+from hm_core.common.route_policy import AUTH, OPTIONAL_SCOPE, PUBLIC, ROUTE_POLICY
+from hm_core.common.scope import (
+    LAYER_MIDDLEWARE,
+    RequestScope,  # noqa: F401  (re-exported; historically defined here)
+    attach_scope,
+    check_membership,
+    get_request_scope,
+    server_timing_header,
+)
 from hm_core.iam.scope import INVALID_SCOPE_MSG, MISSING_SCOPE_MSG
 
 
-@dataclass(frozen=True)
-class RequestScope:
-    tenant_id: UUID
-    facility_id: UUID
-
-
-def _parse_uuid(value: str) -> Optional[UUID]:
-    try:
-        return UUID(str(value))
-    except Exception:
-        return None
-
-
 class TenantFacilityScopeMiddleware(MiddlewareMixin):
     """
     Enforces tenant/facility scope for API requests.
@@ -38,50 +31,18 @@ class TenantFacilityScopeMiddleware(MiddlewareMixin):
       - If invalid UUIDs -> 400
       - If user not a member -> 403
       - On success -> attaches request.scope, request.tenant_id, request.facility_id
-    """
-
-    TENANT_META_KEYS = ("HTTP_X_TENANT_ID", "HTTP_X_HM_TENANT_ID")
-    FACILITY_META_KEYS = ("HTTP_X_FACILITY_ID", "HTTP_X_HM_FACILITY_ID")
-
-    ENFORCED_PREFIXES = ("/api/v1/", "/api/")
-
-    PUBLIC_PATH_PREFIXES = (
-        "/admin/",
-        "/api/docs/",
-        "/api/schema/",
-    )
-
-    AUTH_PATH_SUFFIXES = (
-        "/auth/login/",
-        "/auth/refresh/",
-        "/auth/logout/",
-    )
-
-    ALLOW_NO_SCOPE_EXACT_PATHS = (
-        "/api/v1/",
-        "/api/",
-    )
-
-    ALLOW_NO_SCOPE_SUFFIXES = (
-        "/me/",
-        "/session/bootstrap/",
-    )
 
-    def _is_api_path(self, path: str) -> bool:
-        return any(path.startswith(p) for p in self.ENFORCED_PREFIXES)
+    Which of the above applies is decided by common.route_policy.ROUTE_POLICY_TABLE.
 
-    def _starts_with_any(self, path: str, prefixes: tuple[str, ...]) -> bool:
-        return any(path.startswith(p) for p in prefixes)
-
-    def _endswith_any(self, path: str, suffixes: tuple[str, ...]) -> bool:
-        return any(path.endswith(s) for s in suffixes)
+    Headers are parsed once into the per-request RequestScope (common.scope);
+    authentication/permissions reuse it, so membership hits the DB at most once.
+    With HM_SCOPE_SERVER_TIMING enabled, per-phase timings are returned in a
+    Server-Timing response header.
+    """
 
-    def _get_meta_first(self, request, keys: tuple[str, ...]) -> Optional[str]:
-        for k in keys:
-            v = request.META.get(k)
-            if v:
-                return v
-        return None
+    # Path classification comes from the declarative table in common.route_policy,
+    # compiled once into a single regex (+ LRU on recent paths).
+    route_policy = ROUTE_POLICY
 
     def _json_error(self, request, *, status_code: int, code: str, message: str, details=None) -> JsonResponse:
         return JsonResponse(
@@ -100,21 +61,10 @@ class TenantFacilityScopeMiddleware(MiddlewareMixin):
         request.facility_id = None
 
         path = getattr(request, "path", "") or ""
+        policy = self.route_policy.classify(path)
 
-        # Always allow docs/schema/admin without scope/auth.
-        if self._starts_with_any(path, self.PUBLIC_PATH_PREFIXES):
-            return None
-
-        # If it's not under /api/ or /api/v1/, ignore.
-        if not self._is_api_path(path):
-            return None
-
-        # Allow visiting API roots without forcing scope
-        if path in self.ALLOW_NO_SCOPE_EXACT_PATHS:
-            return None
-
-        # Auth endpoints never require scope
-        if self._endswith_any(path, self.AUTH_PATH_SUFFIXES):
+        # Docs/schema/admin, API roots, non-API paths and auth endpoints: never enforced.
+        if policy in (PUBLIC, AUTH):
             return None
 
         # If user isn't authenticated, don't enforce scope here.
@@ -122,12 +72,11 @@ class TenantFacilityScopeMiddleware(MiddlewareMixin):
         if not user or not user.is_authenticated:
             return None
 
-        tenant_raw = self._get_meta_first(request, self.TENANT_META_KEYS)
-        facility_raw = self._get_meta_first(request, self.FACILITY_META_KEYS)
+        rs = get_request_scope(request)
 
         # No scope headers at all
-        if not tenant_raw and not facility_raw:
-            if self._endswith_any(path, self.ALLOW_NO_SCOPE_SUFFIXES):
+        if rs.is_absent:
+            if policy == OPTIONAL_SCOPE:
                 return None
             return self._json_error(
                 request,
@@ -138,7 +87,7 @@ class TenantFacilityScopeMiddleware(MiddlewareMixin):
             )
 
         # Only one present
-        if not tenant_raw or not facility_raw:
+        if rs.is_partial:
             return self._json_error(
                 request,
                 status_code=400,
@@ -147,9 +96,7 @@ class TenantFacilityScopeMiddleware(MiddlewareMixin):
                 details=None,
             )
 
-        tenant_id = _parse_uuid(tenant_raw)
-        facility_id = _parse_uuid(facility_raw)
-        if not tenant_id or not facility_id:
+        if not rs.is_valid:
             return self._json_error(
                 request,
                 status_code=400,
@@ -158,9 +105,7 @@ class TenantFacilityScopeMiddleware(MiddlewareMixin):
                 details=None,
             )
 
-        from hm_core.iam.services.membership import is_user_member_of_facility
-
-        if not is_user_member_of_facility(user_id=user.id, tenant_id=tenant_id, facility_id=facility_id):
+        if not check_membership(request, user, layer=LAYER_MIDDLEWARE):
             return self._json_error(
                 request,
                 status_code=403,
@@ -169,7 +114,16 @@ class TenantFacilityScopeMiddleware(MiddlewareMixin):
                 details=None,
             )
 
-        request.scope = RequestScope(tenant_id=tenant_id, facility_id=facility_id)
-        request.tenant_id = tenant_id
-        request.facility_id = facility_id
+        attach_scope(request, rs)
         return None
+
+    def process_response(self, request, response):
+        if not getattr(settings, "HM_SCOPE_SERVER_TIMING", False):
+            return response
+
+        rs = getattr(request, "_hm_request_scope", None)
+        if rs is not None and rs.timings:
+            value = server_timing_header(rs)
+            existing = response.get("Server-Timing")
+            response["Server-Timing"] = f"{existing}, {value}" if existing else value
+        return response
@@ -0,0 +1,36 @@
+# Generated by Django 5.2.9 on 2026-10-17 06:12
+
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='IdempotencyRecord',
+            fields=[
+                ('created_at', models.DateTimeField(auto_now_add=True, db_index=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('tenant_id', models.UUIDField(db_index=True)),
+                ('facility_id', models.UUIDField(db_index=True)),
+                ('user_id', models.BigIntegerField(db_index=True)),
+                ('method', models.CharField(db_index=True, max_length=16)),
+                ('path', models.CharField(db_index=True, max_length=255)),
+                ('idempotency_key', models.CharField(db_index=True, max_length=255)),
+                ('status_code', models.PositiveIntegerField(default=200)),
+                ('response_data', models.JSONField(default=dict)),
+            ],
+            options={
+                'db_table': 'common_idempotency_record',
+                'indexes': [models.Index(fields=['tenant_id', 'facility_id', 'created_at'], name='common_idem_tenant__7d23fe_idx')],
+                'constraints': [models.UniqueConstraint(fields=('tenant_id', 'facility_id', 'user_id', 'method', 'path', 'idempotency_key'), name='uq_idempo_scope_user_method_path_key')],
+            },
+        ),
+    ]
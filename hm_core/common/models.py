@@ -16,6 +16,68 @@ class TimeStampedModel(models.Model):
         abstract = True
 
 
+class TrackedFieldsMixin:
+    """
+    Change tracking without re-reading the row.
+
+    Values of `tracked_fields` are snapshotted when the instance is loaded
+    (from_db / refresh_from_db) and after every successful save, so post_save
+    receivers can diff old vs new for free:
+
+        class Task(TrackedFieldsMixin, ScopedModel):
+            tracked_fields = ("status", "completed_at")
+
+        instance.has_changed("completed_at")
+        instance.previous("completed_at")
+
+    Instances never loaded from the DB (new, or built by hand with a pk) have no
+    snapshot: has_changed() is True and previous() returns None ("unknown").
+    """
+
+    tracked_fields: tuple[str, ...] = ()
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._snapshot_tracked()
+        return instance
+
+    def refresh_from_db(self, *args, **kwargs):
+        super().refresh_from_db(*args, **kwargs)
+        fields = kwargs.get("fields")
+        self._snapshot_tracked(None if fields is None else self._field_names(fields))
+
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        update_fields = kwargs.get("update_fields")
+        self._snapshot_tracked(None if update_fields is None else self._field_names(update_fields))
+
+    def _field_names(self, names) -> set[str]:
+        return {self._meta.get_field(n).name for n in names}
+
+    def _snapshot_tracked(self, only: set[str] | None = None) -> None:
+        snapshot = dict(self.__dict__.get("_tracked_snapshot") or {})
+        deferred = self.get_deferred_fields()
+        for name in self.tracked_fields:
+            if only is not None and name not in only:
+                continue
+            attname = self._meta.get_field(name).attname
+            if attname in deferred:
+                snapshot.pop(name, None)
+            else:
+                snapshot[name] = getattr(self, attname)
+        self._tracked_snapshot = snapshot
+
+    def previous(self, field: str):
+        return (self.__dict__.get("_tracked_snapshot") or {}).get(field)
+
+    def has_changed(self, field: str) -> bool:
+        snapshot = self.__dict__.get("_tracked_snapshot") or {}
+        if field not in snapshot:
+            return True
+        return snapshot[field] != getattr(self, self._meta.get_field(field).attname)
+
+
 class ScopedModel(TimeStampedModel):
     """
     Enforces multi-tenant + multi-facility scope at the data layer.
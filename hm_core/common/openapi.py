@@ -5,12 +5,15 @@ from drf_spectacular.openapi import AutoSchema
 from drf_spectacular.types import OpenApiTypes
 from drf_spectacular.utils import OpenApiParameter
 
+from hm_core.common.route_policy import AUTH, OPTIONAL_SCOPE, PUBLIC, REQUIRED_SCOPE, classify_path
+
 
 class HMSAutoSchema(AutoSchema):
     """
     Global OpenAPI improvements for HM Software:
 
-    - Adds scope headers (X-Tenant-Id, X-Facility-Id) automatically to scoped endpoints
+    - Adds scope headers (X-Tenant-Id, X-Facility-Id) per route policy
+      (common.route_policy): required / optional / omitted
     - Adds Idempotency-Key header automatically (optional)
     - Skips scope headers for auth endpoints and schema/docs endpoints
     """
@@ -32,6 +35,17 @@ class HMSAutoSchema(AutoSchema):
         ),
     ]
 
+    OPTIONAL_SCOPE_HEADERS = [
+        OpenApiParameter(
+            name=p.name,
+            type=OpenApiTypes.UUID,
+            location=OpenApiParameter.HEADER,
+            required=False,
+            description=p.description.replace("required for scoped endpoints", "optional; validated if provided"),
+        )
+        for p in SCOPE_HEADERS
+    ]
+
     IDEMPOTENCY_HEADER = OpenApiParameter(
         name="Idempotency-Key",
         type=OpenApiTypes.STR,
@@ -43,36 +57,24 @@ class HMSAutoSchema(AutoSchema):
         ),
     )
 
-    def _is_unscoped_endpoint(self) -> bool:
+    def _route_policy(self) -> str:
         """
-        Endpoints that should NOT show tenant/facility headers in schema.
+        Scope policy for this endpoint from the same route table the
+        scope middleware enforces (common.route_policy).
         """
         view = getattr(self, "view", None)
-        if view is None:
-            return False
 
         # Skip schema & swagger views (spectacular itself)
-        view_class_name = view.__class__.__name__
-        if view_class_name in {"SpectacularAPIView", "SpectacularSwaggerView"}:
-            return True
-
-        # Skip auth module endpoints
-        module = view.__class__.__module__ or ""
-        if module.startswith("hm_core.iam.api."):
-            return True
+        if view is not None and view.__class__.__name__ in {"SpectacularAPIView", "SpectacularSwaggerView"}:
+            return PUBLIC
 
-        # In your API layout, /me and /auth/* are unscoped.
-        # The module check already covers them, but keep this as belt+suspenders.
-        path = ""
-        try:
-            path = getattr(view.request, "path", "") or ""
-        except Exception:
-            path = ""
+        return classify_path(getattr(self, "path", "") or "")
 
-        if "/auth/" in path or path.endswith("/me/") or "/api/schema/" in path or "/api/docs/" in path:
-            return True
-
-        return False
+    def _is_unscoped_endpoint(self) -> bool:
+        """
+        Endpoints that should NOT show tenant/facility headers in schema.
+        """
+        return self._route_policy() in (PUBLIC, AUTH)
 
     def get_override_parameters(self):
         params = list(super().get_override_parameters() or [])
@@ -82,10 +84,12 @@ class HMSAutoSchema(AutoSchema):
         if not any(p.name.lower() == "idempotency-key" for p in params):
             params.append(self.IDEMPOTENCY_HEADER)
 
-        # Add scope headers to ALL scoped endpoints unless explicitly unscoped
-        if not self._is_unscoped_endpoint():
+        # Add scope headers per route policy: required / optional / none
+        policy = self._route_policy()
+        if policy in (REQUIRED_SCOPE, OPTIONAL_SCOPE):
+            headers = self.SCOPE_HEADERS if policy == REQUIRED_SCOPE else self.OPTIONAL_SCOPE_HEADERS
             existing = {p.name.lower() for p in params}
-            for p in self.SCOPE_HEADERS:
+            for p in headers:
                 if p.name.lower() not in existing:
                     params.append(p)
 
@@ -3,10 +3,12 @@
 from __future__ import annotations
 
 from typing import Set
-from uuid import UUID
 
 from rest_framework.permissions import BasePermission, SAFE_METHODS
 
+from hm_core.common.scope import get_request_scope
+from hm_core.iam.services.roles import get_user_roles
+
 # Group/role names (Django auth Group names recommended)
 ROLE_ADMIN = "ADMIN"
 ROLE_DOCTOR = "DOCTOR"
@@ -17,40 +19,20 @@ ROLE_BILLING = "BILLING"
 ROLE_READONLY = "READONLY"
 
 
-def _user_roles(user) -> Set[str]:
+def _user_roles(user, request=None) -> Set[str]:
     """
-    Resolve roles from:
-    1) Django groups: user.groups (recommended)
-    2) Optional user.role attribute (if your project has it)
+    Resolve roles via the shared role service (iam.services.roles):
+    Django groups + optional user.role/user.roles, superuser -> ADMIN.
 
     Returns set of role strings.
 
     Default behavior:
     - If authenticated user has no roles/groups, treat them as READONLY.
     """
-    roles: Set[str] = set()
-
     if not user or not getattr(user, "is_authenticated", False):
-        return roles
-
-    # Superuser treated as admin
-    if getattr(user, "is_superuser", False):
-        roles.add(ROLE_ADMIN)
-        return roles
-
-    # Django Groups
-    if hasattr(user, "groups"):
-        roles.update(user.groups.values_list("name", flat=True))
+        return set()
 
-    # Optional user.role or user.roles
-    if hasattr(user, "role") and user.role:
-        roles.add(str(user.role))
-
-    if hasattr(user, "roles") and user.roles:
-        try:
-            roles.update(set(user.roles))
-        except TypeError:
-            roles.add(str(user.roles))
+    roles: Set[str] = set(get_user_roles(user, request=request))
 
     # ✅ Ensure authenticated users without explicit roles can still read
     if not roles:
@@ -63,25 +45,6 @@ def _user_roles(user) -> Set[str]:
 # Scope helpers (Tenant/Facility)
 # -----------------------------
 
-def _get_header(request, name: str) -> str | None:
-    """
-    Prefer request.headers (case-insensitive), fallback to META (pytest uses HTTP_*).
-    """
-    v = request.headers.get(name)
-    if v:
-        return v
-    meta_key = "HTTP_" + name.upper().replace("-", "_")
-    return request.META.get(meta_key)
-
-
-def _first_header(request, candidates: list[str]) -> str | None:
-    for c in candidates:
-        v = _get_header(request, c)
-        if v:
-            return v
-    return None
-
-
 def ensure_scope_on_request(request) -> bool:
     """
     Ensure request.tenant_id and request.facility_id exist.
@@ -90,9 +53,9 @@ def ensure_scope_on_request(request) -> bool:
     - Permissions must not raise ValidationError (it becomes 400).
     - Return False when missing/invalid -> DRF returns 403.
 
-    Supports BOTH header families:
-    - HM headers: X_HM_TENANT_ID / X_HM_FACILITY_ID (and hyphen versions)
-    - Generic headers: X_TENANT_ID / X_FACILITY_ID (and hyphen versions)
+    Reads the per-request RequestScope (common.scope), so headers parsed by the
+    middleware/authentication are not parsed again. Both header families
+    (X-Tenant-Id / X-HM-Tenant-Id and their facility counterparts) are supported.
     """
     tenant_id = getattr(request, "tenant_id", None)
     facility_id = getattr(request, "facility_id", None)
@@ -100,45 +63,12 @@ def ensure_scope_on_request(request) -> bool:
     if tenant_id and facility_id:
         return True
 
-    raw_tenant = _first_header(
-        request,
-        [
-            # ✅ your project’s headers
-            "X_HM_TENANT_ID",
-            "X-HM-TENANT-ID",
-            "X_HM_TENANT_ID".lower(),
-            # ✅ generic/older variants
-            "X_TENANT_ID",
-            "X-TENANT-ID",
-            "X_TENANT_ID".lower(),
-        ],
-    )
-
-    raw_facility = _first_header(
-        request,
-        [
-            # ✅ your project’s headers
-            "X_HM_FACILITY_ID",
-            "X-HM-FACILITY-ID",
-            "X_HM_FACILITY_ID".lower(),
-            # ✅ generic/older variants
-            "X_FACILITY_ID",
-            "X-FACILITY-ID",
-            "X_FACILITY_ID".lower(),
-        ],
-    )
-
-    if not raw_tenant or not raw_facility:
-        return False
-
-    try:
-        tenant_uuid = UUID(str(raw_tenant))
-        facility_uuid = UUID(str(raw_facility))
-    except Exception:
+    rs = get_request_scope(request)
+    if not rs.is_valid:
         return False
 
-    setattr(request, "tenant_id", tenant_uuid)
-    setattr(request, "facility_id", facility_uuid)
+    setattr(request, "tenant_id", rs.tenant_id)
+    setattr(request, "facility_id", rs.facility_id)
     return True
 
 
@@ -197,7 +127,7 @@ class BaseRolePermission(BasePermission):
         if not user or not getattr(user, "is_authenticated", False):
             return False
 
-        roles = _user_roles(user)
+        roles = _user_roles(user, request)
 
         # ADMIN can do everything
         if ROLE_ADMIN in roles:
@@ -247,10 +177,12 @@ class EncounterPermission(BaseRolePermission):
         "partial_update": {ROLE_ADMIN, ROLE_DOCTOR, ROLE_NURSE},
         "destroy": {ROLE_ADMIN},
         # Custom actions
+        "create_batch": {ROLE_ADMIN, ROLE_DOCTOR, ROLE_NURSE, ROLE_RECEPTION},
         "checkin": {ROLE_ADMIN, ROLE_DOCTOR, ROLE_NURSE, ROLE_RECEPTION},
         "start_consult": {ROLE_ADMIN, ROLE_DOCTOR, ROLE_NURSE},
         "close": {ROLE_ADMIN, ROLE_DOCTOR, ROLE_NURSE},
         "close_gate": {ROLE_ADMIN, ROLE_DOCTOR, ROLE_NURSE, ROLE_RECEPTION},
+        "close_gate_batch": {ROLE_ADMIN, ROLE_DOCTOR, ROLE_NURSE, ROLE_RECEPTION},
         "vitals": {ROLE_ADMIN, ROLE_DOCTOR, ROLE_NURSE},
         "assessment": {ROLE_ADMIN, ROLE_DOCTOR, ROLE_NURSE},
         "plan": {ROLE_ADMIN, ROLE_DOCTOR, ROLE_NURSE},
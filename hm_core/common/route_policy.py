@@ -0,0 +1,103 @@
+# backend/hm_core/common/route_policy.py
+"""
+Declarative route policy for tenant/facility scope enforcement.
+
+ROUTE_POLICY_TABLE is the single source of truth for which paths need scope
+headers. It is compiled once (at import) into one anchored regex with a named
+group per rule, so classifying a path is a single match; recent paths are
+additionally served from an LRU.
+
+Used by:
+  - common.middleware.TenantFacilityScopeMiddleware (enforcement)
+  - common.openapi.HMSAutoSchema (scope header hints in the schema)
+
+Rules are evaluated in table order (first match wins). SUFFIX rules only apply
+under API_PREFIX. Paths matching no rule are not API paths -> PUBLIC.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Sequence
+
+# Policies
+PUBLIC = "public"  # never enforced (docs/schema/admin, API roots, non-API paths)
+AUTH = "auth"  # auth endpoints: scope ignored
+OPTIONAL_SCOPE = "optional_scope"  # headers optional; validated + membership checked if present
+REQUIRED_SCOPE = "required_scope"  # both headers required
+
+# Rule kinds
+PREFIX = "prefix"
+SUFFIX = "suffix"
+EXACT = "exact"
+
+API_PREFIX = "/api/"
+
+CLASSIFY_CACHE_SIZE = 4096
+
+
+@dataclass(frozen=True)
+class RouteRule:
+    kind: str
+    pattern: str
+    policy: str
+
+
+ROUTE_POLICY_TABLE: tuple[RouteRule, ...] = (
+    # Docs/schema/admin: public
+    RouteRule(PREFIX, "/admin/", PUBLIC),
+    RouteRule(PREFIX, "/api/docs/", PUBLIC),
+    RouteRule(PREFIX, "/api/schema/", PUBLIC),
+    # API roots can be visited without scope
+    RouteRule(EXACT, "/api/v1/", PUBLIC),
+    RouteRule(EXACT, "/api/", PUBLIC),
+    # Auth endpoints never require scope
+    RouteRule(SUFFIX, "/auth/login/", AUTH),
+    RouteRule(SUFFIX, "/auth/refresh/", AUTH),
+    RouteRule(SUFFIX, "/auth/logout/", AUTH),
+    # Scope optional, validated if provided
+    RouteRule(SUFFIX, "/me/", OPTIONAL_SCOPE),
+    RouteRule(SUFFIX, "/session/bootstrap/", OPTIONAL_SCOPE),
+    # Everything else under /api/ (and /api/v1/)
+    RouteRule(PREFIX, API_PREFIX, REQUIRED_SCOPE),
+)
+
+
+def _rule_regex(rule: RouteRule) -> str:
+    p = re.escape(rule.pattern)
+    if rule.kind == PREFIX:
+        return p
+    if rule.kind == EXACT:
+        return p + r"\Z"
+    if rule.kind == SUFFIX:
+        return f"(?={re.escape(API_PREFIX)}).*{p}\\Z"
+    raise ValueError(f"Unknown route rule kind: {rule.kind}")
+
+
+class CompiledRoutePolicy:
+    """
+    One regex alternation over the table; the matching group index is the rule.
+    """
+
+    def __init__(self, table: Sequence[RouteRule], *, default: str = PUBLIC, cache_size: int = CLASSIFY_CACHE_SIZE):
+        self.table = tuple(table)
+        self.default = default
+        alternatives = "|".join(f"(?P<r{i}>{_rule_regex(r)})" for i, r in enumerate(self.table))
+        self._regex = re.compile(f"(?:{alternatives})", re.DOTALL)
+        self._policies = {f"r{i}": r.policy for i, r in enumerate(self.table)}
+        self.classify = lru_cache(maxsize=cache_size)(self._classify_uncached)
+
+    def _classify_uncached(self, path: str) -> str:
+        m = self._regex.match(path)
+        if m is None:
+            return self.default
+        return self._policies[m.lastgroup]
+
+
+ROUTE_POLICY = CompiledRoutePolicy(ROUTE_POLICY_TABLE)
+
+
+def classify_path(path: str) -> str:
+    return ROUTE_POLICY.classify(path or "")
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from typing import Optional
 from uuid import UUID
 
@@ -29,6 +31,19 @@ HDR_FACILITY_HM = "X-HM-Facility-Id"
 HDR_TENANT_HM_LEGACY = "X-HM-Tenant-ID"
 HDR_FACILITY_HM_LEGACY = "X-HM-Facility-ID"
 
+# HTTP headers are case-insensitive, so every variant above collapses onto one
+# of two META keys per dimension. Standard family first, HM family second.
+TENANT_META_KEYS = ("HTTP_X_TENANT_ID", "HTTP_X_HM_TENANT_ID")
+FACILITY_META_KEYS = ("HTTP_X_FACILITY_ID", "HTTP_X_HM_FACILITY_ID")
+
+# Layers that may validate membership (recorded on RequestScope.membership_checked_by)
+LAYER_MIDDLEWARE = "middleware"
+LAYER_AUTHENTICATION = "authentication"
+LAYER_PERMISSION = "permission"
+LAYER_VIEW = "view"
+
+_REQUEST_ATTR = "_hm_request_scope"
+
 
 def _parse_uuid(value: str) -> Optional[UUID]:
     try:
@@ -37,19 +52,149 @@ def _parse_uuid(value: str) -> Optional[UUID]:
         return None
 
 
-def _get_header(request, name: str) -> Optional[str]:
-    """
-    request.headers is case-insensitive; fallback to META for pytest/client.
-    """
-    try:
-        v = request.headers.get(name)
+def _meta_first(meta, keys: tuple[str, ...]) -> Optional[str]:
+    for k in keys:
+        v = meta.get(k)
         if v:
             return v
-    except Exception:
-        pass
+    return None
+
+
+@dataclass
+class RequestScope:
+    """
+    Scope resolved once per request and shared by middleware, authentication,
+    permissions and views.
+
+    - Header parsing happens once (get_request_scope memoizes on the request).
+    - Membership is validated at most once per (request, user); the first layer
+      that validates records itself in membership_checked_by.
+    - timings holds per-phase durations in milliseconds.
+    """
+
+    tenant_raw: Optional[str] = None
+    facility_raw: Optional[str] = None
+    tenant_id: Optional[UUID] = None
+    facility_id: Optional[UUID] = None
+
+    is_member: Optional[bool] = None
+    membership_user_id: Optional[int] = None
+    membership_checked_by: Optional[str] = None
+    membership_source: Optional[str] = None  # "token" (signed claims) | "db" (membership service)
+
+    timings: dict[str, float] = field(default_factory=dict)
+
+    @property
+    def is_absent(self) -> bool:
+        return not self.tenant_raw and not self.facility_raw
+
+    @property
+    def is_partial(self) -> bool:
+        return not self.is_absent and not (self.tenant_raw and self.facility_raw)
+
+    @property
+    def is_valid(self) -> bool:
+        return self.tenant_id is not None and self.facility_id is not None
+
+    def as_scope(self) -> Optional[Scope]:
+        if not self.is_valid:
+            return None
+        return Scope(tenant_id=self.tenant_id, facility_id=self.facility_id)
 
-    meta_key = "HTTP_" + name.upper().replace("-", "_")
-    return request.META.get(meta_key)
+    @contextmanager
+    def timed(self, phase: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = (time.perf_counter() - start) * 1000.0
+            self.timings[phase] = self.timings.get(phase, 0.0) + elapsed
+
+
+def _base_request(request):
+    # DRF Request wraps Django's HttpRequest; memoize on the inner object so the
+    # middleware (HttpRequest) and DRF layers (Request) share one instance.
+    return getattr(request, "_request", request)
+
+
+def get_request_scope(request) -> RequestScope:
+    """
+    Return the memoized RequestScope for this request, parsing headers on first use.
+    Never raises; callers decide how to surface absent/partial/invalid scope.
+    """
+    base = _base_request(request)
+    rs = getattr(base, _REQUEST_ATTR, None)
+    if rs is not None:
+        return rs
+
+    rs = RequestScope()
+    with rs.timed("parse"):
+        meta = getattr(base, "META", {}) or {}
+        rs.tenant_raw = _meta_first(meta, TENANT_META_KEYS)
+        rs.facility_raw = _meta_first(meta, FACILITY_META_KEYS)
+        if rs.tenant_raw and rs.facility_raw:
+            rs.tenant_id = _parse_uuid(rs.tenant_raw)
+            rs.facility_id = _parse_uuid(rs.facility_raw)
+
+    setattr(base, _REQUEST_ATTR, rs)
+    return rs
+
+
+def check_membership(request, user, *, layer: str) -> bool:
+    """
+    Validate user membership for the request scope, at most once per user.
+    Returns False when scope is not valid or the user is not a member.
+    """
+    rs = get_request_scope(request)
+    if not rs.is_valid:
+        return False
+
+    user_id = getattr(user, "id", None)
+    if rs.is_member is not None and rs.membership_user_id == user_id:
+        return rs.is_member
+
+    # Looked up at call time so tests can monkeypatch the service.
+    from hm_core.iam.services import membership, token_claims
+
+    with rs.timed("membership"):
+        from_token = token_claims.token_membership(user, tenant_id=rs.tenant_id, facility_id=rs.facility_id)
+        if from_token is not None:
+            rs.is_member = from_token
+            rs.membership_source = "token"
+        else:
+            rs.is_member = bool(
+                membership.is_user_member_of_facility(
+                    user_id=user_id,
+                    tenant_id=rs.tenant_id,
+                    facility_id=rs.facility_id,
+                )
+            )
+            rs.membership_source = "db"
+    rs.membership_user_id = user_id
+    rs.membership_checked_by = layer
+    return rs.is_member
+
+
+def attach_scope(request, rs: RequestScope) -> None:
+    """
+    Expose a valid scope as request.scope / request.tenant_id / request.facility_id
+    on both the DRF Request and the underlying HttpRequest.
+    """
+    base = _base_request(request)
+    for target in (request,) if base is request else (request, base):
+        target.scope = rs
+        target.tenant_id = rs.tenant_id
+        target.facility_id = rs.facility_id
+
+
+def server_timing_header(rs: RequestScope) -> str:
+    """
+    Render timings as a Server-Timing header value.
+    """
+    parts = [f"scope-{phase};dur={ms:.3f}" for phase, ms in rs.timings.items()]
+    if rs.membership_checked_by:
+        parts.append(f'scope-membership-by;desc="{rs.membership_checked_by}/{rs.membership_source}"')
+    return ", ".join(parts)
 
 
 def resolve_scope(request) -> Optional[Scope]:
@@ -57,43 +202,29 @@ def resolve_scope(request) -> Optional[Scope]:
     Pure resolver:
     - Returns Scope if BOTH headers are present and valid
     - Returns None if NO scope headers are present at all
-    - Returns sentinel Scope(None,None) behavior is NOT used here; we just return None or Scope
+    - Raises ValidationError for partial (MISSING_SCOPE_MSG) or invalid (INVALID_SCOPE_MSG) headers
     """
-    # Prefer middleware-attached values if present
+    # Prefer values already attached by middleware/auth
     t = getattr(request, "tenant_id", None)
     f = getattr(request, "facility_id", None)
     if t and f:
-        tu = _parse_uuid(str(t))
-        fu = _parse_uuid(str(f))
+        tu = t if isinstance(t, UUID) else _parse_uuid(str(t))
+        fu = f if isinstance(f, UUID) else _parse_uuid(str(f))
         if tu and fu:
             return Scope(tenant_id=tu, facility_id=fu)
 
-    tenant_raw = (
-        _get_header(request, HDR_TENANT)
-        or _get_header(request, HDR_TENANT_LEGACY)
-        or _get_header(request, HDR_TENANT_HM)
-        or _get_header(request, HDR_TENANT_HM_LEGACY)
-    )
-    facility_raw = (
-        _get_header(request, HDR_FACILITY)
-        or _get_header(request, HDR_FACILITY_LEGACY)
-        or _get_header(request, HDR_FACILITY_HM)
-        or _get_header(request, HDR_FACILITY_HM_LEGACY)
-    )
-
-    if not tenant_raw and not facility_raw:
+    rs = get_request_scope(request)
+
+    if rs.is_absent:
         return None
 
-    if not tenant_raw or not facility_raw:
-        # Partial scope headers present
+    if rs.is_partial:
         raise ValidationError(MISSING_SCOPE_MSG)
 
-    tenant_id = _parse_uuid(tenant_raw)
-    facility_id = _parse_uuid(facility_raw)
-    if not tenant_id or not facility_id:
+    if not rs.is_valid:
         raise ValidationError(INVALID_SCOPE_MSG)
 
-    return Scope(tenant_id=tenant_id, facility_id=facility_id)
+    return rs.as_scope()
 
 
 def require_scope(request) -> Scope:
@@ -0,0 +1,76 @@
+# backend/hm_core/common/tests/test_cache.py
+import pytest
+from django.core.exceptions import ImproperlyConfigured
+
+from hm_core.common import cache
+from hm_core.common.cache import LRUBackend, StampedCache
+
+
+def test_lru_backend_evicts_and_expires(monkeypatch):
+    backend = LRUBackend(max_entries=2)
+    backend.set("a", 1, 60)
+    backend.set("b", 2, 60)
+    backend.get("a")
+    backend.set("c", 3, 60)
+
+    assert backend.get("b") is None
+    assert backend.get("a") == 1
+    assert backend.get("c") == 3
+
+    now = cache.time.monotonic()
+    monkeypatch.setattr(cache.time, "monotonic", lambda: now + 61)
+    assert backend.get("a") is None
+
+
+def _workers():
+    # two StampedCaches over one setting stand in for two worker processes
+    return (StampedCache(setting="TEST_STAMPED_CACHE", key_prefix="test:stamped") for _ in range(2))
+
+
+@pytest.mark.parametrize(
+    "backend, reaches_other_worker",
+    [
+        ("django", True),  # stamps in CACHES["default"], shared by both workers here
+        ("lru", False),  # per-process stamps: allowed under HM_SINGLE_PROCESS only
+    ],
+)
+def test_invalidation_reach_depends_on_stamp_backend(settings, backend, reaches_other_worker):
+    settings.TEST_STAMPED_CACHE = {"BACKEND": backend}
+    a, b = _workers()
+    loads = []
+
+    def build():
+        loads.append(1)
+        return len(loads)
+
+    assert b.get_or_build(("scope",), "value", build) == 1
+    assert b.get_or_build(("scope",), "value", build) == 1
+
+    a.invalidate("scope")
+
+    assert b.get_or_build(("scope",), "value", build) == (2 if reaches_other_worker else 1)
+
+
+@pytest.mark.parametrize("backend", ["django", "lru"])
+def test_process_local_stamps_are_rejected_outside_single_process(settings, backend):
+    settings.HM_SINGLE_PROCESS = False
+    settings.TEST_STAMPED_CACHE = {"BACKEND": backend}  # CACHES["default"] is LocMemCache here
+    a, _ = _workers()
+
+    with pytest.raises(ImproperlyConfigured):
+        a.get_or_build(("scope",), "value", lambda: 1)
+
+    settings.TEST_STAMPED_CACHE = {"BACKEND": backend, "SINGLE_PROCESS": True}
+    assert a.get_or_build(("scope",), "value", lambda: 1) == 1
+
+
+def test_shared_cache_alias_is_accepted(settings):
+    settings.HM_SINGLE_PROCESS = False
+    settings.CACHES = {
+        **settings.CACHES,
+        "shared": {"BACKEND": "django.core.cache.backends.redis.RedisCache", "LOCATION": "redis://127.0.0.1:6379"},
+    }
+    settings.TEST_STAMPED_CACHE = {"BACKEND": "django", "CACHE_ALIAS": "shared"}
+    a, _ = _workers()
+
+    assert isinstance(a.stamps(), cache.DjangoCacheBackend)
@@ -4,6 +4,8 @@ from __future__ import annotations
 from uuid import UUID
 
 from django.core.exceptions import ValidationError as DjangoValidationError
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import StreamingHttpResponse
 from rest_framework import status, viewsets
 from rest_framework.decorators import action
 from rest_framework.exceptions import ErrorDetail, ValidationError as DRFValidationError
@@ -14,14 +16,17 @@ from hm_core.common.api.pagination import paginate
 from hm_core.common.permissions import EncounterPermission
 from hm_core.common.scope import require_scope
 from hm_core.encounters.models import Encounter
-from hm_core.encounters.selectors import EncounterSelectors
+from hm_core.encounters.selectors import TIMELINE_STREAM_CHUNK_SIZE, EncounterSelectors
 from hm_core.encounters.serializers import (
     AssessmentInputSerializer,
+    CloseGateBatchInputSerializer,
+    EncounterBatchCreateSerializer,
     EncounterCreateSerializer,
     EncounterSerializer,
     PlanInputSerializer,
     VitalsInputSerializer,
 )
+from hm_core.encounters.serializers_timeline import EncounterTimelineQuerySerializer
 from hm_core.encounters.services import EncounterService
 
 
@@ -66,6 +71,25 @@ def _validation_payload(exc) -> dict:
     return {"detail": str(exc)}
 
 
+def _stream_timeline(encounter_id: UUID, events, *, cursor: str | None = None) -> StreamingHttpResponse:
+    """
+    {"encounter_id", "items": [...], "next_cursor"} written item by item from a
+    server-side cursor, so memory stays flat however long the timeline is.
+    """
+    encoder = DjangoJSONEncoder(separators=(",", ":"))
+
+    def body():
+        yield '{"encounter_id":%s,"items":[' % encoder.encode(str(encounter_id))
+        last = None
+        for row in events.iterator(chunk_size=TIMELINE_STREAM_CHUNK_SIZE):
+            yield ("," if last is not None else "") + encoder.encode(EncounterSelectors.timeline_item(row))
+            last = row
+        next_cursor = EncounterSelectors.timeline_cursor(last) if last is not None else cursor
+        yield '],"next_cursor":%s}' % encoder.encode(next_cursor)
+
+    return StreamingHttpResponse(body(), content_type="application/json")
+
+
 class EncounterViewSet(viewsets.ViewSet):
     permission_classes = [EncounterPermission]
     serializer_class = EncounterSerializer
@@ -87,16 +111,22 @@ class EncounterViewSet(viewsets.ViewSet):
 
         patient_raw = request.query_params.get("patient") or request.query_params.get("patient_id")
         status_q = request.query_params.get("status")
+        ready_raw = request.query_params.get("ready_to_close")
 
         patient_id = None
         if patient_raw:
             patient_id = UUID(str(patient_raw))
 
+        ready_to_close = None
+        if ready_raw is not None:
+            ready_to_close = ready_raw.strip().lower() in ("1", "true", "yes")
+
         qs = EncounterSelectors.list_encounters(
             tenant_id=scope.tenant_id,
             facility_id=scope.facility_id,
             patient_id=patient_id,
             status=status_q,
+            ready_to_close=ready_to_close,
         )
         return paginate(request, qs, EncounterSerializer)
 
@@ -126,6 +156,43 @@ class EncounterViewSet(viewsets.ViewSet):
 
         return Response(EncounterSerializer(enc).data, status=status.HTTP_201_CREATED)
 
+    @action(detail=False, methods=["post"], url_path="create:batch", url_name="create-batch")
+    def create_batch(self, request):
+        """
+        Register many encounters in one request (OPD intake rush, health camps).
+        Body: {"items": [{"patient_id": ..., "reason": ...}, ...]}
+        Items fail individually (unknown patient / active encounter exists).
+        """
+        scope = require_scope(request)
+
+        ser = EncounterBatchCreateSerializer(data=request.data or {})
+        ser.is_valid(raise_exception=True)
+
+        results = EncounterService.create_many(
+            tenant_id=scope.tenant_id,
+            facility_id=scope.facility_id,
+            items=ser.validated_data["items"],
+            actor_user_id=getattr(request.user, "id", None),
+        )
+        created = sum(1 for r in results if r.ok)
+        return Response(
+            {
+                "created": created,
+                "failed": len(results) - created,
+                "results": [
+                    {
+                        "index": r.index,
+                        "patient_id": str(r.patient_id),
+                        "ok": r.ok,
+                        "encounter": EncounterSerializer(r.encounter).data if r.ok else None,
+                        "error": r.error or None,
+                    }
+                    for r in results
+                ],
+            },
+            status=status.HTTP_201_CREATED if created else status.HTTP_200_OK,
+        )
+
     # ------------------------------------------------------------
     # Existing workflow endpoints (unchanged)
     # ------------------------------------------------------------
@@ -189,6 +256,42 @@ class EncounterViewSet(viewsets.ViewSet):
         )
         return Response(result, status=status.HTTP_200_OK)
 
+    @action(detail=False, methods=["post"], url_path="close-gate:batch", url_name="close-gate-batch")
+    def close_gate_batch(self, request):
+        """
+        Close-gate payloads for many encounters in a constant number of queries.
+        Body: {"encounter_ids": [...]} or {"status": ["CHECKED_IN", "IN_CONSULT"]}.
+        """
+        scope = require_scope(request)
+
+        ser = CloseGateBatchInputSerializer(data=request.data or {})
+        ser.is_valid(raise_exception=True)
+
+        requested = ser.validated_data.get("encounter_ids")
+        if requested is None:
+            requested = list(
+                Encounter.objects.filter(
+                    tenant_id=scope.tenant_id,
+                    facility_id=scope.facility_id,
+                    status__in=ser.validated_data["status"],
+                )
+                .order_by("-created_at")
+                .values_list("id", flat=True)[: CloseGateBatchInputSerializer.MAX_ENCOUNTERS]
+            )
+
+        results = EncounterService.get_close_gate_many(
+            tenant_id=scope.tenant_id,
+            facility_id=scope.facility_id,
+            encounter_ids=requested,
+        )
+        return Response(
+            {
+                "results": {str(eid): payload for eid, payload in results.items()},
+                "not_found": [str(eid) for eid in dict.fromkeys(requested) if eid not in results],
+            },
+            status=status.HTTP_200_OK,
+        )
+
     @action(detail=True, methods=["post"], url_path="vitals")
     def vitals(self, request, pk=None):
         scope = require_scope(request)
@@ -273,9 +376,38 @@ class EncounterViewSet(viewsets.ViewSet):
         ).exists():
             return Response({"detail": "Not found."}, status=status.HTTP_404_NOT_FOUND)
 
-        items = EncounterSelectors.timeline_items(
+        q = EncounterTimelineQuerySerializer(data=request.query_params)
+        q.is_valid(raise_exception=True)
+        params = q.validated_data
+
+        if params["stream"]:
+            return _stream_timeline(
+                encounter_id,
+                EncounterSelectors.timeline_events(
+                    tenant_id=scope.tenant_id,
+                    facility_id=scope.facility_id,
+                    encounter_id=encounter_id,
+                    after=params["after"],
+                    since=params["since_at"],
+                ),
+                cursor=params.get("cursor") or params.get("since"),
+            )
+
+        items, next_cursor, has_more = EncounterSelectors.timeline_page(
             tenant_id=scope.tenant_id,
             facility_id=scope.facility_id,
             encounter_id=encounter_id,
+            after=params["after"],
+            since=params["since_at"],
+            limit=params["limit"],
+        )
+        return Response(
+            {
+                "encounter_id": str(encounter_id),
+                "items": items,
+                # no new events: keep polling from the same position
+                "next_cursor": next_cursor or params.get("cursor") or params.get("since"),
+                "has_more": has_more,
+            },
+            status=status.HTTP_200_OK,
         )
-        return Response({"encounter_id": str(encounter_id), "items": items}, status=status.HTTP_200_OK)
@@ -0,0 +1,16 @@
+# backend/hm_core/encounters/jobs.py
+"""
+Celery jobs of the encounters app (discovered by config.celery). Without a
+broker they run eagerly in-process.
+"""
+
+from __future__ import annotations
+
+from celery import shared_task
+
+from hm_core.encounters import readiness
+
+
+@shared_task(name="encounters.recompute_ready_flags", ignore_result=True)
+def recompute_ready_flags(tenant_id: str, facility_id: str) -> int:
+    return readiness.recompute_ready_flags(tenant_id=tenant_id, facility_id=facility_id)
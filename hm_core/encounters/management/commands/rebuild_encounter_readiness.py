@@ -0,0 +1,30 @@
+# hm_core/encounters/management/commands/rebuild_encounter_readiness.py
+from __future__ import annotations
+
+from django.core.management.base import BaseCommand
+
+from hm_core.encounters import readiness
+
+
+class Command(BaseCommand):
+    help = "Recompute the EncounterReadiness projection from Task/EncounterDocument/LabResult. Only rewrites drifted rows."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--dry-run", action="store_true", help="Print counts only; do not write.")
+        parser.add_argument("--tenant-id", type=str, default=None, help="Optional tenant UUID filter.")
+        parser.add_argument("--facility-id", type=str, default=None, help="Optional facility UUID filter.")
+        parser.add_argument("--chunk-size", type=int, default=500, help="Encounters recomputed per query.")
+
+    def handle(self, *args, **opts):
+        result = readiness.rebuild(
+            tenant_id=opts["tenant_id"],
+            facility_id=opts["facility_id"],
+            chunk_size=max(1, int(opts["chunk_size"])),
+            dry_run=opts["dry_run"],
+        )
+
+        self.stdout.write(f"Encounters examined: {result.scanned}")
+        if opts["dry_run"]:
+            self.stdout.write(f"DRY RUN: readiness rows that would be repaired: {result.repaired}")
+        else:
+            self.stdout.write(f"Readiness rows repaired: {result.repaired}")
@@ -0,0 +1,104 @@
+# Generated by Django 5.2.9 on 2026-10-17 06:12
+
+import django.db.models.deletion
+import hm_core.common.models
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('patients', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Encounter',
+            fields=[
+                ('created_at', models.DateTimeField(auto_now_add=True, db_index=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('tenant_id', models.UUIDField(db_index=True)),
+                ('facility_id', models.UUIDField(db_index=True)),
+                ('status', models.CharField(choices=[('CREATED', 'Created'), ('CHECKED_IN', 'Checked In'), ('IN_CONSULT', 'In Consult'), ('CLOSED', 'Closed'), ('CANCELLED', 'Cancelled')], db_index=True, default='CREATED', max_length=32)),
+                ('scheduled_at', models.DateTimeField(blank=True, null=True)),
+                ('checked_in_at', models.DateTimeField(blank=True, null=True)),
+                ('consult_started_at', models.DateTimeField(blank=True, null=True)),
+                ('closed_at', models.DateTimeField(blank=True, null=True)),
+                ('reason', models.CharField(blank=True, max_length=255)),
+                ('attending_doctor', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='doctor_encounters', to=settings.AUTH_USER_MODEL)),
+                ('created_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='created_encounters', to=settings.AUTH_USER_MODEL)),
+                ('patient', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='encounters', to='patients.patient')),
+            ],
+            options={
+                'db_table': 'encounters_encounter',
+            },
+            bases=(hm_core.common.models.TrackedFieldsMixin, models.Model),
+        ),
+        migrations.CreateModel(
+            name='EncounterEvent',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('tenant_id', models.UUIDField(db_index=True)),
+                ('facility_id', models.UUIDField(db_index=True)),
+                ('encounter_id', models.UUIDField(db_index=True)),
+                ('type', models.CharField(default='EVENT', max_length=20)),
+                ('event_key', models.CharField(db_index=True, max_length=128)),
+                ('code', models.CharField(db_index=True, max_length=64)),
+                ('title', models.CharField(blank=True, default='', max_length=255)),
+                ('timestamp', models.DateTimeField(db_index=True)),
+                ('meta', models.JSONField(blank=True, default=dict)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'db_table': 'encounters_event',
+                'indexes': [models.Index(fields=['tenant_id', 'facility_id', 'encounter_id', 'timestamp', 'created_at', 'id'], name='encounters__tenant__983a9b_idx')],
+                'constraints': [models.UniqueConstraint(fields=('tenant_id', 'facility_id', 'encounter_id', 'event_key'), name='uq_encounterevent_key_per_scope')],
+            },
+        ),
+        migrations.CreateModel(
+            name='EncounterReadiness',
+            fields=[
+                ('created_at', models.DateTimeField(auto_now_add=True, db_index=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('tenant_id', models.UUIDField(db_index=True)),
+                ('facility_id', models.UUIDField(db_index=True)),
+                ('docs_present', models.JSONField(blank=True, default=list)),
+                ('tasks_done', models.JSONField(blank=True, default=list)),
+                ('tasks_open', models.JSONField(blank=True, default=list)),
+                ('critical_unacked_count', models.PositiveIntegerField(default=0)),
+                ('unverified_lab_count', models.PositiveIntegerField(default=0)),
+                ('is_ready_to_close', models.BooleanField(default=False)),
+                ('encounter', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='readiness', to='encounters.encounter')),
+            ],
+            options={
+                'db_table': 'encounters_readiness',
+            },
+        ),
+        migrations.AddIndex(
+            model_name='encounter',
+            index=models.Index(fields=['tenant_id', 'facility_id', 'status'], name='encounters__tenant__bc40dd_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='encounter',
+            index=models.Index(fields=['tenant_id', 'facility_id', 'patient'], name='encounters__tenant__c41901_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='encounter',
+            index=models.Index(fields=['tenant_id', 'facility_id', 'created_at'], name='encounters__tenant__a25ef7_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='encounter',
+            constraint=models.UniqueConstraint(condition=models.Q(('status__in', ['CREATED', 'CHECKED_IN', 'IN_CONSULT'])), fields=('tenant_id', 'facility_id', 'patient'), name='uq_active_encounter_per_patient_scope'),
+        ),
+        migrations.AddIndex(
+            model_name='encounterreadiness',
+            index=models.Index(fields=['tenant_id', 'facility_id', 'is_ready_to_close'], name='encounters__tenant__de4b51_idx'),
+        ),
+    ]
@@ -4,7 +4,7 @@ from typing import Iterable
 from django.conf import settings
 from django.db import models
 from django.db.models import Q
-from hm_core.common.models import ScopedModel
+from hm_core.common.models import ScopedModel, TrackedFieldsMixin
 from hm_core.patients.models import Patient
 from django.core.exceptions import ValidationError
 import uuid
@@ -25,10 +25,13 @@ class EncounterStatus(models.TextChoices):
     CANCELLED = "CANCELLED", "Cancelled"
 
 
-class Encounter(ScopedModel):
+class Encounter(TrackedFieldsMixin, ScopedModel):
     """
     OPD visit container. Everything clinical for Phase 0 hangs off Encounter.
     """
+    # lifecycle timeline receivers diff these (encounters.signals.lifecycle)
+    tracked_fields = ("status", "checked_in_at", "consult_started_at", "closed_at")
+
     patient = models.ForeignKey(Patient, on_delete=models.PROTECT, related_name="encounters")
 
     status = models.CharField(max_length=32, choices=EncounterStatus.choices, default=EncounterStatus.CREATED, db_index=True)
@@ -128,3 +131,35 @@ class EncounterEvent(models.Model):
 
     def delete(self, *args, **kwargs):
         raise ValidationError("EncounterEvent is immutable and cannot be deleted.")
+
+
+class EncounterReadiness(ScopedModel):
+    """
+    Denormalized close-gate projection (one row per encounter).
+
+    Maintained incrementally by hm_core.encounters.readiness from Task /
+    EncounterDocument / LabResult signals and the bulk emit_event call sites;
+    `manage.py rebuild_encounter_readiness` repairs drift from writes that bypass
+    signals (queryset.update(), raw SQL).
+
+    Facts are rule-independent; is_ready_to_close is evaluated against the scope's
+    close-gate rule at refresh time (and recomputed when that rule changes).
+    """
+    encounter = models.OneToOneField(Encounter, on_delete=models.CASCADE, related_name="readiness")
+
+    docs_present = models.JSONField(default=list, blank=True)  # sorted doc kinds
+    tasks_done = models.JSONField(default=list, blank=True)  # task codes with a DONE task
+    tasks_open = models.JSONField(default=list, blank=True)  # codes with OPEN/IN_PROGRESS tasks and no DONE
+    critical_unacked_count = models.PositiveIntegerField(default=0)
+    unverified_lab_count = models.PositiveIntegerField(default=0)
+
+    is_ready_to_close = models.BooleanField(default=False)
+
+    class Meta:
+        db_table = "encounters_readiness"
+        indexes = [
+            models.Index(fields=["tenant_id", "facility_id", "is_ready_to_close"]),
+        ]
+
+    def __str__(self) -> str:
+        return f"EncounterReadiness({self.encounter_id}, ready={self.is_ready_to_close})"
@@ -0,0 +1,310 @@
+# backend/hm_core/encounters/readiness.py
+"""
+EncounterReadiness projection maintenance.
+
+Writes queue their encounters with refresh_on_commit(): one refresh per
+transaction and scope, after commit. Each refresh recomputes the projection rows
+of the touched encounters from the source tables in ONE statement (encounter rows
+annotated with array / count subqueries) and upserts them in one more, so
+maintenance is incremental per encounter and idempotent (no counters that can
+drift on retries).
+
+Call sites:
+  - encounters.signals.readiness: Task / EncounterDocument / LabResult save/delete
+  - EncounterService._emit_task_created_events: bulk_create'd default tasks
+  - rules_changed for the close-gate rule: is_ready_to_close re-evaluated by the
+    encounters.recompute_ready_flags job, queued on commit
+  - manage.py rebuild_encounter_readiness: drift repair
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Iterable, Optional
+from uuid import UUID
+
+from django.contrib.postgres.expressions import ArraySubquery
+from django.db import transaction
+from django.db.models import F, Func, IntegerField, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from hm_core.clinical_docs.models import EncounterDocument
+from hm_core.encounters.models import Encounter, EncounterReadiness, EncounterStatus
+from hm_core.rules.engine import CRITICAL_ACK_TASK_CODE, CloseGateConfig, CloseGateFacts, RuleEngine
+from hm_core.tasks.models import Task, TaskStatus
+
+FACT_FIELDS = [
+    "docs_present",
+    "tasks_done",
+    "tasks_open",
+    "critical_unacked_count",
+    "unverified_lab_count",
+    "is_ready_to_close",
+]
+
+OPEN_ENCOUNTER_STATUSES = [EncounterStatus.CREATED, EncounterStatus.CHECKED_IN, EncounterStatus.IN_CONSULT]
+
+
+@dataclass(frozen=True)
+class RebuildResult:
+    scanned: int
+    repaired: int
+
+
+def _count(qs) -> Coalesce:
+    return Coalesce(
+        Subquery(qs.order_by().annotate(_n=Func(F("pk"), function="COUNT")).values("_n")),
+        0,
+        output_field=IntegerField(),
+    )
+
+
+def _annotate_facts(encounters):
+    from hm_core.lab.models import LabResult  # local import
+
+    scope = {
+        "tenant_id": OuterRef("tenant_id"),
+        "facility_id": OuterRef("facility_id"),
+        "encounter_id": OuterRef("pk"),
+    }
+    tasks = Task.objects.filter(**scope)
+
+    return encounters.annotate(
+        r_docs=ArraySubquery(
+            EncounterDocument.objects.filter(**scope).order_by("kind").values("kind").distinct()
+        ),
+        r_done=ArraySubquery(tasks.filter(status=TaskStatus.DONE).order_by("code").values("code").distinct()),
+        r_active=ArraySubquery(
+            tasks.filter(status__in=[TaskStatus.OPEN, TaskStatus.IN_PROGRESS])
+            .order_by("code")
+            .values("code")
+            .distinct()
+        ),
+        r_critical=_count(tasks.filter(code=CRITICAL_ACK_TASK_CODE).exclude(status=TaskStatus.DONE)),
+        r_unverified=_count(LabResult.objects.filter(**scope, verified_at__isnull=True)),
+    ).values("pk", "tenant_id", "facility_id", "r_docs", "r_done", "r_active", "r_critical", "r_unverified")
+
+
+def is_ready_to_close(*, gate: CloseGateConfig, facts: CloseGateFacts) -> bool:
+    """
+    Would close-strict (RuleEngine.enforce_encounter_close_gate) pass on these facts?
+    """
+    if not RuleEngine.evaluate_completeness(gate=gate, facts=facts).ok:
+        return False
+    if gate.block_on_critical_unacked and facts.critical_unacked:
+        return False
+    if gate.block_on_unverified_lab and facts.unverified_lab:
+        return False
+    return True
+
+
+def compute(encounters) -> list[EncounterReadiness]:
+    """
+    Fresh (unsaved) projection rows for an Encounter queryset, in one query.
+    """
+    gates: dict[tuple[UUID, UUID], CloseGateConfig] = {}
+    out: list[EncounterReadiness] = []
+
+    for row in _annotate_facts(encounters):
+        scope = (row["tenant_id"], row["facility_id"])
+        gate = gates.get(scope)
+        if gate is None:
+            gate = gates[scope] = RuleEngine.get_close_gate_config(tenant_id=scope[0], facility_id=scope[1])
+
+        done = sorted(set(row["r_done"] or ()))
+        obj = EncounterReadiness(
+            tenant_id=row["tenant_id"],
+            facility_id=row["facility_id"],
+            encounter_id=row["pk"],
+            docs_present=sorted(set(row["r_docs"] or ())),
+            tasks_done=done,
+            tasks_open=sorted(set(row["r_active"] or ()) - set(done)),
+            critical_unacked_count=row["r_critical"],
+            unverified_lab_count=row["r_unverified"],
+        )
+        obj.is_ready_to_close = is_ready_to_close(gate=gate, facts=CloseGateFacts.from_readiness(obj))
+        out.append(obj)
+    return out
+
+
+def _upsert(rows: list[EncounterReadiness]) -> None:
+    if not rows:
+        return
+    EncounterReadiness.objects.bulk_create(
+        rows,
+        update_conflicts=True,
+        unique_fields=["encounter"],
+        update_fields=[*FACT_FIELDS, "updated_at"],
+    )
+
+
+def refresh(*, tenant_id: UUID, facility_id: UUID, encounter_ids: Iterable[UUID]) -> int:
+    """
+    Recompute + upsert the projection for the given encounters (2 queries).
+    Unknown encounters are ignored. Returns the number of rows written.
+    """
+    encounter_ids = list({eid for eid in encounter_ids if eid})
+    if not encounter_ids:
+        return 0
+
+    rows = compute(Encounter.objects.filter(tenant_id=tenant_id, facility_id=facility_id, pk__in=encounter_ids))
+    _upsert(rows)
+    return len(rows)
+
+
+class _PendingRefresh:
+    """
+    The single post-commit refresh of one transaction. It is the callback queued
+    with transaction.on_commit and collects the encounters touched by later writes,
+    so the pending set is discarded together with the queue on rollback.
+
+    `stale` tracks what refresh_pending() has not refreshed inline yet; `scopes`
+    everything the commit refresh covers.
+    """
+
+    def __init__(self) -> None:
+        self.scopes: dict[tuple[UUID, UUID], set[UUID]] = {}
+        self.stale: dict[tuple[UUID, UUID], set[UUID]] = {}
+
+    def add(self, tenant_id, facility_id, encounter_ids: Iterable[UUID]) -> None:
+        scope = (UUID(str(tenant_id)), UUID(str(facility_id)))
+        ids = {UUID(str(eid)) for eid in encounter_ids if eid}
+        self.scopes.setdefault(scope, set()).update(ids)
+        self.stale.setdefault(scope, set()).update(ids)
+
+    def take_stale(self, tenant_id, facility_id, encounter_ids: Iterable[UUID]) -> set[UUID]:
+        stale = self.stale.get((UUID(str(tenant_id)), UUID(str(facility_id))), set())
+        taken = stale.intersection(UUID(str(eid)) for eid in encounter_ids if eid)
+        stale -= taken
+        return taken
+
+    def __call__(self) -> None:
+        for (tenant_id, facility_id), ids in self.scopes.items():
+            refresh(tenant_id=tenant_id, facility_id=facility_id, encounter_ids=ids)
+
+
+def _pending() -> Optional[_PendingRefresh]:
+    """
+    This transaction's pending refresh, if one is still queued. Django replaces
+    run_on_commit with a new list on commit and (savepoint) rollback, so the
+    list identity tells whether the remembered callback is still part of it.
+    """
+    connection = transaction.get_connection()
+    remembered = getattr(connection, "_readiness_pending", None)
+    if remembered and remembered[0] is connection.run_on_commit:
+        return remembered[1]
+    return None
+
+
+def refresh_on_commit(*, tenant_id: UUID, facility_id: UUID, encounter_ids: Iterable[UUID]) -> None:
+    """
+    Refresh the encounters once, after the current transaction commits (right
+    away in autocommit). Any number of writes in one transaction share a single
+    refresh per scope; a refresh that runs after commit also makes concurrent
+    writers on one encounter converge on the committed state.
+
+    Callers reading the projection inside the writing transaction use
+    refresh_pending() first.
+    """
+    connection = transaction.get_connection()
+    if not connection.in_atomic_block:
+        refresh(tenant_id=tenant_id, facility_id=facility_id, encounter_ids=encounter_ids)
+        return
+
+    pending = _pending()
+    if pending is None:
+        pending = _PendingRefresh()
+        transaction.on_commit(pending)
+        connection._readiness_pending = (connection.run_on_commit, pending)
+    pending.add(tenant_id, facility_id, encounter_ids)
+
+
+def refresh_pending(*, tenant_id: UUID, facility_id: UUID, encounter_ids: Iterable[UUID]) -> int:
+    """
+    Refresh now those of the encounters written since the last inline refresh of
+    this transaction (they are refreshed again on commit). Costs nothing when
+    none are pending.
+    """
+    pending = _pending()
+    if pending is None:
+        return 0
+    return refresh(
+        tenant_id=tenant_id,
+        facility_id=facility_id,
+        encounter_ids=pending.take_stale(tenant_id, facility_id, encounter_ids),
+    )
+
+
+def recompute_ready_flags(*, tenant_id: UUID, facility_id: UUID) -> int:
+    """
+    Re-evaluate is_ready_to_close of a scope's open encounters from their stored
+    facts (close-gate rule changed). Returns the number of rows whose flag flipped.
+
+    Scans the whole scope: run it from encounters.jobs, not inside a request.
+    """
+    gate = RuleEngine.get_close_gate_config(tenant_id=tenant_id, facility_id=facility_id)
+
+    changed: list[EncounterReadiness] = []
+    qs = EncounterReadiness.objects.filter(
+        tenant_id=tenant_id,
+        facility_id=facility_id,
+        encounter__status__in=OPEN_ENCOUNTER_STATUSES,
+    )
+    ts = timezone.now()
+    for obj in qs.iterator(chunk_size=2000):
+        ready = is_ready_to_close(gate=gate, facts=CloseGateFacts.from_readiness(obj))
+        if ready != obj.is_ready_to_close:
+            obj.is_ready_to_close = ready
+            obj.updated_at = ts
+            changed.append(obj)
+
+    EncounterReadiness.objects.bulk_update(changed, ["is_ready_to_close", "updated_at"], batch_size=1000)
+    return len(changed)
+
+
+def rebuild(
+    *,
+    tenant_id: Optional[UUID] = None,
+    facility_id: Optional[UUID] = None,
+    chunk_size: int = 500,
+    dry_run: bool = False,
+) -> RebuildResult:
+    """
+    Recompute every projection row (optionally for one tenant/facility) and write
+    only rows that are missing or differ. Walks encounters in pk order (keyset),
+    one compute + one compare query per chunk.
+    """
+    qs = Encounter.objects.all()
+    if tenant_id:
+        qs = qs.filter(tenant_id=tenant_id)
+    if facility_id:
+        qs = qs.filter(facility_id=facility_id)
+    qs = qs.order_by("pk")
+
+    scanned = repaired = 0
+    last_pk = None
+    while True:
+        chunk = qs if last_pk is None else qs.filter(pk__gt=last_pk)
+        ids = list(chunk.values_list("pk", flat=True)[:chunk_size])
+        if not ids:
+            break
+        last_pk = ids[-1]
+
+        fresh = compute(Encounter.objects.filter(pk__in=ids))
+        current = {
+            row["encounter_id"]: row
+            for row in EncounterReadiness.objects.filter(encounter_id__in=ids).values("encounter_id", *FACT_FIELDS)
+        }
+        stale = [
+            obj
+            for obj in fresh
+            if current.get(obj.encounter_id) != {"encounter_id": obj.encounter_id, **{f: getattr(obj, f) for f in FACT_FIELDS}}
+        ]
+
+        scanned += len(fresh)
+        repaired += len(stale)
+        if not dry_run:
+            _upsert(stale)
+
+    return RebuildResult(scanned=scanned, repaired=repaired)
@@ -1,12 +1,20 @@
 # backend/hm_core/encounters/selectors.py
 from __future__ import annotations
 
+from datetime import datetime
 from uuid import UUID
 
 from django.db.models import QuerySet
 
+from hm_core.common.api import keyset
 from hm_core.encounters.models import Encounter, EncounterEvent
 
+TIMELINE_KEYSET = ("timestamp", "created_at", "id")
+TIMELINE_CURSOR = (keyset.as_datetime, keyset.as_datetime, keyset.as_uuid)
+TIMELINE_DEFAULT_LIMIT = 200
+TIMELINE_MAX_LIMIT = 1000
+TIMELINE_STREAM_CHUNK_SIZE = 500
+
 
 class EncounterSelectors:
     """
@@ -21,9 +29,18 @@ class EncounterSelectors:
         facility_id: UUID,
         patient_id: UUID | None = None,
         status: str | None = None,
+        ready_to_close: bool | None = None,
     ) -> QuerySet[Encounter]:
         qs = Encounter.objects.filter(tenant_id=tenant_id, facility_id=facility_id).select_related("patient")
 
+        if ready_to_close is not None:
+            # EncounterReadiness projection (tenant_id, facility_id, is_ready_to_close) index
+            qs = qs.filter(
+                readiness__tenant_id=tenant_id,
+                readiness__facility_id=facility_id,
+                readiness__is_ready_to_close=ready_to_close,
+            )
+
         if patient_id:
             qs = qs.filter(patient_id=patient_id)
 
@@ -33,27 +50,73 @@ class EncounterSelectors:
         return qs.order_by("-created_at")
 
     @staticmethod
-    def timeline_items(*, tenant_id: UUID, facility_id: UUID, encounter_id: UUID) -> list[dict]:
-        events = (
-            EncounterEvent.objects.filter(
-                tenant_id=tenant_id,
-                facility_id=facility_id,
-                encounter_id=encounter_id,
-            )
-            .order_by("timestamp", "created_at")
+    def timeline_events(
+        *,
+        tenant_id: UUID,
+        facility_id: UUID,
+        encounter_id: UUID,
+        after: list | None = None,
+        since: datetime | None = None,
+    ) -> QuerySet[EncounterEvent]:
+        """
+        Events in keyset order (timestamp, created_at, id) - the composite index on
+        encounters_event. `after` is a decoded cursor: only events strictly after it;
+        `since` keeps events with timestamp > since.
+        """
+        qs = EncounterEvent.objects.filter(
+            tenant_id=tenant_id,
+            facility_id=facility_id,
+            encounter_id=encounter_id,
         )
+        if after is not None:
+            qs = qs.filter(keyset.after(TIMELINE_KEYSET, after))
+        if since is not None:
+            qs = qs.filter(timestamp__gt=since)
+        return qs.order_by(*TIMELINE_KEYSET).values("id", "code", "title", "timestamp", "created_at", "meta")
 
-        items: list[dict] = []
-        for e in events:
-            at = getattr(e, "timestamp", None) or getattr(e, "created_at", None)
-            items.append(
-                {
-                    "type": "EVENT",
-                    "id": str(e.id),
-                    "code": e.code,
-                    "title": getattr(e, "title", "") or "",
-                    "at": at,
-                    "meta": getattr(e, "meta", None) or {},
-                }
-            )
-        return items
+    @staticmethod
+    def timeline_item(row: dict) -> dict:
+        return {
+            "type": "EVENT",
+            "id": str(row["id"]),
+            "code": row["code"],
+            "title": row.get("title") or "",
+            "at": row.get("timestamp") or row.get("created_at"),
+            "meta": row.get("meta") or {},
+        }
+
+    @staticmethod
+    def timeline_cursor(row: dict) -> str:
+        return keyset.encode_cursor([row[f] for f in TIMELINE_KEYSET])
+
+    @staticmethod
+    def timeline_page(
+        *,
+        tenant_id: UUID,
+        facility_id: UUID,
+        encounter_id: UUID,
+        after: list | None = None,
+        since: datetime | None = None,
+        limit: int = TIMELINE_DEFAULT_LIMIT,
+    ) -> tuple[list[dict], str | None, bool]:
+        """
+        One keyset page: (items, next_cursor, has_more).
+        next_cursor is the position of the last returned event (None if the page is
+        empty) - pass it back as `cursor` for the next page or `since` when polling.
+        """
+        rows = list(
+            EncounterSelectors.timeline_events(
+                tenant_id=tenant_id, facility_id=facility_id, encounter_id=encounter_id, after=after, since=since
+            )[: limit + 1]
+        )
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        next_cursor = EncounterSelectors.timeline_cursor(rows[-1]) if rows else None
+        return [EncounterSelectors.timeline_item(r) for r in rows], next_cursor, has_more
+
+    @staticmethod
+    def timeline_items(*, tenant_id: UUID, facility_id: UUID, encounter_id: UUID) -> list[dict]:
+        events = EncounterSelectors.timeline_events(
+            tenant_id=tenant_id, facility_id=facility_id, encounter_id=encounter_id
+        )
+        return [EncounterSelectors.timeline_item(r) for r in events]
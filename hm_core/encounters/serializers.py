@@ -2,7 +2,7 @@
 
 from hm_core.clinical_docs.models import EncounterDocument
 from rest_framework import serializers
-from hm_core.encounters.models import Encounter
+from hm_core.encounters.models import Encounter, EncounterStatus
 
 
 class EncounterCreateSerializer(serializers.Serializer):
@@ -12,6 +12,46 @@ class EncounterCreateSerializer(serializers.Serializer):
     scheduled_at = serializers.DateTimeField(required=False, allow_null=True)
 
 
+class EncounterBatchCreateSerializer(serializers.Serializer):
+    """
+    POST /encounters/create:batch/
+    """
+
+    MAX_ITEMS = 500
+
+    items = serializers.ListField(
+        child=EncounterCreateSerializer(),
+        allow_empty=False,
+        max_length=MAX_ITEMS,
+    )
+
+
+class CloseGateBatchInputSerializer(serializers.Serializer):
+    """
+    POST /encounters/close-gate:batch/
+    Either an explicit id list or a status filter (e.g. the OPD board's open encounters).
+    """
+
+    MAX_ENCOUNTERS = 500
+
+    encounter_ids = serializers.ListField(
+        child=serializers.UUIDField(),
+        required=False,
+        allow_empty=False,
+        max_length=MAX_ENCOUNTERS,
+    )
+    status = serializers.ListField(
+        child=serializers.ChoiceField(choices=EncounterStatus.choices),
+        required=False,
+        allow_empty=False,
+    )
+
+    def validate(self, attrs):
+        if bool(attrs.get("encounter_ids")) == bool(attrs.get("status")):
+            raise serializers.ValidationError("Provide exactly one of encounter_ids or status.")
+        return attrs
+
+
 class EncounterSerializer(serializers.ModelSerializer):
     class Meta:
         model = Encounter
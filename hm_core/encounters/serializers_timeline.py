@@ -1,6 +1,10 @@
 # backend/hm_core/encounters/serializers_timeline.py
+from django.utils.dateparse import parse_datetime
 from rest_framework import serializers
 
+from hm_core.common.api import keyset
+from hm_core.encounters.selectors import TIMELINE_CURSOR, TIMELINE_DEFAULT_LIMIT, TIMELINE_MAX_LIMIT
+
 
 class EncounterTimelineEventSerializer(serializers.Serializer):
     type = serializers.CharField()
@@ -20,3 +24,38 @@ class EncounterTimelineEventSerializer(serializers.Serializer):
 class EncounterTimelineSerializer(serializers.Serializer):
     encounter = serializers.DictField()
     events = EncounterTimelineEventSerializer(many=True)
+
+
+class EncounterTimelineQuerySerializer(serializers.Serializer):
+    """
+    GET /encounters/{id}/timeline/ query params.
+
+    cursor: next_cursor of a previous page
+    since:  next_cursor of a previous poll, or an ISO datetime (events after it)
+    limit:  page size (ignored when streaming)
+    stream: stream the whole (remaining) timeline as one JSON document
+    """
+
+    cursor = serializers.CharField(required=False)
+    since = serializers.CharField(required=False)
+    limit = serializers.IntegerField(required=False, min_value=1, max_value=TIMELINE_MAX_LIMIT, default=TIMELINE_DEFAULT_LIMIT)
+    stream = serializers.BooleanField(required=False, default=False)
+
+    def validate(self, attrs):
+        if attrs.get("cursor") and attrs.get("since"):
+            raise serializers.ValidationError("Provide either cursor or since, not both.")
+
+        attrs["after"] = None
+        attrs["since_at"] = None
+        if attrs.get("cursor"):
+            attrs["after"] = keyset.decode_cursor(attrs["cursor"], types=TIMELINE_CURSOR)
+        elif attrs.get("since"):
+            try:
+                is_datetime = parse_datetime(attrs["since"]) is not None
+            except ValueError:
+                is_datetime = True  # well-formed but invalid: let DateTimeField report it
+            if is_datetime:
+                attrs["since_at"] = serializers.DateTimeField().to_internal_value(attrs["since"])
+            else:
+                attrs["after"] = keyset.decode_cursor(attrs["since"], types=TIMELINE_CURSOR)
+        return attrs
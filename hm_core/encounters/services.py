@@ -1,30 +1,70 @@
 # backend/hm_core/encounters/services.py
 from __future__ import annotations
 
+from dataclasses import dataclass
+from typing import Iterable, Optional
 from uuid import UUID
 
 from django.db import IntegrityError, transaction
 from django.utils import timezone
 from django.utils.timezone import now
 
-from hm_core.audit.services import AuditService
+from hm_core.audit.services import AuditRecord, AuditService
 from hm_core.clinical_docs.models import EncounterDocument
 from hm_core.common.events import publish
+from hm_core.encounters import readiness
 from hm_core.encounters.constants import EncounterStatus
 from hm_core.encounters.models import Encounter
-from hm_core.encounters.signals._emit import emit_event
+from hm_core.encounters.signals._emit import emit_event, event_buffer
 from hm_core.patients.models import Patient
 from hm_core.rules.engine import RuleEngine
 from hm_core.tasks.models import Task, TaskStatus
 from hm_core.tasks.services import TaskService
 
+DEFAULT_ENCOUNTER_TASKS = [
+    {"code": "record-vitals", "title": "Record Vitals"},
+    {"code": "doctor-consult", "title": "Doctor Consultation"},
+]
+
+ACTIVE_ENCOUNTER_EXISTS = "Active encounter already exists for this patient in this facility."
+
+
+@dataclass(frozen=True)
+class EncounterCreateResult:
+    index: int
+    patient_id: UUID
+    encounter: Optional[Encounter] = None
+    error: str = ""
+
+    @property
+    def ok(self) -> bool:
+        return self.encounter is not None
+
 
 class EncounterService:
     # ---------------------------------------------------------------------
     # Helpers
     # ---------------------------------------------------------------------
+    @staticmethod
+    def _default_tasks(*, tenant_id, facility_id, encounter_id) -> list[Task]:
+        """
+        Unsaved default Phase-0 tasks of a new encounter.
+        """
+        return [
+            Task(
+                tenant_id=tenant_id,
+                facility_id=facility_id,
+                encounter_id=encounter_id,
+                code=t["code"],
+                title=t["title"],
+                status=TaskStatus.OPEN,
+            )
+            for t in DEFAULT_ENCOUNTER_TASKS
+        ]
+
     @staticmethod
     @transaction.atomic
+    @event_buffer()
     def _emit_task_created_events(*, tenant_id, facility_id, encounter_id, tasks) -> int:
         """
         Emit TASK_CREATED events for tasks created via bulk operations.
@@ -52,6 +92,9 @@ class EncounterService:
                 },
             )
             count += 1
+
+        # bulk_create also bypasses the readiness projection signals
+        readiness.refresh_on_commit(tenant_id=tenant_id, facility_id=facility_id, encounter_ids=[encounter_id])
         return count
 
     # ---------------------------------------------------------------------
@@ -59,6 +102,7 @@ class EncounterService:
     # ---------------------------------------------------------------------
     @staticmethod
     @transaction.atomic
+    @event_buffer()
     def create(
         *,
         tenant_id: UUID,
@@ -87,7 +131,7 @@ class EncounterService:
                 scheduled_at=scheduled_at,
             )
         except IntegrityError:
-            raise ValueError("Active encounter already exists for this patient in this facility.")
+            raise ValueError(ACTIVE_ENCOUNTER_EXISTS)
 
         # ENCOUNTER_CREATED (idempotent)
         emit_event(
@@ -106,22 +150,7 @@ class EncounterService:
         )
 
         # Default Phase-0 tasks (bulk_create bypasses signals)
-        default_tasks = [
-            {"code": "record-vitals", "title": "Record Vitals"},
-            {"code": "doctor-consult", "title": "Doctor Consultation"},
-        ]
-
-        task_objs = [
-            Task(
-                tenant_id=tenant_id,
-                facility_id=facility_id,
-                encounter_id=enc.id,
-                code=t["code"],
-                title=t["title"],
-                status=TaskStatus.OPEN,
-            )
-            for t in default_tasks
-        ]
+        task_objs = EncounterService._default_tasks(tenant_id=tenant_id, facility_id=facility_id, encounter_id=enc.id)
 
         created_tasks = Task.objects.bulk_create(task_objs)
 
@@ -156,6 +185,158 @@ class EncounterService:
 
     @staticmethod
     @transaction.atomic
+    @event_buffer()
+    def create_many(
+        *,
+        tenant_id: UUID,
+        facility_id: UUID,
+        items: list[dict],
+        actor_user_id: int | None,
+    ) -> list[EncounterCreateResult]:
+        """
+        Register many walk-ins at once (OPD intake / health camps).
+
+        items: [{"patient_id", "reason"?, "attending_doctor_id"?, "scheduled_at"?}, ...]
+        Returns one EncounterCreateResult per item, in order. An item fails (without
+        failing the batch) when its patient is unknown in this scope or already has
+        an active encounter - including a concurrent registration that wins the race
+        on uq_active_encounter_per_patient_scope.
+
+        Query budget is constant in len(items): patients, active encounters,
+        encounter INSERT ... ON CONFLICT DO NOTHING + inserted-id check, tasks,
+        events, audit rows, readiness refresh.
+        """
+        results: list[EncounterCreateResult | None] = [None] * len(items)
+        patient_ids = {item["patient_id"] for item in items}
+
+        known = set(
+            Patient.objects.filter(tenant_id=tenant_id, facility_id=facility_id, id__in=patient_ids).values_list(
+                "id", flat=True
+            )
+        )
+        busy = set(
+            Encounter.objects.filter(
+                tenant_id=tenant_id,
+                facility_id=facility_id,
+                patient_id__in=known,
+                # statuses covered by uq_active_encounter_per_patient_scope
+                status__in=readiness.OPEN_ENCOUNTER_STATUSES,
+            ).values_list("patient_id", flat=True)
+        )
+
+        pending: list[tuple[int, Encounter]] = []
+        for idx, item in enumerate(items):
+            pid = item["patient_id"]
+            if pid not in known:
+                results[idx] = EncounterCreateResult(index=idx, patient_id=pid, error="Patient not found.")
+                continue
+            if pid in busy:
+                results[idx] = EncounterCreateResult(index=idx, patient_id=pid, error=ACTIVE_ENCOUNTER_EXISTS)
+                continue
+            busy.add(pid)  # same patient twice in one batch: first item wins
+            pending.append(
+                (
+                    idx,
+                    Encounter(
+                        tenant_id=tenant_id,
+                        facility_id=facility_id,
+                        patient_id=pid,
+                        status=EncounterStatus.CREATED,
+                        reason=item.get("reason") or "",
+                        attending_doctor_id=item.get("attending_doctor_id"),
+                        created_by_id=actor_user_id,
+                        scheduled_at=item.get("scheduled_at"),
+                    ),
+                )
+            )
+
+        # Rows losing a race on the partial unique index are skipped, not raised.
+        Encounter.objects.bulk_create([enc for _, enc in pending], ignore_conflicts=True)
+        inserted = set(
+            Encounter.objects.filter(id__in=[enc.id for _, enc in pending]).values_list("id", flat=True)
+        )
+
+        created: list[Encounter] = []
+        for idx, enc in pending:
+            if enc.id not in inserted:
+                results[idx] = EncounterCreateResult(index=idx, patient_id=enc.patient_id, error=ACTIVE_ENCOUNTER_EXISTS)
+                continue
+            created.append(enc)
+            results[idx] = EncounterCreateResult(index=idx, patient_id=enc.patient_id, encounter=enc)
+
+        if not created:
+            return results
+
+        tasks = Task.objects.bulk_create(
+            [
+                t
+                for enc in created
+                for t in EncounterService._default_tasks(tenant_id=tenant_id, facility_id=facility_id, encounter_id=enc.id)
+            ]
+        )
+
+        # bulk_create bypasses the lifecycle/task signals: emit here (one buffered INSERT)
+        for enc in created:
+            emit_event(
+                tenant_id=tenant_id,
+                facility_id=facility_id,
+                encounter_id=enc.id,
+                event_key=f"ENCOUNTER_CREATED:{enc.id}",
+                code="ENCOUNTER_CREATED",
+                title="Encounter created",
+                timestamp=enc.created_at,
+                meta={"encounter_id": str(enc.id), "patient_id": str(enc.patient_id), "status": enc.status},
+            )
+        for task in tasks:
+            emit_event(
+                tenant_id=tenant_id,
+                facility_id=facility_id,
+                encounter_id=task.encounter_id,
+                event_key=f"TASK_CREATED:{task.id}",
+                code="TASK_CREATED",
+                title="Task created",
+                timestamp=task.created_at,
+                meta={
+                    "task_id": str(task.id),
+                    "task_code": task.code,
+                    "task_title": task.title,
+                    "status": task.status,
+                },
+            )
+
+        readiness.refresh_on_commit(
+            tenant_id=tenant_id, facility_id=facility_id, encounter_ids=[enc.id for enc in created]
+        )
+
+        AuditService.log_many(
+            AuditRecord(
+                event_code="encounter.created",
+                entity_type="Encounter",
+                entity_id=enc.id,
+                tenant_id=tenant_id,
+                facility_id=facility_id,
+                actor_user_id=actor_user_id,
+                metadata={"patient_id": str(enc.patient_id)},
+            )
+            for enc in created
+        )
+
+        for enc in created:
+            publish(
+                "encounter.created",
+                {
+                    "tenant_id": str(tenant_id),
+                    "facility_id": str(facility_id),
+                    "encounter_id": str(enc.id),
+                    "actor_user_id": actor_user_id,
+                },
+            )
+
+        return results
+
+    @staticmethod
+    @transaction.atomic
+    @event_buffer()
     def checkin(
         *,
         tenant_id: UUID,
@@ -192,6 +373,7 @@ class EncounterService:
 
     @staticmethod
     @transaction.atomic
+    @event_buffer()
     def start_consult(
         *,
         tenant_id: UUID,
@@ -349,12 +531,48 @@ class EncounterService:
           - a flat "missing" list that includes labels + codes
             (needed because some tests assert presence of "tasks_open"/"TASKS")
         """
-        result = RuleEngine.check_encounter_close_gate(
+        payloads = EncounterService.get_close_gate_many(
             tenant_id=tenant_id,
             facility_id=facility_id,
-            encounter_id=encounter_id,
+            encounter_ids=[encounter_id],
+        )
+        return payloads.get(UUID(str(encounter_id))) or EncounterService._close_gate_payload(
+            RuleEngine.check_encounter_close_gate(
+                tenant_id=tenant_id,
+                facility_id=facility_id,
+                encounter_id=encounter_id,
+            ),
+            critical_unacked=False,
+        )
+
+    @staticmethod
+    def get_close_gate_many(*, tenant_id: UUID, facility_id: UUID, encounter_ids: Iterable[UUID]) -> dict:
+        """
+        get_close_gate payloads for many encounters (worklist "ready to close" badges).
+
+        Set-based: the rule comes from the compiled rule cache and all docs/tasks/
+        critical-ack facts are loaded in one statement, whatever the number of
+        encounters. Unknown / out-of-scope ids are omitted from the result.
+        """
+        gate = RuleEngine.get_close_gate_config(tenant_id=tenant_id, facility_id=facility_id)
+        facts_by_id = RuleEngine.gather_close_gate_facts_many(
+            tenant_id=tenant_id,
+            facility_id=facility_id,
+            encounter_ids=encounter_ids,
+            gate=gate,
+            # advisory safety marker is reported regardless of the rule's strict toggle
+            critical_ack=True,
         )
+        return {
+            eid: EncounterService._close_gate_payload(
+                RuleEngine.evaluate_completeness(gate=gate, facts=facts),
+                critical_unacked=facts.critical_unacked,
+            )
+            for eid, facts in facts_by_id.items()
+        }
 
+    @staticmethod
+    def _close_gate_payload(result, *, critical_unacked: bool) -> dict:
         missing_map = getattr(result, "missing", {}) or {}
         docs_missing = list(missing_map.get("docs_missing") or [])
         tasks_open = list(missing_map.get("tasks_open") or [])
@@ -366,13 +584,7 @@ class EncounterService:
             missing_list += ["TASKS", "tasks_open", *tasks_open]
 
         # Safety advisory (helpful for UI)
-        try:
-            RuleEngine.enforce_critical_ack_gate(
-                tenant_id=tenant_id,
-                facility_id=facility_id,
-                encounter_id=encounter_id,
-            )
-        except Exception:
+        if critical_unacked:
             missing_list += ["SAFETY", "CRITICAL_ACK", "critical-result-ack"]
 
         return {
@@ -392,6 +604,7 @@ class EncounterService:
     # ---------------------------------------------------------------------
     @staticmethod
     @transaction.atomic
+    @event_buffer()
     def close(
         *,
         tenant_id: UUID,
@@ -438,6 +651,7 @@ class EncounterService:
 
     @staticmethod
     @transaction.atomic
+    @event_buffer()
     def close_strict(
         *,
         tenant_id: UUID,
@@ -4,3 +4,4 @@
 from .lifecycle import *  # noqa: F401,F403
 from .task_events import *  # noqa: F401,F403
 from .doc_events import *  # noqa: F401,F403
+from .readiness import *  # noqa: F401,F403
@@ -1,12 +1,63 @@
 # hm_core/encounters/signals/_emit.py
 from __future__ import annotations
 
+import threading
+from contextlib import contextmanager
 from typing import Any, Dict, Optional
 
 from django.utils.timezone import now
 
 from hm_core.encounters.models import EncounterEvent
 
+_state = threading.local()
+
+
+def _pending() -> Optional[dict]:
+    return getattr(_state, "events", None)
+
+
+def _insert(events: list[EncounterEvent]) -> None:
+    """
+    One INSERT ... ON CONFLICT DO NOTHING: rows whose (tenant, facility, encounter,
+    event_key) already exist (uq_encounterevent_key_per_scope) are skipped.
+    """
+    if events:
+        EncounterEvent.objects.bulk_create(events, ignore_conflicts=True)
+
+
+@contextmanager
+def event_buffer():
+    """
+    Collect emit_event() calls and write them in one statement when the block exits.
+
+    Use INSIDE the transaction (below @transaction.atomic), so the flush happens
+    before commit and rolls back with it:
+
+        @staticmethod
+        @transaction.atomic
+        @event_buffer()
+        def create(...): ...
+
+    - events are de-duplicated in memory by scope + event_key (first emit wins,
+      same as the old get_or_create; signal receivers and services emit the same keys)
+    - nested buffers join the outermost one, which does the flush
+    - on an exception the buffer is discarded (the transaction rolls back anyway)
+
+    Don't swallow rollbacks of inner savepoints inside a buffered block: events
+    emitted there would still be flushed.
+    """
+    if _pending() is not None:
+        yield
+        return
+
+    _state.events = {}
+    try:
+        yield
+        events = list(_state.events.values())
+    finally:
+        _state.events = None
+    _insert(events)
+
 
 def emit_event(
     *,
@@ -28,23 +79,29 @@ def emit_event(
     - Writing the event inside the same DB transaction is safe: if the transaction
       rolls back, the event row rolls back too (no "ghost history").
 
-    So we write immediately (still idempotent via event_key uniqueness).
+    So we never defer to on_commit: outside an event_buffer() the event is written
+    immediately, inside one it is written when the buffer exits - still within the
+    transaction. Either way idempotent via event_key uniqueness (ON CONFLICT DO NOTHING).
     """
     if timestamp is None:
         timestamp = now()
     if meta is None:
         meta = {}
 
-    EncounterEvent.objects.get_or_create(
+    event = EncounterEvent(
         tenant_id=tenant_id,
         facility_id=facility_id,
         encounter_id=encounter_id,
         event_key=event_key,
-        defaults={
-            "type": "EVENT",
-            "code": code,
-            "title": title,
-            "timestamp": timestamp,
-            "meta": meta,
-        },
+        type="EVENT",
+        code=code,
+        title=title,
+        timestamp=timestamp,
+        meta=meta,
     )
+
+    pending = _pending()
+    if pending is None:
+        _insert([event])
+        return
+    pending.setdefault((str(tenant_id), str(facility_id), str(encounter_id), event_key), event)
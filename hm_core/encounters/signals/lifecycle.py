@@ -1,19 +1,9 @@
 # hm_core/encounters/signals/lifecycle.py
-from django.db.models.signals import pre_save, post_save
+from django.db.models.signals import post_save
 from django.dispatch import receiver
 
-from hm_core.encounters.models import Encounter, EncounterEvent
-
-
-@receiver(pre_save, sender=Encounter)
-def encounter_pre_save(sender, instance: Encounter, **kwargs):
-    if not instance.pk:
-        instance._pre_save_snapshot = None
-        return
-    try:
-        instance._pre_save_snapshot = Encounter.objects.get(pk=instance.pk)
-    except Encounter.DoesNotExist:
-        instance._pre_save_snapshot = None
+from hm_core.encounters.models import Encounter
+from hm_core.encounters.signals._emit import emit_event
 
 
 def _emit_encounter_event(*, encounter: Encounter, code: str, title: str, ts):
@@ -23,18 +13,15 @@ def _emit_encounter_event(*, encounter: Encounter, code: str, title: str, ts):
     # event_key makes it idempotent
     event_key = f"{code}:{encounter.id}"
 
-    EncounterEvent.objects.get_or_create(
+    emit_event(
         tenant_id=encounter.tenant_id,
         facility_id=encounter.facility_id,
         encounter_id=encounter.id,
         event_key=event_key,
-        defaults={
-            "type": "EVENT",
-            "code": code,
-            "title": title,
-            "timestamp": ts,   # IMPORTANT: you renamed occurred_at -> timestamp
-            "meta": {"status": encounter.status},
-        },
+        code=code,
+        title=title,
+        timestamp=ts,
+        meta={"status": encounter.status},
     )
 
 
@@ -49,14 +36,11 @@ def encounter_post_save(sender, instance: Encounter, created: bool, **kwargs):
         )
         return
 
-    prev = getattr(instance, "_pre_save_snapshot", None)
-    if not prev:
-        return
-
-    def flipped(prev_val, new_val):
-        return (prev_val is None) and (new_val is not None)
+    # previous values come from the load-time snapshot (TrackedFieldsMixin), no re-read
+    def flipped(field):
+        return instance.previous(field) is None and getattr(instance, field) is not None
 
-    if flipped(getattr(prev, "checked_in_at", None), getattr(instance, "checked_in_at", None)):
+    if flipped("checked_in_at"):
         _emit_encounter_event(
             encounter=instance,
             code="CHECKED_IN",
@@ -64,7 +48,7 @@ def encounter_post_save(sender, instance: Encounter, created: bool, **kwargs):
             ts=instance.checked_in_at,
         )
 
-    if flipped(getattr(prev, "consult_started_at", None), getattr(instance, "consult_started_at", None)):
+    if flipped("consult_started_at"):
         _emit_encounter_event(
             encounter=instance,
             code="CONSULT_STARTED",
@@ -72,7 +56,7 @@ def encounter_post_save(sender, instance: Encounter, created: bool, **kwargs):
             ts=instance.consult_started_at,
         )
 
-    if flipped(getattr(prev, "closed_at", None), getattr(instance, "closed_at", None)):
+    if flipped("closed_at"):
         _emit_encounter_event(
             encounter=instance,
             code="CLOSED",
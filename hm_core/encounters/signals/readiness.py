@@ -0,0 +1,36 @@
+# hm_core/encounters/signals/readiness.py
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from hm_core.clinical_docs.models import EncounterDocument
+from hm_core.encounters import jobs, readiness
+from hm_core.lab.models import LabResult
+from hm_core.rules.engine import CLOSE_GATE_RULE_CODE
+from hm_core.rules.signals import rules_changed
+from hm_core.tasks.models import Task
+
+
+@receiver(post_save, sender=Task, dispatch_uid="encounters_readiness_task_save")
+@receiver(post_delete, sender=Task, dispatch_uid="encounters_readiness_task_delete")
+@receiver(post_save, sender=EncounterDocument, dispatch_uid="encounters_readiness_doc_save")
+@receiver(post_delete, sender=EncounterDocument, dispatch_uid="encounters_readiness_doc_delete")
+@receiver(post_save, sender=LabResult, dispatch_uid="encounters_readiness_lab_result_save")
+@receiver(post_delete, sender=LabResult, dispatch_uid="encounters_readiness_lab_result_delete")
+def readiness_source_changed(sender, instance, **kwargs):
+    encounter_id = getattr(instance, "encounter_id", None)
+    if not encounter_id:
+        return
+    readiness.refresh_on_commit(
+        tenant_id=instance.tenant_id,
+        facility_id=instance.facility_id,
+        encounter_ids=[encounter_id],
+    )
+
+
+@receiver(rules_changed, dispatch_uid="encounters_readiness_rules_changed")
+def close_gate_rule_changed(sender, tenant_id, facility_id, code, **kwargs):
+    if code != CLOSE_GATE_RULE_CODE:
+        return
+    # facility-wide scan: off the request path, once the rule change is committed
+    transaction.on_commit(lambda: jobs.recompute_ready_flags.delay(str(tenant_id), str(facility_id)))
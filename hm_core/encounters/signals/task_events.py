@@ -1,20 +1,9 @@
 # hm_core/encounters/signals/task_events.py
-from django.db.models.signals import pre_save, post_save
+from django.db.models.signals import post_save
 from django.dispatch import receiver
 
 from hm_core.tasks.models import Task
-from hm_core.encounters.models import EncounterEvent
-
-
-@receiver(pre_save, sender=Task)
-def task_pre_save(sender, instance: Task, **kwargs):
-    if not instance.pk:
-        instance._pre_save_snapshot = None
-        return
-    try:
-        instance._pre_save_snapshot = Task.objects.get(pk=instance.pk)
-    except Task.DoesNotExist:
-        instance._pre_save_snapshot = None
+from hm_core.encounters.signals._emit import emit_event
 
 
 def _emit_task_event(*, task: Task, code: str, title: str, ts):
@@ -23,22 +12,19 @@ def _emit_task_event(*, task: Task, code: str, title: str, ts):
 
     event_key = f"{code}:{task.id}"
 
-    EncounterEvent.objects.get_or_create(
+    emit_event(
         tenant_id=task.tenant_id,
         facility_id=task.facility_id,
         encounter_id=task.encounter_id,
         event_key=event_key,
-        defaults={
-            "type": "EVENT",
-            "code": code,
-            "title": title,
-            "timestamp": ts,
-            "meta": {
-                "task_id": str(task.id),
-                "task_code": task.code,
-                "task_title": task.title,
-                "status": task.status,
-            },
+        code=code,
+        title=title,
+        timestamp=ts,
+        meta={
+            "task_id": str(task.id),
+            "task_code": task.code,
+            "task_title": task.title,
+            "status": task.status,
         },
     )
 
@@ -54,14 +40,10 @@ def task_post_save(sender, instance: Task, created: bool, **kwargs):
         )
         return
 
-    prev = getattr(instance, "_pre_save_snapshot", None)
-    if not prev:
-        return
-
-    prev_completed = getattr(prev, "completed_at", None)
-    new_completed = getattr(instance, "completed_at", None)
+    # previous completed_at from the load-time snapshot (TrackedFieldsMixin), no re-read
+    new_completed = instance.completed_at
 
-    if prev_completed is None and new_completed is not None:
+    if instance.previous("completed_at") is None and new_completed is not None:
         _emit_task_event(
             task=instance,
             code="TASK_DONE",
@@ -0,0 +1,93 @@
+# backend/hm_core/encounters/tests/test_close_gate_batch.py
+import uuid
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from hm_core.encounters.services import EncounterService
+from hm_core.patients.models import Patient
+from hm_core.tasks.models import Task, TaskStatus
+
+pytestmark = pytest.mark.django_db
+
+URL = "/api/v1/encounters/close-gate:batch/"
+
+
+def _scope(tenant, facility):
+    return {"HTTP_X_TENANT_ID": str(tenant.id), "HTTP_X_FACILITY_ID": str(facility.id)}
+
+
+def _encounters(tenant, facility, n):
+    # one active encounter per patient
+    out = []
+    for _ in range(n):
+        p = Patient.objects.create(
+            tenant_id=tenant.id, facility_id=facility.id, full_name="Batch Patient", mrn=f"MRN-{uuid.uuid4().hex[:10]}"
+        )
+        out.append(
+            EncounterService.create(tenant_id=tenant.id, facility_id=facility.id, patient_id=p.id, actor_user_id=None)
+        )
+    return out
+
+
+def _batch_queries(api_client, tenant, facility, encounters):
+    with CaptureQueriesContext(connection) as ctx:
+        res = api_client.post(URL, {"encounter_ids": [str(e.id) for e in encounters]}, format="json", **_scope(tenant, facility))
+    assert res.status_code == 200, res.data
+    return res, len(ctx.captured_queries)
+
+
+def test_batch_matches_single_close_gate(api_client, tenant, facility, encounter):
+    other = _encounters(tenant, facility, 1)[0]
+    Task.objects.create(
+        tenant_id=tenant.id, facility_id=facility.id, encounter_id=other.id,
+        code="critical-result-ack", title="Acknowledge Critical Result", status=TaskStatus.OPEN,
+    )
+    missing_id = uuid.uuid4()
+
+    res = api_client.post(
+        URL,
+        {"encounter_ids": [str(encounter.id), str(other.id), str(missing_id)]},
+        format="json",
+        **_scope(tenant, facility),
+    )
+    assert res.status_code == 200, res.data
+    assert res.data["not_found"] == [str(missing_id)]
+
+    for enc in (encounter, other):
+        single = api_client.get(f"/api/v1/encounters/{enc.id}/close-gate/", **_scope(tenant, facility))
+        assert res.data["results"][str(enc.id)] == single.data
+
+    assert "CRITICAL_ACK" in res.data["results"][str(other.id)]["missing"]
+
+
+def test_batch_query_count_is_constant(api_client, tenant, facility):
+    few = _encounters(tenant, facility, 2)
+    many = few + _encounters(tenant, facility, 8)
+
+    _batch_queries(api_client, tenant, facility, few)  # warm auth/rule caches
+    _, q_few = _batch_queries(api_client, tenant, facility, few)
+    res, q_many = _batch_queries(api_client, tenant, facility, many)
+
+    assert q_many == q_few
+    assert len(res.data["results"]) == 10
+
+
+def test_batch_by_status_is_scoped(api_client, tenant, facility, encounter):
+    res = api_client.post(URL, {"status": [encounter.status]}, format="json", **_scope(tenant, facility))
+    assert res.status_code == 200, res.data
+    assert list(res.data["results"]) == [str(encounter.id)]
+
+
+def test_batch_requires_exactly_one_selector(api_client, tenant, facility, encounter):
+    res = api_client.post(URL, {}, format="json", **_scope(tenant, facility))
+    assert res.status_code == 400
+
+    res = api_client.post(
+        URL,
+        {"encounter_ids": [str(encounter.id)], "status": ["CREATED"]},
+        format="json",
+        **_scope(tenant, facility),
+    )
+    assert res.status_code == 400
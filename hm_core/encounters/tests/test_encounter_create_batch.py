@@ -0,0 +1,80 @@
+# backend/hm_core/encounters/tests/test_encounter_create_batch.py
+import uuid
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from hm_core.audit.models import AuditEvent
+from hm_core.encounters.models import Encounter, EncounterEvent, EncounterReadiness
+from hm_core.patients.models import Patient
+from hm_core.tasks.models import Task
+
+pytestmark = pytest.mark.django_db
+
+URL = "/api/v1/encounters/create:batch/"
+
+
+def _scope(tenant, facility):
+    return {"HTTP_X_TENANT_ID": str(tenant.id), "HTTP_X_FACILITY_ID": str(facility.id)}
+
+
+def _patients(tenant, facility, n):
+    return [
+        Patient.objects.create(
+            tenant_id=tenant.id, facility_id=facility.id, full_name="Walk-in", mrn=f"MRN-{uuid.uuid4().hex[:10]}"
+        )
+        for _ in range(n)
+    ]
+
+
+def _post(api_client, tenant, facility, patient_ids):
+    return api_client.post(
+        URL, {"items": [{"patient_id": str(pid)} for pid in patient_ids]}, format="json", **_scope(tenant, facility)
+    )
+
+
+def test_batch_creates_encounters_with_tasks_events_and_audit(
+    api_client, tenant, facility, django_capture_on_commit_callbacks
+):
+    patients = _patients(tenant, facility, 3)
+
+    with django_capture_on_commit_callbacks(execute=True):  # readiness projection
+        res = _post(api_client, tenant, facility, [p.id for p in patients])
+    assert res.status_code == 201, res.data
+    assert res.data["created"] == 3 and res.data["failed"] == 0
+
+    ids = [r["encounter"]["id"] for r in res.data["results"]]
+    assert [r["index"] for r in res.data["results"]] == [0, 1, 2]
+    assert Task.objects.filter(encounter_id__in=ids).count() == 6
+    assert EncounterEvent.objects.filter(encounter_id__in=ids, code="ENCOUNTER_CREATED").count() == 3
+    assert EncounterEvent.objects.filter(encounter_id__in=ids, code="TASK_CREATED").count() == 6
+    assert AuditEvent.objects.filter(entity_id__in=ids, event_code="encounter.created").count() == 3
+    assert EncounterReadiness.objects.filter(encounter_id__in=ids).count() == 3
+
+
+def test_batch_reports_per_item_failures(api_client, tenant, facility, encounter):
+    fresh = _patients(tenant, facility, 1)[0]
+    missing = uuid.uuid4()
+
+    res = _post(api_client, tenant, facility, [encounter.patient_id, fresh.id, fresh.id, missing])
+    assert res.status_code == 201, res.data
+
+    ok = [r["ok"] for r in res.data["results"]]
+    assert ok == [False, True, False, False]
+    assert "Active encounter already exists" in res.data["results"][0]["error"]
+    assert "Active encounter already exists" in res.data["results"][2]["error"]
+    assert res.data["results"][3]["error"] == "Patient not found."
+    assert Encounter.objects.filter(patient_id=fresh.id).count() == 1
+
+
+def test_batch_query_count_is_constant(api_client, tenant, facility):
+    _post(api_client, tenant, facility, [p.id for p in _patients(tenant, facility, 1)])  # warm auth caches
+
+    def queries(n):
+        ids = [p.id for p in _patients(tenant, facility, n)]
+        with CaptureQueriesContext(connection) as ctx:
+            assert _post(api_client, tenant, facility, ids).status_code == 201
+        return len(ctx.captured_queries)
+
+    assert queries(2) == queries(20)
@@ -0,0 +1,137 @@
+# backend/hm_core/encounters/tests/test_encounter_readiness.py
+import pytest
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from hm_core.clinical_docs.models import EncounterDocument
+from hm_core.encounters import readiness
+from hm_core.encounters.models import EncounterReadiness
+from hm_core.encounters.services import EncounterService
+from hm_core.rules.engine import RuleEngine
+from hm_core.rules.services_rules import RuleService
+from hm_core.tasks.models import Task, TaskStatus
+
+pytestmark = pytest.mark.django_db
+
+
+def _scope(tenant, facility):
+    return {"HTTP_X_TENANT_ID": str(tenant.id), "HTTP_X_FACILITY_ID": str(facility.id)}
+
+
+def _seed_rule(tenant, facility, **cfg):
+    RuleService.ensure_default_close_gate_rule(
+        tenant_id=tenant.id,
+        facility_id=facility.id,
+        required_docs=["ASSESSMENT"],
+        **cfg,
+    )
+
+
+def _readiness(encounter):
+    # same-transaction read: the test transaction never commits
+    readiness.refresh_pending(
+        tenant_id=encounter.tenant_id, facility_id=encounter.facility_id, encounter_ids=[encounter.id]
+    )
+    return EncounterReadiness.objects.get(encounter_id=encounter.id)
+
+
+def _complete(tenant, facility, encounter):
+    for t in Task.objects.filter(encounter_id=encounter.id):
+        t.status = TaskStatus.DONE
+        t.save(update_fields=["status"])
+    EncounterDocument.objects.create(
+        tenant_id=tenant.id, facility_id=facility.id, encounter_id=encounter.id, kind="ASSESSMENT", content={}
+    )
+
+
+def test_projection_follows_task_and_doc_changes(tenant, facility, encounter):
+    _seed_rule(tenant, facility)
+
+    r = _readiness(encounter)
+    assert r.tasks_open == ["doctor-consult", "record-vitals"]
+    assert r.is_ready_to_close is False
+
+    _complete(tenant, facility, encounter)
+
+    r = _readiness(encounter)
+    assert r.docs_present == ["ASSESSMENT"]
+    assert r.tasks_open == []
+    assert r.is_ready_to_close is True
+
+    ack = Task.objects.create(
+        tenant_id=tenant.id, facility_id=facility.id, encounter_id=encounter.id,
+        code="critical-result-ack", title="Acknowledge Critical Result", status=TaskStatus.OPEN,
+    )
+    r = _readiness(encounter)
+    assert r.critical_unacked_count == 1
+    assert r.is_ready_to_close is False
+
+    ack.delete()
+    assert _readiness(encounter).is_ready_to_close is True
+
+
+def test_writes_share_one_refresh_on_commit(tenant, facility, patient, django_capture_on_commit_callbacks):
+    _seed_rule(tenant, facility)
+
+    with django_capture_on_commit_callbacks(execute=True) as callbacks:
+        encounter = EncounterService.create(
+            tenant_id=tenant.id, facility_id=facility.id, patient_id=patient.id, actor_user_id=None
+        )
+        with CaptureQueriesContext(connection) as ctx:
+            _complete(tenant, facility, encounter)
+
+    # writes no longer read or write the projection; one queued refresh covers them all
+    assert not [q for q in ctx.captured_queries if "encounters_readiness" in q["sql"]]
+    assert len([cb for cb in callbacks if isinstance(cb, readiness._PendingRefresh)]) == 1
+
+    r = EncounterReadiness.objects.get(encounter_id=encounter.id)
+    assert (r.docs_present, r.tasks_open, r.is_ready_to_close) == (["ASSESSMENT"], [], True)
+
+
+def test_rule_change_recomputes_ready_flag(tenant, facility, encounter, django_capture_on_commit_callbacks):
+    _seed_rule(tenant, facility)
+    _complete(tenant, facility, encounter)
+    assert _readiness(encounter).is_ready_to_close is True
+
+    with django_capture_on_commit_callbacks(execute=True):  # encounters.recompute_ready_flags job
+        RuleService.ensure_default_close_gate_rule(
+            tenant_id=tenant.id, facility_id=facility.id, required_docs=["ASSESSMENT", "PLAN"]
+        )
+    assert _readiness(encounter).is_ready_to_close is False
+
+
+def test_list_filter_and_projection_read(api_client, tenant, facility, encounter, django_assert_num_queries):
+    _seed_rule(tenant, facility)
+    _complete(tenant, facility, encounter)
+    _readiness(encounter)
+
+    res = api_client.get("/api/v1/encounters/?ready_to_close=true", **_scope(tenant, facility))
+    assert res.status_code == 200, res.data
+    items = res.data.get("results", res.data)
+    assert [i["id"] for i in items] == [str(encounter.id)]
+
+    res = api_client.get("/api/v1/encounters/?ready_to_close=false", **_scope(tenant, facility))
+    assert res.data.get("results", res.data) == []
+
+    RuleEngine.get_close_gate_config(tenant_id=tenant.id, facility_id=facility.id)
+    with django_assert_num_queries(1):
+        r = RuleEngine.check_encounter_close_gate(
+            tenant_id=tenant.id, facility_id=facility.id, encounter_id=encounter.id, use_projection=True
+        )
+    assert r.ok is True
+
+
+def test_rebuild_repairs_drift(tenant, facility, encounter):
+    _seed_rule(tenant, facility)
+    EncounterReadiness.objects.filter(encounter_id=encounter.id).delete()
+
+    call_command("rebuild_encounter_readiness", "--dry-run")
+    assert not EncounterReadiness.objects.filter(encounter_id=encounter.id).exists()
+
+    call_command("rebuild_encounter_readiness", "--tenant-id", str(tenant.id))
+    assert _readiness(encounter).tasks_open == ["doctor-consult", "record-vitals"]
+
+    EncounterReadiness.objects.filter(encounter_id=encounter.id).update(is_ready_to_close=True)
+    call_command("rebuild_encounter_readiness")
+    assert _readiness(encounter).is_ready_to_close is False
@@ -1,6 +1,7 @@
 #hm_core/encounters/tests/test_encounter_timeline_endpoint.py
 import pytest
 
+from hm_core.common.api import keyset
 from hm_core.conftest import scope_headers
 from hm_core.encounters.models import EncounterEvent
 from hm_core.tasks.models import Task
@@ -66,3 +67,93 @@ def test_timeline_includes_tasks_and_docs(api_client, tenant, facility, encounte
     # Bonus: validate events really exist in DB (not computed)
     assert EncounterEvent.objects.filter(encounter_id=encounter.id, code="TASK_CREATED").exists()
     assert EncounterEvent.objects.filter(encounter_id=encounter.id, code="DOC_AUTHORED").exists()
+
+
+def _add_events(tenant, facility, encounter, n, *, at=None):
+    from datetime import timedelta
+
+    from django.utils import timezone
+
+    at = at or timezone.now()
+    EncounterEvent.objects.bulk_create(
+        [
+            EncounterEvent(
+                tenant_id=tenant.id,
+                facility_id=facility.id,
+                encounter_id=encounter.id,
+                event_key=f"test:{at.timestamp()}:{i}",
+                code="TEST_EVENT",
+                # every 3 events share a timestamp: pages must break ties on (created_at, id)
+                timestamp=at + timedelta(seconds=i // 3),
+            )
+            for i in range(n)
+        ]
+    )
+
+
+def test_timeline_keyset_pages_cover_every_event_once(api_client, tenant, facility, encounter):
+    _add_events(tenant, facility, encounter, 25)
+    url = f"/api/v1/encounters/{encounter.id}/timeline/"
+
+    seen, cursor = [], None
+    while True:
+        params = {"limit": 4, **({"cursor": cursor} if cursor else {})}
+        resp = api_client.get(url, params, **scope_headers(tenant, facility))
+        assert resp.status_code == 200, resp.data
+        seen += [i["id"] for i in resp.data["items"]]
+        cursor = resp.data["next_cursor"]
+        if not resp.data["has_more"]:
+            break
+
+    full = api_client.get(url, {"limit": 1000}, **scope_headers(tenant, facility)).data["items"]
+    assert seen == [i["id"] for i in full]
+    assert len(seen) == len(set(seen)) == EncounterEvent.objects.filter(encounter_id=encounter.id).count()
+
+
+def test_timeline_since_polls_only_new_events(api_client, tenant, facility, encounter):
+    url = f"/api/v1/encounters/{encounter.id}/timeline/"
+    first = api_client.get(url, **scope_headers(tenant, facility)).data
+    since = first["next_cursor"]
+
+    idle = api_client.get(url, {"since": since}, **scope_headers(tenant, facility)).data
+    assert idle["items"] == [] and idle["next_cursor"] == since
+
+    _add_events(tenant, facility, encounter, 2)
+    polled = api_client.get(url, {"since": since}, **scope_headers(tenant, facility)).data
+    assert [i["code"] for i in polled["items"]] == ["TEST_EVENT", "TEST_EVENT"]
+
+    assert api_client.get(url, {"cursor": "not-a-cursor"}, **scope_headers(tenant, facility)).status_code == 400
+
+
+@pytest.mark.parametrize(
+    "forged",
+    [
+        ["x", "y", "z"],
+        [1, 2, 3],
+        [None, None, None],
+        [{"a": 1}, [], True],
+        ["2024-01-01T00:00:00", "2024-01-01T00:00:00", "not-a-uuid"],  # naive datetimes
+    ],
+)
+def test_timeline_rejects_forged_cursor(api_client, tenant, facility, encounter, forged):
+    url = f"/api/v1/encounters/{encounter.id}/timeline/"
+    token = keyset.encode_cursor(forged)
+    for param in ("cursor", "since"):
+        resp = api_client.get(url, {param: token}, **scope_headers(tenant, facility))
+        assert resp.status_code == 400, resp.data
+        assert "cursor" in resp.data["error"]["details"]
+
+
+def test_timeline_stream_matches_paged_items(api_client, tenant, facility, encounter):
+    import json
+
+    _add_events(tenant, facility, encounter, 7)
+    url = f"/api/v1/encounters/{encounter.id}/timeline/"
+
+    resp = api_client.get(url, {"stream": "true"}, **scope_headers(tenant, facility))
+    assert resp.status_code == 200
+    body = json.loads(b"".join(resp.streaming_content))
+
+    paged = api_client.get(url, {"limit": 1000}, **scope_headers(tenant, facility)).data
+    assert [i["id"] for i in body["items"]] == [i["id"] for i in paged["items"]]
+    assert body["next_cursor"] == paged["next_cursor"]
@@ -0,0 +1,64 @@
+# backend/hm_core/encounters/tests/test_event_buffer.py
+import pytest
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+
+from hm_core.encounters.models import EncounterEvent
+from hm_core.encounters.services import EncounterService
+from hm_core.encounters.signals._emit import emit_event, event_buffer
+
+pytestmark = pytest.mark.django_db
+
+
+def _emit(tenant, facility, encounter, key, title=""):
+    emit_event(
+        tenant_id=tenant.id,
+        facility_id=facility.id,
+        encounter_id=encounter.id,
+        event_key=key,
+        code="TEST_EVENT",
+        title=title,
+    )
+
+
+def _events(encounter, key):
+    return EncounterEvent.objects.filter(encounter_id=encounter.id, event_key=key)
+
+
+def test_buffer_dedupes_and_flushes_in_one_insert(tenant, facility, encounter):
+    with CaptureQueriesContext(connection) as ctx:
+        with event_buffer():
+            _emit(tenant, facility, encounter, "k1", title="first")
+            _emit(tenant, facility, encounter, "k1", title="second")
+            with event_buffer():  # nested joins the outer buffer
+                _emit(tenant, facility, encounter, "k2")
+            assert not _events(encounter, "k1").exists()
+
+    inserts = [q for q in ctx.captured_queries if q["sql"].startswith("INSERT")]
+    assert len(inserts) == 1 and "ON CONFLICT DO NOTHING" in inserts[0]["sql"]
+    assert _events(encounter, "k1").get().title == "first"
+    assert _events(encounter, "k2").count() == 1
+
+    # already stored keys are skipped, unbuffered emits write immediately
+    _emit(tenant, facility, encounter, "k1", title="again")
+    assert _events(encounter, "k1").get().title == "first"
+
+
+def test_buffer_is_discarded_on_error(tenant, facility, encounter):
+    with pytest.raises(RuntimeError):
+        with transaction.atomic(), event_buffer():
+            _emit(tenant, facility, encounter, "boom")
+            raise RuntimeError
+
+    assert not _events(encounter, "boom").exists()
+    _emit(tenant, facility, encounter, "after")
+    assert _events(encounter, "after").exists()
+
+
+def test_encounter_create_writes_events_once(tenant, facility, patient):
+    enc = EncounterService.create(tenant_id=tenant.id, facility_id=facility.id, patient_id=patient.id, actor_user_id=None)
+
+    keys = list(EncounterEvent.objects.filter(encounter_id=enc.id).values_list("event_key", flat=True))
+    assert len(keys) == len(set(keys))
+    assert f"ENCOUNTER_CREATED:{enc.id}" in keys
+    assert sum(k.startswith("TASK_CREATED:") for k in keys) == enc.tasks.count()
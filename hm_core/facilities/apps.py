@@ -5,3 +5,7 @@ from django.apps import AppConfig
 class FacilitiesConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "hm_core.facilities"
+
+    def ready(self) -> None:
+        # facility settings cache invalidation
+        from hm_core.facilities import signals  # noqa: F401
@@ -0,0 +1,110 @@
+# backend/hm_core/facilities/facility_settings.py
+"""
+Cached, typed facility settings.
+
+Billing reads a facility's pricing_tax_mode on every line it prices (auto-attach
+signal, manual lines, invoice generation) and numbering needs its timezone, while
+the Facility row itself changes rarely. get_facility_settings() returns an
+immutable FacilitySettings snapshot kept per process, keyed by (tenant_id,
+facility_id), so hot paths never query facilities_facility once warm. Unknown
+facilities are cached too (with model defaults).
+
+Coherence uses a per-facility version stamp (common.cache.StampedCache). Saving
+or deleting a Facility (FacilityService create/update/deactivate, admin; see
+facilities.signals) bumps it. QuerySet.update() / bulk_create() on Facility send
+no signals: such bulk writes must call invalidate_on_commit() themselves.
+
+Settings (optional, shape in common.cache):
+
+    FACILITY_SETTINGS_CACHE = {
+        "BACKEND": "django",       # where version stamps live: "django" | "lru" | "none"
+        "TTL": 300,                # seconds a snapshot is kept per process
+        "MAX_ENTRIES": 10000,
+        "CACHE_ALIAS": "default",  # django only
+    }
+
+Changes reach every worker through a shared CACHES[CACHE_ALIAS] (Redis);
+process-local stamps raise ImproperlyConfigured unless HM_SINGLE_PROCESS
+(common.cache), so no worker keeps an old tax mode unnoticed.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from uuid import UUID
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from django.conf import settings
+
+from hm_core.common.cache import StampedCache
+from hm_core.facilities.models import Facility, PricingTaxMode
+
+_cache = StampedCache(setting="FACILITY_SETTINGS_CACHE", key_prefix="facilities:settings")
+
+
+@dataclass(frozen=True)
+class FacilitySettings:
+    tenant_id: UUID
+    facility_id: UUID
+    exists: bool = False
+    is_active: bool = False
+    pricing_tax_mode: PricingTaxMode = PricingTaxMode.EXCLUSIVE
+    timezone: str = "Asia/Kolkata"
+    gstin: str = ""
+
+    @property
+    def prices_include_tax(self) -> bool:
+        return self.pricing_tax_mode == PricingTaxMode.INCLUSIVE
+
+    @property
+    def tzinfo(self) -> ZoneInfo:
+        """
+        Facility timezone; falls back to settings.TIME_ZONE for unknown names.
+        """
+        try:
+            return ZoneInfo(self.timezone)
+        except (ZoneInfoNotFoundError, ValueError):
+            return ZoneInfo(settings.TIME_ZONE)
+
+
+def reset() -> None:
+    """
+    Drop backends and every cached snapshot (tests / settings overrides).
+    """
+    _cache.reset()
+
+
+def _load(*, tenant_id: UUID, facility_id: UUID) -> FacilitySettings:
+    row = (
+        Facility.objects.filter(tenant_id=tenant_id, id=facility_id)
+        .values_list("is_active", "pricing_tax_mode", "timezone", "gstin")
+        .first()
+    )
+    if row is None:
+        return FacilitySettings(tenant_id=tenant_id, facility_id=facility_id)
+    is_active, pricing_tax_mode, tz, gstin = row
+    return FacilitySettings(
+        tenant_id=tenant_id,
+        facility_id=facility_id,
+        exists=True,
+        is_active=is_active,
+        pricing_tax_mode=PricingTaxMode(pricing_tax_mode),
+        timezone=tz,
+        gstin=gstin,
+    )
+
+
+def get_facility_settings(*, tenant_id: UUID, facility_id: UUID) -> FacilitySettings:
+    return _cache.get_or_build(
+        (tenant_id, facility_id),
+        "settings",
+        lambda: _load(tenant_id=tenant_id, facility_id=facility_id),
+    )
+
+
+def invalidate(*, tenant_id, facility_id) -> None:
+    _cache.invalidate(tenant_id, facility_id)
+
+
+def invalidate_on_commit(*, tenant_id, facility_id) -> None:
+    _cache.invalidate_on_commit(tenant_id, facility_id)
@@ -0,0 +1,50 @@
+# Generated by Django 5.2.9 on 2026-10-17 06:12
+
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('tenants', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Facility',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('name', models.CharField(max_length=255)),
+                ('code', models.SlugField(max_length=64)),
+                ('facility_type', models.CharField(choices=[('HOSPITAL', 'Hospital'), ('CLINIC', 'Clinic'), ('LAB', 'Lab'), ('PHARMACY', 'Pharmacy'), ('DIAGNOSTIC', 'Diagnostic Center'), ('OTHER', 'Other')], db_index=True, default='HOSPITAL', max_length=24)),
+                ('timezone', models.CharField(default='Asia/Kolkata', max_length=64)),
+                ('pricing_tax_mode', models.CharField(choices=[('EXCLUSIVE', 'Exclusive (tax added)'), ('INCLUSIVE', 'Inclusive (tax included)')], default='EXCLUSIVE', max_length=16)),
+                ('phone', models.CharField(blank=True, default='', max_length=32)),
+                ('email', models.EmailField(blank=True, default='', max_length=254)),
+                ('address_line1', models.CharField(blank=True, default='', max_length=255)),
+                ('address_line2', models.CharField(blank=True, default='', max_length=255)),
+                ('city', models.CharField(blank=True, default='', max_length=128)),
+                ('state', models.CharField(blank=True, default='', max_length=128)),
+                ('pincode', models.CharField(blank=True, default='', max_length=16)),
+                ('country', models.CharField(blank=True, default='India', max_length=64)),
+                ('registration_number', models.CharField(blank=True, default='', max_length=64)),
+                ('gstin', models.CharField(blank=True, default='', max_length=32)),
+                ('is_active', models.BooleanField(db_index=True, default=True)),
+                ('deactivated_at', models.DateTimeField(blank=True, null=True)),
+                ('deactivation_reason', models.CharField(blank=True, default='', max_length=255)),
+                ('created_at', models.DateTimeField(auto_now_add=True, db_index=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('parent_facility', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='child_facilities', to='facilities.facility')),
+                ('tenant', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='facilities', to='tenants.tenant')),
+            ],
+            options={
+                'db_table': 'facilities_facility',
+                'indexes': [models.Index(fields=['tenant', 'code'], name='facilities__tenant__7b27cc_idx'), models.Index(fields=['tenant', 'is_active'], name='facilities__tenant__2bb16f_idx'), models.Index(fields=['tenant', 'facility_type'], name='facilities__tenant__0c9afa_idx'), models.Index(fields=['tenant', 'parent_facility'], name='facilities__tenant__8d59b5_idx'), models.Index(fields=['tenant', 'pricing_tax_mode'], name='facilities__tenant__eff1e2_idx')],
+                'constraints': [models.UniqueConstraint(fields=('tenant', 'code'), name='uq_facility_tenant_code')],
+            },
+        ),
+    ]
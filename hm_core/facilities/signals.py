@@ -0,0 +1,17 @@
+# backend/hm_core/facilities/signals.py
+from __future__ import annotations
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from hm_core.facilities import facility_settings
+from hm_core.facilities.models import Facility
+
+
+@receiver(post_save, sender=Facility, dispatch_uid="facilities_settings_cache_save")
+@receiver(post_delete, sender=Facility, dispatch_uid="facilities_settings_cache_delete")
+def facility_changed(sender, instance: Facility, **kwargs):
+    # Covers FacilityService.create/update/deactivate, admin edits and instance
+    # save()/delete(). QuerySet.update() / bulk_create() send no signals: callers
+    # of those must call facility_settings.invalidate_on_commit() themselves.
+    facility_settings.invalidate_on_commit(tenant_id=instance.tenant_id, facility_id=instance.id)
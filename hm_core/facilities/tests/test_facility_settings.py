@@ -0,0 +1,97 @@
+# backend/hm_core/facilities/tests/test_facility_settings.py
+import uuid
+from decimal import Decimal
+from zoneinfo import ZoneInfo
+
+import pytest
+from django.core.exceptions import ImproperlyConfigured
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from hm_core.billing.services import InvoiceService
+from hm_core.billing.tests.test_invoice_generate_bulk import _events
+from hm_core.facilities import facility_settings
+from hm_core.facilities.facility_settings import get_facility_settings
+from hm_core.facilities.models import PricingTaxMode
+from hm_core.facilities.services import FacilityService, FacilityUpdate
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture(autouse=True)
+def _fresh_facility_settings():
+    facility_settings.reset()
+    yield
+    facility_settings.reset()
+
+
+def _settings(facility):
+    return get_facility_settings(tenant_id=facility.tenant_id, facility_id=facility.id)
+
+
+def test_settings_are_typed_and_cached(facility, django_assert_num_queries):
+    with django_assert_num_queries(1):
+        fs = _settings(facility)
+    with django_assert_num_queries(0):
+        assert _settings(facility) is fs
+
+    assert fs.exists and fs.is_active
+    assert fs.pricing_tax_mode is PricingTaxMode.EXCLUSIVE
+    assert not fs.prices_include_tax
+    assert fs.tzinfo == ZoneInfo("Asia/Kolkata")
+
+
+def test_unknown_facility_gets_defaults(tenant, django_assert_num_queries):
+    missing = uuid.uuid4()
+    get_facility_settings(tenant_id=tenant.id, facility_id=missing)
+
+    with django_assert_num_queries(0):
+        fs = get_facility_settings(tenant_id=tenant.id, facility_id=missing)
+    assert not fs.exists
+    assert fs.pricing_tax_mode is PricingTaxMode.EXCLUSIVE
+
+
+def test_facility_service_updates_invalidate(facility):
+    _settings(facility)
+
+    FacilityService.update(
+        tenant_id=facility.tenant_id,
+        facility_id=facility.id,
+        patch=FacilityUpdate(timezone="Europe/London", gstin="29ABCDE1234F1Z5"),
+    )
+    fs = _settings(facility)
+    assert (fs.timezone, fs.gstin) == ("Europe/London", "29ABCDE1234F1Z5")
+
+    FacilityService.deactivate(tenant_id=facility.tenant_id, facility_id=facility.id)
+    assert not _settings(facility).is_active
+
+
+def test_invoice_generation_does_not_query_facility(tenant, facility, patient, encounter):
+    facility.pricing_tax_mode = PricingTaxMode.INCLUSIVE
+    facility.save(update_fields=["pricing_tax_mode", "updated_at"])
+    assert _settings(facility).prices_include_tax
+
+    inv = InvoiceService.create_draft(
+        tenant_id=tenant.id, facility_id=facility.id, patient_id=patient.id, encounter_id=encounter.id
+    )
+    _events(tenant, facility, encounter, ["svc-1", "svc-2"])
+
+    with CaptureQueriesContext(connection) as ctx:
+        created = InvoiceService.generate_from_billable_events(
+            tenant_id=tenant.id,
+            facility_id=facility.id,
+            invoice_id=inv.id,
+            encounter_id=encounter.id,
+            default_unit_price=Decimal("10.00"),
+        )
+
+    assert created == 2
+    assert not [q for q in ctx.captured_queries if "facilities_facility" in q["sql"]]
+
+
+def test_process_local_stamps_need_single_process(settings, tenant, facility):
+    settings.HM_SINGLE_PROCESS = False  # CACHES["default"] is LocMemCache here
+    facility_settings.reset()
+
+    with pytest.raises(ImproperlyConfigured):
+        get_facility_settings(tenant_id=tenant.id, facility_id=facility.id)
@@ -19,6 +19,7 @@ from hm_core.iam.api.schema_serializers import (
     RefreshResponseSerializer,
     LogoutResponseSerializer,
 )
+from hm_core.iam.services.token_claims import enrich_access_token
 
 def _seconds(value: Any) -> int:
     """
@@ -87,7 +88,7 @@ class LoginView(APIView):
         serializer = TokenObtainPairSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
 
-        access = serializer.validated_data["access"]
+        access = enrich_access_token(serializer.validated_data["access"], serializer.user)
         refresh = serializer.validated_data["refresh"]
 
         res = Response({"detail": "login ok"}, status=status.HTTP_200_OK)
@@ -112,7 +113,7 @@ class RefreshView(APIView):
         serializer = TokenRefreshSerializer(data={"refresh": refresh})
         serializer.is_valid(raise_exception=True)
 
-        access = serializer.validated_data["access"]
+        access = enrich_access_token(serializer.validated_data["access"])
         new_refresh = serializer.validated_data.get("refresh", refresh)
 
         res = Response({"detail": "refreshed"}, status=status.HTTP_200_OK)
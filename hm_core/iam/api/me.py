@@ -10,7 +10,7 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from hm_core.iam.scope import resolve_scope_from_headers, assert_user_membership
+from hm_core.iam.scope import apply_scope_from_headers
 from hm_core.iam.services.membership import is_user_member_of_facility, list_user_facilities
 
 from drf_spectacular.utils import extend_schema, OpenApiParameter
@@ -46,16 +46,9 @@ class MeView(APIView):
         Scope headers are OPTIONAL for GET /me.
         If scope headers are provided, they MUST be valid and user MUST be a member, else 400/403.
         """
-        # If headers are present, validate and attach scope
-        scope = resolve_scope_from_headers(request)
-        if scope is not None:
-            # Ensures 403 if not a member
-            assert_user_membership(request.user, scope)
-
-            # Attach for downstream consistency (even if middleware didn’t)
-            request.scope = scope
-            request.tenant_id = scope.tenant_id
-            request.facility_id = scope.facility_id
+        # If headers are present, validate (403 if not a member) and attach scope.
+        # Reuses the request's RequestScope, so an earlier membership check is not repeated.
+        apply_scope_from_headers(request, user=request.user)
 
         memberships = list_user_facilities(request.user.id)
 
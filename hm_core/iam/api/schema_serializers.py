@@ -71,6 +71,10 @@ class SessionBootstrapResponseSerializer(serializers.Serializer):
     # Capability list for UI gating (menus/buttons)
     permissions = serializers.ListField(child=serializers.CharField(), required=False)
 
+    # Compact form (?permissions_format=bitmask): hex bitmask, bit i = permission_codes[i]
+    permission_mask = serializers.CharField(required=False)
+    permission_codes = serializers.ListField(child=serializers.CharField(), required=False)
+
     # Future-proofing
     feature_flags = serializers.DictField(required=False)
     server_time = serializers.DateTimeField(required=False)
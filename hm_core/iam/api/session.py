@@ -10,9 +10,10 @@ from rest_framework.views import APIView
 from drf_spectacular.utils import extend_schema, OpenApiParameter
 
 from hm_core.iam.api.schema_serializers import SessionBootstrapResponseSerializer
-from hm_core.iam.scope import resolve_scope_from_headers, assert_user_membership
+from hm_core.iam.scope import apply_scope_from_headers
 from hm_core.iam.services.membership import list_user_facilities
-from hm_core.iam.models import FacilityMembership, RolePermission
+from hm_core.iam.models import FacilityMembership
+from hm_core.iam.services.permission_registry import get_registry
 
 
 class SessionBootstrapView(APIView):
@@ -24,6 +25,9 @@ class SessionBootstrapView(APIView):
       - If provided -> validated + membership enforced.
       - If not provided -> server chooses a default scope from memberships.
     - Returns everything needed for UI initialization.
+    - ?permissions_format=bitmask returns permissions as a compact bitmask
+      (permission_mask, hex) plus the code table (permission_codes, bit i = codes[i])
+      instead of a list of codes.
     """
     permission_classes = [IsAuthenticated]
 
@@ -33,6 +37,13 @@ class SessionBootstrapView(APIView):
         parameters=[
             OpenApiParameter(name="X-Tenant-Id", location=OpenApiParameter.HEADER, required=False, type=str),
             OpenApiParameter(name="X-Facility-Id", location=OpenApiParameter.HEADER, required=False, type=str),
+            OpenApiParameter(
+                name="permissions_format",
+                location=OpenApiParameter.QUERY,
+                required=False,
+                type=str,
+                enum=["list", "bitmask"],
+            ),
         ],
     )
     def get(self, request):
@@ -41,9 +52,8 @@ class SessionBootstrapView(APIView):
 
         # 2) determine active scope:
         #    a) if headers provided, validate + enforce membership
-        scope = resolve_scope_from_headers(request)
+        scope = apply_scope_from_headers(request, user=request.user)
         if scope is not None:
-            assert_user_membership(request.user, scope)
             active_scope = {"tenant_id": str(scope.tenant_id), "facility_id": str(scope.facility_id)}
         else:
             # b) choose default from memberships (primary first, else first)
@@ -63,10 +73,11 @@ class SessionBootstrapView(APIView):
                 }
 
         # 3) active context (tenant/facility/role + permissions)
+        registry = get_registry()
         active_tenant = None
         active_facility = None
         active_role = None
-        permissions: list[str] = []
+        permission_mask = 0
 
         if active_scope:
             tenant_id = active_scope["tenant_id"]
@@ -94,11 +105,17 @@ class SessionBootstrapView(APIView):
                 active_facility = {"id": str(f.id), "code": getattr(f, "code", None), "name": getattr(f, "name", None)}
                 active_role = {"id": str(r.id), "code": getattr(r, "code", None), "name": getattr(r, "name", None)}
 
-                permissions = list(
-                    RolePermission.objects.select_related("permission")
-                    .filter(role_id=r.id)
-                    .values_list("permission__code", flat=True)
-                )
+                permission_mask = registry.role_mask(r.id)
+
+        as_bitmask = request.query_params.get("permissions_format") == "bitmask"
+        if as_bitmask:
+            permission_payload = {
+                "permissions": [],
+                "permission_mask": format(permission_mask, "x"),
+                "permission_codes": list(registry.codes),
+            }
+        else:
+            permission_payload = {"permissions": registry.decode(permission_mask)}
 
         # 4) response
         return Response(
@@ -114,7 +131,7 @@ class SessionBootstrapView(APIView):
                 "active_tenant": active_tenant,
                 "active_facility": active_facility,
                 "active_role": active_role,
-                "permissions": permissions,
+                **permission_payload,
                 "feature_flags": {},  # later: tenant/facility policy flags
                 "server_time": timezone.now(),
                 "api_version": "0.1.0",
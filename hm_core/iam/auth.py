@@ -4,8 +4,10 @@ from __future__ import annotations
 
 from django.conf import settings
 from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken
 
 from hm_core.iam.scope import apply_scope_from_headers
+from hm_core.iam.services import token_claims
 
 
 class CookieOrHeaderJWTAuthentication(JWTAuthentication):
@@ -15,8 +17,24 @@ class CookieOrHeaderJWTAuthentication(JWTAuthentication):
       2) HttpOnly cookie containing access token
 
     ALSO enforces tenant/facility scope headers after user is known.
+
+    With IAM_TOKEN_CLAIMS enabled, tokens carrying signed scope/role claims are
+    authorized straight from the token (see iam.services.token_claims): no user
+    lookup, membership or group queries. Stale claims -> 401 so the client refreshes.
     """
 
+    def get_user(self, validated_token):
+        if token_claims.is_enabled() and token_claims.has_claims(validated_token):
+            if not token_claims.is_current(validated_token):
+                raise InvalidToken(
+                    {
+                        "detail": "Token memberships are stale. Refresh the token.",
+                        "code": "token_stale",
+                    }
+                )
+            return token_claims.user_from_claims(validated_token)
+        return super().get_user(validated_token)
+
     def authenticate(self, request):
         # 1) Prefer Authorization header
         header = self.get_header(request)
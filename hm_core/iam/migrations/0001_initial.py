@@ -0,0 +1,116 @@
+# Generated by Django 5.2.9 on 2026-10-17 06:12
+
+import django.db.models.deletion
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('facilities', '0001_initial'),
+        ('tenants', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Permission',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('code', models.CharField(max_length=128, unique=True)),
+                ('description', models.CharField(blank=True, max_length=255)),
+            ],
+            options={
+                'db_table': 'iam_permission',
+                'indexes': [models.Index(fields=['code'], name='iam_permiss_code_e10e79_idx')],
+            },
+        ),
+        migrations.CreateModel(
+            name='Role',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('name', models.CharField(max_length=128)),
+                ('code', models.SlugField(max_length=64)),
+                ('is_active', models.BooleanField(default=True)),
+                ('tenant', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='roles', to='tenants.tenant')),
+            ],
+            options={
+                'db_table': 'iam_role',
+            },
+        ),
+        migrations.CreateModel(
+            name='RolePermission',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('permission', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='permission_roles', to='iam.permission')),
+                ('role', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='role_permissions', to='iam.role')),
+            ],
+            options={
+                'db_table': 'iam_role_permission',
+            },
+        ),
+        migrations.CreateModel(
+            name='UserProfile',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('is_active', models.BooleanField(default=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True, db_index=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('tenant', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='user_profiles', to='tenants.tenant')),
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='hm_profile', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'db_table': 'iam_user_profile',
+            },
+        ),
+        migrations.CreateModel(
+            name='FacilityMembership',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('is_active', models.BooleanField(default=True)),
+                ('facility', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='memberships', to='facilities.facility')),
+                ('tenant', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='facility_memberships', to='tenants.tenant')),
+                ('role', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='memberships', to='iam.role')),
+                ('user_profile', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='memberships', to='iam.userprofile')),
+            ],
+            options={
+                'db_table': 'iam_facility_membership',
+            },
+        ),
+        migrations.AddIndex(
+            model_name='role',
+            index=models.Index(fields=['tenant', 'code'], name='iam_role_tenant__c91e36_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='role',
+            index=models.Index(fields=['tenant', 'is_active'], name='iam_role_tenant__f03e0e_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='role',
+            constraint=models.UniqueConstraint(fields=('tenant', 'code'), name='uq_role_tenant_code'),
+        ),
+        migrations.AddConstraint(
+            model_name='rolepermission',
+            constraint=models.UniqueConstraint(fields=('role', 'permission'), name='uq_role_permission'),
+        ),
+        migrations.AddIndex(
+            model_name='userprofile',
+            index=models.Index(fields=['tenant', 'is_active'], name='iam_user_pr_tenant__aad1dc_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='facilitymembership',
+            index=models.Index(fields=['tenant', 'facility'], name='iam_facilit_tenant__374671_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='facilitymembership',
+            index=models.Index(fields=['tenant', 'is_active'], name='iam_facilit_tenant__b7b343_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='facilitymembership',
+            constraint=models.UniqueConstraint(fields=('facility', 'user_profile'), name='uq_facility_user_profile_membership'),
+        ),
+    ]
@@ -27,40 +27,31 @@ MISSING_SCOPE_MSG = "Missing scope headers. Provide X-Tenant-Id and X-Facility-I
 INVALID_SCOPE_MSG = "Invalid scope headers. Provide valid UUIDs for X-Tenant-Id and X-Facility-Id."
 
 
-def _parse_uuid(value: str, header_name: str) -> UUID:
-    try:
-        return UUID(str(value))
-    except Exception:
-        # DRF-friendly error shape
-        raise ValidationError({header_name: "Invalid UUID"})
-
-
-def _get_header(request, name: str) -> str | None:
-    # request.headers is case-insensitive; returns None if missing
-    try:
-        return request.headers.get(name)
-    except Exception:
-        return None
-
-
 def resolve_scope_from_headers(request) -> Scope | None:
     """
     Reads scope headers. Returns Scope if both are present.
     - If neither is present: returns None.
     - If only one is present: raises 400 ValidationError with MISSING_SCOPE_MSG.
+
+    Parsing is shared with the middleware/permissions via the per-request
+    RequestScope (hm_core.common.scope.get_request_scope).
     """
-    tenant_raw = _get_header(request, HDR_TENANT) or _get_header(request, HDR_TENANT_LEGACY)
-    facility_raw = _get_header(request, HDR_FACILITY) or _get_header(request, HDR_FACILITY_LEGACY)
+    from hm_core.common.scope import get_request_scope
+
+    rs = get_request_scope(request)
 
-    if not tenant_raw and not facility_raw:
+    if rs.is_absent:
         return None
 
-    if not tenant_raw or not facility_raw:
+    if rs.is_partial:
         raise ValidationError(MISSING_SCOPE_MSG)
 
-    tenant_id = _parse_uuid(tenant_raw, HDR_TENANT)
-    facility_id = _parse_uuid(facility_raw, HDR_FACILITY)
-    return Scope(tenant_id=tenant_id, facility_id=facility_id)
+    if rs.tenant_id is None:
+        raise ValidationError({HDR_TENANT: "Invalid UUID"})
+    if rs.facility_id is None:
+        raise ValidationError({HDR_FACILITY: "Invalid UUID"})
+
+    return Scope(tenant_id=rs.tenant_id, facility_id=rs.facility_id)
 
 
 def require_scope_from_headers(request) -> Scope:
@@ -90,25 +81,30 @@ def assert_user_membership(user, scope: Scope) -> None:
 
 def apply_scope_from_headers(request, user=None) -> Scope | None:
     """
-    Public API used by auth layer (CookieOrHeaderJWTAuthentication).
+    Public API used by auth layer (CookieOrHeaderJWTAuthentication) and the
+    scope-optional IAM views.
 
     If scope headers are present:
       - validates they are UUIDs
-      - verifies user membership
+      - verifies user membership (skipped if an earlier layer already did it for this user)
       - sets request.tenant_id and request.facility_id
       - sets request.scope
       - returns Scope
 
     If no scope headers: returns None and does nothing.
     """
+    from hm_core.common.scope import LAYER_AUTHENTICATION, attach_scope, check_membership, get_request_scope
+
     scope = resolve_scope_from_headers(request)
     if scope is None:
         return None
 
     u = user or getattr(request, "user", None)
-    assert_user_membership(u, scope)
+    if not u or not getattr(u, "is_authenticated", False):
+        raise PermissionDenied("Authentication required to set scope.")
+
+    if not check_membership(request, u, layer=LAYER_AUTHENTICATION):
+        raise PermissionDenied("You do not have access to the selected facility.")
 
-    request.tenant_id = scope.tenant_id
-    request.facility_id = scope.facility_id
-    request.scope = scope
+    attach_scope(request, get_request_scope(request))
     return scope
@@ -4,6 +4,7 @@ from __future__ import annotations
 from uuid import UUID
 
 from hm_core.iam.models import FacilityMembership
+from hm_core.iam.services import membership_cache
 
 
 def list_user_facilities(user_id: int) -> list[dict]:
@@ -39,11 +40,7 @@ def list_user_facilities(user_id: int) -> list[dict]:
     return items
 
 
-def is_user_member_of_facility(*, user_id: int, tenant_id: UUID, facility_id: UUID) -> bool:
-    """
-    Validate user -> (tenant, facility) membership.
-    This is the single source of truth used by scope enforcement.
-    """
+def _query_membership(*, user_id: int, tenant_id: UUID, facility_id: UUID) -> bool:
     return FacilityMembership.objects.filter(
         is_active=True,
         tenant_id=tenant_id,
@@ -51,3 +48,19 @@ def is_user_member_of_facility(*, user_id: int, tenant_id: UUID, facility_id: UU
         user_profile__user_id=user_id,
         user_profile__is_active=True,
     ).exists()
+
+
+def is_user_member_of_facility(*, user_id: int, tenant_id: UUID, facility_id: UUID) -> bool:
+    """
+    Validate user -> (tenant, facility) membership.
+    This is the single source of truth used by scope enforcement.
+
+    Answers are served from the membership cache (see membership_cache.py);
+    iam.signals invalidates it when FacilityMembership/UserProfile/Role change.
+    """
+    return membership_cache.get_or_load(
+        user_id=user_id,
+        tenant_id=tenant_id,
+        facility_id=facility_id,
+        loader=lambda: _query_membership(user_id=user_id, tenant_id=tenant_id, facility_id=facility_id),
+    )
@@ -0,0 +1,136 @@
+# backend/hm_core/iam/services/membership_cache.py
+"""
+Membership cache for scope enforcement.
+
+Keyed by (user_id, tenant_id, facility_id). Both positive and negative answers
+are cached so a steady stream of scoped requests costs no DB round trips.
+
+Invalidation uses generation stamps instead of key scans:
+  - per-user generation: bumped when a user's FacilityMembership/UserProfile changes
+  - global generation:   bumped when a Role changes
+Old keys simply stop being addressed and age out through TTL/LRU eviction.
+
+Settings (all optional):
+
+    IAM_MEMBERSHIP_CACHE = {
+        "BACKEND": "lru",          # "lru" (in-process, default) | "django" | "none"
+        "TTL": 300,                # seconds
+        "MAX_ENTRIES": 10000,      # lru only
+        "CACHE_ALIAS": "default",  # django only (e.g. a Redis cache)
+    }
+
+The "lru" backend is per process: signal invalidation reaches the worker that
+made the change, other workers converge within TTL. Use "django" with a shared
+cache (Redis) when memberships must be revoked across workers immediately.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Callable, Optional
+from uuid import UUID
+
+from django.conf import settings
+
+from hm_core.common.cache import build_backend, config_ttl, new_stamp
+
+KEY_PREFIX = "iam:membership"
+
+
+_backend = None
+_backend_lock = threading.Lock()
+
+
+def _config() -> dict:
+    return getattr(settings, "IAM_MEMBERSHIP_CACHE", {}) or {}
+
+
+def get_backend():
+    global _backend
+    if _backend is None:
+        with _backend_lock:
+            if _backend is None:
+                _backend = build_backend(_config())
+    return _backend
+
+
+def reset_backend() -> None:
+    """
+    Drop the configured backend (tests / settings overrides).
+    """
+    global _backend
+    with _backend_lock:
+        _backend = None
+
+
+# -----------------------------
+# Generation stamps
+# -----------------------------
+
+def _global_gen_key() -> str:
+    return f"{KEY_PREFIX}:gen"
+
+
+def _user_gen_key(user_id: int) -> str:
+    return f"{KEY_PREFIX}:gen:u:{user_id}"
+
+
+def _get_generation(key: str) -> int:
+    # Generations are stored without timeout and are read on every lookup, so
+    # under LRU pressure stale entries are always evicted before their stamp.
+    return int(get_backend().get(key, 0) or 0)
+
+
+def _bump(key: str) -> None:
+    get_backend().set(key, new_stamp(), None)
+
+
+def bump_global_generation() -> None:
+    _bump(_global_gen_key())
+
+
+def _entry_key(*, user_id: int, tenant_id: UUID, facility_id: UUID) -> str:
+    g = _get_generation(_global_gen_key())
+    u = _get_generation(_user_gen_key(user_id))
+    return f"{KEY_PREFIX}:{g}:{u}:{user_id}:{tenant_id}:{facility_id}"
+
+
+# -----------------------------
+# Public API
+# -----------------------------
+
+def get_or_load(*, user_id: int, tenant_id: UUID, facility_id: UUID, loader: Callable[[], bool]) -> bool:
+    """
+    Return cached membership answer, calling loader() on a miss.
+
+    The key (with its generation stamps) is computed once before loading, so an
+    invalidation racing with the DB read stores under a stale key that is never
+    addressed again.
+    """
+    backend = get_backend()
+    key = _entry_key(user_id=user_id, tenant_id=tenant_id, facility_id=facility_id)
+
+    value = backend.get(key)
+    if value is not None:
+        return bool(value)
+
+    is_member = bool(loader())
+    backend.set(key, is_member, config_ttl(_config()))
+    return is_member
+
+
+def invalidate_user(user_id: Optional[int]) -> None:
+    """
+    Forget every cached membership answer for a user.
+    """
+    if user_id is None:
+        return
+    _bump(_user_gen_key(user_id))
+
+
+def invalidate_all() -> None:
+    """
+    Forget every cached membership answer (role changes, tests).
+    """
+    get_backend().clear()
+    bump_global_generation()
@@ -0,0 +1,91 @@
+# backend/hm_core/iam/services/permission_registry.py
+"""
+Compiled permission registry (iam.Permission / iam.RolePermission).
+
+Every Permission.code gets a bit index (codes sorted, so the table is stable for a
+given set of permissions) and every role a bitmask of its permissions. Checks are
+then integer operations:
+
+    reg = get_registry()
+    reg.has(reg.role_mask(role_id), "encounters.close")
+
+The registry is built in two queries and kept per process for up to TTL. iam.signals
+bumps its version stamp (common.cache.StampedCache, stamps in CACHES[CACHE_ALIAS])
+when Permission, RolePermission or Role rows change; each process rebuilds lazily
+when it sees a new stamp.
+
+Settings (optional, shape in common.cache):
+
+    IAM_PERMISSION_REGISTRY_CACHE = {
+        "BACKEND": "django",       # where the version stamp lives: "django" | "lru" | "none"
+        "TTL": 300,                # seconds a compiled registry is kept per process
+        "CACHE_ALIAS": "default",  # django only
+    }
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Mapping, Optional
+from uuid import UUID
+
+from hm_core.common.cache import StampedCache
+from hm_core.iam.models import Permission, RolePermission
+
+_cache = StampedCache(setting="IAM_PERMISSION_REGISTRY_CACHE", key_prefix="iam:permissions", max_entries=1)
+
+
+@dataclass(frozen=True)
+class CompiledPermissions:
+    codes: tuple[str, ...]
+    bits: Mapping[str, int]
+    masks_by_role_id: Mapping[UUID, int]
+
+    def bit(self, code: str) -> Optional[int]:
+        return self.bits.get(code)
+
+    def role_mask(self, role_id) -> int:
+        if role_id is None:
+            return 0
+        if not isinstance(role_id, UUID):
+            role_id = UUID(str(role_id))
+        return self.masks_by_role_id.get(role_id, 0)
+
+    def has(self, mask: int, code: str) -> bool:
+        b = self.bits.get(code)
+        return b is not None and bool(mask >> b & 1)
+
+    def decode(self, mask: int) -> list[str]:
+        return [code for i, code in enumerate(self.codes) if mask >> i & 1]
+
+
+def compile_registry() -> CompiledPermissions:
+    codes = tuple(sorted(Permission.objects.values_list("code", flat=True)))
+    bits = {code: i for i, code in enumerate(codes)}
+
+    by_role_id: dict[UUID, int] = {}
+    for role_id, perm_code in RolePermission.objects.values_list("role_id", "permission__code"):
+        by_role_id[role_id] = by_role_id.get(role_id, 0) | 1 << bits[perm_code]
+
+    return CompiledPermissions(codes=codes, bits=bits, masks_by_role_id=by_role_id)
+
+
+def reset() -> None:
+    """
+    Drop the backends and the compiled registry (tests / settings overrides).
+    """
+    _cache.reset()
+
+
+def get_registry() -> CompiledPermissions:
+    """
+    Return the compiled registry, rebuilding it if the version stamp moved.
+    """
+    return _cache.get_or_build((), "registry", compile_registry)
+
+
+def invalidate() -> None:
+    """
+    Force every process to rebuild on next use.
+    """
+    _cache.invalidate()
@@ -0,0 +1,159 @@
+# backend/hm_core/iam/services/roles.py
+"""
+Role-set resolution shared by permission classes (common.permissions, tasks.permissions).
+
+Roles are Django Group names. Lookups are cached at two levels:
+  - per request: memoized on the HttpRequest, so has_permission/has_object_permission
+    called repeatedly in one request never re-resolve
+  - cross request: group names per user_id in a cache backend (same backends as the
+    membership cache), invalidated by m2m_changed on User.groups and Group changes
+
+Settings (optional, same shape as IAM_MEMBERSHIP_CACHE):
+
+    IAM_ROLE_CACHE = {"BACKEND": "lru", "TTL": 300, "MAX_ENTRIES": 10000}
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import FrozenSet, Optional, Set
+
+from django.conf import settings
+
+from hm_core.common.cache import build_backend, config_ttl, new_stamp
+
+KEY_PREFIX = "iam:roles"
+
+# Superuser is treated as admin everywhere.
+ROLE_ADMIN = "ADMIN"
+
+# Set on users built from signed JWT claims (see iam.services.token_claims)
+USER_ATTR_ROLES = "_hm_token_roles"
+
+_REQUEST_ATTR = "_hm_user_roles"
+
+_backend = None
+_backend_lock = threading.Lock()
+
+
+def _config() -> dict:
+    return getattr(settings, "IAM_ROLE_CACHE", {}) or {}
+
+
+def get_backend():
+    global _backend
+    if _backend is None:
+        with _backend_lock:
+            if _backend is None:
+                _backend = build_backend(_config())
+    return _backend
+
+
+def reset_backend() -> None:
+    global _backend
+    with _backend_lock:
+        _backend = None
+
+
+def _global_gen_key() -> str:
+    return f"{KEY_PREFIX}:gen"
+
+
+def _entry_key(user_id: int) -> str:
+    gen = int(get_backend().get(_global_gen_key(), 0) or 0)
+    return f"{KEY_PREFIX}:{gen}:{user_id}"
+
+
+def _load_group_names(user) -> FrozenSet[str]:
+    if not hasattr(user, "groups"):
+        return frozenset()
+    return frozenset(user.groups.values_list("name", flat=True))
+
+
+def get_user_group_names(user) -> FrozenSet[str]:
+    """
+    Group names for a user, served from the cross-request cache.
+    """
+    user_id = getattr(user, "id", None)
+    if user_id is None:
+        return _load_group_names(user)
+
+    backend = get_backend()
+    key = _entry_key(user_id)
+
+    names = backend.get(key)
+    if names is not None:
+        return frozenset(names)
+
+    names = _load_group_names(user)
+    backend.set(key, tuple(sorted(names)), config_ttl(_config()))
+    return names
+
+
+def _resolve(user) -> FrozenSet[str]:
+    roles: Set[str] = set()
+
+    # Superuser treated as admin
+    if getattr(user, "is_superuser", False):
+        roles.add(ROLE_ADMIN)
+        return frozenset(roles)
+
+    # Django Groups (from signed token claims when request.user was built from them)
+    token_roles = getattr(user, USER_ATTR_ROLES, None)
+    if token_roles is not None:
+        roles.update(token_roles)
+    else:
+        roles.update(get_user_group_names(user))
+
+    # Optional user.role or user.roles
+    if hasattr(user, "role") and user.role:
+        roles.add(str(user.role))
+
+    if hasattr(user, "roles") and user.roles:
+        try:
+            roles.update(set(user.roles))
+        except TypeError:
+            roles.add(str(user.roles))
+
+    return frozenset(roles)
+
+
+def get_user_roles(user, request=None) -> FrozenSet[str]:
+    """
+    Resolve roles from:
+    1) Django groups: user.groups (recommended)
+    2) Optional user.role / user.roles attribute (if your project has it)
+
+    Returns an empty set for anonymous users. When request is given, the
+    result is memoized on it for the rest of the request.
+    """
+    if not user or not getattr(user, "is_authenticated", False):
+        return frozenset()
+
+    if request is None:
+        return _resolve(user)
+
+    base = getattr(request, "_request", request)
+    memo = getattr(base, _REQUEST_ATTR, None)
+    if memo is None:
+        memo = {}
+        setattr(base, _REQUEST_ATTR, memo)
+
+    user_id = getattr(user, "id", None)
+    roles = memo.get(user_id)
+    if roles is None:
+        roles = _resolve(user)
+        memo[user_id] = roles
+    return roles
+
+
+def invalidate_user(user_id: Optional[int]) -> None:
+    if user_id is None:
+        return
+    get_backend().delete(_entry_key(user_id))
+
+
+def invalidate_all() -> None:
+    backend = get_backend()
+    backend.clear()
+    backend.set(_global_gen_key(), new_stamp(), None)
@@ -0,0 +1,225 @@
+# backend/hm_core/iam/services/token_claims.py
+"""
+Signed scope/role claims for JWT access tokens (opt-in).
+
+When enabled, login/refresh embed into the access token:
+  - hm_mbr:   active facility memberships as [tenant_id, facility_id, role_code]
+  - hm_roles: Django group names (the role codes used by permission classes)
+  - hm_su:    is_superuser
+  - hm_username / hm_email: identity fields the session endpoints return
+  - hm_mv:    membership version at issue time
+
+CookieOrHeaderJWTAuthentication then builds request.user from the token
+(no user lookup), scope membership is answered from hm_mbr and roles from
+hm_roles, so an authorized request needs no IAM queries at all.
+
+The membership version is bumped (iam.signals) whenever memberships, profiles,
+roles, groups or the user row change. A token whose hm_mv no longer matches is
+rejected with 401 ("token_stale") so the client refreshes and gets fresh claims;
+the access token lifetime (SIMPLE_JWT.ACCESS_TOKEN_LIFETIME) bounds staleness
+otherwise.
+
+Versions live in their own Django cache (VERSION_CACHE_ALIAS), stored without
+timeout and never cleared with the membership cache, so every worker sees a bump.
+A per-process cache (LocMemCache / DummyCache) cannot carry bumps across workers:
+enabling claims with one raises ImproperlyConfigured unless the deployment is
+declared single-process (see common.cache).
+A version missing from the cache (never bumped, or evicted) is re-stamped on
+read, which turns tokens issued under the lost stamp stale rather than valid.
+
+Settings:
+
+    IAM_TOKEN_CLAIMS = {
+        "ENABLED": False,
+        "VERSION_CACHE_ALIAS": "default",  # CACHES alias, e.g. Redis
+        "SINGLE_PROCESS": False,           # allow a process-local version cache
+    }
+
+Omitting SINGLE_PROCESS falls back to settings.HM_SINGLE_PROCESS.
+"""
+
+from __future__ import annotations
+
+from typing import Iterable, Optional
+from uuid import UUID
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import caches
+from rest_framework_simplejwt.settings import api_settings
+
+from hm_core.common.cache import new_stamp, require_shared_cache
+from hm_core.iam.models import FacilityMembership
+from hm_core.iam.services.roles import USER_ATTR_ROLES
+
+CLAIM_MEMBERSHIPS = "hm_mbr"
+CLAIM_ROLES = "hm_roles"
+CLAIM_SUPERUSER = "hm_su"
+CLAIM_VERSION = "hm_mv"
+CLAIM_USERNAME = "hm_username"
+CLAIM_EMAIL = "hm_email"
+
+# Attached to the token-built user; read by common.scope.check_membership
+USER_ATTR_MEMBERSHIPS = "_hm_token_memberships"
+
+KEY_PREFIX = "iam:claims"
+
+DEFAULT_VERSION_CACHE_ALIAS = "default"
+
+def _config() -> dict:
+    return getattr(settings, "IAM_TOKEN_CLAIMS", {}) or {}
+
+
+def is_enabled() -> bool:
+    return bool(_config().get("ENABLED", False))
+
+
+# -----------------------------
+# Membership version
+# -----------------------------
+
+def _version_key(user_id) -> str:
+    return f"{KEY_PREFIX}:v:{user_id}"
+
+
+def _global_version_key() -> str:
+    return f"{KEY_PREFIX}:v"
+
+
+def _version_cache():
+    cfg = _config()
+    alias = cfg.get("VERSION_CACHE_ALIAS", DEFAULT_VERSION_CACHE_ALIAS)
+    require_shared_cache(alias, setting="IAM_TOKEN_CLAIMS", cfg=cfg)
+    return caches[alias]
+
+
+def current_version(user_id) -> str:
+    cache = _version_cache()
+    keys = [_global_version_key(), _version_key(user_id)]
+    found = cache.get_many(keys)
+    for key in keys:
+        if found.get(key) is None:
+            # never bumped or evicted: re-stamp (add keeps a concurrent worker's stamp)
+            cache.add(key, new_stamp(), None)
+            found[key] = cache.get(key)
+    return f"{int(found[keys[0]])}.{int(found[keys[1]])}"
+
+
+def bump_version(user_id) -> None:
+    if user_id is None or not is_enabled():
+        return
+    _version_cache().set(_version_key(user_id), new_stamp(), None)
+
+
+def bump_all_versions() -> None:
+    if not is_enabled():
+        return
+    _version_cache().set(_global_version_key(), new_stamp(), None)
+
+
+# -----------------------------
+# Issuing
+# -----------------------------
+
+def build_claims(user) -> dict:
+    """
+    Claims for an access token issued to user (2 queries: memberships + groups).
+    """
+    memberships = (
+        FacilityMembership.objects.filter(
+            is_active=True,
+            user_profile__user_id=user.pk,
+            user_profile__is_active=True,
+        )
+        .order_by("tenant_id", "facility_id")
+        .values_list("tenant_id", "facility_id", "role__code")
+    )
+
+    return {
+        CLAIM_MEMBERSHIPS: [[str(t), str(f), r] for t, f, r in memberships],
+        CLAIM_ROLES: sorted(user.groups.values_list("name", flat=True)),
+        CLAIM_SUPERUSER: bool(getattr(user, "is_superuser", False)),
+        CLAIM_USERNAME: getattr(user, get_user_model().USERNAME_FIELD, None),
+        CLAIM_EMAIL: getattr(user, get_user_model().get_email_field_name(), None),
+        CLAIM_VERSION: current_version(user.pk),
+    }
+
+
+def enrich_access_token(access: str, user=None) -> str:
+    """
+    Re-sign an encoded access token with scope/role claims.
+    user defaults to the token's subject. No-op unless IAM_TOKEN_CLAIMS["ENABLED"].
+    """
+    if not is_enabled():
+        return access
+
+    from rest_framework_simplejwt.tokens import AccessToken
+
+    token = AccessToken(access)
+    if user is None:
+        user = get_user_model().objects.get(**{api_settings.USER_ID_FIELD: token[api_settings.USER_ID_CLAIM]})
+
+    for k, v in build_claims(user).items():
+        token[k] = v
+    return str(token)
+
+
+# -----------------------------
+# Consuming
+# -----------------------------
+
+def has_claims(validated_token) -> bool:
+    return CLAIM_VERSION in validated_token and CLAIM_MEMBERSHIPS in validated_token
+
+
+def is_current(validated_token) -> bool:
+    user_id = validated_token.get(api_settings.USER_ID_CLAIM)
+    return validated_token.get(CLAIM_VERSION) == current_version(user_id)
+
+
+def user_from_claims(validated_token):
+    """
+    Build request.user from a validated token without touching the DB.
+
+    The instance is unsaved-but-persisted (pk set, _state.adding False), so it can
+    be assigned to ForeignKeys; it must never be saved.
+    """
+    User = get_user_model()
+    id_field = User._meta.get_field(api_settings.USER_ID_FIELD)
+    user_id = id_field.to_python(validated_token[api_settings.USER_ID_CLAIM])
+
+    user = User(**{api_settings.USER_ID_FIELD: user_id})
+    user._state.adding = False
+    user._state.db = "default"
+    user.is_active = True
+    user.is_superuser = bool(validated_token.get(CLAIM_SUPERUSER, False))
+    username = validated_token.get(CLAIM_USERNAME)
+    if username is not None:
+        setattr(user, User.USERNAME_FIELD, username)
+    email = validated_token.get(CLAIM_EMAIL)
+    if email is not None:
+        setattr(user, User.get_email_field_name(), email)
+
+    setattr(user, USER_ATTR_MEMBERSHIPS, _membership_map(validated_token.get(CLAIM_MEMBERSHIPS) or []))
+    setattr(user, USER_ATTR_ROLES, frozenset(validated_token.get(CLAIM_ROLES) or []))
+    return user
+
+
+def _membership_map(rows: Iterable) -> dict:
+    out = {}
+    for row in rows:
+        try:
+            out[(UUID(str(row[0])), UUID(str(row[1])))] = row[2] if len(row) > 2 else None
+        except (IndexError, TypeError, ValueError):
+            continue
+    return out
+
+
+def token_membership(user, *, tenant_id: UUID, facility_id: UUID) -> Optional[bool]:
+    """
+    Membership answer from token claims, or None if user was not built from claims.
+    """
+    memberships = getattr(user, USER_ATTR_MEMBERSHIPS, None)
+    if memberships is None:
+        return None
+    return (tenant_id, facility_id) in memberships
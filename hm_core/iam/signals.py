@@ -1,3 +1,124 @@
 # backend/hm_core/iam/signals.py
-# Intentionally empty for now.
-# Keep this module so AppConfig.ready() can import it safely.
+from __future__ import annotations
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from hm_core.common.cache import now_and_on_commit
+from hm_core.iam.models import FacilityMembership, Permission, Role, RolePermission, UserProfile
+from hm_core.iam.services import membership_cache, permission_registry, roles, token_claims
+
+
+def _invalidate_user(user_id) -> None:
+    def _run():
+        membership_cache.invalidate_user(user_id)
+        token_claims.bump_version(user_id)
+
+    now_and_on_commit(_run)
+
+
+def _invalidate_all() -> None:
+    def _run():
+        membership_cache.invalidate_all()
+        token_claims.bump_all_versions()
+
+    now_and_on_commit(_run)
+
+
+@receiver(post_save, sender=FacilityMembership, dispatch_uid="iam_membership_cache_fm_save")
+@receiver(post_delete, sender=FacilityMembership, dispatch_uid="iam_membership_cache_fm_delete")
+def facility_membership_changed(sender, instance: FacilityMembership, **kwargs):
+    user_id = (
+        UserProfile.objects.filter(pk=instance.user_profile_id).values_list("user_id", flat=True).first()
+    )
+    if user_id is None:
+        # Profile already gone (cascade delete) -> UserProfile receiver handles it.
+        return
+    _invalidate_user(user_id)
+
+
+@receiver(post_save, sender=UserProfile, dispatch_uid="iam_membership_cache_profile_save")
+@receiver(post_delete, sender=UserProfile, dispatch_uid="iam_membership_cache_profile_delete")
+def user_profile_changed(sender, instance: UserProfile, **kwargs):
+    _invalidate_user(instance.user_id)
+
+
+@receiver(post_save, sender=Role, dispatch_uid="iam_membership_cache_role_save")
+@receiver(post_delete, sender=Role, dispatch_uid="iam_membership_cache_role_delete")
+def role_changed(sender, instance: Role, **kwargs):
+    _invalidate_all()
+    _invalidate_permissions()
+
+
+# -----------------------------
+# Compiled permission registry
+# -----------------------------
+
+def _invalidate_permissions() -> None:
+    now_and_on_commit(permission_registry.invalidate)
+
+
+@receiver(post_save, sender=RolePermission, dispatch_uid="iam_permission_registry_rp_save")
+@receiver(post_delete, sender=RolePermission, dispatch_uid="iam_permission_registry_rp_delete")
+@receiver(post_save, sender=Permission, dispatch_uid="iam_permission_registry_perm_save")
+@receiver(post_delete, sender=Permission, dispatch_uid="iam_permission_registry_perm_delete")
+def permissions_changed(sender, instance, **kwargs):
+    _invalidate_permissions()
+
+
+# -----------------------------
+# Role cache (Django groups)
+# -----------------------------
+
+def _invalidate_roles(user_ids) -> None:
+    user_ids = list(user_ids)
+
+    def _run():
+        for uid in user_ids:
+            roles.invalidate_user(uid)
+            token_claims.bump_version(uid)
+
+    now_and_on_commit(_run)
+
+
+def _invalidate_all_roles() -> None:
+    def _run():
+        roles.invalidate_all()
+        token_claims.bump_all_versions()
+
+    now_and_on_commit(_run)
+
+
+@receiver(m2m_changed, sender=get_user_model().groups.through, dispatch_uid="iam_role_cache_user_groups")
+def user_groups_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+
+    if not reverse:
+        # user.groups.add/remove/clear(...)
+        _invalidate_roles([instance.pk])
+    elif pk_set:
+        # group.user_set.add/remove(...)
+        _invalidate_roles(pk_set)
+    else:
+        # group.user_set.clear(): affected users are unknown
+        _invalidate_all_roles()
+
+
+@receiver(post_save, sender=Group, dispatch_uid="iam_role_cache_group_save")
+@receiver(post_delete, sender=Group, dispatch_uid="iam_role_cache_group_delete")
+def group_changed(sender, instance: Group, created: bool = False, **kwargs):
+    if created:
+        # A new group has no members yet.
+        return
+    _invalidate_all_roles()
+
+
+@receiver(post_save, sender=get_user_model(), dispatch_uid="iam_token_claims_user_save")
+def user_saved(sender, instance, created: bool = False, update_fields=None, **kwargs):
+    # is_active / is_superuser / username end up in token claims.
+    if created or (update_fields and set(update_fields) <= {"last_login"}):
+        return
+    token_claims.bump_version(instance.pk)
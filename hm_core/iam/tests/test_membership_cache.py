@@ -0,0 +1,83 @@
+# backend/hm_core/iam/tests/test_membership_cache.py
+import pytest
+
+from hm_core.iam.models import FacilityMembership, Role, UserProfile
+from hm_core.iam.services import membership_cache
+from hm_core.iam.services.membership import is_user_member_of_facility
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache(settings):
+    settings.IAM_MEMBERSHIP_CACHE = {"BACKEND": "lru", "TTL": 300, "MAX_ENTRIES": 100}
+    membership_cache.reset_backend()
+    yield
+    membership_cache.reset_backend()
+
+
+def _check(user, tenant, facility) -> bool:
+    return is_user_member_of_facility(user_id=user.id, tenant_id=tenant.id, facility_id=facility.id)
+
+
+def test_membership_check_is_cached(user, tenant, facility, django_assert_num_queries):
+    assert _check(user, tenant, facility) is True
+
+    with django_assert_num_queries(0):
+        assert _check(user, tenant, facility) is True
+
+
+def test_negative_answer_is_cached(user, other_tenant, other_facility, django_assert_num_queries):
+    assert _check(user, other_tenant, other_facility) is False
+
+    with django_assert_num_queries(0):
+        assert _check(user, other_tenant, other_facility) is False
+
+
+def test_membership_deactivation_invalidates(user, tenant, facility):
+    assert _check(user, tenant, facility) is True
+
+    m = FacilityMembership.objects.get(user_profile__user=user, facility=facility)
+    m.is_active = False
+    m.save(update_fields=["is_active"])
+
+    assert _check(user, tenant, facility) is False
+
+
+def test_new_membership_invalidates_negative_answer(user, other_tenant, other_facility):
+    assert _check(user, other_tenant, other_facility) is False
+
+    # Cross-tenant membership for the test only; profile tenant is irrelevant to the check.
+    role = Role.objects.create(tenant=other_tenant, code="doctor", name="Doctor")
+    FacilityMembership.objects.create(
+        tenant=other_tenant,
+        facility=other_facility,
+        user_profile=UserProfile.objects.get(user=user),
+        role=role,
+    )
+
+    assert _check(user, other_tenant, other_facility) is True
+
+
+def test_profile_deactivation_invalidates(user, tenant, facility):
+    assert _check(user, tenant, facility) is True
+
+    profile = UserProfile.objects.get(user=user)
+    profile.is_active = False
+    profile.save(update_fields=["is_active"])
+
+    assert _check(user, tenant, facility) is False
+
+
+def test_django_cache_backend(settings, user, tenant, facility, django_assert_num_queries):
+    settings.IAM_MEMBERSHIP_CACHE = {"BACKEND": "django", "TTL": 300, "CACHE_ALIAS": "default"}
+    membership_cache.reset_backend()
+
+    assert _check(user, tenant, facility) is True
+    with django_assert_num_queries(0):
+        assert _check(user, tenant, facility) is True
+
+    FacilityMembership.objects.filter(user_profile__user=user).update(is_active=False)
+    membership_cache.invalidate_user(user.id)
+
+    assert _check(user, tenant, facility) is False
@@ -0,0 +1,75 @@
+# backend/hm_core/iam/tests/test_permission_registry.py
+import pytest
+
+from hm_core.common.cache import StampedCache
+from hm_core.iam.models import Permission, Role, RolePermission
+from hm_core.iam.services import permission_registry
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture(autouse=True)
+def _fresh_registry():
+    permission_registry.reset()
+    permission_registry.invalidate()
+    yield
+    permission_registry.reset()
+
+
+@pytest.fixture
+def admin_role(user, tenant):
+    role = Role.objects.get(tenant=tenant, code="admin")
+    for code in ("encounters.close", "patients.create", "tasks.assign"):
+        p, _ = Permission.objects.get_or_create(code=code)
+        if code != "tasks.assign":
+            RolePermission.objects.create(role=role, permission=p)
+    return role
+
+
+def test_registry_compiles_bitmasks(admin_role, django_assert_num_queries):
+    reg = permission_registry.get_registry()
+    mask = reg.role_mask(admin_role.id)
+
+    assert reg.has(mask, "encounters.close")
+    assert not reg.has(mask, "tasks.assign")
+    assert not reg.has(mask, "unknown.code")
+    assert reg.decode(mask) == ["encounters.close", "patients.create"]
+
+    with django_assert_num_queries(0):
+        assert permission_registry.get_registry() is reg
+
+
+def test_role_permission_change_rebuilds(admin_role):
+    reg = permission_registry.get_registry()
+    assert not reg.has(reg.role_mask(admin_role.id), "tasks.assign")
+
+    RolePermission.objects.create(role=admin_role, permission=Permission.objects.get(code="tasks.assign"))
+
+    reg = permission_registry.get_registry()
+    assert reg.has(reg.role_mask(admin_role.id), "tasks.assign")
+
+
+def test_role_permission_change_reaches_other_workers(admin_role):
+    # another worker: its own per-process registry, stamps in the shared CACHES["default"]
+    other = StampedCache(setting="IAM_PERMISSION_REGISTRY_CACHE", key_prefix="iam:permissions")
+    reg = other.get_or_build((), "registry", permission_registry.compile_registry)
+    assert not reg.has(reg.role_mask(admin_role.id), "tasks.assign")
+
+    RolePermission.objects.create(role=admin_role, permission=Permission.objects.get(code="tasks.assign"))
+
+    reg = other.get_or_build((), "registry", permission_registry.compile_registry)
+    assert reg.has(reg.role_mask(admin_role.id), "tasks.assign")
+
+
+def test_bootstrap_returns_bitmask_and_code_table(api_client, admin_role, tenant, facility):
+    headers = {"HTTP_X_TENANT_ID": str(tenant.id), "HTTP_X_FACILITY_ID": str(facility.id)}
+
+    res = api_client.get("/api/session/bootstrap/", **headers)
+    assert res.status_code == 200
+    assert res.json()["permissions"] == ["encounters.close", "patients.create"]
+
+    res = api_client.get("/api/session/bootstrap/?permissions_format=bitmask", **headers)
+    body = res.json()
+    codes = body["permission_codes"]
+    mask = int(body["permission_mask"], 16)
+    assert [c for i, c in enumerate(codes) if mask >> i & 1] == ["encounters.close", "patients.create"]
@@ -0,0 +1,69 @@
+# backend/hm_core/iam/tests/test_role_cache.py
+import pytest
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group
+from django.test import RequestFactory
+
+from hm_core.iam.services import roles
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache(settings):
+    settings.IAM_ROLE_CACHE = {"BACKEND": "lru", "TTL": 300, "MAX_ENTRIES": 100}
+    roles.reset_backend()
+    yield
+    roles.reset_backend()
+
+
+@pytest.fixture
+def nurse():
+    u = get_user_model().objects.create_user(username="nurse1", password="pass123")
+    u.groups.add(Group.objects.get_or_create(name="NURSE")[0])
+    return u
+
+
+def test_roles_cached_across_requests(nurse, django_assert_num_queries):
+    assert roles.get_user_roles(nurse) == {"NURSE"}
+
+    with django_assert_num_queries(0):
+        assert roles.get_user_roles(nurse) == {"NURSE"}
+
+
+def test_roles_memoized_per_request(nurse, django_assert_num_queries):
+    request = RequestFactory().get("/api/v1/tasks/")
+
+    with django_assert_num_queries(1):
+        for _ in range(5):
+            assert roles.get_user_roles(nurse, request=request) == {"NURSE"}
+
+
+def test_group_membership_change_invalidates(nurse):
+    assert roles.get_user_roles(nurse) == {"NURSE"}
+
+    doctor, _ = Group.objects.get_or_create(name="DOCTOR")
+    nurse.groups.add(doctor)
+    assert roles.get_user_roles(nurse) == {"NURSE", "DOCTOR"}
+
+    doctor.user_set.remove(nurse)
+    assert roles.get_user_roles(nurse) == {"NURSE"}
+
+    nurse.groups.clear()
+    assert roles.get_user_roles(nurse) == frozenset()
+
+
+def test_group_rename_invalidates(nurse):
+    assert roles.get_user_roles(nurse) == {"NURSE"}
+
+    g = Group.objects.get(name="NURSE")
+    g.name = "DOCTOR"
+    g.save()
+
+    assert roles.get_user_roles(nurse) == {"DOCTOR"}
+
+
+def test_superuser_is_admin_without_queries(django_assert_num_queries):
+    su = get_user_model().objects.create_superuser(username="root1", password="pass123")
+    with django_assert_num_queries(0):
+        assert roles.get_user_roles(su) == {"ADMIN"}
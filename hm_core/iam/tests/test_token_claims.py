@@ -0,0 +1,132 @@
+# backend/hm_core/iam/tests/test_token_claims.py
+import pytest
+from django.core.cache import caches
+from django.core.exceptions import ImproperlyConfigured
+from django.test import RequestFactory
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken, RefreshToken
+
+from hm_core.iam.auth import CookieOrHeaderJWTAuthentication
+from hm_core.iam.models import FacilityMembership
+from hm_core.iam.services import membership_cache, roles, token_claims
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture(autouse=True)
+def _claims_enabled(settings):
+    # test runs are one process: the default LocMemCache may hold versions
+    settings.IAM_TOKEN_CLAIMS = {"ENABLED": True, "SINGLE_PROCESS": True}
+    caches["default"].clear()
+    membership_cache.reset_backend()
+    roles.reset_backend()
+    yield
+    membership_cache.reset_backend()
+    roles.reset_backend()
+
+
+def _access_for(user) -> str:
+    return token_claims.enrich_access_token(str(RefreshToken.for_user(user).access_token), user)
+
+
+def _authenticate(access: str, tenant, facility):
+    req = RequestFactory().get(
+        "/api/v1/patients/",
+        HTTP_AUTHORIZATION=f"Bearer {access}",
+        HTTP_X_TENANT_ID=str(tenant.id),
+        HTTP_X_FACILITY_ID=str(facility.id),
+    )
+    return req, CookieOrHeaderJWTAuthentication().authenticate(req)
+
+
+def test_access_token_carries_claims(user, tenant, facility):
+    token = AccessToken(_access_for(user))
+
+    assert token[token_claims.CLAIM_MEMBERSHIPS] == [[str(tenant.id), str(facility.id), "admin"]]
+    assert token[token_claims.CLAIM_ROLES] == ["ADMIN"]
+    assert token[token_claims.CLAIM_SUPERUSER] is False
+
+
+def test_authentication_uses_claims_without_queries(user, tenant, facility, django_assert_num_queries):
+    access = _access_for(user)
+
+    with django_assert_num_queries(0):
+        req, (auth_user, _) = _authenticate(access, tenant, facility)
+        assert roles.get_user_roles(auth_user, request=req) == {"ADMIN"}
+
+    assert auth_user.pk == user.pk
+    assert req.facility_id == facility.id
+    assert req._hm_request_scope.membership_source == "token"
+
+
+def test_scope_outside_claims_is_forbidden(user, other_tenant, other_facility):
+    from rest_framework.exceptions import PermissionDenied
+
+    with pytest.raises(PermissionDenied):
+        _authenticate(_access_for(user), other_tenant, other_facility)
+
+
+def test_membership_change_makes_token_stale(user, tenant, facility):
+    access = _access_for(user)
+
+    m = FacilityMembership.objects.get(user_profile__user=user)
+    m.is_active = False
+    m.save(update_fields=["is_active"])
+
+    with pytest.raises(AuthenticationFailed) as exc:
+        _authenticate(access, tenant, facility)
+    assert exc.value.status_code == 401
+
+
+def test_versions_survive_membership_cache_clear_and_restamp_when_lost(user, tenant, facility):
+    access = _access_for(user)
+
+    membership_cache.invalidate_all()
+    _authenticate(access, tenant, facility)  # still current
+
+    caches["default"].delete(token_claims._version_key(user.pk))  # evicted
+    with pytest.raises(AuthenticationFailed):
+        _authenticate(access, tenant, facility)
+
+
+def test_process_local_version_cache_is_rejected(settings, user):
+    settings.HM_SINGLE_PROCESS = False
+    settings.IAM_TOKEN_CLAIMS = {"ENABLED": True}
+
+    with pytest.raises(ImproperlyConfigured):
+        _access_for(user)
+
+
+def test_login_and_refresh_issue_claims(user):
+    user.set_password("Pass@12345")
+    user.save(update_fields=["password"])
+
+    c = APIClient()
+    res = c.post("/api/auth/login/", {"username": user.username, "password": "Pass@12345"}, format="json")
+    assert res.status_code == 200
+    assert token_claims.CLAIM_VERSION in AccessToken(res.cookies["hm_access"].value)
+
+    res = c.post("/api/auth/refresh/")
+    assert res.status_code == 200
+    assert token_claims.CLAIM_MEMBERSHIPS in AccessToken(res.cookies["hm_access"].value)
+
+
+def test_session_endpoints_return_identity_from_claims(user, tenant, facility):
+    user.email = "testuser@example.com"
+    user.save(update_fields=["email"])
+    c = APIClient()
+    c.credentials(HTTP_AUTHORIZATION=f"Bearer {_access_for(user)}")
+    headers = {"HTTP_X_TENANT_ID": str(tenant.id), "HTTP_X_FACILITY_ID": str(facility.id)}
+
+    for url in ("/api/session/bootstrap/", "/api/me/"):
+        res = c.get(url, **headers)
+        assert res.status_code == 200, res.data
+        assert res.data["user"]["username"] == "testuser"
+        assert res.data["user"]["email"] == "testuser@example.com"
+
+
+def test_disabled_mode_issues_plain_tokens(settings, user):
+    settings.IAM_TOKEN_CLAIMS = {"ENABLED": False}
+    access = token_claims.enrich_access_token(str(RefreshToken.for_user(user).access_token), user)
+    assert token_claims.CLAIM_MEMBERSHIPS not in AccessToken(access)
@@ -0,0 +1,298 @@
+# backend/hm_core/lab/critical_values.py
+"""
+Critical-value engine for lab results.
+
+Thresholds are per facility, stored as a rules.Rule (code "lab.critical_values"):
+
+    {
+      "analytes": [
+        {"analyte": "hb", "code": "HB", "unit": "g/dL", "low": 6.0, "high": 20.0},
+        {"analyte": "k", "code": "K", "unit": "mmol/L", "low": 2.5, "high": 6.5},
+        # optional bands: most specific matching band wins
+        {"analyte": "hb", "code": "HB", "low": 9.5, "age_max_years": 0.08},
+        {"analyte": "crp", "code": "CRP", "high": 200, "sex": "F", "age_min_years": 18}
+      ]
+    }
+
+Without a rule the Phase-1 default applies (hb < 6 => HB_LOW); so does a stored
+rule that fails validation (logged), so one bad band never blocks result entry.
+The rule is
+compiled once (rules.cache) into CriticalValueTable: analyte -> bands, so a
+payload is checked in a single pass over its keys. evaluate_many() checks many
+payloads column-wise: values are gathered per (analyte, band) into float arrays
+and compared against the thresholds with C-level map/compress passes.
+
+Reason shape (LabResult.critical_reasons) is unchanged:
+    {"code": "HB_LOW", "value": <raw payload value>, "threshold": 6.0}
+"""
+
+from __future__ import annotations
+
+import logging
+from array import array
+from dataclasses import dataclass
+from datetime import date
+from itertools import compress
+from typing import Any, Iterable, Mapping, Optional, Sequence
+from uuid import UUID
+
+from hm_core.rules import cache as rule_cache
+
+logger = logging.getLogger(__name__)
+
+RULE_CODE = "lab.critical_values"
+
+SEX_VALUES = ("M", "F")
+
+
+@dataclass(frozen=True)
+class CriticalBand:
+    analyte: str  # payload key (case-insensitive)
+    code: str  # reason prefix: HB -> HB_LOW / HB_HIGH
+    low: Optional[float] = None  # value < low => critical
+    high: Optional[float] = None  # value > high => critical
+    unit: str = ""
+    sex: Optional[str] = None  # "M" | "F" | None (any)
+    age_min_years: Optional[float] = None  # inclusive
+    age_max_years: Optional[float] = None  # exclusive
+
+    @property
+    def is_banded(self) -> bool:
+        return self.sex is not None or self.age_min_years is not None or self.age_max_years is not None
+
+    @property
+    def specificity(self) -> int:
+        return (self.sex is not None) + (self.age_min_years is not None) + (self.age_max_years is not None)
+
+    def applies_to(self, ctx: Optional["PatientContext"]) -> bool:
+        if not self.is_banded:
+            return True
+        if ctx is None:
+            return False
+        if self.sex is not None and ctx.sex != self.sex:
+            return False
+        if self.age_min_years is not None or self.age_max_years is not None:
+            if ctx.age_years is None:
+                return False
+            if self.age_min_years is not None and ctx.age_years < self.age_min_years:
+                return False
+            if self.age_max_years is not None and ctx.age_years >= self.age_max_years:
+                return False
+        return True
+
+
+@dataclass(frozen=True)
+class PatientContext:
+    sex: Optional[str] = None  # normalized "M" / "F"
+    age_years: Optional[float] = None
+
+    @classmethod
+    def from_patient(cls, *, gender: str = "", date_of_birth: Optional[date] = None, on: Optional[date] = None):
+        g = (gender or "").strip()[:1].upper()
+        age = None
+        if date_of_birth:
+            age = ((on or date.today()) - date_of_birth).days / 365.25
+        return cls(sex=g if g in SEX_VALUES else None, age_years=age)
+
+
+DEFAULT_BANDS = (CriticalBand(analyte="hb", code="HB", low=6.0, unit="g/dL"),)
+
+
+def _to_float(value: Any) -> Optional[float]:
+    try:
+        return float(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+def _opt_float(raw: Mapping[str, Any], key: str) -> Optional[float]:
+    v = raw.get(key)
+    if v is None or v == "":
+        return None
+    f = _to_float(v)
+    if f is None:
+        raise ValueError(f"Critical value band {raw.get('analyte')!r}: {key} must be a number.")
+    return f
+
+
+def parse_band(raw: Mapping[str, Any]) -> CriticalBand:
+    analyte = str(raw.get("analyte") or "").strip().lower()
+    if not analyte:
+        raise ValueError("Critical value band requires 'analyte'.")
+
+    low = _opt_float(raw, "low")
+    high = _opt_float(raw, "high")
+    if low is None and high is None:
+        raise ValueError(f"Critical value band {analyte!r} needs 'low' and/or 'high'.")
+
+    sex = raw.get("sex")
+    sex = str(sex).strip()[:1].upper() if sex else None
+    if sex is not None and sex not in SEX_VALUES:
+        raise ValueError(f"Critical value band {analyte!r}: sex must be one of {SEX_VALUES}.")
+
+    return CriticalBand(
+        analyte=analyte,
+        code=str(raw.get("code") or analyte).strip().upper(),
+        low=low,
+        high=high,
+        unit=str(raw.get("unit") or ""),
+        sex=sex,
+        age_min_years=_opt_float(raw, "age_min_years"),
+        age_max_years=_opt_float(raw, "age_max_years"),
+    )
+
+
+def validate_config(config: Mapping[str, Any]) -> list[CriticalBand]:
+    """
+    Parse Rule.config; raises ValueError on malformed bands (use before saving).
+    """
+    analytes = (config or {}).get("analytes")
+    if not isinstance(analytes, list):
+        raise ValueError("Critical value config requires an 'analytes' list.")
+    return [parse_band(raw) for raw in analytes]
+
+
+class CriticalValueTable:
+    """
+    Compiled thresholds: analyte -> bands, most specific first.
+    """
+
+    def __init__(self, bands: Iterable[CriticalBand]):
+        grouped: dict[str, list[CriticalBand]] = {}
+        for band in bands:
+            grouped.setdefault(band.analyte, []).append(band)
+        self.by_analyte: dict[str, tuple[CriticalBand, ...]] = {
+            analyte: tuple(sorted(bs, key=lambda b: -b.specificity)) for analyte, bs in grouped.items()
+        }
+        self.needs_patient_context = any(b.is_banded for bs in self.by_analyte.values() for b in bs)
+
+    @classmethod
+    def compile(cls, config: Optional[dict]) -> "CriticalValueTable":
+        if config is None:
+            return cls(DEFAULT_BANDS)
+        return cls(validate_config(config))
+
+    def band_for(self, analyte: str, ctx: Optional[PatientContext] = None) -> Optional[CriticalBand]:
+        for band in self.by_analyte.get(analyte, ()):
+            if band.applies_to(ctx):
+                return band
+        return None
+
+    # -------------------------
+    # Single payload
+    # -------------------------
+    def evaluate(self, payload: Mapping[str, Any], ctx: Optional[PatientContext] = None) -> tuple[bool, list[dict]]:
+        reasons: list[dict] = []
+        for key, raw in (payload or {}).items():
+            band = self.band_for(str(key).lower(), ctx)
+            if band is None:
+                continue
+            x = _to_float(raw)
+            if x is None:
+                continue
+            if band.low is not None and x < band.low:
+                reasons.append({"code": f"{band.code}_LOW", "value": raw, "threshold": band.low})
+            elif band.high is not None and x > band.high:
+                reasons.append({"code": f"{band.code}_HIGH", "value": raw, "threshold": band.high})
+        return (len(reasons) > 0), reasons
+
+    # -------------------------
+    # Batch (column-wise)
+    # -------------------------
+    def evaluate_many(
+        self,
+        payloads: Sequence[Mapping[str, Any]],
+        contexts: Optional[Sequence[Optional[PatientContext]]] = None,
+    ) -> list[tuple[bool, list[dict]]]:
+        """
+        Same results as [evaluate(p, ctx) for ...], computed per (analyte, band)
+        column instead of per payload.
+        """
+        n = len(payloads)
+        # (band) -> parallel columns: values, payload index, key position, raw value
+        columns: dict[CriticalBand, tuple[array, list[int], list[int], list[Any]]] = {}
+
+        for i, payload in enumerate(payloads):
+            ctx = contexts[i] if contexts is not None else None
+            for pos, (key, raw) in enumerate((payload or {}).items()):
+                bands = self.by_analyte.get(str(key).lower())
+                if not bands:
+                    continue
+                band = bands[0] if not bands[0].is_banded else self.band_for(str(key).lower(), ctx)
+                if band is None:
+                    continue
+                x = _to_float(raw)
+                if x is None:
+                    continue
+                col = columns.get(band)
+                if col is None:
+                    col = columns[band] = (array("d"), [], [], [])
+                col[0].append(x)
+                col[1].append(i)
+                col[2].append(pos)
+                col[3].append(raw)
+
+        hits: list[list[tuple[int, dict]]] = [[] for _ in range(n)]
+        for band, (values, rows, positions, raws) in columns.items():
+            low_flags = list(map(band.low.__gt__, values)) if band.low is not None else [False] * len(values)
+            for j in compress(range(len(values)), low_flags):
+                hits[rows[j]].append((positions[j], {"code": f"{band.code}_LOW", "value": raws[j], "threshold": band.low}))
+
+            if band.high is not None:
+                high_flags = map(band.high.__lt__, values)
+                for j in compress(range(len(values)), high_flags):
+                    if not low_flags[j]:
+                        hits[rows[j]].append(
+                            (positions[j], {"code": f"{band.code}_HIGH", "value": raws[j], "threshold": band.high})
+                        )
+
+        out: list[tuple[bool, list[dict]]] = []
+        for h in hits:
+            h.sort(key=lambda t: t[0])
+            reasons = [r for _pos, r in h]
+            out.append((len(reasons) > 0, reasons))
+        return out
+
+
+def _compile_or_default(config: Optional[dict]) -> CriticalValueTable:
+    try:
+        return CriticalValueTable.compile(config)
+    except ValueError as exc:
+        logger.error("Invalid %s rule, using default thresholds: %s", RULE_CODE, exc)
+        return CriticalValueTable(DEFAULT_BANDS)
+
+
+def get_table(*, tenant_id: UUID, facility_id: UUID) -> CriticalValueTable:
+    """
+    Compiled thresholds for a facility (no query in the steady state).
+    A malformed stored rule is logged once per version and replaced by DEFAULT_BANDS.
+    """
+    return rule_cache.get_compiled_rule(
+        tenant_id=tenant_id,
+        facility_id=facility_id,
+        code=RULE_CODE,
+        compiler=_compile_or_default,
+    )
+
+
+def check_critical_values(
+    *,
+    tenant_id: UUID,
+    facility_id: UUID,
+    result_payload: Mapping[str, Any],
+    ctx: Optional[PatientContext] = None,
+) -> tuple[bool, list[dict]]:
+    return get_table(tenant_id=tenant_id, facility_id=facility_id).evaluate(result_payload or {}, ctx)
+
+
+def check_critical_values_many(
+    *,
+    tenant_id: UUID,
+    facility_id: UUID,
+    payloads: Sequence[Mapping[str, Any]],
+    contexts: Optional[Sequence[Optional[PatientContext]]] = None,
+) -> list[tuple[bool, list[dict]]]:
+    """
+    Analyzer bursts: check thousands of payloads of one facility in one call.
+    """
+    return get_table(tenant_id=tenant_id, facility_id=facility_id).evaluate_many(payloads, contexts)
@@ -0,0 +1,63 @@
+# Generated by Django 5.2.9 on 2026-10-17 06:12
+
+import django.db.models.deletion
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('encounters', '0001_initial'),
+        ('orders', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='LabResult',
+            fields=[
+                ('created_at', models.DateTimeField(auto_now_add=True, db_index=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('tenant_id', models.UUIDField(db_index=True)),
+                ('facility_id', models.UUIDField(db_index=True)),
+                ('version', models.PositiveIntegerField()),
+                ('result_payload', models.JSONField(default=dict)),
+                ('is_critical', models.BooleanField(default=False)),
+                ('critical_reasons', models.JSONField(blank=True, default=list)),
+                ('verified_at', models.DateTimeField(blank=True, null=True)),
+                ('released_at', models.DateTimeField(blank=True, null=True)),
+                ('encounter', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='lab_results', to='encounters.encounter')),
+                ('order_item', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='lab_results', to='orders.orderitem')),
+                ('released_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='released_lab_results', to=settings.AUTH_USER_MODEL)),
+                ('verified_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='verified_lab_results', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'db_table': 'lab_result',
+                'indexes': [models.Index(fields=['tenant_id', 'facility_id', 'order_item'], name='lab_result_tenant__947fab_idx'), models.Index(fields=['tenant_id', 'facility_id', 'encounter'], name='lab_result_tenant__e8524e_idx')],
+                'constraints': [models.UniqueConstraint(fields=('tenant_id', 'facility_id', 'order_item', 'version'), name='uq_lab_result_version_per_item_scope')],
+            },
+        ),
+        migrations.CreateModel(
+            name='LabSample',
+            fields=[
+                ('created_at', models.DateTimeField(auto_now_add=True, db_index=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('tenant_id', models.UUIDField(db_index=True)),
+                ('facility_id', models.UUIDField(db_index=True)),
+                ('barcode', models.CharField(blank=True, max_length=64, null=True)),
+                ('received_at', models.DateTimeField(blank=True, null=True)),
+                ('order_item', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='lab_sample', to='orders.orderitem')),
+                ('received_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'db_table': 'lab_sample',
+                'indexes': [models.Index(fields=['tenant_id', 'facility_id', 'order_item'], name='lab_sample_tenant__150b20_idx')],
+            },
+        ),
+    ]
@@ -12,24 +12,22 @@ from hm_core.common.task_codes import (
     lab_result_verify_code,
     critical_ack_code,
 )
+from hm_core.lab.critical_values import (
+    RULE_CODE as CRITICAL_VALUES_RULE_CODE,
+    PatientContext,
+    get_table,
+    validate_config,
+)
 from hm_core.lab.models import LabSample, LabResult
 from hm_core.lab.selectors import get_order_item_scoped, latest_result_for_item
 from hm_core.tasks.services import TaskService
 from hm_core.billing.models import BillableEvent
+from hm_core.encounters.signals._emit import event_buffer
 
 
-def _critical_check(result_payload: dict) -> tuple[bool, list[dict]]:
-    """
-    Phase-1 minimal rule: hb < 6 => critical
-    """
-    reasons: list[dict] = []
-    hb = (result_payload or {}).get("hb")
-    try:
-        if hb is not None and float(hb) < 6.0:
-            reasons.append({"code": "HB_LOW", "value": hb, "threshold": 6.0})
-    except Exception:
-        pass
-    return (len(reasons) > 0), reasons
+def _patient_context(oi) -> PatientContext:
+    p = oi.encounter.patient
+    return PatientContext.from_patient(gender=p.gender, date_of_birth=p.date_of_birth, on=timezone.localdate())
 
 
 class LabService:
@@ -41,6 +39,27 @@ class LabService:
     - Release (requires verification, emits billing event once)
     """
 
+    # ----------------------------
+    # Critical-value rules
+    # ----------------------------
+    @staticmethod
+    def configure_critical_values(*, tenant_id: UUID, facility_id: UUID, analytes: list[dict]):
+        """
+        Validate + store the facility's critical-value thresholds (rules.Rule).
+        Raises ValueError on malformed bands, so a bad config never reaches result entry.
+        """
+        from hm_core.rules.services_rules import RuleService  # local import
+
+        config = {"analytes": list(analytes or [])}
+        validate_config(config)
+        return RuleService.upsert_rule(
+            tenant_id=tenant_id,
+            facility_id=facility_id,
+            code=CRITICAL_VALUES_RULE_CODE,
+            description="Lab critical-value thresholds",
+            config=config,
+        )
+
     # ----------------------------
     # Sample receive
     # ----------------------------
@@ -96,6 +115,7 @@ class LabService:
     # ----------------------------
     @staticmethod
     @transaction.atomic
+    @event_buffer()
     def create_result(
         *,
         tenant_id: UUID,
@@ -108,7 +128,10 @@ class LabService:
         latest = latest_result_for_item(tenant_id=tenant_id, facility_id=facility_id, order_item_id=oi.id)
         next_version = 1 if not latest else int(latest.version) + 1
 
-        is_critical, reasons = _critical_check(result_payload or {})
+        # Patient sex/age only matter when the facility configured banded thresholds.
+        table = get_table(tenant_id=tenant_id, facility_id=facility_id)
+        ctx = _patient_context(oi) if table.needs_patient_context else None
+        is_critical, reasons = table.evaluate(result_payload or {}, ctx)
 
         lr = LabResult.objects.create(
             tenant_id=tenant_id,
@@ -0,0 +1,128 @@
+# backend/hm_core/lab/tests/test_critical_values.py
+import logging
+import random
+from datetime import date
+
+import pytest
+
+from hm_core.lab.critical_values import (
+    DEFAULT_BANDS,
+    RULE_CODE,
+    CriticalValueTable,
+    PatientContext,
+    check_critical_values,
+)
+from hm_core.lab.services import LabService
+from hm_core.rules.services_rules import RuleService
+from hm_core.tests.helpers import scoped
+
+CONFIG = {
+    "analytes": [
+        {"analyte": "hb", "code": "HB", "unit": "g/dL", "low": 7.0, "high": 20.0},
+        {"analyte": "hb", "code": "HB", "low": 9.5, "age_max_years": 1},
+        {"analyte": "K", "code": "K", "unit": "mmol/L", "low": 2.5, "high": 6.5},
+        {"analyte": "ck", "code": "CK", "high": 1000, "sex": "F"},
+    ]
+}
+
+
+def _create_item_and_receive_sample(api_client, tenant, facility, encounter):
+    order = api_client.post(
+        "/api/v1/orders/",
+        {"encounter_id": str(encounter.id), "order_type": "LAB", "priority": "ROUTINE", "items": [{"service_code": "CBC"}]},
+        format="json",
+        **scoped(tenant, facility),
+    )
+    assert order.status_code in (200, 201), order.data
+    order_item_id = order.data["items"][0]["id"]
+
+    recv = api_client.post(
+        "/api/v1/lab/samples/receive/",
+        {"order_item_id": str(order_item_id), "barcode": "SAMPLE-CV"},
+        format="json",
+        **scoped(tenant, facility),
+    )
+    assert recv.status_code in (200, 201), recv.data
+    return order_item_id
+
+
+def test_default_table_keeps_phase1_reason_shape():
+    table = CriticalValueTable(DEFAULT_BANDS)
+    assert table.evaluate({"hb": "4.0", "wbc": 8000}) == (
+        True,
+        [{"code": "HB_LOW", "value": "4.0", "threshold": 6.0}],
+    )
+    assert table.evaluate({"hb": "n/a"}) == (False, [])
+    assert table.evaluate({}) == (False, [])
+
+
+def test_bands_pick_most_specific_threshold():
+    table = CriticalValueTable.compile(CONFIG)
+    infant = PatientContext(sex="M", age_years=0.5)
+    adult_f = PatientContext.from_patient(gender="female", date_of_birth=date(1990, 1, 1), on=date(2024, 1, 1))
+
+    assert table.evaluate({"hb": 8.0}, adult_f) == (False, [])
+    assert table.evaluate({"hb": 8.0}, infant)[1] == [{"code": "HB_LOW", "value": 8.0, "threshold": 9.5}]
+    assert table.evaluate({"k": 7, "hb": 25}, None)[1] == [
+        {"code": "K_HIGH", "value": 7, "threshold": 6.5},
+        {"code": "HB_HIGH", "value": 25, "threshold": 20.0},
+    ]
+    assert table.evaluate({"ck": 5000}, adult_f)[0] is True
+    assert table.evaluate({"ck": 5000}, infant)[0] is False
+
+
+def test_compile_rejects_malformed_bands():
+    with pytest.raises(ValueError):
+        CriticalValueTable.compile({"analytes": [{"analyte": "hb"}]})
+    with pytest.raises(ValueError):
+        CriticalValueTable.compile({"analytes": [{"analyte": "hb", "low": "x"}]})
+    with pytest.raises(ValueError):
+        CriticalValueTable.compile({"analytes": [{"analyte": "hb", "low": 1, "sex": "X"}]})
+
+
+def test_evaluate_many_matches_evaluate():
+    table = CriticalValueTable.compile(CONFIG)
+    rng = random.Random(7)
+    keys = ["hb", "K", "ck", "wbc"]
+    payloads, contexts = [], []
+    for _ in range(2000):
+        payloads.append({k: round(rng.uniform(0, 30), 1) for k in rng.sample(keys, rng.randint(0, 4))})
+        contexts.append(
+            rng.choice([None, PatientContext(sex="F", age_years=40), PatientContext(sex="M", age_years=0.2)])
+        )
+    payloads.append({"hb": "bad", "k": None})
+    contexts.append(None)
+
+    assert table.evaluate_many(payloads, contexts) == [table.evaluate(p, c) for p, c in zip(payloads, contexts)]
+
+
+def test_create_result_uses_facility_rule(api_client, tenant, facility, encounter):
+    LabService.configure_critical_values(tenant_id=tenant.id, facility_id=facility.id, analytes=CONFIG["analytes"])
+    order_item_id = _create_item_and_receive_sample(api_client, tenant, facility, encounter)
+
+    r = api_client.post(
+        "/api/v1/lab/results/",
+        {"order_item_id": str(order_item_id), "result_payload": {"hb": 6.5, "k": 7.1}},
+        format="json",
+        **scoped(tenant, facility),
+    )
+    assert r.status_code in (200, 201), r.data
+    assert r.data["is_critical"] is True
+    assert [x["code"] for x in r.data["critical_reasons"]] == ["HB_LOW", "K_HIGH"]
+
+    with pytest.raises(ValueError):
+        LabService.configure_critical_values(tenant_id=tenant.id, facility_id=facility.id, analytes=[{"analyte": "k"}])
+
+
+@pytest.mark.django_db
+def test_malformed_stored_rule_falls_back_to_defaults(tenant, facility, caplog):
+    # written around configure_critical_values' validation (admin / raw upsert)
+    RuleService.upsert_rule(
+        tenant_id=tenant.id, facility_id=facility.id, code=RULE_CODE, config={"analytes": [{"analyte": "k"}]}
+    )
+
+    with caplog.at_level(logging.ERROR, logger="hm_core.lab.critical_values"):
+        result = check_critical_values(tenant_id=tenant.id, facility_id=facility.id, result_payload={"hb": 5, "k": 9})
+
+    assert result == (True, [{"code": "HB_LOW", "value": 5, "threshold": 6.0}])
+    assert "'k' needs 'low' and/or 'high'" in caplog.text
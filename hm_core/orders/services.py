@@ -15,7 +15,7 @@ class OrderService:
     """
     Write-model operations for Orders.
     - Creates Order + OrderItems atomically
-    - Creates the per-item lab tasks (idempotent) via TaskService
+    - Creates the per-item lab tasks (idempotent, one batch) via TaskService
     """
 
     @staticmethod
@@ -51,20 +51,16 @@ class OrderService:
             )
             items_out.append(oi)
 
-            # Per-item tasks (idempotent on encounter+code)
-            TaskService.create_task(
-                tenant_id=tenant_id,
-                facility_id=facility_id,
-                encounter_id=encounter.id,
-                code=lab_sample_receive_code(oi.id),
-                title="Receive Lab Sample",
-            )
-            TaskService.create_task(
-                tenant_id=tenant_id,
-                facility_id=facility_id,
-                encounter_id=encounter.id,
-                code=lab_result_enter_code(oi.id),
-                title="Enter Lab Result",
-            )
+        # Per-item tasks (idempotent on encounter+code), one upsert for the whole order
+        task_items: list[dict] = []
+        for oi in items_out:
+            task_items.append({"code": lab_sample_receive_code(oi.id), "title": "Receive Lab Sample"})
+            task_items.append({"code": lab_result_enter_code(oi.id), "title": "Enter Lab Result"})
+        TaskService.create_tasks(
+            tenant_id=tenant_id,
+            facility_id=facility_id,
+            encounter_id=encounter.id,
+            items=task_items,
+        )
 
         return order, items_out
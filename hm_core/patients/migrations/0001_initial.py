@@ -0,0 +1,36 @@
+# Generated by Django 5.2.9 on 2026-10-17 06:12
+
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Patient',
+            fields=[
+                ('created_at', models.DateTimeField(auto_now_add=True, db_index=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('tenant_id', models.UUIDField(db_index=True)),
+                ('facility_id', models.UUIDField(db_index=True)),
+                ('full_name', models.CharField(max_length=255)),
+                ('phone', models.CharField(blank=True, max_length=32)),
+                ('email', models.EmailField(blank=True, max_length=254)),
+                ('date_of_birth', models.DateField(blank=True, null=True)),
+                ('gender', models.CharField(blank=True, max_length=32)),
+                ('mrn', models.CharField(max_length=64)),
+            ],
+            options={
+                'db_table': 'patients_patient',
+                'indexes': [models.Index(fields=['tenant_id', 'facility_id', 'full_name'], name='patients_pa_tenant__be4a1e_idx'), models.Index(fields=['tenant_id', 'facility_id', 'phone'], name='patients_pa_tenant__68e257_idx')],
+                'constraints': [models.UniqueConstraint(fields=('tenant_id', 'facility_id', 'mrn'), name='uq_patient_scope_mrn')],
+            },
+        ),
+    ]
@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class RulesConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'hm_core.rules'
+
+    def ready(self) -> None:
+        # compiled rule cache invalidation
+        from hm_core.rules import signals  # noqa: F401
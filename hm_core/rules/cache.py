@@ -0,0 +1,107 @@
+# backend/hm_core/rules/cache.py
+"""
+Compiled rule cache.
+
+Rules are read on every close-gate evaluation but change rarely, so each active
+Rule is compiled once into an immutable object and kept per process, keyed by
+(tenant_id, facility_id, code). A missing/inactive rule is cached too (compiled
+from config=None), so the steady state costs zero rule queries.
+
+Coherence uses a per-scope version stamp (tenant_id, facility_id); see
+common.cache.StampedCache. Bumping the stamp (rules.signals on Rule save/delete,
+RuleService.set_rule_active) makes processes recompile on next use. Queryset
+update() / bulk_create() on Rule bypass the signals and must call
+rules.signals.notify_rules_changed().
+
+Settings (optional, shape in common.cache):
+
+    RULES_CACHE = {
+        "BACKEND": "django",       # where version stamps live: "django" | "lru" | "none"
+        "TTL": 300,                # seconds a compiled rule is kept per process
+        "MAX_ENTRIES": 10000,
+        "CACHE_ALIAS": "default",  # django only
+    }
+
+Invalidation reaches every worker through a shared CACHES[CACHE_ALIAS] (Redis);
+"lru" or a LocMemCache alias raise ImproperlyConfigured unless the deployment is
+single-process (HM_SINGLE_PROCESS).
+"""
+
+from __future__ import annotations
+
+import copy
+from types import MappingProxyType
+from typing import Any, Callable, Mapping, Optional, TypeVar
+from uuid import UUID
+
+from hm_core.common.cache import StampedCache
+from hm_core.rules.models import Rule
+
+T = TypeVar("T")
+
+_cache = StampedCache(setting="RULES_CACHE", key_prefix="rules:compiled")
+
+
+def reset() -> None:
+    """
+    Drop backends and every compiled rule (tests / settings overrides).
+    """
+    _cache.reset()
+
+
+def current_version(*, tenant_id, facility_id) -> int:
+    return _cache.version(tenant_id, facility_id)
+
+
+def freeze_config(config: Optional[dict]) -> Optional[Mapping[str, Any]]:
+    """
+    Default compiler: a read-only view over a private copy of Rule.config.
+    """
+    if config is None:
+        return None
+    return MappingProxyType(copy.deepcopy(config))
+
+
+def _load_config(*, tenant_id: UUID, facility_id: UUID, code: str) -> Optional[dict]:
+    row = (
+        Rule.objects.filter(
+            tenant_id=tenant_id,
+            facility_id=facility_id,
+            code=code,
+            is_active=True,
+        )
+        .values_list("config", flat=True)
+        .first()
+    )
+    if row is None:
+        return None
+    return row or {}
+
+
+def get_compiled_rule(
+    *,
+    tenant_id: UUID,
+    facility_id: UUID,
+    code: str,
+    compiler: Callable[[Optional[dict]], T] = freeze_config,
+) -> T:
+    """
+    Return compiler(config) for the active rule in scope (config=None when there
+    is no active rule), compiling at most once per version stamp.
+    """
+    return _cache.get_or_build(
+        (tenant_id, facility_id),
+        f"{code}:{compiler.__module__}.{compiler.__qualname__}",
+        lambda: compiler(_load_config(tenant_id=tenant_id, facility_id=facility_id, code=code)),
+    )
+
+
+def invalidate(*, tenant_id, facility_id) -> None:
+    """
+    Force processes to recompile rules of one (tenant, facility) scope.
+    """
+    _cache.invalidate(tenant_id, facility_id)
+
+
+def invalidate_on_commit(*, tenant_id, facility_id) -> None:
+    _cache.invalidate_on_commit(tenant_id, facility_id)
@@ -1,15 +1,18 @@
 # backend/hm_core/rules/engine.py
 from __future__ import annotations
 
+import copy
 from dataclasses import dataclass
-from typing import Any, Dict
+from typing import Any, Dict, Iterable, Mapping, Optional
 from uuid import UUID
 
+from django.db.models import Exists, OuterRef
 from rest_framework.exceptions import ValidationError
 
 from hm_core.clinical_docs.models import EncounterDocument
+from hm_core.encounters.models import Encounter, EncounterReadiness
 from hm_core.tasks.models import Task, TaskStatus
-from hm_core.rules.models import Rule
+from hm_core.rules import cache as rule_cache
 
 # Keep this import for hard blocker only (critical ack),
 # so we don't break your existing EncounterRuleEngine logic there.
@@ -39,6 +42,62 @@ class CloseGateResult:
     missing: dict  # {"docs_missing": [...], "tasks_open": [...], "DOCS": bool, "TASKS": bool, ...}
 
 
+CLOSE_GATE_RULE_CODE = "encounter.close_gate"
+
+DEFAULT_REQUIRED_TASKS = ("record-vitals", "doctor-consult")
+DEFAULT_REQUIRED_DOCS = ("VITALS", "ASSESSMENT", "PLAN")
+
+CRITICAL_ACK_TASK_CODE = "critical-result-ack"
+
+
+@dataclass(frozen=True)
+class CloseGateConfig:
+    """
+    Compiled Rule(code="encounter.close_gate").config (see rules.cache).
+    """
+
+    required_tasks: tuple[str, ...]
+    required_docs: tuple[str, ...]
+    block_on_critical_unacked: bool
+    block_on_unverified_lab: bool
+    config: Mapping[str, Any]
+
+    @classmethod
+    def compile(cls, config: Optional[dict]) -> "CloseGateConfig":
+        frozen = rule_cache.freeze_config(config or {})
+        return cls(
+            required_tasks=tuple(frozen.get("required_tasks") or DEFAULT_REQUIRED_TASKS),
+            required_docs=tuple(frozen.get("required_docs") or DEFAULT_REQUIRED_DOCS),
+            block_on_critical_unacked=bool(frozen.get("block_on_critical_unacked", True)),
+            block_on_unverified_lab=bool(frozen.get("block_on_unverified_lab", False)),
+            config=frozen,
+        )
+
+
+@dataclass(frozen=True)
+class CloseGateFacts:
+    """
+    Encounter state the close-gate is evaluated against (see gather_close_gate_facts).
+    """
+
+    docs_present: frozenset[str]  # required doc kinds that exist
+    tasks_done: frozenset[str]  # required task codes with at least one DONE task
+    critical_unacked: bool = False
+    unverified_lab: bool = False
+
+    @classmethod
+    def from_readiness(cls, readiness: EncounterReadiness) -> "CloseGateFacts":
+        return cls(
+            docs_present=frozenset(readiness.docs_present or ()),
+            tasks_done=frozenset(readiness.tasks_done or ()),
+            critical_unacked=readiness.critical_unacked_count > 0,
+            unverified_lab=readiness.unverified_lab_count > 0,
+        )
+
+
+NO_FACTS = CloseGateFacts(docs_present=frozenset(), tasks_done=frozenset())
+
+
 class RuleEngine:
     """
     ✅ Canonical RuleEngine.
@@ -62,7 +121,7 @@ class RuleEngine:
     # Advisory completeness (close-gate)
     # -----------------------
     @staticmethod
-    def _load_close_gate_config(*, tenant_id: UUID, facility_id: UUID) -> tuple[list[str], list[str], dict]:
+    def get_close_gate_config(*, tenant_id: UUID, facility_id: UUID) -> CloseGateConfig:
         """
         Source of truth:
         Rule(code="encounter.close_gate").config:
@@ -76,76 +135,194 @@ class RuleEngine:
             }
 
         Tests seed this rule and expect it to drive docs/tasks behavior.
+        Served from the compiled rule cache (no query in the steady state).
         """
-        rule = Rule.objects.filter(
+        return rule_cache.get_compiled_rule(
             tenant_id=tenant_id,
             facility_id=facility_id,
-            code="encounter.close_gate",
-            is_active=True,
-        ).first()
+            code=CLOSE_GATE_RULE_CODE,
+            compiler=CloseGateConfig.compile,
+        )
 
-        config = (rule.config or {}) if rule else {}
-        required_tasks = list(config.get("required_tasks") or ["record-vitals", "doctor-consult"])
-        required_docs = list(config.get("required_docs") or ["VITALS", "ASSESSMENT", "PLAN"])
-        return required_tasks, required_docs, config
+    @staticmethod
+    def _load_close_gate_config(*, tenant_id: UUID, facility_id: UUID) -> tuple[list[str], list[str], dict]:
+        """
+        Backward-compatible (required_tasks, required_docs, config) view of
+        get_close_gate_config(); returns copies callers may mutate.
+        """
+        gate = RuleEngine.get_close_gate_config(tenant_id=tenant_id, facility_id=facility_id)
+        return list(gate.required_tasks), list(gate.required_docs), copy.deepcopy(dict(gate.config))
 
     @staticmethod
-    def check_encounter_close_gate(*, tenant_id: UUID, facility_id: UUID, encounter_id: UUID) -> CloseGateResult:
+    def check_encounter_close_gate(
+        *,
+        tenant_id: UUID,
+        facility_id: UUID,
+        encounter_id: UUID,
+        use_projection: bool = False,
+    ) -> CloseGateResult:
         """
         Advisory gate used by /close-gate/.
         Uses Rule config (required_docs/required_tasks) and is resilient to duplicate tasks:
         DONE "wins" over OPEN/IN_PROGRESS if any DONE exists for the same code.
+
+        use_projection=True reads the EncounterReadiness row instead of the source
+        tables (advisory reads only: it lags writes that bypass signals until
+        rebuild_encounter_readiness runs). Strict close always reads live facts.
+        """
+        gate = RuleEngine.get_close_gate_config(tenant_id=tenant_id, facility_id=facility_id)
+        facts = RuleEngine.gather_close_gate_facts_many(
+            tenant_id=tenant_id,
+            facility_id=facility_id,
+            encounter_ids=[encounter_id],
+            gate=gate,
+            use_projection=use_projection,
+        ).get(UUID(str(encounter_id)), NO_FACTS)
+        return RuleEngine.evaluate_completeness(gate=gate, facts=facts)
+
+    # -----------------------
+    # Fact gathering (one round trip)
+    # -----------------------
+    @staticmethod
+    def gather_close_gate_facts(
+        *,
+        tenant_id: UUID,
+        facility_id: UUID,
+        encounter_id: UUID,
+        gate: CloseGateConfig,
+        include_safety: bool = False,
+    ) -> CloseGateFacts:
+        """
+        Load every fact the close-gate needs for one encounter in ONE statement.
+        include_safety adds the critical-ack / unverified-lab blockers the rule enables.
+
+        A missing encounter yields "nothing present", same as the per-table
+        queries this replaces.
         """
-        required_tasks, required_docs, _config = RuleEngine._load_close_gate_config(
+        facts = RuleEngine.gather_close_gate_facts_many(
             tenant_id=tenant_id,
             facility_id=facility_id,
+            encounter_ids=[encounter_id],
+            gate=gate,
+            critical_ack=include_safety and gate.block_on_critical_unacked,
+            unverified_lab=include_safety and gate.block_on_unverified_lab,
         )
+        return facts.get(UUID(str(encounter_id)), NO_FACTS)
 
-        # ----- docs -----
-        existing_docs = set(
-            EncounterDocument.objects.filter(
+    @staticmethod
+    def gather_close_gate_facts_many(
+        *,
+        tenant_id: UUID,
+        facility_id: UUID,
+        encounter_ids: Iterable[UUID],
+        gate: CloseGateConfig,
+        critical_ack: bool = False,
+        unverified_lab: bool = False,
+        use_projection: bool = False,
+    ) -> dict[UUID, CloseGateFacts]:
+        """
+        Set-based fact loading: the scoped encounter rows annotated with correlated
+        EXISTS subqueries (one per required doc kind / task code, plus the optional
+        blockers), so any number of encounters costs one statement. Each subquery is
+        served by the (tenant_id, facility_id, encounter, ...) indexes.
+
+        use_projection=True first reads EncounterReadiness rows (one query, all facts);
+        encounters without a projection row fall back to the live statement.
+
+        Encounters outside the scope (or unknown ids) are absent from the result.
+        """
+        encounter_ids = list(encounter_ids)
+        if not encounter_ids:
+            return {}
+
+        projected: dict[UUID, CloseGateFacts] = {}
+        if use_projection:
+            from hm_core.encounters import readiness  # local import (readiness imports the engine)
+
+            # writes of this transaction are only projected on commit
+            readiness.refresh_pending(tenant_id=tenant_id, facility_id=facility_id, encounter_ids=encounter_ids)
+            for row in EncounterReadiness.objects.filter(
                 tenant_id=tenant_id,
                 facility_id=facility_id,
-                encounter_id=encounter_id,
-                kind__in=required_docs,
-            ).values_list("kind", flat=True)
+                encounter_id__in=encounter_ids,
+            ):
+                projected[row.encounter_id] = CloseGateFacts.from_readiness(row)
+
+            encounter_ids = [eid for eid in encounter_ids if UUID(str(eid)) not in projected]
+            if not encounter_ids:
+                return projected
+
+        scope = {
+            "tenant_id": tenant_id,
+            "facility_id": facility_id,
+            "encounter_id": OuterRef("pk"),
+        }
+
+        annotations: dict[str, Exists] = {}
+        for i, kind in enumerate(gate.required_docs):
+            annotations[f"doc_{i}"] = Exists(EncounterDocument.objects.filter(**scope, kind=kind))
+        for i, code in enumerate(gate.required_tasks):
+            # One task per code (uq_task_code_per_encounter_scope): done iff it is DONE.
+            annotations[f"task_{i}"] = Exists(Task.objects.filter(**scope, code=code, status=TaskStatus.DONE))
+
+        if critical_ack:
+            annotations["critical_unacked"] = Exists(
+                Task.objects.filter(**scope, code=CRITICAL_ACK_TASK_CODE).exclude(status=TaskStatus.DONE)
+            )
+        if unverified_lab:
+            from hm_core.lab.models import LabResult  # local import
+
+            annotations["unverified_lab"] = Exists(LabResult.objects.filter(**scope, verified_at__isnull=True))
+
+        rows = (
+            Encounter.objects.filter(tenant_id=tenant_id, facility_id=facility_id, pk__in=encounter_ids)
+            .annotate(**annotations)
+            .values("pk", *annotations)
         )
-        docs_missing = [k for k in required_docs if k not in existing_docs]
-
-        # ----- tasks -----
-        # rank: higher is better (DONE wins)
-        rank = {
-            TaskStatus.DONE: 3,
-            TaskStatus.CANCELLED: 2,   # treat as "not blocking" (optional)
-            TaskStatus.IN_PROGRESS: 1,
-            TaskStatus.OPEN: 0,
+
+        return {
+            **projected,
+            **{
+                row["pk"]: CloseGateFacts(
+                    docs_present=frozenset(k for i, k in enumerate(gate.required_docs) if row[f"doc_{i}"]),
+                    tasks_done=frozenset(c for i, c in enumerate(gate.required_tasks) if row[f"task_{i}"]),
+                    critical_unacked=bool(row.get("critical_unacked")),
+                    unverified_lab=bool(row.get("unverified_lab")),
+                )
+                for row in rows
+            },
         }
 
-        rows = Task.objects.filter(
+    @staticmethod
+    def check_encounter_close_gate_many(
+        *,
+        tenant_id: UUID,
+        facility_id: UUID,
+        encounter_ids: Iterable[UUID],
+        use_projection: bool = False,
+    ) -> dict[UUID, CloseGateResult]:
+        """
+        check_encounter_close_gate for many encounters in a constant number of
+        queries (worklists / boards). Unknown or out-of-scope ids are omitted.
+        """
+        gate = RuleEngine.get_close_gate_config(tenant_id=tenant_id, facility_id=facility_id)
+        facts = RuleEngine.gather_close_gate_facts_many(
             tenant_id=tenant_id,
             facility_id=facility_id,
-            encounter_id=encounter_id,
-            code__in=required_tasks,
-        ).values_list("code", "status")
-
-        best_rank_by_code: dict[str, int] = {}
-        best_status_by_code: dict[str, str] = {}
-
-        for code, st in rows:
-            r = rank.get(st, -1)
-            if code not in best_rank_by_code or r > best_rank_by_code[code]:
-                best_rank_by_code[code] = r
-                best_status_by_code[code] = st
-
-        tasks_open: list[str] = []
-        for code in required_tasks:
-            st = best_status_by_code.get(code)
-            if st is None:
-                # missing task record counts as "open/missing" for gate purposes
-                tasks_open.append(code)
-            elif st != TaskStatus.DONE:
-                # not DONE counts as open for gate purposes
-                tasks_open.append(code)
+            encounter_ids=encounter_ids,
+            gate=gate,
+            use_projection=use_projection,
+        )
+        return {eid: RuleEngine.evaluate_completeness(gate=gate, facts=f) for eid, f in facts.items()}
+
+    @staticmethod
+    def evaluate_completeness(*, gate: CloseGateConfig, facts: CloseGateFacts) -> CloseGateResult:
+        """
+        Pure docs/tasks completeness check over already-gathered facts.
+        """
+        docs_missing = [k for k in gate.required_docs if k not in facts.docs_present]
+        # missing task record or not DONE counts as "open" for gate purposes
+        tasks_open = [c for c in gate.required_tasks if c not in facts.tasks_done]
 
         missing = {
             "docs_missing": docs_missing,
@@ -157,28 +334,6 @@ class RuleEngine:
         ok = (not docs_missing) and (not tasks_open)
         return CloseGateResult(can_close=ok, ok=ok, missing=missing)
 
-    # -----------------------
-    # Optional strict safety: unverified lab results
-    # -----------------------
-    @staticmethod
-    def _has_unverified_lab_results(*, tenant_id: UUID, facility_id: UUID, encounter_id: UUID) -> bool:
-        """
-        Returns True if there exist lab results linked to this encounter that are not verified.
-        Local imports to avoid module import coupling if lab isn't fully stable yet.
-
-        ASSUMPTIONS (we will confirm with you):
-        - LabResult has field: verified_at
-        - LabResult has FK: order_item
-        - OrderItem has FK/field: encounter_id
-        """
-        from hm_core.lab.models import LabResult  # local import
-        return LabResult.objects.filter(
-            tenant_id=tenant_id,
-            facility_id=facility_id,
-            order_item__encounter_id=encounter_id,
-            verified_at__isnull=True,
-        ).exists()
-
     # -----------------------
     # Strict completeness enforcement (close-strict)
     # -----------------------
@@ -193,56 +348,25 @@ class RuleEngine:
         - critical-ack hard safety blocker (if enabled)
         - optional unverified-lab blocker (if enabled)
         """
-        required_tasks, required_docs, _config = RuleEngine._load_close_gate_config(
-            tenant_id=tenant_id,
-            facility_id=facility_id,
-        )
-
-        # existing completeness evaluation
-        r = RuleEngine.check_encounter_close_gate(
+        gate = RuleEngine.get_close_gate_config(tenant_id=tenant_id, facility_id=facility_id)
+        facts = RuleEngine.gather_close_gate_facts(
             tenant_id=tenant_id,
             facility_id=facility_id,
             encounter_id=encounter_id,
+            gate=gate,
+            include_safety=True,
         )
-
-        # load rule again to read extra flags (backward compatible)
-        rule = Rule.objects.filter(
-            tenant_id=tenant_id,
-            facility_id=facility_id,
-            code="encounter.close_gate",
-            is_active=True,
-        ).first()
-        config = (rule.config or {}) if rule else {}
-
-        block_on_critical_unacked = bool(config.get("block_on_critical_unacked", True))
-        block_on_unverified_lab = bool(config.get("block_on_unverified_lab", False))
+        r = RuleEngine.evaluate_completeness(gate=gate, facts=facts)
 
         missing = dict(r.missing)
 
         # ---- critical ack blocker (strict) ----
-        if block_on_critical_unacked:
-            try:
-                RuleEngine.enforce_critical_ack_gate(
-                    tenant_id=tenant_id,
-                    facility_id=facility_id,
-                    encounter_id=encounter_id,
-                )
-            except ValidationError:
-                missing["CRITICAL_ACK"] = True
+        if facts.critical_unacked:
+            missing["CRITICAL_ACK"] = True
 
         # ---- optional: unverified lab results blocker (strict) ----
-        if block_on_unverified_lab:
-            from hm_core.lab.models import LabResult
-
-            has_unverified = LabResult.objects.filter(
-                tenant_id=tenant_id,
-                facility_id=facility_id,
-                encounter_id=encounter_id,
-                verified_at__isnull=True,
-            ).exists()
-
-            if has_unverified:
-                missing["UNVERIFIED_LAB_RESULTS"] = True
+        if facts.unverified_lab:
+            missing["UNVERIFIED_LAB_RESULTS"] = True
 
         ok = bool(r.ok) and (not missing.get("CRITICAL_ACK")) and (not missing.get("UNVERIFIED_LAB_RESULTS"))
         if not ok:
@@ -268,18 +392,15 @@ class RuleEngine:
 
         Includes safety reasons as advisory markers.
         """
-        r = RuleEngine.check_encounter_close_gate(
+        gate = RuleEngine.get_close_gate_config(tenant_id=tenant_id, facility_id=facility_id)
+        facts = RuleEngine.gather_close_gate_facts(
             tenant_id=tenant_id,
             facility_id=facility_id,
             encounter_id=encounter_id,
+            gate=gate,
+            include_safety=True,
         )
-
-        _required_tasks, _required_docs, config = RuleEngine._load_close_gate_config(
-            tenant_id=tenant_id,
-            facility_id=facility_id,
-        )
-        block_on_critical_unacked = bool(config.get("block_on_critical_unacked", True))
-        block_on_unverified_lab = bool(config.get("block_on_unverified_lab", False))
+        r = RuleEngine.evaluate_completeness(gate=gate, facts=facts)
 
         missing_docs = list(r.missing.get("docs_missing", []))
         missing_tasks = list(r.missing.get("tasks_open", []))
@@ -290,23 +411,11 @@ class RuleEngine:
         for c in missing_tasks:
             reasons.append({"type": "TASK_NOT_DONE", "code": c})
 
-        if block_on_critical_unacked:
-            try:
-                RuleEngine.enforce_critical_ack_gate(
-                    tenant_id=tenant_id,
-                    facility_id=facility_id,
-                    encounter_id=encounter_id,
-                )
-            except ValidationError:
-                reasons.append({"type": "SAFETY_BLOCK", "code": "CRITICAL_ACK"})
+        if facts.critical_unacked:
+            reasons.append({"type": "SAFETY_BLOCK", "code": "CRITICAL_ACK"})
 
-        if block_on_unverified_lab:
-            if RuleEngine._has_unverified_lab_results(
-                tenant_id=tenant_id,
-                facility_id=facility_id,
-                encounter_id=encounter_id,
-            ):
-                reasons.append({"type": "SAFETY_BLOCK", "code": "UNVERIFIED_LAB_RESULTS"})
+        if facts.unverified_lab:
+            reasons.append({"type": "SAFETY_BLOCK", "code": "UNVERIFIED_LAB_RESULTS"})
 
         ok = bool(r.ok) and not any(rr.get("type") == "SAFETY_BLOCK" for rr in reasons)
         return GateResult(
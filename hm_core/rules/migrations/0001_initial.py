@@ -0,0 +1,34 @@
+# Generated by Django 5.2.9 on 2026-10-17 06:12
+
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Rule',
+            fields=[
+                ('created_at', models.DateTimeField(auto_now_add=True, db_index=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('tenant_id', models.UUIDField(db_index=True)),
+                ('facility_id', models.UUIDField(db_index=True)),
+                ('code', models.CharField(db_index=True, max_length=128)),
+                ('description', models.CharField(blank=True, max_length=255)),
+                ('is_active', models.BooleanField(default=True)),
+                ('config', models.JSONField(default=dict)),
+            ],
+            options={
+                'db_table': 'rules_rule',
+                'indexes': [models.Index(fields=['tenant_id', 'facility_id', 'is_active'], name='rules_rule_tenant__4c2e2f_idx')],
+                'constraints': [models.UniqueConstraint(fields=('tenant_id', 'facility_id', 'code'), name='uq_rule_scope_code')],
+            },
+        ),
+    ]
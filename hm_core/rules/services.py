@@ -16,6 +16,7 @@ from hm_core.rules.engine import (  # noqa: F401
     GateFailed,
     GateResult,
     CloseGateResult,
+    CloseGateConfig,
 )
 
 __all__ = [
@@ -23,4 +24,5 @@ __all__ = [
     "GateFailed",
     "GateResult",
     "CloseGateResult",
+    "CloseGateConfig",
 ]
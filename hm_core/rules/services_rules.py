@@ -8,6 +8,7 @@ from django.db import transaction
 from django.utils.timezone import now
 
 from hm_core.rules.models import Rule
+from hm_core.rules.signals import notify_rules_changed
 
 
 @dataclass(frozen=True)
@@ -27,6 +28,8 @@ class RuleService:
 
     Rule uniqueness:
       (tenant_id, facility_id, code)
+
+    Every write invalidates compiled rules (rules.cache) and sends rules.signals.rules_changed.
     """
 
     @staticmethod
@@ -58,6 +61,7 @@ class RuleService:
                 "updated_at": now(),
             },
         )
+        # post_save (rules.signals) has already invalidated the compiled rule.
         return UpsertRuleResult(rule=obj, created=created)
 
     @staticmethod
@@ -76,12 +80,17 @@ class RuleService:
         if not code:
             raise ValueError("Rule code is required.")
 
-        return Rule.objects.filter(
+        updated = Rule.objects.filter(
             tenant_id=tenant_id,
             facility_id=facility_id,
             code=code,
         ).update(is_active=bool(is_active), updated_at=now())
 
+        # queryset.update() sends no post_save
+        if updated:
+            notify_rules_changed(tenant_id=tenant_id, facility_id=facility_id, code=code)
+        return updated
+
     # -----------------------------
     # Project standard defaults
     # -----------------------------
@@ -100,7 +109,7 @@ class RuleService:
         Ensures the canonical close-gate rule exists:
           code = "encounter.close_gate"
 
-        This matches RuleEngine._load_close_gate_config().
+        This matches RuleEngine.get_close_gate_config().
         """
         cfg = {
             "required_tasks": required_tasks or ["record-vitals", "doctor-consult"],
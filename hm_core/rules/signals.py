@@ -0,0 +1,26 @@
+# backend/hm_core/rules/signals.py
+from __future__ import annotations
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import Signal, receiver
+
+from hm_core.rules import cache as rule_cache
+from hm_core.rules.models import Rule
+
+# Sent after a scope's rules changed (compiled cache already invalidated).
+# kwargs: tenant_id, facility_id, code
+rules_changed = Signal()
+
+
+def notify_rules_changed(*, tenant_id, facility_id, code: str) -> None:
+    rule_cache.invalidate_on_commit(tenant_id=tenant_id, facility_id=facility_id)
+    rules_changed.send(sender=Rule, tenant_id=tenant_id, facility_id=facility_id, code=code)
+
+
+@receiver(post_save, sender=Rule, dispatch_uid="rules_compiled_cache_rule_save")
+@receiver(post_delete, sender=Rule, dispatch_uid="rules_compiled_cache_rule_delete")
+def rule_changed(sender, instance: Rule, **kwargs):
+    # Covers RuleService.upsert_rule, admin edits and instance save()/delete().
+    # QuerySet.update() / bulk_create() send no signals: call notify_rules_changed()
+    # (as RuleService.set_rule_active does).
+    notify_rules_changed(tenant_id=instance.tenant_id, facility_id=instance.facility_id, code=instance.code)
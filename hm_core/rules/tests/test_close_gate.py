@@ -1,5 +1,6 @@
 # backend/hm_core/rules/tests/test_close_gate.py
 import pytest
+from rest_framework.exceptions import ValidationError
 from hm_core.rules.models import Rule
 from hm_core.rules.services import RuleEngine
 from hm_core.tasks.models import Task, TaskStatus
@@ -102,3 +103,50 @@ def test_close_gate_ok(tenant, facility, encounter):
     assert res.ok is True
     assert res.missing_tasks == []
     assert res.missing_docs == []
+
+
+def test_close_gate_facts_single_query(tenant, facility, encounter, django_assert_num_queries):
+    seed_close_gate_rule(tenant.id, facility.id)
+    Task.objects.create(
+        tenant_id=tenant.id, facility_id=facility.id, encounter_id=encounter.id,
+        code="record-vitals", title="Record Vitals", status=TaskStatus.DONE
+    )
+    Task.objects.create(
+        tenant_id=tenant.id, facility_id=facility.id, encounter_id=encounter.id,
+        code="critical-result-ack", title="Acknowledge Critical Result", status=TaskStatus.OPEN
+    )
+    # warm the compiled rule cache
+    RuleEngine.get_close_gate_config(tenant_id=tenant.id, facility_id=facility.id)
+
+    with django_assert_num_queries(1):
+        res = RuleEngine.evaluate_encounter_close_gate(
+            tenant_id=tenant.id, facility_id=facility.id, encounter_id=encounter.id
+        )
+    assert res.ok is False
+    assert res.missing_tasks == ["doctor-consult"]
+    assert {"type": "SAFETY_BLOCK", "code": "CRITICAL_ACK"} in res.reasons
+
+    with django_assert_num_queries(1):
+        with pytest.raises(ValidationError) as exc:
+            RuleEngine.enforce_encounter_close_gate(
+                tenant_id=tenant.id, facility_id=facility.id, encounter_id=encounter.id
+            )
+    missing = exc.value.detail["missing"]
+    assert missing["CRITICAL_ACK"]
+    assert [str(c) for c in missing["tasks_open"]] == ["doctor-consult"]
+
+
+def test_check_close_gate_flags_docs_only_when_required_tasks_done(tenant, facility, encounter):
+    seed_close_gate_rule(tenant.id, facility.id)
+    for code in ("record-vitals", "doctor-consult"):
+        Task.objects.create(
+            tenant_id=tenant.id, facility_id=facility.id, encounter_id=encounter.id,
+            code=code, title=code, status=TaskStatus.DONE
+        )
+
+    res = RuleEngine.check_encounter_close_gate(
+        tenant_id=tenant.id, facility_id=facility.id, encounter_id=encounter.id
+    )
+    assert res.missing["tasks_open"] == []
+    assert res.missing["TASKS"] is False
+    assert res.missing["DOCS"] is True
@@ -0,0 +1,97 @@
+# backend/hm_core/rules/tests/test_rule_cache.py
+import pytest
+from rest_framework.exceptions import ValidationError
+
+from hm_core.rules import cache as rule_cache
+from hm_core.rules.models import Rule
+from hm_core.rules.services import RuleEngine
+from hm_core.rules.services_rules import RuleService
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture(autouse=True)
+def _fresh_rule_cache():
+    rule_cache.reset()
+    yield
+    rule_cache.reset()
+
+
+def _seed(tenant, facility, **cfg):
+    return RuleService.ensure_default_close_gate_rule(tenant_id=tenant.id, facility_id=facility.id, **cfg)
+
+
+def _gate(tenant, facility):
+    return RuleEngine.get_close_gate_config(tenant_id=tenant.id, facility_id=facility.id)
+
+
+def test_steady_state_does_not_query_rules(tenant, facility, encounter, django_assert_num_queries):
+    _seed(tenant, facility, required_docs=["PLAN"])
+    _gate(tenant, facility)
+
+    with django_assert_num_queries(0):
+        gate = _gate(tenant, facility)
+    assert gate.required_docs == ("PLAN",)
+
+    # Strict close: rule from cache, all encounter facts in one statement.
+    with django_assert_num_queries(1):  # encounter facts
+        with pytest.raises(ValidationError):
+            RuleEngine.enforce_encounter_close_gate(
+                tenant_id=tenant.id, facility_id=facility.id, encounter_id=encounter.id
+            )
+
+
+def test_missing_rule_is_cached_with_defaults(tenant, facility, django_assert_num_queries):
+    gate = _gate(tenant, facility)
+    assert gate.required_tasks == ("record-vitals", "doctor-consult")
+
+    with django_assert_num_queries(0):
+        _gate(tenant, facility)
+
+
+def test_compiled_config_is_immutable(tenant, facility):
+    _seed(tenant, facility)
+    gate = _gate(tenant, facility)
+
+    with pytest.raises(TypeError):
+        gate.config["required_docs"] = []
+
+    # Legacy tuple view hands out copies.
+    _tasks, docs, config = RuleEngine._load_close_gate_config(tenant_id=tenant.id, facility_id=facility.id)
+    docs.append("X")
+    config["required_docs"].append("X")
+    assert "X" not in _gate(tenant, facility).required_docs
+
+
+def test_upsert_and_set_active_invalidate(tenant, facility):
+    _seed(tenant, facility, required_docs=["PLAN"])
+    assert _gate(tenant, facility).required_docs == ("PLAN",)
+
+    _seed(tenant, facility, required_docs=["VITALS"], block_on_unverified_lab=True)
+    gate = _gate(tenant, facility)
+    assert gate.required_docs == ("VITALS",)
+    assert gate.block_on_unverified_lab is True
+
+    RuleService.set_rule_active(tenant_id=tenant.id, facility_id=facility.id, code="encounter.close_gate", is_active=False)
+    assert _gate(tenant, facility).block_on_unverified_lab is False
+
+
+def test_version_stamp_from_another_worker(tenant, facility):
+    _seed(tenant, facility, required_docs=["PLAN"])
+    _gate(tenant, facility)
+
+    # A write this process never saw (no signals) ...
+    Rule.objects.filter(tenant_id=tenant.id, facility_id=facility.id).update(config={"required_docs": ["VITALS"]})
+    assert _gate(tenant, facility).required_docs == ("PLAN",)
+
+    # ... becomes visible once the writer bumps the shared version stamp.
+    rule_cache.invalidate(tenant_id=tenant.id, facility_id=facility.id)
+    assert _gate(tenant, facility).required_docs == ("VITALS",)
+
+
+def test_scopes_are_isolated(tenant, facility, other_tenant, other_facility):
+    _seed(tenant, facility, required_docs=["PLAN"])
+    _seed(other_tenant, other_facility, required_docs=["VITALS"])
+
+    assert _gate(tenant, facility).required_docs == ("PLAN",)
+    assert _gate(other_tenant, other_facility).required_docs == ("VITALS",)
@@ -27,3 +27,18 @@ class TaskSerializer(serializers.ModelSerializer):
             "updated_at",
         ]
         read_only_fields = fields
+
+
+class TaskBulkActionSerializer(serializers.Serializer):
+    """
+    POST /tasks/{assign,unassign,start,done,cancel}:batch/
+    """
+
+    MAX_TASKS = 200
+
+    task_ids = serializers.ListField(
+        child=serializers.UUIDField(),
+        allow_empty=False,
+        max_length=MAX_TASKS,
+    )
+    assigned_to_id = serializers.IntegerField(required=False, min_value=1)
@@ -8,10 +8,11 @@ from rest_framework.decorators import action
 from rest_framework.exceptions import NotFound, ValidationError as DRFValidationError
 from rest_framework.response import Response
 
-from hm_core.tasks.api.serializers import TaskSerializer
+from hm_core.common.api import keyset
+from hm_core.tasks.api.serializers import TaskBulkActionSerializer, TaskSerializer
 from hm_core.tasks.models import Task
-from hm_core.tasks.permissions import TaskPermission
-from hm_core.tasks.selectors import TaskSelector
+from hm_core.tasks.permissions import BATCH_ACTIONS, TaskPermission
+from hm_core.tasks.selectors import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, TaskSelector
 from hm_core.tasks.services import TaskService
 
 
@@ -24,6 +25,11 @@ from hm_core.tasks.services import TaskService
     reopen=extend_schema(tags=["Tasks"], operation_id="v1_tasks_reopen", responses={200: TaskSerializer}),
     cancel=extend_schema(tags=["Tasks"], operation_id="v1_tasks_cancel", responses={200: TaskSerializer}),
     backfill_done=extend_schema(tags=["Tasks"], operation_id="v1_tasks_backfill_done"),
+    assign_batch=extend_schema(tags=["Tasks"], operation_id="v1_tasks_assign_batch", request=TaskBulkActionSerializer),
+    unassign_batch=extend_schema(tags=["Tasks"], operation_id="v1_tasks_unassign_batch", request=TaskBulkActionSerializer),
+    start_batch=extend_schema(tags=["Tasks"], operation_id="v1_tasks_start_batch", request=TaskBulkActionSerializer),
+    done_batch=extend_schema(tags=["Tasks"], operation_id="v1_tasks_done_batch", request=TaskBulkActionSerializer),
+    cancel_batch=extend_schema(tags=["Tasks"], operation_id="v1_tasks_cancel_batch", request=TaskBulkActionSerializer),
 )
 class TaskViewSet(viewsets.ViewSet):
     """
@@ -70,6 +76,8 @@ class TaskViewSet(viewsets.ViewSet):
             raise DRFValidationError({"due_after": msg})
         if lowered.startswith("ordering"):
             raise DRFValidationError({"ordering": msg})
+        if lowered.startswith("cursor"):
+            raise DRFValidationError({"cursor": msg})
 
         raise DRFValidationError({"detail": msg})
 
@@ -86,10 +94,36 @@ class TaskViewSet(viewsets.ViewSet):
                 user_id=getattr(request.user, "id", None),
                 params=request.query_params,
             )
+            ordering = TaskSelector.keyset_ordering(request.query_params.get("ordering"))
+            limit = self._page_size(request)
+            tasks, next_cursor = TaskSelector.page_tasks(
+                qs, ordering=ordering, cursor=request.query_params.get("cursor"), limit=limit
+            )
         except DjangoValidationError as e:
             self._map_django_validation_error(e)
 
-        return Response(TaskSerializer(qs[:300], many=True).data, status=status.HTTP_200_OK)
+        # Body stays a plain list; paging metadata travels in headers.
+        resp = Response(TaskSerializer(tasks, many=True).data, status=status.HTTP_200_OK)
+        if next_cursor:
+            resp["X-Next-Cursor"] = next_cursor
+            next_params = request.query_params.copy()
+            next_params["cursor"] = next_cursor
+            resp["Link"] = f'<{request.build_absolute_uri(request.path)}?{next_params.urlencode()}>; rel="next"'
+        if request.query_params.get("count") == "estimate":
+            resp["X-Total-Count-Estimate"] = str(keyset.estimate_count(qs))
+        return resp
+
+    def _page_size(self, request) -> int:
+        raw = request.query_params.get("limit")
+        if raw in (None, ""):
+            return DEFAULT_PAGE_SIZE
+        try:
+            limit = int(raw)
+        except ValueError:
+            raise DRFValidationError({"limit": "Must be an integer."})
+        if not 1 <= limit <= MAX_PAGE_SIZE:
+            raise DRFValidationError({"limit": f"Must be between 1 and {MAX_PAGE_SIZE}."})
+        return limit
 
     # ----------------------------
     # Workflow / assignment actions
@@ -201,6 +235,73 @@ class TaskViewSet(viewsets.ViewSet):
         task.refresh_from_db()
         return Response(TaskSerializer(task).data, status=status.HTTP_200_OK)
 
+    # ----------------------------
+    # Batch workflow / assignment (worklist multi-select)
+    # ----------------------------
+    def _bulk(self, request, service_action: str):
+        """
+        Body: {"task_ids": [...], "assigned_to_id": ... (assign only)}
+        Tasks fail individually (not found / not permitted / invalid transition);
+        the object permission of the single-task action is applied per task.
+        """
+        tenant_id, facility_id = self._require_scope(request)
+
+        ser = TaskBulkActionSerializer(data=request.data or {})
+        ser.is_valid(raise_exception=True)
+        assigned_to_id = ser.validated_data.get("assigned_to_id")
+        if service_action == "assign" and not assigned_to_id:
+            raise DRFValidationError({"assigned_to_id": "This field is required."})
+
+        permission = TaskPermission()
+        object_action = BATCH_ACTIONS[self.action]
+        try:
+            results = TaskService.bulk_apply(
+                tenant_id=tenant_id,
+                facility_id=facility_id,
+                action=service_action,
+                task_ids=ser.validated_data["task_ids"],
+                assigned_to_id=assigned_to_id,
+                can_act=lambda task: permission.can_act_on(request, object_action, task),
+            )
+        except DjangoValidationError as e:
+            self._map_django_validation_error(e)
+
+        return Response(
+            {
+                "results": [
+                    {
+                        "id": str(r.task_id),
+                        "ok": r.ok,
+                        "changed": r.changed,
+                        "task": TaskSerializer(r.task).data if r.ok else None,
+                        "error": r.error or None,
+                    }
+                    for r in results
+                ],
+            },
+            status=status.HTTP_200_OK,
+        )
+
+    @action(detail=False, methods=["post"], url_path="assign:batch", url_name="assign-batch")
+    def assign_batch(self, request):
+        return self._bulk(request, "assign")
+
+    @action(detail=False, methods=["post"], url_path="unassign:batch", url_name="unassign-batch")
+    def unassign_batch(self, request):
+        return self._bulk(request, "unassign")
+
+    @action(detail=False, methods=["post"], url_path="start:batch", url_name="start-batch")
+    def start_batch(self, request):
+        return self._bulk(request, "start")
+
+    @action(detail=False, methods=["post"], url_path="done:batch", url_name="done-batch")
+    def done_batch(self, request):
+        return self._bulk(request, "complete")
+
+    @action(detail=False, methods=["post"], url_path="cancel:batch", url_name="cancel-batch")
+    def cancel_batch(self, request):
+        return self._bulk(request, "cancel")
+
     # ----------------------------
     # Backfill (admin-only via permission)
     # ----------------------------
@@ -0,0 +1,18 @@
+# backend/hm_core/tasks/jobs.py
+"""
+Celery jobs of the tasks app (discovered by config.celery; scheduled in
+CELERY_BEAT_SCHEDULE). Without a broker they run eagerly in-process.
+"""
+
+from __future__ import annotations
+
+from dataclasses import asdict
+
+from celery import shared_task
+
+from hm_core.tasks import overdue
+
+
+@shared_task(name="tasks.sweep_overdue_tasks", ignore_result=True)
+def sweep_overdue_tasks(tenant_id: str | None = None, facility_id: str | None = None) -> dict:
+    return asdict(overdue.sweep(tenant_id=tenant_id, facility_id=facility_id))
@@ -0,0 +1,58 @@
+# Generated by Django 5.2.9 on 2026-10-17 06:12
+
+import django.db.models.deletion
+import hm_core.common.models
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('encounters', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OverdueSweepMark',
+            fields=[
+                ('created_at', models.DateTimeField(auto_now_add=True, db_index=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('tenant_id', models.UUIDField(db_index=True)),
+                ('facility_id', models.UUIDField(db_index=True)),
+                ('swept_until', models.DateTimeField()),
+            ],
+            options={
+                'db_table': 'tasks_overdue_sweep_mark',
+                'constraints': [models.UniqueConstraint(fields=('tenant_id', 'facility_id'), name='uq_overdue_sweep_mark_scope')],
+            },
+        ),
+        migrations.CreateModel(
+            name='Task',
+            fields=[
+                ('created_at', models.DateTimeField(auto_now_add=True, db_index=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('tenant_id', models.UUIDField(db_index=True)),
+                ('facility_id', models.UUIDField(db_index=True)),
+                ('code', models.SlugField(max_length=64)),
+                ('title', models.CharField(max_length=255)),
+                ('status', models.CharField(choices=[('OPEN', 'Open'), ('IN_PROGRESS', 'In Progress'), ('DONE', 'Done'), ('CANCELLED', 'Cancelled')], db_index=True, default='OPEN', max_length=32)),
+                ('due_at', models.DateTimeField(blank=True, db_index=True, null=True)),
+                ('completed_at', models.DateTimeField(blank=True, null=True)),
+                ('assigned_to', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='assigned_tasks', to=settings.AUTH_USER_MODEL)),
+                ('encounter', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='tasks', to='encounters.encounter')),
+            ],
+            options={
+                'db_table': 'tasks_task',
+                'indexes': [models.Index(fields=['tenant_id', 'facility_id', 'status', 'due_at'], name='tasks_task_tenant__e51560_idx'), models.Index(fields=['tenant_id', 'facility_id', 'encounter', 'status'], name='tasks_task_tenant__54d953_idx'), models.Index(fields=['tenant_id', 'facility_id', 'code'], name='tasks_task_tenant__40fc27_idx'), models.Index(fields=['tenant_id', 'facility_id', 'created_at', 'id'], name='tasks_task_tenant__7cab45_idx'), models.Index(fields=['tenant_id', 'facility_id', 'due_at', 'id'], name='tasks_task_tenant__3f271d_idx'), models.Index(condition=models.Q(('status__in', ['OPEN', 'IN_PROGRESS'])), fields=['tenant_id', 'facility_id', 'due_at'], name='task_actionable_due_idx')],
+                'constraints': [models.UniqueConstraint(fields=('tenant_id', 'facility_id', 'encounter', 'code'), name='uq_task_code_per_encounter_scope')],
+            },
+            bases=(hm_core.common.models.TrackedFieldsMixin, models.Model),
+        ),
+    ]
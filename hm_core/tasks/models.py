@@ -1,9 +1,10 @@
 # backend/hm_core/tasks/models.py
 from django.conf import settings
-from django.db import IntegrityError, models, transaction
+from django.db import IntegrityError, connections, models, transaction
+from django.db.models import Q
 from django.utils.timezone import now as tz_now
 
-from hm_core.common.models import ScopedModel
+from hm_core.common.models import ScopedModel, TrackedFieldsMixin
 from hm_core.encounters.models import Encounter
 
 
@@ -14,10 +15,119 @@ class TaskStatus(models.TextChoices):
     CANCELLED = "CANCELLED", "Cancelled"
 
 
-class Task(ScopedModel):
+ACTIONABLE_STATUSES = [TaskStatus.OPEN, TaskStatus.IN_PROGRESS]
+
+
+class TaskQuerySet(models.QuerySet):
+    # uq_task_code_per_encounter_scope
+    CONFLICT_FIELDS = ("tenant_id", "facility_id", "encounter", "code")
+
+    def upsert(
+        self,
+        *,
+        tenant_id,
+        facility_id,
+        encounter_id,
+        code: str,
+        title: str = "",
+        assigned_to_id=None,
+        due_at=None,
+    ) -> tuple["Task", bool]:
+        """
+        Single-code form of upsert_many: (task, created).
+        """
+        return self.upsert_many(
+            tenant_id=tenant_id,
+            facility_id=facility_id,
+            encounter_id=encounter_id,
+            items=[{"code": code, "title": title, "assigned_to_id": assigned_to_id, "due_at": due_at}],
+        )[0]
+
+    def upsert_many(self, *, tenant_id, facility_id, encounter_id, items: list[dict]) -> list[tuple["Task", bool]]:
+        """
+        Create-or-refresh tasks of one encounter in ONE statement:
+
+            INSERT ... ON CONFLICT (tenant_id, facility_id, encounter_id, code)
+            DO UPDATE ... RETURNING *, (xmax = 0) AS created
+
+        items: [{"code", "title"?, "assigned_to_id"?, "due_at"?}, ...]; a repeated
+        code keeps its first item. New rows are OPEN. Existing rows keep their
+        status; title / assigned_to_id / due_at are only overwritten when given
+        (non-empty / not None), and updated_at only moves when one of them changed.
+
+        Like bulk_create this bypasses save() and post_save. Returns (task, created)
+        in the order of the first occurrence of each code.
+        """
+        first: dict[str, dict] = {}
+        for item in items:
+            first.setdefault(item["code"], item)
+        if not first:
+            return []
+
+        model = self.model
+        conn = connections[self.db]
+        qn = conn.ops.quote_name
+        fields = list(model._meta.concrete_fields)
+
+        params: list = []
+        for code, item in first.items():
+            obj = model(
+                tenant_id=tenant_id,
+                facility_id=facility_id,
+                encounter_id=encounter_id,
+                code=code,
+                title=item.get("title") or "",
+                status=TaskStatus.OPEN,
+                assigned_to_id=item.get("assigned_to_id"),
+                due_at=item.get("due_at"),
+            )
+            params.extend(f.get_db_prep_save(f.pre_save(obj, True), conn) for f in fields)
+
+        col = {f.name: qn(f.column) for f in fields}
+        row = "(" + ", ".join(["%s"] * len(fields)) + ")"
+        given = {
+            "title": "EXCLUDED.{c} <> ''",
+            "assigned_to": "EXCLUDED.{c} IS NOT NULL",
+            "due_at": "EXCLUDED.{c} IS NOT NULL",
+        }
+        sets = [
+            f"{col[name]} = CASE WHEN {cond.format(c=col[name])} THEN EXCLUDED.{col[name]} ELSE t.{col[name]} END"
+            for name, cond in given.items()
+        ]
+        changed = " OR ".join(
+            f"({cond.format(c=col[name])} AND EXCLUDED.{col[name]} IS DISTINCT FROM t.{col[name]})"
+            for name, cond in given.items()
+        )
+        sets.append(
+            f"{col['updated_at']} = CASE WHEN {changed} THEN EXCLUDED.{col['updated_at']} ELSE t.{col['updated_at']} END"
+        )
+
+        sql = (
+            f"INSERT INTO {qn(model._meta.db_table)} AS t ({', '.join(col.values())}) "
+            f"VALUES {', '.join([row] * len(first))} "
+            f"ON CONFLICT ({', '.join(col[name] for name in self.CONFLICT_FIELDS)}) "
+            f"DO UPDATE SET {', '.join(sets)} "
+            f"RETURNING {', '.join('t.' + c for c in col.values())}, (t.xmax = 0) AS created"
+        )
+        with conn.cursor() as cursor:
+            cursor.execute(sql, params)
+            rows = cursor.fetchall()
+
+        attnames = [f.attname for f in fields]
+        code_idx = attnames.index("code")
+        by_code = {r[code_idx]: (model.from_db(self.db, attnames, r[:-1]), bool(r[-1])) for r in rows}
+        return [by_code[code] for code in first]
+
+
+class Task(TrackedFieldsMixin, ScopedModel):
     """
     Operational task created by workflows/events/rules.
     """
+    # timeline receivers diff these (encounters.signals.task_events, tasks.signals.timeline)
+    tracked_fields = ("status", "completed_at")
+
+    objects = TaskQuerySet.as_manager()
+
     encounter = models.ForeignKey(Encounter, on_delete=models.CASCADE, related_name="tasks")
 
     code = models.SlugField(max_length=64, db_index=True)  # e.g. "record-vitals"
@@ -47,6 +157,15 @@ class Task(ScopedModel):
             models.Index(fields=["tenant_id", "facility_id", "status", "due_at"]),
             models.Index(fields=["tenant_id", "facility_id", "encounter", "status"]),
             models.Index(fields=["tenant_id", "facility_id", "code"]),
+            # worklist keyset pagination (TaskSelector.page_tasks)
+            models.Index(fields=["tenant_id", "facility_id", "created_at", "id"]),
+            models.Index(fields=["tenant_id", "facility_id", "due_at", "id"]),
+            # overdue sweeper delta scans (hm_core.tasks.overdue): only actionable rows
+            models.Index(
+                fields=["tenant_id", "facility_id", "due_at"],
+                condition=Q(status__in=ACTIONABLE_STATUSES),
+                name="task_actionable_due_idx",
+            ),
         ]
         constraints = [
             models.UniqueConstraint(
@@ -65,7 +184,7 @@ class Task(ScopedModel):
         """
         if not self.due_at:
             return False
-        if self.status not in {TaskStatus.OPEN, TaskStatus.IN_PROGRESS}:
+        if self.status not in ACTIONABLE_STATUSES:
             return False
         return self.due_at < tz_now()
 
@@ -117,3 +236,20 @@ class Task(ScopedModel):
 
             self.id = existing.id
             return existing
+
+
+class OverdueSweepMark(ScopedModel):
+    """
+    High-water mark of the overdue sweeper (hm_core.tasks.overdue), one row per
+    scope: actionable tasks with due_at < swept_until have been examined.
+    """
+    swept_until = models.DateTimeField()
+
+    class Meta:
+        db_table = "tasks_overdue_sweep_mark"
+        constraints = [
+            models.UniqueConstraint(fields=["tenant_id", "facility_id"], name="uq_overdue_sweep_mark_scope"),
+        ]
+
+    def __str__(self) -> str:
+        return f"OverdueSweepMark({self.facility_id}, {self.swept_until})"
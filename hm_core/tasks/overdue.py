@@ -0,0 +1,135 @@
+# backend/hm_core/tasks/overdue.py
+"""
+Overdue-task sweeper.
+
+Overdue is computed on read (Task.is_overdue, ?overdue=1). The sweeper makes it
+proactive: a periodic job (hm_core.tasks.jobs.sweep_overdue_tasks, Celery beat)
+picks up tasks that BECAME overdue since its previous run and escalates them
+(TaskService.raise_overdue: TASK_OVERDUE event + "task-overdue" Alert).
+
+Each scope keeps a high-water mark (OverdueSweepMark.swept_until). A run only
+scans actionable tasks with swept_until <= due_at < now - a range scan on the
+partial task_actionable_due_idx - in keyset chunks of BATCH_SIZE, then moves the
+mark to now. Work per run is proportional to the delta, not to the backlog.
+
+A scope seen for the first time starts INITIAL_LOOKBACK_HOURS back, so enabling
+the sweeper does not alert on every historical overdue task. A task whose due_at
+is moved into the already-swept past is not escalated (it is still overdue on read).
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Optional
+from uuid import UUID
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from hm_core.common.api import keyset
+from hm_core.facilities.models import Facility
+from hm_core.tasks.models import ACTIONABLE_STATUSES, OverdueSweepMark, Task
+from hm_core.tasks.services import TaskService
+
+DEFAULTS = {
+    "BATCH_SIZE": 500,
+    "INITIAL_LOOKBACK_HOURS": 24,
+}
+
+
+def _setting(key: str):
+    return {**DEFAULTS, **getattr(settings, "TASKS_OVERDUE_SWEEP", {})}[key]
+
+
+@dataclass(frozen=True)
+class SweepResult:
+    scopes: int
+    overdue: int
+    alerts: int
+
+
+@transaction.atomic
+def sweep_scope(
+    *,
+    tenant_id: UUID,
+    facility_id: UUID,
+    now: Optional[datetime] = None,
+    batch_size: Optional[int] = None,
+) -> Optional[tuple[int, int]]:
+    """
+    Escalate the scope's newly overdue tasks and advance its mark, in one
+    transaction. Returns (overdue, alerts), or None when another worker holds
+    the scope's mark (skip, it is being swept).
+    """
+    now = now or timezone.now()
+    batch_size = batch_size or _setting("BATCH_SIZE")
+
+    mark, _ = OverdueSweepMark.objects.get_or_create(
+        tenant_id=tenant_id,
+        facility_id=facility_id,
+        defaults={"swept_until": now - timedelta(hours=_setting("INITIAL_LOOKBACK_HOURS"))},
+    )
+    mark = OverdueSweepMark.objects.select_for_update(skip_locked=True).filter(pk=mark.pk).first()
+    if mark is None:
+        return None
+    if mark.swept_until >= now:
+        return 0, 0
+
+    qs = Task.objects.filter(
+        tenant_id=tenant_id,
+        facility_id=facility_id,
+        status__in=ACTIONABLE_STATUSES,
+        due_at__gte=mark.swept_until,
+        due_at__lt=now,
+    ).order_by("due_at", "id")
+
+    overdue = alerts = 0
+    last = None
+    while True:
+        chunk = list((qs if last is None else qs.filter(keyset.after(("due_at", "id"), last)))[:batch_size])
+        if not chunk:
+            break
+        last = (chunk[-1].due_at, chunk[-1].id)
+        overdue += len(chunk)
+        alerts += TaskService.raise_overdue(tenant_id=tenant_id, facility_id=facility_id, tasks=chunk)
+        if len(chunk) < batch_size:
+            break
+
+    mark.swept_until = now
+    mark.save(update_fields=["swept_until", "updated_at"])
+    return overdue, alerts
+
+
+def sweep(
+    *,
+    tenant_id: Optional[UUID] = None,
+    facility_id: Optional[UUID] = None,
+    now: Optional[datetime] = None,
+    batch_size: Optional[int] = None,
+) -> SweepResult:
+    """
+    Sweep one scope (tenant_id + facility_id) or every active facility
+    (optionally of one tenant), each scope in its own transaction.
+    """
+    now = now or timezone.now()
+
+    if tenant_id and facility_id:
+        scopes = [(tenant_id, facility_id)]
+    else:
+        qs = Facility.objects.filter(is_active=True)
+        if tenant_id:
+            qs = qs.filter(tenant_id=tenant_id)
+        scopes = list(qs.values_list("tenant_id", "id"))
+
+    swept = overdue = alerts = 0
+    for scope_tenant_id, scope_facility_id in scopes:
+        result = sweep_scope(tenant_id=scope_tenant_id, facility_id=scope_facility_id, now=now, batch_size=batch_size)
+        if result is None:
+            continue
+        swept += 1
+        overdue += result[0]
+        alerts += result[1]
+
+    return SweepResult(scopes=swept, overdue=overdue, alerts=alerts)
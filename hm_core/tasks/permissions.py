@@ -6,6 +6,7 @@ from typing import Set
 
 from rest_framework.permissions import BasePermission, SAFE_METHODS
 
+from hm_core.iam.services.roles import get_user_roles
 from hm_core.tasks.models import Task, TaskStatus
 
 
@@ -18,40 +19,24 @@ ROLE_LAB = "LAB"
 ROLE_BILLING = "BILLING"
 ROLE_READONLY = "READONLY"
 
+# batch view action -> single-task action whose object rule applies per task
+BATCH_ACTIONS = {
+    "assign_batch": "assign",
+    "unassign_batch": "unassign",
+    "start_batch": "start",
+    "done_batch": "done",
+    "cancel_batch": "cancel",
+}
 
-def _user_roles(user) -> Set[str]:
-    """
-    Resolve roles from:
-    1) Django groups: user.groups (recommended)
-    2) Optional user.role attribute (if your project has it)
 
-    Returns set of role strings.
+def _user_roles(user, request=None) -> Set[str]:
     """
-    roles: Set[str] = set()
-
-    if not user or not getattr(user, "is_authenticated", False):
-        return roles
-
-    # Superuser treated as admin
-    if getattr(user, "is_superuser", False):
-        roles.add(ROLE_ADMIN)
-        return roles
-
-    # Django Groups
-    if hasattr(user, "groups"):
-        roles.update(user.groups.values_list("name", flat=True))
-
-    # Optional user.role or user.roles
-    if hasattr(user, "role") and user.role:
-        roles.add(str(user.role))
+    Resolve roles via the shared role service (iam.services.roles):
+    Django groups + optional user.role/user.roles, superuser -> ADMIN.
 
-    if hasattr(user, "roles") and user.roles:
-        try:
-            roles.update(set(user.roles))
-        except TypeError:
-            roles.add(str(user.roles))
-
-    return roles
+    Returns set of role strings. Memoized per request when request is given.
+    """
+    return set(get_user_roles(user, request=request))
 
 
 class TaskPermission(BasePermission):
@@ -73,7 +58,7 @@ class TaskPermission(BasePermission):
 
     def has_permission(self, request, view) -> bool:
         user = request.user
-        roles = _user_roles(user)
+        roles = _user_roles(user, request)
 
         # Must be authenticated for everything in this HMS API
         if not user or not user.is_authenticated:
@@ -95,28 +80,34 @@ class TaskPermission(BasePermission):
         if action in {"backfill_done"}:
             return False
 
-        # Workflow + assignment actions (non-admin)
-        if action in {"assign", "unassign", "start", "done", "reopen", "cancel"}:
+        # Workflow + assignment actions (non-admin); batch forms are checked per task
+        if action in {"assign", "unassign", "start", "done", "reopen", "cancel"} | set(BATCH_ACTIONS):
             # doctors/nurses can do these broadly; others may be allowed via object permission
             if ROLE_DOCTOR in roles or ROLE_NURSE in roles:
                 return True
             # allow pass-through to object permission (assignee rule),
-            # DRF will call has_object_permission for detail=True actions.
+            # DRF will call has_object_permission for detail=True actions;
+            # batch actions apply can_act_on to each task.
             return True
 
         # Unknown action => deny by default (safer)
         return False
 
     def has_object_permission(self, request, view, obj: Task) -> bool:
+        return self.can_act_on(request, getattr(view, "action", None), obj)
+
+    def can_act_on(self, request, action, obj: Task) -> bool:
+        """
+        Object rule for one task; batch actions call it per task with the
+        single-task action name (BATCH_ACTIONS).
+        """
         user = request.user
-        roles = _user_roles(user)
+        roles = _user_roles(user, request)
 
         # ADMIN can do all
         if ROLE_ADMIN in roles:
             return True
 
-        action = getattr(view, "action", None)
-
         # list doesn't hit object permissions typically, but keep safe
         if action in {None, "list"}:
             return True
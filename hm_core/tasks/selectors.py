@@ -9,7 +9,16 @@ from django.db.models import QuerySet
 from django.utils.dateparse import parse_datetime
 from django.utils.timezone import now
 
-from hm_core.tasks.models import Task
+from hm_core.common.api import keyset
+from hm_core.tasks.models import ACTIONABLE_STATUSES, Task
+
+# page size when the client sends none (the worklist used to truncate at 300)
+DEFAULT_PAGE_SIZE = 300
+MAX_PAGE_SIZE = 1000
+
+KEYSET_ORDERINGS = ("created_at", "-created_at", "due_at", "-due_at")
+# (ordering issued for, value of the ordering column, last id); due_at is nullable
+TASK_CURSOR = (keyset.one_of(*KEYSET_ORDERINGS), keyset.optional(keyset.as_datetime), keyset.as_uuid)
 
 
 class TaskSelector:
@@ -34,7 +43,7 @@ class TaskSelector:
           - overdue=1|true
           - due_before=ISO datetime
           - due_after=ISO datetime
-          - ordering in {created_at, -created_at, due_at, -due_at}
+          - ordering in {created_at, -created_at, due_at, -due_at} (id breaks ties)
         """
         encounter_id = params.get("encounter_id") or params.get("encounter")
         status_param = params.get("status")
@@ -62,7 +71,8 @@ class TaskSelector:
             qs = qs.filter(assigned_to_id=user_id)
 
         if overdue in {"1", "true", "True"}:
-            qs = qs.filter(due_at__lt=now()).exclude(status__in=["DONE", "CANCELLED"])
+            # status__in (not exclude) matches the partial task_actionable_due_idx predicate
+            qs = qs.filter(due_at__lt=now(), status__in=ACTIONABLE_STATUSES)
 
         if due_before:
             dt = parse_datetime(due_before)
@@ -76,12 +86,42 @@ class TaskSelector:
                 raise ValidationError("due_after is invalid. Use ISO datetime.")
             qs = qs.filter(due_at__gte=dt)
 
-        allowed = {"created_at", "-created_at", "due_at", "-due_at"}
-        if ordering:
-            if ordering not in allowed:
-                raise ValidationError(f"ordering is invalid. Allowed: {sorted(allowed)}")
-            qs = qs.order_by(ordering)
-        else:
-            qs = qs.order_by("-created_at")
+        return qs.order_by(*TaskSelector.keyset_ordering(ordering))
 
-        return qs
+    @staticmethod
+    def keyset_ordering(ordering: Optional[str]) -> tuple[str, str]:
+        """
+        ORDER BY of the worklist: the requested column plus id as a stable tie-breaker.
+        """
+        if ordering and ordering not in KEYSET_ORDERINGS:
+            raise ValidationError(f"ordering is invalid. Allowed: {sorted(KEYSET_ORDERINGS)}")
+        ordering = ordering or "-created_at"
+        return ordering, ("-id" if ordering.startswith("-") else "id")
+
+    @staticmethod
+    def page_tasks(
+        qs: QuerySet[Task],
+        *,
+        ordering: tuple[str, str],
+        cursor: Optional[str] = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+    ) -> tuple[list[Task], Optional[str]]:
+        """
+        One keyset page of list_tasks(): (tasks, next_cursor or None on the last page).
+        Cursors carry the ordering they were issued for; reusing one with another
+        ordering is rejected.
+        """
+        if cursor:
+            issued_for, value, last_id = keyset.decode_cursor(cursor, types=TASK_CURSOR)
+            if issued_for != ordering[0]:
+                raise ValidationError("cursor does not match ordering.")
+            qs = qs.filter(keyset.after_ordering(ordering, [value, last_id], nullable=("due_at",)))
+
+        rows = list(qs[: limit + 1])
+        if len(rows) <= limit:
+            return rows, None
+
+        rows = rows[:limit]
+        last = rows[-1]
+        column = ordering[0].lstrip("-")
+        return rows, keyset.encode_cursor([ordering[0], getattr(last, column), last.id])
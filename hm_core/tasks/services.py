@@ -2,16 +2,34 @@
 
 from __future__ import annotations
 
-from typing import Optional
+from dataclasses import dataclass
+from typing import Callable, Optional
 from uuid import UUID
 
 from django.core.exceptions import ValidationError
-from django.db import transaction
+from django.db import connection, transaction
 from django.utils.timezone import now
 
-from hm_core.encounters.signals._emit import emit_event
+from hm_core.alerts.models import Alert, AlertSeverity, AlertStatus
+from hm_core.alerts.services import AlertContext, AlertService, NotificationService
+from hm_core.encounters import readiness
+from hm_core.encounters.signals._emit import emit_event, event_buffer
 from hm_core.tasks.models import Task, TaskStatus
 
+OVERDUE_ALERT_CODE = "task-overdue"
+
+
+@dataclass(frozen=True)
+class BulkTaskResult:
+    task_id: UUID
+    task: Optional[Task] = None
+    changed: bool = False
+    error: str = ""
+
+    @property
+    def ok(self) -> bool:
+        return not self.error
+
 
 class TaskService:
     """
@@ -84,6 +102,7 @@ class TaskService:
     # -------------------------
     @staticmethod
     @transaction.atomic
+    @event_buffer()
     def create_task(
         *,
         tenant_id: UUID,
@@ -97,62 +116,54 @@ class TaskService:
         """
         Idempotent per (tenant_id, facility_id, encounter_id, code).
         Emits TASK_CREATED only when the task is newly created.
+        Existing tasks only get title / assignee / due_at refreshed (when given).
         """
-        task, created = Task.objects.get_or_create(
+        return TaskService.create_tasks(
             tenant_id=tenant_id,
             facility_id=facility_id,
             encounter_id=encounter_id,
-            code=code,
-            defaults={
-                "title": title,
-                "status": TaskStatus.OPEN,
-                "assigned_to_id": assigned_to_id,
-                "due_at": due_at,
-            },
-        )
-
-        # If it already exists, optionally refresh fields WITHOUT re-emitting TASK_CREATED.
-        if not created:
-            changed_fields: list[str] = []
-
-            if title and task.title != title:
-                task.title = title
-                changed_fields.append("title")
-
-            # Only update assignment if explicitly provided
-            if assigned_to_id is not None and task.assigned_to_id != assigned_to_id:
-                task.assigned_to_id = assigned_to_id
-                changed_fields.append("assigned_to")
-
-            if due_at is not None and task.due_at != due_at:
-                task.due_at = due_at
-                changed_fields.append("due_at")
-
-            if changed_fields:
-                TaskService._touch_updated_at(task, changed_fields)
-                task.save(update_fields=changed_fields)
-
-            return task
+            items=[{"code": code, "title": title, "assigned_to_id": assigned_to_id, "due_at": due_at}],
+        )[0]
 
-        # Newly created => emit TASK_CREATED (idempotent via event_key uniqueness)
-        ts = getattr(task, "created_at", None) or now()
-        emit_event(
+    @staticmethod
+    @transaction.atomic
+    @event_buffer()
+    def create_tasks(*, tenant_id: UUID, facility_id: UUID, encounter_id: UUID, items: list[dict]) -> list[Task]:
+        """
+        Batch form of create_task for one encounter (e.g. all tasks of an order):
+        one upsert statement, one buffered event insert.
+        items: [{"code", "title", "assigned_to_id"?, "due_at"?}, ...]
+        """
+        results = Task.objects.upsert_many(
             tenant_id=tenant_id,
             facility_id=facility_id,
             encounter_id=encounter_id,
-            event_key=f"TASK_CREATED:{task.id}",
-            code="TASK_CREATED",
-            title="Task created",
-            timestamp=ts,
-            meta={
-                "task_id": str(task.id),
-                "task_code": task.code,
-                "task_title": task.title,
-                "status": task.status,
-                "assigned_to_id": task.assigned_to_id,
-            },
+            items=items,
         )
-        return task
+
+        created = [task for task, was_created in results if was_created]
+        for task in created:
+            # upsert bypasses post_save: same TASK_CREATED the receiver wrote
+            emit_event(
+                tenant_id=tenant_id,
+                facility_id=facility_id,
+                encounter_id=encounter_id,
+                event_key=f"TASK_CREATED:{task.id}",
+                code="TASK_CREATED",
+                title="Task created",
+                timestamp=task.created_at,
+                meta={
+                    "task_id": str(task.id),
+                    "task_code": task.code,
+                    "task_title": task.title,
+                    "status": task.status,
+                    "assigned_to_id": task.assigned_to_id,
+                },
+            )
+
+        if created:
+            readiness.refresh_on_commit(tenant_id=tenant_id, facility_id=facility_id, encounter_ids=[encounter_id])
+        return [task for task, _ in results]
 
     # -------------------------
     # Assignment (Story 1) + Events
@@ -243,6 +254,7 @@ class TaskService:
 
     @staticmethod
     @transaction.atomic
+    @event_buffer()
     def complete_task(
         *,
         tenant_id: UUID,
@@ -352,11 +364,241 @@ class TaskService:
         )
         return task
 
+    # -------------------------
+    # Bulk workflow / assignment (worklist multi-select)
+    # -------------------------
+    BULK_ACTIONS = ("assign", "unassign", "start", "complete", "cancel")
+
+    @staticmethod
+    def _bulk_transition(action: str, task: Task, *, assigned_to_id: Optional[int], ts) -> dict:
+        """
+        Same rules as the single-task methods. Returns the field values to write,
+        {} for an idempotent no-op; raises ValidationError when not allowed.
+        """
+        closed = {TaskStatus.DONE, TaskStatus.CANCELLED}
+        if action == "assign":
+            if task.status in closed:
+                raise ValidationError("Cannot assign DONE/CANCELLED task.")
+            return {} if task.assigned_to_id == assigned_to_id else {"assigned_to_id": assigned_to_id}
+        if action == "unassign":
+            if task.status in closed:
+                raise ValidationError("Cannot unassign DONE/CANCELLED task.")
+            return {} if task.assigned_to_id is None else {"assigned_to_id": None}
+        if action == "start":
+            if task.status != TaskStatus.OPEN:
+                raise ValidationError("Only OPEN task can be started.")
+            return {"status": TaskStatus.IN_PROGRESS}
+        if action == "complete":
+            if task.status == TaskStatus.DONE and task.completed_at:
+                return {}
+            if task.status != TaskStatus.IN_PROGRESS:
+                raise ValidationError("Only IN_PROGRESS task can be completed.")
+            return {"status": TaskStatus.DONE, "completed_at": ts}
+        if action == "cancel":
+            if task.status == TaskStatus.DONE:
+                raise ValidationError("Cannot cancel DONE task.")
+            if task.status == TaskStatus.CANCELLED:
+                return {}
+            return {"status": TaskStatus.CANCELLED, "completed_at": None}
+        raise ValueError(f"Unknown bulk task action: {action}")
+
+    @staticmethod
+    def _bulk_emit(action: str, task: Task, prev: dict, *, ts) -> None:
+        # event keys / titles / meta as emitted by the single-task methods
+        if action == "assign":
+            TaskService._emit_task_event(
+                task=task,
+                event_code="TASK_ASSIGNED",
+                title="Task assigned",
+                event_key=f"TASK_ASSIGNED:{task.id}:{task.assigned_to_id}",
+                timestamp=ts,
+            )
+        elif action == "unassign":
+            TaskService._emit_task_event(
+                task=task,
+                event_code="TASK_UNASSIGNED",
+                title="Task unassigned",
+                event_key=f"TASK_UNASSIGNED:{task.id}:{prev['assigned_to_id']}",
+                meta={"previous_assigned_to_id": prev["assigned_to_id"]},
+                timestamp=ts,
+            )
+        elif action == "start":
+            TaskService._emit_task_event(
+                task=task,
+                event_code="TASK_STARTED",
+                title="Task started",
+                event_key=f"TASK_STARTED:{task.id}",
+                timestamp=ts,
+            )
+        elif action == "complete":
+            # TASK_DONE as written first by the post_save receiver (encounters.signals.task_events)
+            emit_event(
+                tenant_id=task.tenant_id,
+                facility_id=task.facility_id,
+                encounter_id=task.encounter_id,
+                event_key=f"TASK_DONE:{task.id}",
+                code="TASK_DONE",
+                title="Task completed",
+                timestamp=task.completed_at,
+                meta={
+                    "task_id": str(task.id),
+                    "task_code": task.code,
+                    "task_title": task.title,
+                    "status": task.status,
+                },
+            )
+        elif action == "cancel":
+            TaskService._emit_task_event(
+                task=task,
+                event_code="TASK_CANCELLED",
+                title="Task cancelled",
+                event_key=f"TASK_CANCELLED:{task.id}",
+                meta={"previous_status": prev["status"]},
+                timestamp=ts,
+            )
+
+    @staticmethod
+    @transaction.atomic
+    @event_buffer()
+    def bulk_apply(
+        *,
+        tenant_id: UUID,
+        facility_id: UUID,
+        action: str,
+        task_ids: list[UUID],
+        assigned_to_id: Optional[int] = None,
+        can_act: Optional[Callable[[Task], bool]] = None,
+    ) -> list[BulkTaskResult]:
+        """
+        Apply one workflow/assignment action to many tasks:
+        - one locking SELECT validates every transition (same rules as the single-task methods)
+        - one UPDATE writes all allowed tasks (the new values are the same for all of them)
+        - one buffered INSERT writes the per-task events
+        Items fail individually (not found / forbidden by can_act / invalid transition).
+        Returns one BulkTaskResult per distinct id, in request order.
+        """
+        if action not in TaskService.BULK_ACTIONS:
+            raise ValueError(f"Unknown bulk task action: {action}")
+        if action == "assign" and not assigned_to_id:
+            raise ValidationError("assigned_to_id is required.")
+
+        ids = list(dict.fromkeys(task_ids))
+        tasks = Task.objects.select_for_update().filter(tenant_id=tenant_id, facility_id=facility_id).in_bulk(ids)
+
+        ts = now()
+        results: list[BulkTaskResult] = []
+        changed: list[tuple[Task, dict]] = []
+        update: dict = {}
+        for task_id in ids:
+            task = tasks.get(task_id)
+            if task is None:
+                results.append(BulkTaskResult(task_id=task_id, error="Task not found in this scope."))
+                continue
+            if can_act is not None and not can_act(task):
+                results.append(
+                    BulkTaskResult(task_id=task_id, task=task, error="You do not have permission to perform this action.")
+                )
+                continue
+            try:
+                values = TaskService._bulk_transition(action, task, assigned_to_id=assigned_to_id, ts=ts)
+            except ValidationError as e:
+                results.append(BulkTaskResult(task_id=task_id, task=task, error=e.messages[0]))
+                continue
+
+            if values:
+                prev = {"status": task.status, "assigned_to_id": task.assigned_to_id}
+                for field, value in values.items():
+                    setattr(task, field, value)
+                task.updated_at = ts
+                # per action the new values are the same for every task
+                update = {**values, "updated_at": ts}
+                changed.append((task, prev))
+            results.append(BulkTaskResult(task_id=task_id, task=task, changed=bool(values)))
+
+        if changed:
+            Task.objects.filter(id__in=[t.id for t, _ in changed]).update(**update)
+
+            for task, prev in changed:
+                TaskService._bulk_emit(action, task, prev, ts=ts)
+
+            if action in ("start", "complete", "cancel"):
+                # queryset update fires no post_save: refresh the close-gate projection here
+                readiness.refresh_on_commit(
+                    tenant_id=tenant_id,
+                    facility_id=facility_id,
+                    encounter_ids={t.encounter_id for t, _ in changed},
+                )
+        return results
+
+    # -------------------------
+    # Overdue escalation (hm_core.tasks.overdue sweeper)
+    # -------------------------
+    @staticmethod
+    @transaction.atomic
+    @event_buffer()
+    def raise_overdue(*, tenant_id: UUID, facility_id: UUID, tasks: list[Task]) -> int:
+        """
+        For tasks of one scope that just became overdue:
+        - TASK_OVERDUE timeline event (idempotent per task + due_at, so a rescheduled
+          task that goes overdue again gets a new one)
+        - one OPEN "task-overdue" Alert per task (skipped while one is still OPEN),
+          plus an in-app notification for the assignee
+        One query + three INSERTs per call, whatever the number of tasks.
+        Returns the number of alerts raised.
+        """
+        if not tasks:
+            return 0
+
+        for task in tasks:
+            due = task.due_at.isoformat()
+            TaskService._emit_task_event(
+                task=task,
+                event_code="TASK_OVERDUE",
+                title="Task overdue",
+                event_key=f"TASK_OVERDUE:{task.id}:{due}",
+                meta={"due_at": due},
+                timestamp=task.due_at,
+            )
+
+        alerted = set(
+            Alert.objects.filter(
+                tenant_id=tenant_id,
+                facility_id=facility_id,
+                code=OVERDUE_ALERT_CODE,
+                status=AlertStatus.OPEN,
+                task_id__in=[t.id for t in tasks],
+            ).values_list("task_id", flat=True)
+        )
+        pending = [t for t in tasks if t.id not in alerted]
+
+        ctx = AlertContext(tenant_id=tenant_id, facility_id=facility_id, actor_user_id=None)
+        alerts = AlertService.create_alerts(
+            ctx=ctx,
+            items=[
+                {
+                    "code": OVERDUE_ALERT_CODE,
+                    "title": "Task overdue",
+                    "message": task.title,
+                    "severity": AlertSeverity.WARNING,
+                    "encounter_id": task.encounter_id,
+                    "task_id": task.id,
+                    "meta": {"task_code": task.code, "due_at": task.due_at.isoformat()},
+                }
+                for task in pending
+            ],
+        )
+        NotificationService.notify_alert_recipients(
+            ctx=ctx,
+            recipients=[(alert, task.assigned_to_id) for alert, task in zip(alerts, pending) if task.assigned_to_id],
+        )
+        return len(alerts)
+
     # -------------------------
     # Backfill/Repair (Story 3 utilities)
     # -------------------------
     @staticmethod
     @transaction.atomic
+    @event_buffer()
     def backfill_mark_done(
         *,
         tenant_id: UUID,
@@ -453,6 +695,7 @@ class TaskService:
 
     @staticmethod
     @transaction.atomic
+    @event_buffer()
     def close_all_for_encounter(*, tenant_id: UUID, facility_id: UUID, encounter_id: UUID) -> int:
         """
         Completes all tasks for the encounter that are not DONE/CANCELLED.
@@ -461,22 +704,81 @@ class TaskService:
         - OPEN tasks are started then completed
         - IN_PROGRESS tasks are completed
         - CANCELLED tasks are left as-is
-        """
-        count = 0
-        qs = Task.objects.select_for_update().filter(
-            tenant_id=tenant_id,
-            facility_id=facility_id,
-            encounter_id=encounter_id,
-        )
-
-        for t in qs:
-            if t.status in {TaskStatus.DONE, TaskStatus.CANCELLED}:
-                continue
 
-            if t.status == TaskStatus.OPEN:
-                TaskService.start_task(tenant_id=tenant_id, facility_id=facility_id, task_id=t.id)
+        Set-based: one locking UPDATE ... RETURNING transitions every eligible task,
+        then TASK_STARTED / TASK_DONE go out in one buffered INSERT. The event stream
+        matches start_task + complete_task per task (same keys, titles and meta).
+        """
+        ts = now()
+        table = Task._meta.db_table
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"""
+                WITH prev AS (
+                    SELECT id, status
+                    FROM {table}
+                    WHERE tenant_id = %s AND facility_id = %s AND encounter_id = %s
+                      AND status IN (%s, %s)
+                    FOR UPDATE
+                )
+                UPDATE {table} AS t
+                SET status = %s, completed_at = %s, updated_at = %s
+                FROM prev
+                WHERE t.id = prev.id
+                RETURNING t.id, t.code, t.title, t.assigned_to_id, prev.status
+                """,
+                [
+                    tenant_id,
+                    facility_id,
+                    encounter_id,
+                    TaskStatus.OPEN,
+                    TaskStatus.IN_PROGRESS,
+                    TaskStatus.DONE,
+                    ts,
+                    ts,
+                ],
+            )
+            rows = cursor.fetchall()
 
-            TaskService.complete_task(tenant_id=tenant_id, facility_id=facility_id, task_id=t.id)
-            count += 1
+        for task_id, code, title, assigned_to_id, prev_status in rows:
+            task = Task(
+                id=task_id,
+                tenant_id=tenant_id,
+                facility_id=facility_id,
+                encounter_id=encounter_id,
+                code=code,
+                title=title,
+                assigned_to_id=assigned_to_id,
+            )
+            if prev_status == TaskStatus.OPEN:
+                task.status = TaskStatus.IN_PROGRESS
+                TaskService._emit_task_event(
+                    task=task,
+                    event_code="TASK_STARTED",
+                    title="Task started",
+                    event_key=f"TASK_STARTED:{task.id}",
+                    timestamp=ts,
+                )
+
+            # TASK_DONE as written first by the post_save receiver (encounters.signals.task_events)
+            emit_event(
+                tenant_id=tenant_id,
+                facility_id=facility_id,
+                encounter_id=encounter_id,
+                event_key=f"TASK_DONE:{task.id}",
+                code="TASK_DONE",
+                title="Task completed",
+                timestamp=ts,
+                meta={
+                    "task_id": str(task.id),
+                    "task_code": code,
+                    "task_title": title,
+                    "status": TaskStatus.DONE,
+                },
+            )
 
-        return count
+        if rows:
+            # queryset-level write: no post_save, refresh the close-gate projection here
+            readiness.refresh_on_commit(tenant_id=tenant_id, facility_id=facility_id, encounter_ids=[encounter_id])
+        return len(rows)
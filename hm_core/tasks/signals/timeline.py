@@ -1,39 +1,24 @@
 # backend/hm_core/tasks/signals/timeline.py
-from django.db.models.signals import pre_save, post_save
+from django.db.models.signals import post_save
 from django.dispatch import receiver
-from django.utils.timezone import now
 
 from hm_core.tasks.models import Task
-from hm_core.encounters.models import EncounterEvent
-
-
-@receiver(pre_save, sender=Task)
-def task_pre_save(sender, instance: Task, **kwargs):
-    if not instance.pk:
-        instance._pre_save_snapshot = None
-        return
-    try:
-        instance._pre_save_snapshot = Task.objects.get(pk=instance.pk)
-    except Task.DoesNotExist:
-        instance._pre_save_snapshot = None
+from hm_core.encounters.signals._emit import emit_event
 
 
 @receiver(post_save, sender=Task)
 def task_post_save(sender, instance: Task, created: bool, **kwargs):
 
     def emit(code, title, key, ts, meta):
-        EncounterEvent.objects.get_or_create(
+        emit_event(
             tenant_id=instance.tenant_id,
             facility_id=instance.facility_id,
             encounter_id=instance.encounter_id,
             event_key=key,
-            defaults={
-                "type": "EVENT",
-                "code": code,
-                "title": title,
-                "timestamp": ts or now(),
-                "meta": meta,
-            },
+            code=code,
+            title=title,
+            timestamp=ts,
+            meta=meta,
         )
 
     if created:
@@ -50,8 +35,7 @@ def task_post_save(sender, instance: Task, created: bool, **kwargs):
         )
         return
 
-    prev = getattr(instance, "_pre_save_snapshot", None)
-    if prev and prev.completed_at is None and instance.completed_at:
+    if instance.previous("completed_at") is None and instance.completed_at:
         emit(
             "TASK_DONE",
             "Task completed",
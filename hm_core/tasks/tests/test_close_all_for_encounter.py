@@ -0,0 +1,81 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from hm_core.encounters.models import EncounterEvent
+from hm_core.tasks.models import Task, TaskStatus
+from hm_core.tasks.services import TaskService
+from hm_core.tasks.tests.conftest import create_minimal_instance, get_encounter_model
+
+pytestmark = pytest.mark.django_db
+
+
+def _seed(tenant_id, facility_id, encounter, n_open=3):
+    ids = {}
+    for i in range(n_open):
+        ids[f"open-{i}"] = TaskService.create_task(
+            tenant_id=tenant_id, facility_id=facility_id, encounter_id=encounter.id, code=f"open-{i}", title=f"Open {i}"
+        ).id
+    for code, steps in {
+        "running": ("start",),
+        "finished": ("start", "complete"),
+        "dropped": ("cancel",),
+    }.items():
+        t = TaskService.create_task(
+            tenant_id=tenant_id, facility_id=facility_id, encounter_id=encounter.id, code=code, title=code.title()
+        )
+        for step in steps:
+            getattr(TaskService, f"{step}_task")(tenant_id=tenant_id, facility_id=facility_id, task_id=t.id)
+        ids[code] = t.id
+    return ids
+
+
+def _stream(encounter, since_codes=("TASK_STARTED", "TASK_DONE")):
+    out = []
+    for e in EncounterEvent.objects.filter(encounter_id=encounter.id, code__in=since_codes):
+        task_code = e.meta["task_code"]
+        meta = {k: v for k, v in e.meta.items() if k != "task_id"}
+        out.append((e.code, task_code, e.title, e.event_key.split(":")[0], tuple(sorted(meta.items()))))
+    return sorted(out)
+
+
+def _legacy_close(tenant_id, facility_id, encounter):
+    for t in Task.objects.filter(encounter_id=encounter.id):
+        if t.status in {TaskStatus.DONE, TaskStatus.CANCELLED}:
+            continue
+        if t.status == TaskStatus.OPEN:
+            TaskService.start_task(tenant_id=tenant_id, facility_id=facility_id, task_id=t.id)
+        TaskService.complete_task(tenant_id=tenant_id, facility_id=facility_id, task_id=t.id)
+
+
+def test_set_based_close_matches_per_task_event_stream(tenant_id, facility_id, encounter):
+    other = create_minimal_instance(get_encounter_model(), tenant_id=tenant_id, facility_id=facility_id)
+    _seed(tenant_id, facility_id, encounter)
+    _seed(tenant_id, facility_id, other)
+
+    closed = TaskService.close_all_for_encounter(tenant_id=tenant_id, facility_id=facility_id, encounter_id=encounter.id)
+    _legacy_close(tenant_id, facility_id, other)
+
+    assert closed == 4
+    assert _stream(encounter) == _stream(other)
+
+    statuses = dict(Task.objects.filter(encounter_id=encounter.id).values_list("code", "status"))
+    assert statuses["dropped"] == TaskStatus.CANCELLED
+    assert {statuses[c] for c in ("open-0", "open-1", "open-2", "running", "finished")} == {TaskStatus.DONE}
+    assert not Task.objects.filter(encounter_id=encounter.id, status=TaskStatus.DONE, completed_at__isnull=True).exists()
+
+    # idempotent
+    assert TaskService.close_all_for_encounter(tenant_id=tenant_id, facility_id=facility_id, encounter_id=encounter.id) == 0
+
+
+def test_set_based_close_query_count_is_constant(tenant_id, facility_id, encounter):
+    other = create_minimal_instance(get_encounter_model(), tenant_id=tenant_id, facility_id=facility_id)
+    _seed(tenant_id, facility_id, encounter, n_open=2)
+    _seed(tenant_id, facility_id, other, n_open=20)
+
+    def queries(enc):
+        with CaptureQueriesContext(connection) as ctx:
+            TaskService.close_all_for_encounter(tenant_id=tenant_id, facility_id=facility_id, encounter_id=enc.id)
+        return len(ctx.captured_queries)
+
+    assert queries(encounter) == queries(other)
@@ -0,0 +1,102 @@
+#backend/hm_core/tasks/tests/test_overdue_sweeper.py
+
+from datetime import timedelta
+
+import pytest
+from django.utils.timezone import now
+
+from hm_core.alerts.models import Alert, AlertStatus, Notification
+from hm_core.encounters.models import EncounterEvent
+from hm_core.tasks import overdue
+from hm_core.tasks.jobs import sweep_overdue_tasks
+from hm_core.tasks.models import OverdueSweepMark, Task, TaskStatus
+from hm_core.tasks.services import OVERDUE_ALERT_CODE, TaskService
+
+pytestmark = pytest.mark.django_db
+
+
+def _task(encounter, code, due_at, **kwargs):
+    return TaskService.create_task(
+        tenant_id=encounter.tenant_id,
+        facility_id=encounter.facility_id,
+        encounter_id=encounter.id,
+        code=code,
+        title=code.title(),
+        due_at=due_at,
+        **kwargs,
+    )
+
+
+def _overdue_events(encounter):
+    return EncounterEvent.objects.filter(encounter_id=encounter.id, code="TASK_OVERDUE")
+
+
+def _sweep(encounter, **kwargs):
+    return overdue.sweep(tenant_id=encounter.tenant_id, facility_id=encounter.facility_id, **kwargs)
+
+
+def test_sweep_escalates_newly_overdue_actionable_tasks(encounter, user):
+    t0 = now()
+    late = _task(encounter, "late", t0 - timedelta(minutes=5), assigned_to_id=user.id)
+    _task(encounter, "future", t0 + timedelta(hours=1))
+    _task(encounter, "ancient", t0 - timedelta(days=3))  # before the initial lookback
+    done = _task(encounter, "done-late", t0 - timedelta(minutes=5))
+    Task.objects.filter(id=done.id).update(status=TaskStatus.DONE)
+
+    result = _sweep(encounter, now=t0)
+    assert (result.scopes, result.overdue, result.alerts) == (1, 1, 1)
+
+    event = _overdue_events(encounter).get()
+    assert event.meta["task_id"] == str(late.id)
+    assert event.timestamp == late.due_at
+
+    alert = Alert.objects.get(code=OVERDUE_ALERT_CODE)
+    assert (alert.task_id, alert.encounter_id, alert.status) == (late.id, encounter.id, AlertStatus.OPEN)
+    assert Notification.objects.get(alert=alert).recipient_id == user.id
+
+    assert OverdueSweepMark.objects.get(facility_id=encounter.facility_id).swept_until == t0
+
+
+def test_sweep_only_touches_the_delta_since_the_high_water_mark(encounter):
+    t0 = now()
+    _task(encounter, "first", t0 - timedelta(minutes=1))
+    assert _sweep(encounter, now=t0).overdue == 1
+
+    # nothing new: already-swept tasks are not rescanned
+    assert _sweep(encounter, now=t0 + timedelta(seconds=30)).overdue == 0
+
+    second = _task(encounter, "second", t0 + timedelta(minutes=1))
+    result = _sweep(encounter, now=t0 + timedelta(minutes=2))
+    assert (result.overdue, result.alerts) == (1, 1)
+    assert {e.meta["task_id"] for e in _overdue_events(encounter)} >= {str(second.id)}
+    assert _overdue_events(encounter).count() == 2
+    assert Alert.objects.filter(code=OVERDUE_ALERT_CODE).count() == 2
+
+
+def test_sweep_chunks_with_due_at_ties(encounter):
+    t0 = now()
+    due = t0 - timedelta(minutes=10)
+    for i in range(7):
+        _task(encounter, f"tie-{i}", due)
+
+    result = _sweep(encounter, now=t0, batch_size=3)
+    assert (result.overdue, result.alerts) == (7, 7)
+    assert _overdue_events(encounter).count() == 7
+
+
+def test_raise_overdue_skips_tasks_with_an_open_alert(encounter):
+    t0 = now()
+    task = _task(encounter, "again", t0 - timedelta(minutes=1))
+    kwargs = {"tenant_id": encounter.tenant_id, "facility_id": encounter.facility_id, "tasks": [task]}
+
+    assert TaskService.raise_overdue(**kwargs) == 1
+    assert TaskService.raise_overdue(**kwargs) == 0
+    assert _overdue_events(encounter).count() == 1
+
+
+def test_sweep_job_runs_eagerly(encounter):
+    _task(encounter, "eager", now() - timedelta(minutes=1))
+
+    result = sweep_overdue_tasks.delay(tenant_id=str(encounter.tenant_id), facility_id=str(encounter.facility_id))
+    assert result.get() == {"scopes": 1, "overdue": 1, "alerts": 1}
+    assert _overdue_events(encounter).count() == 1
@@ -0,0 +1,203 @@
+#backend/hm_core/tasks/tests/test_task_bulk_actions.py
+
+import uuid
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from hm_core.encounters.models import EncounterEvent
+from hm_core.tasks.api.views import TaskViewSet
+from hm_core.tasks.models import Task, TaskStatus
+from hm_core.tasks.services import TaskService
+from hm_core.tasks.tests.test_task_permissions_api import make_user
+
+pytestmark = pytest.mark.django_db
+
+
+def call_batch(*, user, tenant_id, facility_id, action: str, data: dict):
+    factory = APIRequestFactory()
+    request = factory.post(f"/tasks/{action}:batch/", data=data, format="json")
+    force_authenticate(request, user=user)
+    request.tenant_id = tenant_id
+    request.facility_id = facility_id
+    view = TaskViewSet.as_view({"post": f"{action}_batch"})
+    return view(request)
+
+
+def _tasks(encounter, n, prefix="bulk"):
+    return [
+        TaskService.create_task(
+            tenant_id=encounter.tenant_id,
+            facility_id=encounter.facility_id,
+            encounter_id=encounter.id,
+            code=f"{prefix}-{i}",
+            title=f"Bulk {i}",
+        )
+        for i in range(n)
+    ]
+
+
+def _events(encounter, code):
+    return EncounterEvent.objects.filter(
+        tenant_id=encounter.tenant_id,
+        facility_id=encounter.facility_id,
+        encounter_id=encounter.id,
+        code=code,
+    )
+
+
+def test_start_batch_reports_per_task_outcomes(encounter):
+    admin = make_user("bulk_admin", "ADMIN")
+    a, b, c = _tasks(encounter, 3)
+    TaskService.start_task(tenant_id=c.tenant_id, facility_id=c.facility_id, task_id=c.id)
+    missing = uuid.uuid4()
+
+    resp = call_batch(
+        user=admin,
+        tenant_id=encounter.tenant_id,
+        facility_id=encounter.facility_id,
+        action="start",
+        data={"task_ids": [str(a.id), str(b.id), str(c.id), str(missing), str(a.id)]},
+    )
+    assert resp.status_code == 200, resp.data
+
+    results = resp.data["results"]
+    assert [r["id"] for r in results] == [str(a.id), str(b.id), str(c.id), str(missing)]
+    assert [r["ok"] for r in results] == [True, True, False, False]
+    assert results[0]["task"]["status"] == TaskStatus.IN_PROGRESS
+    assert results[2]["error"] == "Only OPEN task can be started."
+    assert results[3]["error"] == "Task not found in this scope."
+
+    assert set(Task.objects.filter(status=TaskStatus.IN_PROGRESS).values_list("id", flat=True)) == {a.id, b.id, c.id}
+    assert _events(encounter, "TASK_STARTED").count() == 3
+
+
+def test_done_batch_matches_single_task_events(encounter):
+    admin = make_user("bulk_admin", "ADMIN")
+    tasks = _tasks(encounter, 3)
+    for t in tasks:
+        TaskService.start_task(tenant_id=t.tenant_id, facility_id=t.facility_id, task_id=t.id)
+
+    resp = call_batch(
+        user=admin,
+        tenant_id=encounter.tenant_id,
+        facility_id=encounter.facility_id,
+        action="done",
+        data={"task_ids": [str(t.id) for t in tasks]},
+    )
+    assert resp.status_code == 200, resp.data
+    assert all(r["ok"] and r["changed"] for r in resp.data["results"])
+
+    done = {e.meta["task_id"]: e for e in _events(encounter, "TASK_DONE")}
+    assert set(done) == {str(t.id) for t in tasks}
+    for t in tasks:
+        t.refresh_from_db()
+        assert t.status == TaskStatus.DONE
+        assert done[str(t.id)].timestamp == t.completed_at
+        # same meta as the post_save receiver writes for complete_task
+        assert done[str(t.id)].meta == {
+            "task_id": str(t.id),
+            "task_code": t.code,
+            "task_title": t.title,
+            "status": TaskStatus.DONE,
+        }
+
+    # idempotent: a second call is a no-op per task
+    again = call_batch(
+        user=admin,
+        tenant_id=encounter.tenant_id,
+        facility_id=encounter.facility_id,
+        action="done",
+        data={"task_ids": [str(t.id) for t in tasks]},
+    )
+    assert all(r["ok"] and not r["changed"] for r in again.data["results"])
+    assert _events(encounter, "TASK_DONE").count() == 3
+
+
+def test_assign_and_unassign_batch(encounter):
+    admin = make_user("bulk_admin", "ADMIN")
+    nurse = make_user("bulk_nurse", "NURSE")
+    a, b = _tasks(encounter, 2)
+    TaskService.cancel_task(tenant_id=b.tenant_id, facility_id=b.facility_id, task_id=b.id)
+
+    missing_assignee = call_batch(
+        user=admin,
+        tenant_id=encounter.tenant_id,
+        facility_id=encounter.facility_id,
+        action="assign",
+        data={"task_ids": [str(a.id)]},
+    )
+    assert missing_assignee.status_code == 400
+
+    resp = call_batch(
+        user=admin,
+        tenant_id=encounter.tenant_id,
+        facility_id=encounter.facility_id,
+        action="assign",
+        data={"task_ids": [str(a.id), str(b.id)], "assigned_to_id": nurse.id},
+    )
+    assert resp.status_code == 200, resp.data
+    ok, cancelled = resp.data["results"]
+    assert ok["ok"] and ok["task"]["assigned_to_id"] == nurse.id
+    assert cancelled["error"] == "Cannot assign DONE/CANCELLED task."
+    assert _events(encounter, "TASK_ASSIGNED").get().event_key == f"TASK_ASSIGNED:{a.id}:{nurse.id}"
+
+    resp = call_batch(
+        user=admin,
+        tenant_id=encounter.tenant_id,
+        facility_id=encounter.facility_id,
+        action="unassign",
+        data={"task_ids": [str(a.id)]},
+    )
+    assert resp.data["results"][0]["changed"] is True
+    a.refresh_from_db()
+    assert a.assigned_to_id is None
+    assert _events(encounter, "TASK_UNASSIGNED").get().meta["previous_assigned_to_id"] == nurse.id
+
+
+def test_cancel_batch_applies_assignee_rule_per_task(encounter):
+    lab = make_user("bulk_lab", "LAB")
+    mine, theirs = _tasks(encounter, 2)
+    TaskService.assign_task(
+        tenant_id=mine.tenant_id, facility_id=mine.facility_id, task_id=mine.id, assigned_to_id=lab.id
+    )
+
+    resp = call_batch(
+        user=lab,
+        tenant_id=encounter.tenant_id,
+        facility_id=encounter.facility_id,
+        action="cancel",
+        data={"task_ids": [str(mine.id), str(theirs.id)]},
+    )
+    assert resp.status_code == 200, resp.data
+    ok, forbidden = resp.data["results"]
+    assert ok["ok"] and ok["task"]["status"] == TaskStatus.CANCELLED
+    assert forbidden["ok"] is False
+    assert forbidden["error"] == "You do not have permission to perform this action."
+
+    theirs.refresh_from_db()
+    assert theirs.status == TaskStatus.OPEN
+    assert _events(encounter, "TASK_CANCELLED").get().meta["previous_status"] == TaskStatus.OPEN
+
+
+def test_bulk_apply_query_count_does_not_grow_with_tasks(encounter):
+    def task_queries(tasks):
+        with CaptureQueriesContext(connection) as ctx:
+            TaskService.bulk_apply(
+                tenant_id=encounter.tenant_id,
+                facility_id=encounter.facility_id,
+                action="start",
+                task_ids=[t.id for t in tasks],
+            )
+        # one locking SELECT + one UPDATE (readiness refresh reads tasks_task via subqueries)
+        return [
+            q["sql"]
+            for q in ctx.captured_queries
+            if q["sql"].startswith(('SELECT "tasks_task"', 'UPDATE "tasks_task"', 'INSERT INTO "encounters_event"'))
+        ]
+
+    small = task_queries(_tasks(encounter, 2, prefix="small"))
+    large = task_queries(_tasks(encounter, 20, prefix="large"))
+    assert len(small) == len(large) == 3
@@ -0,0 +1,51 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils.timezone import now
+
+from hm_core.encounters.models import EncounterEvent
+from hm_core.tasks.models import Task, TaskStatus
+
+pytestmark = pytest.mark.django_db
+
+
+def _task(tenant_id, facility_id, encounter):
+    return Task.objects.create(
+        tenant_id=tenant_id,
+        facility_id=facility_id,
+        encounter_id=encounter.id,
+        code="tracked-task",
+        title="Tracked",
+    )
+
+
+def test_loaded_task_tracks_previous_values(tenant_id, facility_id, encounter):
+    _task(tenant_id, facility_id, encounter)
+    task = Task.objects.get(encounter_id=encounter.id, code="tracked-task")
+
+    assert task.has_changed("status") is False
+    task.status = TaskStatus.DONE
+    assert task.has_changed("status") is True
+    assert task.previous("status") == TaskStatus.OPEN
+
+    task.save(update_fields=["status"])
+    assert task.has_changed("status") is False
+    assert task.previous("status") == TaskStatus.DONE
+
+    Task.objects.filter(pk=task.pk).update(status=TaskStatus.CANCELLED)
+    task.refresh_from_db(fields=["status"])
+    assert task.previous("status") == TaskStatus.CANCELLED
+
+
+def test_completion_save_does_not_reread_task(tenant_id, facility_id, encounter):
+    task = Task.objects.get(pk=_task(tenant_id, facility_id, encounter).pk)
+    task.status = TaskStatus.DONE
+    task.completed_at = now()
+
+    with CaptureQueriesContext(connection) as ctx:
+        task.save(update_fields=["status", "completed_at"])
+
+    # readiness projection refresh still reads tasks via subqueries; no row re-fetch
+    selects = [q["sql"] for q in ctx.captured_queries if q["sql"].startswith('SELECT "tasks_task"')]
+    assert selects == []
+    assert EncounterEvent.objects.filter(event_key=f"TASK_DONE:{task.id}").count() == 1
@@ -0,0 +1,96 @@
+#backend/hm_core/tasks/tests/test_task_list_keyset_pagination.py
+
+import pytest
+from datetime import timedelta
+
+from django.utils.timezone import now
+
+from hm_core.common.api import keyset
+from hm_core.tasks.models import Task
+from hm_core.tasks.tests.test_task_list_filters_due_range_ordering import call_list, make_admin
+
+pytestmark = pytest.mark.django_db
+
+
+def _seed(encounter, n=13):
+    t0 = now()
+    Task.objects.bulk_create(
+        [
+            Task(
+                tenant_id=encounter.tenant_id,
+                facility_id=encounter.facility_id,
+                encounter_id=encounter.id,
+                code=f"page-{i}",
+                title=f"Page {i}",
+                # duplicates and NULLs exercise the id tie-breaker / null placement
+                due_at=None if i % 4 == 0 else t0 + timedelta(hours=i // 3),
+            )
+            for i in range(n)
+        ]
+    )
+
+
+def _walk(admin, encounter, ordering, limit=4):
+    params = {"encounter": str(encounter.id), "ordering": ordering, "limit": limit}
+    seen = []
+    while True:
+        resp = call_list(user=admin, tenant_id=encounter.tenant_id, facility_id=encounter.facility_id, params=params)
+        assert resp.status_code == 200, resp.data
+        seen += [row["id"] for row in resp.data]
+        cursor = resp.get("X-Next-Cursor")
+        if not cursor:
+            return seen
+        assert 'rel="next"' in resp["Link"]
+        params = {**params, "cursor": cursor}
+
+
+@pytest.mark.parametrize("ordering", ["created_at", "-created_at", "due_at", "-due_at"])
+def test_keyset_pages_match_full_ordering(encounter, ordering):
+    admin = make_admin()
+    _seed(encounter)
+
+    full = call_list(
+        user=admin,
+        tenant_id=encounter.tenant_id,
+        facility_id=encounter.facility_id,
+        params={"encounter": str(encounter.id), "ordering": ordering, "limit": 1000},
+    )
+    assert full.get("X-Next-Cursor") is None
+    expected = [row["id"] for row in full.data]
+
+    assert _walk(admin, encounter, ordering) == expected
+    assert len(expected) == Task.objects.filter(encounter_id=encounter.id).count()
+
+
+def test_cursor_is_bound_to_its_ordering_and_count_estimate_is_optional(encounter):
+    admin = make_admin()
+    _seed(encounter)
+    scope = {"tenant_id": encounter.tenant_id, "facility_id": encounter.facility_id}
+
+    first = call_list(user=admin, **scope, params={"ordering": "due_at", "limit": 2})
+    assert "X-Total-Count-Estimate" not in first
+
+    resp = call_list(user=admin, **scope, params={"ordering": "created_at", "cursor": first["X-Next-Cursor"]})
+    assert resp.status_code == 400 and "cursor" in resp.data["error"]["details"]
+
+    resp = call_list(user=admin, **scope, params={"count": "estimate"})
+    assert int(resp["X-Total-Count-Estimate"]) >= 0
+
+
+@pytest.mark.parametrize(
+    "forged",
+    [
+        ["-created_at", {"a": 1}, "00000000-0000-0000-0000-000000000000"],
+        ["-created_at", 5, 7],
+        ["-created_at", "2024-01-01T00:00:00+00:00", None],
+        ["-id", "2024-01-01T00:00:00+00:00", "00000000-0000-0000-0000-000000000000"],
+        [None, None, None],
+    ],
+)
+def test_forged_cursor_is_rejected(encounter, forged):
+    admin = make_admin()
+    scope = {"tenant_id": encounter.tenant_id, "facility_id": encounter.facility_id}
+
+    resp = call_list(user=admin, **scope, params={"cursor": keyset.encode_cursor(forged)})
+    assert resp.status_code == 400, resp.data
+    assert "cursor" in resp.data["error"]["details"]
@@ -0,0 +1,70 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from hm_core.encounters.models import EncounterEvent
+from hm_core.tasks.models import Task, TaskStatus
+from hm_core.tasks.services import TaskService
+
+pytestmark = pytest.mark.django_db
+
+
+def test_upsert_reports_created_then_existing_in_one_statement(tenant_id, facility_id, encounter):
+    scope = {"tenant_id": tenant_id, "facility_id": facility_id, "encounter_id": encounter.id}
+
+    with CaptureQueriesContext(connection) as ctx:
+        task, created = Task.objects.upsert(**scope, code="triage", title="Triage")
+    assert created is True and task.status == TaskStatus.OPEN
+    assert len(ctx.captured_queries) == 1
+
+    Task.objects.filter(pk=task.pk).update(status=TaskStatus.IN_PROGRESS)
+    before = Task.objects.get(pk=task.pk).updated_at
+
+    same, created = Task.objects.upsert(**scope, code="triage", title="")
+    assert created is False and same.pk == task.pk
+    assert same.title == "Triage" and same.status == TaskStatus.IN_PROGRESS
+    assert same.updated_at == before  # nothing given changed
+
+    renamed, _ = Task.objects.upsert(**scope, code="triage", title="Triage (urgent)")
+    assert renamed.title == "Triage (urgent)" and renamed.updated_at > before
+
+
+def test_upsert_many_mixes_new_and_existing_codes(tenant_id, facility_id, encounter):
+    scope = {"tenant_id": tenant_id, "facility_id": facility_id, "encounter_id": encounter.id}
+    Task.objects.upsert(**scope, code="a", title="A")
+
+    results = Task.objects.upsert_many(
+        **scope, items=[{"code": "b", "title": "B"}, {"code": "a", "title": "A"}, {"code": "b", "title": "ignored"}]
+    )
+    assert [(t.code, t.title, created) for t, created in results] == [("b", "B", True), ("a", "A", False)]
+    assert Task.objects.filter(encounter_id=encounter.id).count() == 2
+
+
+def test_create_tasks_emits_task_created_only_for_new(tenant_id, facility_id, encounter):
+    TaskService.create_task(tenant_id=tenant_id, facility_id=facility_id, encounter_id=encounter.id, code="a", title="A")
+    tasks = TaskService.create_tasks(
+        tenant_id=tenant_id,
+        facility_id=facility_id,
+        encounter_id=encounter.id,
+        items=[{"code": "a", "title": "A"}, {"code": "b", "title": "B"}],
+    )
+
+    assert [t.code for t in tasks] == ["a", "b"]
+    keys = set(EncounterEvent.objects.filter(encounter_id=encounter.id, code="TASK_CREATED").values_list("event_key", flat=True))
+    assert keys == {f"TASK_CREATED:{t.id}" for t in tasks}
+
+
+def test_task_created_meta_keeps_assignee(tenant_id, facility_id, encounter, django_user_model):
+    user = django_user_model.objects.create_user(username="assignee", password="x")
+    tasks = TaskService.create_tasks(
+        tenant_id=tenant_id,
+        facility_id=facility_id,
+        encounter_id=encounter.id,
+        items=[{"code": "a", "title": "A", "assigned_to_id": user.id}, {"code": "b", "title": "B"}],
+    )
+
+    metas = {
+        e.event_key: e.meta for e in EncounterEvent.objects.filter(encounter_id=encounter.id, code="TASK_CREATED")
+    }
+    assert metas[f"TASK_CREATED:{tasks[0].id}"]["assigned_to_id"] == user.id
+    assert metas[f"TASK_CREATED:{tasks[1].id}"]["assigned_to_id"] is None
@@ -0,0 +1,31 @@
+# Generated by Django 5.2.9 on 2026-10-17 06:12
+
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Tenant',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('name', models.CharField(max_length=255)),
+                ('code', models.SlugField(max_length=64, unique=True)),
+                ('status', models.CharField(choices=[('ACTIVE', 'Active'), ('INACTIVE', 'Inactive'), ('SUSPENDED', 'Suspended'), ('DELETED', 'Deleted')], db_index=True, default='ACTIVE', max_length=16)),
+                ('metadata', models.JSONField(blank=True, default=dict)),
+                ('created_at', models.DateTimeField(auto_now_add=True, db_index=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'db_table': 'tenants_tenant',
+                'indexes': [models.Index(fields=['code'], name='tenants_ten_code_64b1a2_idx'), models.Index(fields=['status'], name='tenants_ten_status_e7eaee_idx'), models.Index(fields=['created_at'], name='tenants_ten_created_99c6ff_idx')],
+            },
+        ),
+    ]
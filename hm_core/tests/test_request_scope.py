@@ -0,0 +1,81 @@
+import pytest
+from django.contrib.auth.models import User
+from django.test import RequestFactory
+from rest_framework.request import Request
+
+from hm_core.common.middleware import TenantFacilityScopeMiddleware
+from hm_core.common.permissions import ensure_scope_on_request
+from hm_core.common.scope import LAYER_MIDDLEWARE, get_request_scope
+from hm_core.iam.scope import apply_scope_from_headers
+
+TENANT = "11111111-1111-1111-1111-111111111111"
+FACILITY = "22222222-2222-2222-2222-222222222222"
+
+
+@pytest.fixture
+def member_calls(monkeypatch):
+    calls = []
+
+    def _fake(**kwargs):
+        calls.append(kwargs)
+        return True
+
+    monkeypatch.setattr("hm_core.iam.services.membership.is_user_member_of_facility", _fake, raising=True)
+    return calls
+
+
+@pytest.mark.django_db
+def test_scope_is_parsed_and_validated_once_across_layers(member_calls):
+    rf = RequestFactory()
+    req = rf.get("/api/v1/patients/", HTTP_X_TENANT_ID=TENANT, HTTP_X_FACILITY_ID=FACILITY)
+    req.user = User.objects.create_user(username="rs1", password="pass123")
+
+    mw = TenantFacilityScopeMiddleware(get_response=lambda r: None)
+    assert mw.process_request(req) is None
+
+    drf_req = Request(req)
+    scope = apply_scope_from_headers(drf_req, user=req.user)
+    assert ensure_scope_on_request(drf_req) is True
+
+    assert len(member_calls) == 1
+    assert str(scope.tenant_id) == TENANT
+
+    rs = get_request_scope(drf_req)
+    assert rs is get_request_scope(req)
+    assert rs.membership_checked_by == LAYER_MIDDLEWARE
+    assert set(rs.timings) == {"parse", "membership"}
+    assert drf_req.scope is rs
+
+
+@pytest.mark.django_db
+def test_membership_rechecked_for_different_user(member_calls):
+    rf = RequestFactory()
+    req = rf.get("/api/v1/patients/", HTTP_X_HM_TENANT_ID=TENANT, HTTP_X_HM_FACILITY_ID=FACILITY)
+    req.user = User.objects.create_user(username="rs2", password="pass123")
+
+    mw = TenantFacilityScopeMiddleware(get_response=lambda r: None)
+    assert mw.process_request(req) is None
+
+    other = User.objects.create_user(username="rs3", password="pass123")
+    apply_scope_from_headers(Request(req), user=other)
+
+    assert [c["user_id"] for c in member_calls] == [req.user.id, other.id]
+
+
+@pytest.mark.django_db
+def test_server_timing_header(settings, member_calls):
+    settings.HM_SCOPE_SERVER_TIMING = True
+
+    rf = RequestFactory()
+    req = rf.get("/api/v1/patients/", HTTP_X_TENANT_ID=TENANT, HTTP_X_FACILITY_ID=FACILITY)
+    req.user = User.objects.create_user(username="rs4", password="pass123")
+
+    from django.http import HttpResponse
+
+    mw = TenantFacilityScopeMiddleware(get_response=lambda r: HttpResponse("ok"))
+    resp = mw(req)
+
+    header = resp["Server-Timing"]
+    assert "scope-parse;dur=" in header
+    assert "scope-membership;dur=" in header
+    assert 'desc="middleware/db"' in header
@@ -0,0 +1,49 @@
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+
+from hm_core.common.management.commands.bench_scope_middleware import SAMPLE_PATHS, legacy_classify
+from hm_core.common.route_policy import (
+    AUTH,
+    OPTIONAL_SCOPE,
+    PUBLIC,
+    REQUIRED_SCOPE,
+    ROUTE_POLICY_TABLE,
+    CompiledRoutePolicy,
+    classify_path,
+)
+
+
+@pytest.mark.parametrize(
+    "path,policy",
+    [
+        ("/admin/", PUBLIC),
+        ("/api/schema/", PUBLIC),
+        ("/api/docs/swagger/", PUBLIC),
+        ("/api/v1/", PUBLIC),
+        ("/api/", PUBLIC),
+        ("/healthz", PUBLIC),
+        ("/api/auth/login/", AUTH),
+        ("/api/v1/auth/refresh/", AUTH),
+        ("/api/v1/me/", OPTIONAL_SCOPE),
+        ("/api/session/bootstrap/", OPTIONAL_SCOPE),
+        ("/api/v1/patients/", REQUIRED_SCOPE),
+        ("/api/v1/encounters/123/timeline/", REQUIRED_SCOPE),
+        ("/other/me/", PUBLIC),
+    ],
+)
+def test_classify_path(path, policy):
+    assert classify_path(path) == policy
+
+
+@pytest.mark.parametrize("path", SAMPLE_PATHS)
+def test_compiled_policy_matches_legacy_scans(path):
+    assert CompiledRoutePolicy(ROUTE_POLICY_TABLE, cache_size=0).classify(path) == legacy_classify(path)
+
+
+def test_bench_command_runs_scoped_path():
+    out = StringIO()
+    call_command("bench_scope_middleware", number=50, stdout=out)
+    assert "process_request, scoped (legacy)" in out.getvalue()
+    assert "process_request, scoped (compiled)" in out.getvalue()